@@ -0,0 +1,71 @@
+# Copyright The OpenTelemetry Authors
+# SPDX-License-Identifier: Apache-2.0
+
+# Serializes batches of spans the size of the default batch of the
+# BatchSpanProcessor, building the protobuf messages first or writing the
+# spans directly in the protobuf wire format.
+
+# pylint: disable=invalid-name
+import pytest
+
+from opentelemetry.exporter.otlp.proto.common.trace_encoder import (
+    encode_spans,
+    encode_spans_to_bytes,
+)
+from opentelemetry.sdk.resources import Resource
+from opentelemetry.sdk.trace import Event, SpanContext, _Span
+from opentelemetry.sdk.util.instrumentation import InstrumentationScope
+from opentelemetry.trace import Link
+
+TRACE_ID = 0x3E0C63257DE34C926F9EFCD03927272E
+BATCH_SIZE = 512
+
+# Resources of services running in Kubernetes carry dozens of attributes.
+resource = Resource(
+    {
+        "service.name": "benchmark",
+        "service.version": "1.0.0",
+        "host.name": "benchmark-host",
+        **{f"k8s.pod.label.{index}": f"value-{index}" for index in range(40)},
+    }
+)
+scope = InstrumentationScope("benchmark_scope", "1.0.0")
+
+
+def _make_span(index):
+    span = _Span(
+        f"span-{index}",
+        SpanContext(TRACE_ID, 0x1000 + index, is_remote=False),
+        parent=SpanContext(TRACE_ID, 0x1000, is_remote=False),
+        resource=resource,
+        attributes={
+            "http.request.method": "GET",
+            "http.response.status_code": 200,
+            "url.full": f"https://example.com/items/{index}",
+            "server.port": 443,
+            "retried": False,
+            "ratio": 0.5,
+        },
+        events=[Event("event", {"event.index": index}, timestamp=index)],
+        links=[Link(SpanContext(TRACE_ID, 0x2000, is_remote=True))],
+        instrumentation_scope=scope,
+    )
+    span.start(start_time=index)
+    span.end(end_time=index + 1000)
+    return span
+
+
+spans = [_make_span(index) for index in range(BATCH_SIZE)]
+
+
+def _serialize_messages(spans_to_encode):
+    return encode_spans(spans_to_encode).SerializePartialToString()
+
+
+@pytest.mark.parametrize(
+    "encoder",
+    [_serialize_messages, encode_spans_to_bytes],
+    ids=["messages", "direct"],
+)
+def test_encode_spans(benchmark, encoder):
+    benchmark(encoder, spans)
@@ -5,9 +5,12 @@
 from __future__ import annotations
 
 import logging
-from collections.abc import Callable, Mapping, Sequence
+from collections import OrderedDict, defaultdict
+from collections.abc import Callable, Iterable, Mapping, Sequence
+from threading import Lock
 from typing import (
     Any,
+    Generic,
     TypeVar,
 )
 
@@ -33,6 +36,79 @@ _logger = logging.getLogger(__name__)
 
 _TypingResourceT = TypeVar("_TypingResourceT")
 _ResourceDataT = TypeVar("_ResourceDataT")
+_CachedT = TypeVar("_CachedT")
+_EncodedT = TypeVar("_EncodedT")
+_ItemT = TypeVar("_ItemT")
+
+
+class _EncodingCache(Generic[_CachedT, _EncodedT]):
+    """Least recently used cache of the encodings of immutable objects.
+
+    Resources and instrumentation scopes hardly ever change during the
+    lifetime of a process but they are encoded again for every exported
+    batch. Entries are keyed by the identity of the encoded objects, which
+    are kept alive by the cache so that their ids are not reused while they
+    are cached. The encodings returned must not be modified.
+    """
+
+    def __init__(
+        self, encode: Callable[[_CachedT], _EncodedT], maxsize: int = 128
+    ):
+        self._encode = encode
+        self._maxsize = maxsize
+        self._entries: OrderedDict[int, tuple[_CachedT, _EncodedT]] = (
+            OrderedDict()
+        )
+        self._lock = Lock()
+
+    def get(self, obj: _CachedT) -> _EncodedT:
+        key = id(obj)
+        with self._lock:
+            entry = self._entries.get(key)
+            if entry is not None:
+                self._entries.move_to_end(key)
+                return entry[1]
+
+        encoded = self._encode(obj)
+
+        with self._lock:
+            self._entries[key] = (obj, encoded)
+            if len(self._entries) > self._maxsize:
+                self._entries.popitem(last=False)
+        return encoded
+
+    def clear(self) -> None:
+        with self._lock:
+            self._entries.clear()
+
+
+def _group_by_resource_and_scope(
+    items: Iterable[_ItemT],
+) -> dict[Resource, dict[InstrumentationScope | None, list[_ItemT]]]:
+    """Groups spans or log records by resource and instrumentation scope.
+
+    Items are grouped by the identity of their resource first, so that a
+    resource is hashed once per batch instead of once per item, hashing a
+    resource serializes all of its attributes. Groups of distinct but equal
+    resources are then merged.
+    """
+    groups_by_id = {}
+    for item in items:
+        resource = item.resource
+        group = groups_by_id.get(id(resource))
+        if group is None:
+            group = groups_by_id[id(resource)] = (
+                resource,
+                defaultdict(list),
+            )
+        group[1][item.instrumentation_scope or None].append(item)
+
+    groups = {}
+    for resource, scope_groups in groups_by_id.values():
+        resource_group = groups.setdefault(resource, {})
+        for scope, scope_items in scope_groups.items():
+            resource_group.setdefault(scope, []).extend(scope_items)
+    return groups
 
 
 def _encode_instrumentation_scope(
@@ -145,15 +221,20 @@ def _get_resource_data(
         sdk_resource,
         scope_data,
     ) in sdk_resource_scope_data.items():
-        collector_resource = PB2Resource(
-            attributes=_encode_attributes(sdk_resource.attributes)
-        )
         resource_data.append(
             resource_class(
                 **{
-                    "resource": collector_resource,
+                    "resource": _RESOURCE_CACHE.get(sdk_resource),
                     f"scope_{name}": scope_data.values(),
                 }
             )
         )
     return resource_data
+
+
+_RESOURCE_CACHE: _EncodingCache[Resource, PB2Resource] = _EncodingCache(
+    _encode_resource
+)
+_INSTRUMENTATION_SCOPE_CACHE: _EncodingCache[
+    InstrumentationScope | None, PB2InstrumentationScope
+] = _EncodingCache(_encode_instrumentation_scope)
@@ -1,15 +1,15 @@
 # Copyright The OpenTelemetry Authors
 # SPDX-License-Identifier: Apache-2.0
-from collections import defaultdict
 from collections.abc import Sequence
 
 from opentelemetry.exporter.otlp.proto.common._internal import (
+    _INSTRUMENTATION_SCOPE_CACHE,
+    _RESOURCE_CACHE,
     _encode_attributes,
-    _encode_instrumentation_scope,
-    _encode_resource,
     _encode_span_id,
     _encode_trace_id,
     _encode_value,
+    _group_by_resource_and_scope,
 )
 from opentelemetry.proto.collector.logs.v1.logs_service_pb2 import (
     ExportLogsServiceRequest,
@@ -62,24 +62,22 @@ def _encode_log(readable_log_record: ReadableLogRecord) -> PB2LogRecord:
 def _encode_resource_logs(
     batch: Sequence[ReadableLogRecord],
 ) -> list[ResourceLogs]:
-    sdk_resource_logs = defaultdict(lambda: defaultdict(list))
-
-    for readable_log in batch:
-        sdk_resource = readable_log.resource
-        sdk_instrumentation = readable_log.instrumentation_scope or None
-        pb2_log = _encode_log(readable_log)
-
-        sdk_resource_logs[sdk_resource][sdk_instrumentation].append(pb2_log)
-
     pb2_resource_logs = []
 
-    for sdk_resource, sdk_instrumentations in sdk_resource_logs.items():
+    for sdk_resource, sdk_instrumentations in _group_by_resource_and_scope(
+        batch
+    ).items():
         scope_logs = []
-        for sdk_instrumentation, pb2_logs in sdk_instrumentations.items():
+        for sdk_instrumentation, readable_logs in sdk_instrumentations.items():
             scope_logs.append(
                 ScopeLogs(
-                    scope=(_encode_instrumentation_scope(sdk_instrumentation)),
-                    log_records=pb2_logs,
+                    scope=_INSTRUMENTATION_SCOPE_CACHE.get(
+                        sdk_instrumentation
+                    ),
+                    log_records=[
+                        _encode_log(readable_log)
+                        for readable_log in readable_logs
+                    ],
                     schema_url=sdk_instrumentation.schema_url
                     if sdk_instrumentation
                     else None,
@@ -87,7 +85,7 @@ def _encode_resource_logs(
             )
         pb2_resource_logs.append(
             ResourceLogs(
-                resource=_encode_resource(sdk_resource),
+                resource=_RESOURCE_CACHE.get(sdk_resource),
                 scope_logs=scope_logs,
                 schema_url=sdk_resource.schema_url,
             )
@@ -0,0 +1,211 @@
+# Copyright The OpenTelemetry Authors
+# SPDX-License-Identifier: Apache-2.0
+
+"""Helpers writing OTLP messages in the protobuf wire format.
+
+The functions in this module write directly into a ``bytearray`` the same
+bytes that ``SerializePartialToString`` produces for the messages built by
+the functions in ``opentelemetry.exporter.otlp.proto.common._internal``,
+without building the intermediate protobuf message objects.
+
+Fields are written in field number order and fields with default values are
+omitted, as the protobuf runtime does for proto3 messages. Messages that are
+set, even when empty, and the members of a ``oneof`` are always written.
+"""
+
+from __future__ import annotations
+
+import logging
+from collections.abc import Mapping, Sequence
+from functools import lru_cache
+from struct import Struct
+from typing import Any
+
+from opentelemetry.exporter.otlp.proto.common._internal import (
+    _EncodingCache,
+)
+from opentelemetry.sdk.trace import Resource
+from opentelemetry.sdk.util.instrumentation import InstrumentationScope
+from opentelemetry.util.types import _ExtendedAttributes
+
+_logger = logging.getLogger(__name__)
+
+_FIXED32 = Struct("<I").pack
+_FIXED64 = Struct("<Q").pack
+_DOUBLE = Struct("<d").pack
+
+_INT64_MIN = -(1 << 63)
+_INT64_MAX = (1 << 63) - 1
+_UINT64_RANGE = 1 << 64
+
+_SMALL_VARINTS = tuple(bytes((value,)) for value in range(0x80))
+
+
+def _varint(value: int) -> bytes:
+    if value < 0x80:
+        return _SMALL_VARINTS[value]
+    encoded = bytearray()
+    while value > 0x7F:
+        encoded.append((value & 0x7F) | 0x80)
+        value >>= 7
+    encoded.append(value)
+    return bytes(encoded)
+
+
+def _tag(field_number: int, wire_type: int) -> bytes:
+    return _varint(field_number << 3 | wire_type)
+
+
+_VARINT = 0
+_I64 = 1
+_LEN = 2
+_I32 = 5
+
+# AnyValue
+_ANY_VALUE_STRING = _tag(1, _LEN)
+_ANY_VALUE_BOOL_TRUE = _tag(2, _VARINT) + b"\x01"
+_ANY_VALUE_BOOL_FALSE = _tag(2, _VARINT) + b"\x00"
+_ANY_VALUE_INT = _tag(3, _VARINT)
+_ANY_VALUE_DOUBLE = _tag(4, _I64)
+_ANY_VALUE_ARRAY = _tag(5, _LEN)
+_ANY_VALUE_KVLIST = _tag(6, _LEN)
+_ANY_VALUE_BYTES = _tag(7, _LEN)
+# ArrayValue and KeyValueList
+_VALUES = _tag(1, _LEN)
+# KeyValue
+_KEY_VALUE_KEY = _tag(1, _LEN)
+_KEY_VALUE_VALUE = _tag(2, _LEN)
+# InstrumentationScope
+_SCOPE_NAME = _tag(1, _LEN)
+_SCOPE_VERSION = _tag(2, _LEN)
+_SCOPE_ATTRIBUTES = _tag(3, _LEN)
+# Resource
+_RESOURCE_ATTRIBUTES = _tag(1, _LEN)
+
+
+def _write_bytes(buffer: bytearray, tag: bytes, value: bytes) -> None:
+    buffer += tag
+    buffer += _varint(len(value))
+    buffer += value
+
+
+def _write_string(buffer: bytearray, tag: bytes, value: str | None) -> None:
+    # Empty strings are the default value, they are not written.
+    if value:
+        _write_bytes(buffer, tag, value.encode("utf-8"))
+
+
+def _write_uint(buffer: bytearray, tag: bytes, value: int | None) -> None:
+    if value:
+        buffer += tag
+        buffer += _varint(value)
+
+
+def _write_fixed64(buffer: bytearray, tag: bytes, value: int | None) -> None:
+    if value:
+        buffer += tag
+        buffer += _FIXED64(value)
+
+
+def _encode_value(value: Any) -> bytes:
+    # The exact types of the most common attribute values are checked first.
+    value_type = type(value)
+    if value_type is str:
+        encoded = value.encode("utf-8")
+        return _ANY_VALUE_STRING + _varint(len(encoded)) + encoded
+    if value_type is bool:
+        return _ANY_VALUE_BOOL_TRUE if value else _ANY_VALUE_BOOL_FALSE
+    if value_type is int and 0 <= value < 0x80:
+        return _ANY_VALUE_INT + _SMALL_VARINTS[value]
+    if value_type is float:
+        return _ANY_VALUE_DOUBLE + _DOUBLE(value)
+
+    buffer = bytearray()
+    if isinstance(value, bool):
+        buffer += _ANY_VALUE_BOOL_TRUE if value else _ANY_VALUE_BOOL_FALSE
+    elif isinstance(value, str):
+        _write_bytes(buffer, _ANY_VALUE_STRING, value.encode("utf-8"))
+    elif isinstance(value, int):
+        if not _INT64_MIN <= value <= _INT64_MAX:
+            raise ValueError(f"Value out of range: {value}")
+        buffer += _ANY_VALUE_INT
+        buffer += _varint(value if value >= 0 else value + _UINT64_RANGE)
+    elif isinstance(value, float):
+        buffer += _ANY_VALUE_DOUBLE
+        buffer += _DOUBLE(value)
+    elif isinstance(value, bytes):
+        _write_bytes(buffer, _ANY_VALUE_BYTES, value)
+    elif isinstance(value, Sequence):
+        array = bytearray()
+        for element in value:
+            _write_bytes(array, _VALUES, _encode_value(element))
+        _write_bytes(buffer, _ANY_VALUE_ARRAY, array)
+    elif isinstance(value, Mapping):
+        kvlist = bytearray()
+        for key, element in value.items():
+            _write_bytes(kvlist, _VALUES, _encode_key_value(str(key), element))
+        _write_bytes(buffer, _ANY_VALUE_KVLIST, kvlist)
+    else:
+        # pylint: disable=broad-exception-raised
+        raise Exception(f"Invalid type {type(value)} of value {value}")
+    return bytes(buffer)
+
+
+@lru_cache(maxsize=1024)
+def _encode_key(key: str) -> bytes:
+    # Attribute keys repeat across spans, their encoding is cached.
+    if not key:
+        return b""
+    encoded = key.encode("utf-8")
+    return _KEY_VALUE_KEY + _varint(len(encoded)) + encoded
+
+
+def _encode_key_value(key: str, value: Any) -> bytes:
+    value = _encode_value(value)
+    return b"".join(
+        (_encode_key(key), _KEY_VALUE_VALUE, _varint(len(value)), value)
+    )
+
+
+def _write_attributes(
+    buffer: bytearray, tag: bytes, attributes: _ExtendedAttributes
+) -> None:
+    if not attributes:
+        return
+    for key, value in attributes.items():
+        # pylint: disable=broad-exception-caught
+        try:
+            key_value = _encode_key_value(key, value)
+        except Exception as error:
+            _logger.exception("Failed to encode key %s: %s", key, error)
+        else:
+            buffer += tag
+            buffer += _varint(len(key_value))
+            buffer += key_value
+
+
+def _encode_resource(resource: Resource) -> bytes:
+    buffer = bytearray()
+    _write_attributes(buffer, _RESOURCE_ATTRIBUTES, resource.attributes)
+    return bytes(buffer)
+
+
+def _encode_instrumentation_scope(
+    instrumentation_scope: InstrumentationScope | None,
+) -> bytes:
+    buffer = bytearray()
+    if instrumentation_scope is not None:
+        _write_string(buffer, _SCOPE_NAME, instrumentation_scope.name)
+        _write_string(buffer, _SCOPE_VERSION, instrumentation_scope.version)
+        _write_attributes(
+            buffer, _SCOPE_ATTRIBUTES, instrumentation_scope.attributes
+        )
+    return bytes(buffer)
+
+
+_RESOURCE_CACHE: _EncodingCache[Resource, bytes] = _EncodingCache(
+    _encode_resource
+)
+_INSTRUMENTATION_SCOPE_CACHE: _EncodingCache[
+    InstrumentationScope | None, bytes
+] = _EncodingCache(_encode_instrumentation_scope)
@@ -6,8 +6,9 @@ import logging
 from os import environ
 
 from opentelemetry.exporter.otlp.proto.common._internal import (
+    _INSTRUMENTATION_SCOPE_CACHE,
+    _RESOURCE_CACHE,
     _encode_attributes,
-    _encode_instrumentation_scope,
     _encode_span_id,
     _encode_trace_id,
 )
@@ -15,9 +16,6 @@ from opentelemetry.proto.collector.metrics.v1.metrics_service_pb2 import (
     ExportMetricsServiceRequest,
 )
 from opentelemetry.proto.metrics.v1 import metrics_pb2 as pb2
-from opentelemetry.proto.resource.v1.resource_pb2 import (
-    Resource as PB2Resource,
-)
 from opentelemetry.sdk.environment_variables import (
     OTEL_EXPORTER_OTLP_METRICS_DEFAULT_HISTOGRAM_AGGREGATION,
     OTEL_EXPORTER_OTLP_METRICS_TEMPORALITY_PREFERENCE,
@@ -188,9 +186,7 @@ def encode_metrics(data: MetricsData) -> ExportMetricsServiceRequest:
     ) in resource_metrics_dict.items():
         resource_data.append(
             pb2.ResourceMetrics(
-                resource=PB2Resource(
-                    attributes=_encode_attributes(sdk_resource.attributes)
-                ),
+                resource=_RESOURCE_CACHE.get(sdk_resource),
                 scope_metrics=scope_data.values(),
                 schema_url=sdk_resource.schema_url,
             )
@@ -211,7 +207,7 @@ def _encode_resource_metrics(resource_metrics, resource_metrics_dict):
         # there is no need to check for existing instrumentation scopes
         # here.
         pb2_scope_metrics = pb2.ScopeMetrics(
-            scope=_encode_instrumentation_scope(instrumentation_scope),
+            scope=_INSTRUMENTATION_SCOPE_CACHE.get(instrumentation_scope),
             schema_url=instrumentation_scope.schema_url,
         )
 
@@ -2,15 +2,18 @@
 # SPDX-License-Identifier: Apache-2.0
 
 import logging
-from collections import defaultdict
 from collections.abc import Sequence
 
 from opentelemetry.exporter.otlp.proto.common._internal import (
+    _INSTRUMENTATION_SCOPE_CACHE,
+    _RESOURCE_CACHE,
     _encode_attributes,
-    _encode_instrumentation_scope,
-    _encode_resource,
     _encode_span_id,
     _encode_trace_id,
+    _group_by_resource_and_scope,
+)
+from opentelemetry.exporter.otlp.proto.common._internal import (
+    _wire_encoder as _wire,
 )
 from opentelemetry.proto.collector.trace.v1.trace_service_pb2 import (
     ExportTraceServiceRequest as PB2ExportTraceServiceRequest,
@@ -37,6 +40,50 @@ _SPAN_KIND_MAP = {
 
 _logger = logging.getLogger(__name__)
 
+# ExportTraceServiceRequest
+_RESOURCE_SPANS = _wire._tag(1, _wire._LEN)
+# ResourceSpans
+_RESOURCE_SPANS_RESOURCE = _wire._tag(1, _wire._LEN)
+_RESOURCE_SPANS_SCOPE_SPANS = _wire._tag(2, _wire._LEN)
+_RESOURCE_SPANS_SCHEMA_URL = _wire._tag(3, _wire._LEN)
+# ScopeSpans
+_SCOPE_SPANS_SCOPE = _wire._tag(1, _wire._LEN)
+_SCOPE_SPANS_SPANS = _wire._tag(2, _wire._LEN)
+_SCOPE_SPANS_SCHEMA_URL = _wire._tag(3, _wire._LEN)
+# Span
+# Trace ids are always 16 bytes long and span ids 8 bytes long, the tags of
+# their fields are followed by their constant length.
+_SPAN_TRACE_ID = _wire._tag(1, _wire._LEN) + _wire._varint(16)
+_SPAN_SPAN_ID = _wire._tag(2, _wire._LEN) + _wire._varint(8)
+_SPAN_TRACE_STATE = _wire._tag(3, _wire._LEN)
+_SPAN_PARENT_SPAN_ID = _wire._tag(4, _wire._LEN) + _wire._varint(8)
+_SPAN_NAME = _wire._tag(5, _wire._LEN)
+_SPAN_KIND = _wire._tag(6, _wire._VARINT)
+_SPAN_START_TIME = _wire._tag(7, _wire._I64)
+_SPAN_END_TIME = _wire._tag(8, _wire._I64)
+_SPAN_ATTRIBUTES = _wire._tag(9, _wire._LEN)
+_SPAN_DROPPED_ATTRIBUTES = _wire._tag(10, _wire._VARINT)
+_SPAN_EVENTS = _wire._tag(11, _wire._LEN)
+_SPAN_DROPPED_EVENTS = _wire._tag(12, _wire._VARINT)
+_SPAN_LINKS = _wire._tag(13, _wire._LEN)
+_SPAN_DROPPED_LINKS = _wire._tag(14, _wire._VARINT)
+_SPAN_STATUS = _wire._tag(15, _wire._LEN)
+_SPAN_FLAGS = _wire._tag(16, _wire._I32)
+# Span.Event
+_EVENT_TIME = _wire._tag(1, _wire._I64)
+_EVENT_NAME = _wire._tag(2, _wire._LEN)
+_EVENT_ATTRIBUTES = _wire._tag(3, _wire._LEN)
+_EVENT_DROPPED_ATTRIBUTES = _wire._tag(4, _wire._VARINT)
+# Span.Link
+_LINK_TRACE_ID = _wire._tag(1, _wire._LEN) + _wire._varint(16)
+_LINK_SPAN_ID = _wire._tag(2, _wire._LEN) + _wire._varint(8)
+_LINK_ATTRIBUTES = _wire._tag(4, _wire._LEN)
+_LINK_DROPPED_ATTRIBUTES = _wire._tag(5, _wire._VARINT)
+_LINK_FLAGS = _wire._tag(6, _wire._I32)
+# Status
+_STATUS_MESSAGE = _wire._tag(2, _wire._LEN)
+_STATUS_CODE = _wire._tag(3, _wire._VARINT)
+
 
 def encode_spans(
     sdk_spans: Sequence[ReadableSpan],
@@ -46,6 +93,53 @@ def encode_spans(
     )
 
 
+def encode_spans_to_bytes(sdk_spans: Sequence[ReadableSpan]) -> bytes:
+    """Returns the serialized ``ExportTraceServiceRequest`` of the spans.
+
+    The result is byte for byte the same as
+    ``encode_spans(sdk_spans).SerializePartialToString()`` but the spans are
+    written directly in the protobuf wire format, without building the
+    protobuf messages first.
+    """
+    request = bytearray()
+
+    for sdk_resource, sdk_instrumentations in _group_by_resource_and_scope(
+        sdk_spans
+    ).items():
+        resource_spans = bytearray()
+        _wire._write_bytes(
+            resource_spans,
+            _RESOURCE_SPANS_RESOURCE,
+            _wire._RESOURCE_CACHE.get(sdk_resource),
+        )
+        for sdk_instrumentation, spans in sdk_instrumentations.items():
+            scope_spans = bytearray()
+            _wire._write_bytes(
+                scope_spans,
+                _SCOPE_SPANS_SCOPE,
+                _wire._INSTRUMENTATION_SCOPE_CACHE.get(sdk_instrumentation),
+            )
+            for sdk_span in spans:
+                _wire._write_bytes(
+                    scope_spans, _SCOPE_SPANS_SPANS, _serialize_span(sdk_span)
+                )
+            if sdk_instrumentation is not None:
+                _wire._write_string(
+                    scope_spans,
+                    _SCOPE_SPANS_SCHEMA_URL,
+                    sdk_instrumentation.schema_url,
+                )
+            _wire._write_bytes(
+                resource_spans, _RESOURCE_SPANS_SCOPE_SPANS, scope_spans
+            )
+        _wire._write_string(
+            resource_spans, _RESOURCE_SPANS_SCHEMA_URL, sdk_resource.schema_url
+        )
+        _wire._write_bytes(request, _RESOURCE_SPANS, resource_spans)
+
+    return bytes(request)
+
+
 def _encode_resource_spans(
     sdk_spans: Sequence[ReadableSpan],
 ) -> list[PB2ResourceSpans]:
@@ -55,29 +149,26 @@ def _encode_resource_spans(
     #     Instrumentation Library
     #       Spans
     #
-    # First loop organizes the SDK spans in this structure. Protobuf messages
-    # are not hashable so we stick with SDK data in this phase.
+    # _group_by_resource_and_scope organizes the SDK spans in this
+    # structure. Protobuf messages are not hashable so we stick with SDK data
+    # in this phase.
     #
-    # Second loop encodes the data into Protobuf format.
+    # The loop below encodes the data into Protobuf format, the resources and
+    # instrumentation scopes are encoded once and cached across batches.
     #
-    sdk_resource_spans = defaultdict(lambda: defaultdict(list))
-
-    for sdk_span in sdk_spans:
-        sdk_resource = sdk_span.resource
-        sdk_instrumentation = sdk_span.instrumentation_scope or None
-        pb2_span = _encode_span(sdk_span)
-
-        sdk_resource_spans[sdk_resource][sdk_instrumentation].append(pb2_span)
-
     pb2_resource_spans = []
 
-    for sdk_resource, sdk_instrumentations in sdk_resource_spans.items():
+    for sdk_resource, sdk_instrumentations in _group_by_resource_and_scope(
+        sdk_spans
+    ).items():
         scope_spans = []
-        for sdk_instrumentation, pb2_spans in sdk_instrumentations.items():
+        for sdk_instrumentation, spans in sdk_instrumentations.items():
             scope_spans.append(
                 PB2ScopeSpans(
-                    scope=(_encode_instrumentation_scope(sdk_instrumentation)),
-                    spans=pb2_spans,
+                    scope=_INSTRUMENTATION_SCOPE_CACHE.get(
+                        sdk_instrumentation
+                    ),
+                    spans=[_encode_span(sdk_span) for sdk_span in spans],
                     schema_url=sdk_instrumentation.schema_url
                     if sdk_instrumentation
                     else None,
@@ -85,7 +176,7 @@ def _encode_resource_spans(
             )
         pb2_resource_spans.append(
             PB2ResourceSpans(
-                resource=_encode_resource(sdk_resource),
+                resource=_RESOURCE_CACHE.get(sdk_resource),
                 scope_spans=scope_spans,
                 schema_url=sdk_resource.schema_url,
             )
@@ -179,3 +270,80 @@ def _encode_parent_id(context: SpanContext | None) -> bytes | None:
     if context:
         return _encode_span_id(context.span_id)
     return None
+
+
+_SPAN_KIND_VALUES = {
+    kind: _wire._varint(value) for kind, value in _SPAN_KIND_MAP.items()
+}
+
+
+def _serialize_span(sdk_span: ReadableSpan) -> bytes:
+    # pylint: disable=protected-access
+    span_context = sdk_span.get_span_context()
+    parent = sdk_span.parent
+    buffer = bytearray(_SPAN_TRACE_ID)
+    buffer += _encode_trace_id(span_context.trace_id)
+    buffer += _SPAN_SPAN_ID
+    buffer += _encode_span_id(span_context.span_id)
+    if span_context.trace_state:
+        _wire._write_string(
+            buffer,
+            _SPAN_TRACE_STATE,
+            _encode_trace_state(span_context.trace_state),
+        )
+    if parent:
+        buffer += _SPAN_PARENT_SPAN_ID
+        buffer += _encode_span_id(parent.span_id)
+    _wire._write_string(buffer, _SPAN_NAME, sdk_span.name)
+    buffer += _SPAN_KIND
+    buffer += _SPAN_KIND_VALUES[sdk_span.kind]
+    _wire._write_fixed64(buffer, _SPAN_START_TIME, sdk_span.start_time)
+    _wire._write_fixed64(buffer, _SPAN_END_TIME, sdk_span.end_time)
+    _wire._write_attributes(buffer, _SPAN_ATTRIBUTES, sdk_span.attributes)
+    _wire._write_uint(
+        buffer, _SPAN_DROPPED_ATTRIBUTES, sdk_span.dropped_attributes
+    )
+    for event in sdk_span.events:
+        _wire._write_bytes(buffer, _SPAN_EVENTS, _serialize_event(event))
+    _wire._write_uint(buffer, _SPAN_DROPPED_EVENTS, sdk_span.dropped_events)
+    for link in sdk_span.links:
+        _wire._write_bytes(buffer, _SPAN_LINKS, _serialize_link(link))
+    _wire._write_uint(buffer, _SPAN_DROPPED_LINKS, sdk_span.dropped_links)
+    status = sdk_span.status
+    if status is not None:
+        _wire._write_bytes(buffer, _SPAN_STATUS, _serialize_status(status))
+    buffer += _SPAN_FLAGS
+    buffer += _wire._FIXED32(_span_flags(parent))
+    return bytes(buffer)
+
+
+def _serialize_event(event: Event) -> bytes:
+    buffer = bytearray()
+    _wire._write_fixed64(buffer, _EVENT_TIME, event.timestamp)
+    _wire._write_string(buffer, _EVENT_NAME, event.name)
+    _wire._write_attributes(buffer, _EVENT_ATTRIBUTES, event.attributes)
+    _wire._write_uint(
+        buffer, _EVENT_DROPPED_ATTRIBUTES, event.dropped_attributes
+    )
+    return bytes(buffer)
+
+
+def _serialize_link(link: Link) -> bytes:
+    buffer = bytearray(_LINK_TRACE_ID)
+    buffer += _encode_trace_id(link.context.trace_id)
+    buffer += _LINK_SPAN_ID
+    buffer += _encode_span_id(link.context.span_id)
+    _wire._write_attributes(buffer, _LINK_ATTRIBUTES, link.attributes)
+    _wire._write_uint(
+        buffer, _LINK_DROPPED_ATTRIBUTES, link.dropped_attributes
+    )
+    buffer += _LINK_FLAGS
+    buffer += _wire._FIXED32(_span_flags(link.context))
+    return bytes(buffer)
+
+
+def _serialize_status(status: Status) -> bytes:
+    buffer = bytearray()
+    _wire._write_string(buffer, _STATUS_MESSAGE, status.description)
+    _wire._write_uint(buffer, _STATUS_CODE, status.status_code.value)
+    return bytes(buffer)
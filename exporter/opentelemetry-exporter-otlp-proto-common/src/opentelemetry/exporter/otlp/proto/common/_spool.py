@@ -0,0 +1,267 @@
+# Copyright The OpenTelemetry Authors
+# SPDX-License-Identifier: Apache-2.0
+
+from __future__ import annotations
+
+import logging
+import mmap
+import os
+import struct
+import threading
+import zlib
+
+_logger = logging.getLogger(__name__)
+
+_SEGMENT_SUFFIX = ".seg"
+_CURSOR_FILE_NAME = "cursor"
+# Every record is the payload length and its crc32 followed by the payload.
+_RECORD_HEADER = struct.Struct("<II")
+
+_DEFAULT_MAX_BYTES = 64 * 1024 * 1024
+_DEFAULT_SEGMENT_BYTES = 4 * 1024 * 1024
+
+
+class DiskSpool:
+    """Persistent spool of serialized export requests.
+
+    OTLP exporters append the requests they failed to deliver after
+    exhausting their retries, and replay them oldest first once an export
+    succeeds again. Requests are appended to segment files in ``directory``
+    and read back through memory maps. A read cursor is stored next to the
+    segments, so spooled requests survive a restart of the process.
+
+    When the spool grows above ``max_bytes`` the oldest segments are deleted.
+
+    Only one sender replays the spool at a time: it peeks, sends and commits
+    requests between `acquire_replay` and `release_replay`.
+
+    Args:
+        directory: Directory holding the segment files, created if missing.
+            It must not be shared by exporters of different signals.
+        max_bytes: Maximum size of all the segment files together.
+        segment_bytes: Size after which a new segment file is started.
+    """
+
+    def __init__(
+        self,
+        directory: str,
+        max_bytes: int = _DEFAULT_MAX_BYTES,
+        segment_bytes: int = _DEFAULT_SEGMENT_BYTES,
+    ):
+        if max_bytes <= 0:
+            raise ValueError("max_bytes must be a positive integer.")
+        if segment_bytes <= 0:
+            raise ValueError("segment_bytes must be a positive integer.")
+        os.makedirs(directory, exist_ok=True)
+        self._directory = directory
+        self._max_bytes = max_bytes
+        self._segment_bytes = min(segment_bytes, max_bytes)
+        self._lock = threading.Lock()
+        self._replay_lock = threading.Lock()
+        self._segment_sizes: dict[int, int] = {}
+        for name in os.listdir(directory):
+            if name.endswith(_SEGMENT_SUFFIX):
+                self._segment_sizes[int(name[: -len(_SEGMENT_SUFFIX)])] = (
+                    os.path.getsize(os.path.join(directory, name))
+                )
+        self._segments = sorted(self._segment_sizes)
+        if self._segments:
+            self._truncate_partial_record(self._segments[-1])
+        self._read_segment, self._read_offset = self._load_cursor()
+        self._peeked_bytes = 0
+
+    def __len__(self) -> int:
+        """Returns the number of bytes stored in the spool."""
+        with self._lock:
+            return sum(self._segment_sizes.values())
+
+    def append(self, payload: bytes) -> bool:
+        """Appends a serialized request to the spool.
+
+        Returns False if the payload is too big to ever fit in the spool.
+        """
+        record_bytes = _RECORD_HEADER.size + len(payload)
+        if record_bytes > self._segment_bytes:
+            _logger.warning(
+                "Request of %d bytes is too big to be spooled.", len(payload)
+            )
+            return False
+        with self._lock:
+            if (
+                not self._segments
+                or self._segment_sizes[self._segments[-1]] + record_bytes
+                > self._segment_bytes
+            ):
+                if self._segments:
+                    segment = self._segments[-1] + 1
+                else:
+                    segment, self._read_offset = self._read_segment, 0
+                self._segments.append(segment)
+                self._segment_sizes[segment] = 0
+            segment = self._segments[-1]
+            with open(self._segment_path(segment), "ab") as segment_file:
+                segment_file.write(
+                    _RECORD_HEADER.pack(len(payload), zlib.crc32(payload))
+                )
+                segment_file.write(payload)
+            self._segment_sizes[segment] += record_bytes
+            self._evict()
+        return True
+
+    def acquire_replay(self) -> bool:
+        """Reserves replaying the spool to the caller until it calls
+        `release_replay`. Returns False if another sender is replaying it.
+
+        Senders exporting concurrently must not replay the same request or
+        commit one they did not deliver, so `peek` and `commit` are only
+        called by the sender holding the replay."""
+        return self._replay_lock.acquire(blocking=False)  # pylint: disable=consider-using-with
+
+    def release_replay(self) -> None:
+        self._replay_lock.release()
+
+    def peek(self) -> bytes | None:
+        """Returns the oldest spooled request without removing it, or None
+        if the spool is empty. Call `commit` once it has been delivered."""
+        with self._lock:
+            while self._segments:
+                if self._read_segment not in self._segment_sizes:
+                    # The segment was evicted or the cursor is stale.
+                    self._read_segment = self._segments[0]
+                    self._read_offset = 0
+                segment = self._read_segment
+                record = self._read_record(segment, self._read_offset)
+                if record is not None:
+                    payload, record_bytes = record
+                    if payload is not None:
+                        self._peeked_bytes = record_bytes
+                        return payload
+                    # The record is corrupted, skip it.
+                    self._read_offset += record_bytes
+                    self._store_cursor()
+                    continue
+                # The segment is exhausted. The newest one is still being
+                # appended to, so it is kept.
+                if segment == self._segments[-1]:
+                    return None
+                self._remove_segment(segment)
+                self._read_segment, self._read_offset = segment + 1, 0
+                self._store_cursor()
+            return None
+
+    def commit(self) -> None:
+        """Removes the request returned by the last `peek` from the spool."""
+        with self._lock:
+            if not self._peeked_bytes:
+                return
+            self._read_offset += self._peeked_bytes
+            self._peeked_bytes = 0
+            if (
+                self._segments == [self._read_segment]
+                and self._read_offset
+                == self._segment_sizes[self._read_segment]
+            ):
+                # Everything was delivered, start over in a new segment.
+                self._remove_segment(self._read_segment)
+                self._read_segment, self._read_offset = (
+                    self._read_segment + 1,
+                    0,
+                )
+            self._store_cursor()
+
+    def _segment_path(self, segment: int) -> str:
+        return os.path.join(
+            self._directory, f"{segment:020d}{_SEGMENT_SUFFIX}"
+        )
+
+    def _read_record(
+        self, segment: int, offset: int
+    ) -> tuple[bytes | None, int] | None:
+        """Returns the payload and the size of the record at ``offset``, or
+        None past the last record of the segment. The payload is None if the
+        record is corrupted. A record whose length runs past the end of the
+        segment covers the rest of it, since records after it cannot be
+        found."""
+        size = self._segment_sizes[segment]
+        if offset + _RECORD_HEADER.size > size:
+            return None
+        with (
+            open(self._segment_path(segment), "rb") as segment_file,
+            mmap.mmap(
+                segment_file.fileno(), 0, access=mmap.ACCESS_READ
+            ) as segment_map,
+        ):
+            length, crc = _RECORD_HEADER.unpack_from(segment_map, offset)
+            start = offset + _RECORD_HEADER.size
+            if start + length > size:
+                _logger.warning(
+                    "Skipping the unreadable end of spool segment %s.",
+                    self._segment_path(segment),
+                )
+                return None, size - offset
+            payload = segment_map[start : start + length]
+        if zlib.crc32(payload) != crc:
+            _logger.warning(
+                "Skipping corrupted request in spool segment %s.",
+                self._segment_path(segment),
+            )
+            return None, _RECORD_HEADER.size + length
+        return payload, _RECORD_HEADER.size + length
+
+    def _truncate_partial_record(self, segment: int) -> None:
+        # A crash in the middle of an append leaves a partial record at the end
+        # of the newest segment, which would hide the records appended after.
+        size = self._segment_sizes[segment]
+        offset = 0
+        while offset < size:
+            record = self._read_record(segment, offset)
+            if record is None:
+                break
+            payload, record_bytes = record
+            if payload is None and offset + record_bytes == size:
+                break
+            # Corrupted records before the end are skipped when replaying.
+            offset += record_bytes
+        if offset != size:
+            os.truncate(self._segment_path(segment), offset)
+            self._segment_sizes[segment] = offset
+
+    def _remove_segment(self, segment: int) -> None:
+        try:
+            os.remove(self._segment_path(segment))
+        except FileNotFoundError:
+            pass
+        self._segments.remove(segment)
+        del self._segment_sizes[segment]
+
+    def _evict(self) -> None:
+        total = sum(self._segment_sizes.values())
+        while total > self._max_bytes and len(self._segments) > 1:
+            segment = self._segments[0]
+            total -= self._segment_sizes[segment]
+            _logger.warning(
+                "Spool is full, dropping %d bytes of oldest requests.",
+                self._segment_sizes[segment],
+            )
+            self._remove_segment(segment)
+            if segment == self._read_segment:
+                self._read_segment, self._read_offset = segment + 1, 0
+                self._peeked_bytes = 0
+                self._store_cursor()
+
+    def _load_cursor(self) -> tuple[int, int]:
+        try:
+            with open(
+                os.path.join(self._directory, _CURSOR_FILE_NAME),
+                encoding="ascii",
+            ) as cursor_file:
+                segment, offset = cursor_file.read().split()
+                return int(segment), int(offset)
+        except (OSError, ValueError):
+            return 0, 0
+
+    def _store_cursor(self) -> None:
+        path = os.path.join(self._directory, _CURSOR_FILE_NAME)
+        with open(f"{path}.tmp", "w", encoding="ascii") as cursor_file:
+            cursor_file.write(f"{self._read_segment} {self._read_offset}")
+        os.replace(f"{path}.tmp", path)
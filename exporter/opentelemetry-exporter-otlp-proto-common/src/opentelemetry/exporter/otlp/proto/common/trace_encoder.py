@@ -4,6 +4,7 @@
 
 from opentelemetry.exporter.otlp.proto.common._internal.trace_encoder import (
     encode_spans,
+    encode_spans_to_bytes,
 )
 
-__all__ = ["encode_spans"]
+__all__ = ["encode_spans", "encode_spans_to_bytes"]
@@ -0,0 +1,67 @@
+# Copyright The OpenTelemetry Authors
+# SPDX-License-Identifier: Apache-2.0
+
+# pylint: disable=protected-access
+
+import unittest
+from unittest.mock import Mock
+
+from opentelemetry.exporter.otlp.proto.common._internal import (
+    _EncodingCache,
+    _group_by_resource_and_scope,
+)
+from opentelemetry.sdk.resources import Resource
+from opentelemetry.sdk.util.instrumentation import InstrumentationScope
+
+
+class TestEncodingCache(unittest.TestCase):
+    def test_encodes_once_per_object(self):
+        encode = Mock(side_effect=lambda resource: dict(resource.attributes))
+        cache = _EncodingCache(encode)
+        resource = Resource({"a": 1})
+
+        self.assertEqual(cache.get(resource), {"a": 1})
+        self.assertIs(cache.get(resource), cache.get(resource))
+        self.assertEqual(encode.call_count, 1)
+
+        # Equal resources are distinct entries, they are keyed by identity.
+        cache.get(Resource({"a": 1}))
+        self.assertEqual(encode.call_count, 2)
+
+    def test_least_recently_used_evicted(self):
+        encode = Mock(side_effect=lambda resource: resource.attributes["a"])
+        cache = _EncodingCache(encode, maxsize=2)
+        resources = [Resource({"a": index}) for index in range(3)]
+
+        cache.get(resources[0])
+        cache.get(resources[1])
+        cache.get(resources[0])
+        cache.get(resources[2])
+        self.assertEqual(encode.call_count, 3)
+
+        cache.get(resources[0])
+        self.assertEqual(encode.call_count, 3)
+        cache.get(resources[1])
+        self.assertEqual(encode.call_count, 4)
+
+        cache.clear()
+        cache.get(resources[0])
+        self.assertEqual(encode.call_count, 5)
+
+
+class TestGroupByResourceAndScope(unittest.TestCase):
+    def test_equal_resources_merged(self):
+        scope = InstrumentationScope("scope")
+        first = Mock(resource=Resource({"a": 1}), instrumentation_scope=scope)
+        second = Mock(resource=Resource({"b": 2}), instrumentation_scope=None)
+        third = Mock(resource=Resource({"a": 1}), instrumentation_scope=scope)
+
+        groups = _group_by_resource_and_scope([first, second, third])
+
+        self.assertEqual(
+            groups,
+            {
+                Resource({"a": 1}): {scope: [first, third]},
+                Resource({"b": 2}): {None: [second]},
+            },
+        )
@@ -0,0 +1,124 @@
+# Copyright The OpenTelemetry Authors
+# SPDX-License-Identifier: Apache-2.0
+
+import os
+import tempfile
+import unittest
+
+from opentelemetry.exporter.otlp.proto.common._spool import DiskSpool
+
+
+class TestDiskSpool(unittest.TestCase):
+    def setUp(self):
+        self._tmp_dir = tempfile.TemporaryDirectory()
+        self.directory = self._tmp_dir.name
+
+    def tearDown(self):
+        self._tmp_dir.cleanup()
+
+    def _drain(self, spool):
+        payloads = []
+        while (payload := spool.peek()) is not None:
+            payloads.append(payload)
+            spool.commit()
+        return payloads
+
+    def test_replays_oldest_first(self):
+        spool = DiskSpool(self.directory, segment_bytes=32)
+        for index in range(5):
+            self.assertTrue(spool.append(f"payload{index}".encode()))
+        self.assertEqual(spool.peek(), b"payload0")
+        # Peeking without committing returns the same payload again.
+        self.assertEqual(spool.peek(), b"payload0")
+        self.assertEqual(
+            self._drain(spool), [f"payload{i}".encode() for i in range(5)]
+        )
+        self.assertEqual(len(spool), 0)
+        self.assertFalse(
+            any(name.endswith(".seg") for name in os.listdir(self.directory))
+        )
+        spool.append(b"next")
+        self.assertEqual(self._drain(spool), [b"next"])
+
+    def test_survives_restart(self):
+        spool = DiskSpool(self.directory, segment_bytes=32)
+        for index in range(4):
+            spool.append(f"payload{index}".encode())
+        spool.peek()
+        spool.commit()
+        spool = DiskSpool(self.directory, segment_bytes=32)
+        self.assertEqual(
+            self._drain(spool), [f"payload{i}".encode() for i in range(1, 4)]
+        )
+
+    def test_evicts_oldest_segments(self):
+        # Every record takes 16 bytes, so every segment holds 2 records.
+        spool = DiskSpool(self.directory, max_bytes=64, segment_bytes=32)
+        for index in range(10):
+            spool.append(f"payload{index}".encode())
+        self.assertLessEqual(len(spool), 64)
+        self.assertEqual(
+            self._drain(spool), [f"payload{i}".encode() for i in range(6, 10)]
+        )
+
+    def test_rejects_payload_bigger_than_segment(self):
+        spool = DiskSpool(self.directory, segment_bytes=32)
+        with self.assertLogs(level="WARNING"):
+            self.assertFalse(spool.append(b"x" * 32))
+        self.assertIsNone(spool.peek())
+
+    def test_truncates_partial_record(self):
+        spool = DiskSpool(self.directory)
+        spool.append(b"complete")
+        spool.append(b"partial")
+        (segment,) = [
+            name
+            for name in os.listdir(self.directory)
+            if name.endswith(".seg")
+        ]
+        path = os.path.join(self.directory, segment)
+        os.truncate(path, os.path.getsize(path) - 3)
+        spool = DiskSpool(self.directory)
+        spool.append(b"after restart")
+        self.assertEqual(self._drain(spool), [b"complete", b"after restart"])
+
+    def test_replay_is_reserved_to_one_sender(self):
+        spool = DiskSpool(self.directory)
+        spool.append(b"payload")
+        self.assertTrue(spool.acquire_replay())
+        self.assertFalse(spool.acquire_replay())
+        spool.release_replay()
+        self.assertTrue(spool.acquire_replay())
+        spool.release_replay()
+
+    def _corrupt_record(self, segment_name, offset):
+        path = os.path.join(self.directory, segment_name)
+        with open(path, "r+b") as segment_file:
+            # Flips the first payload byte, after the 8 bytes of header.
+            segment_file.seek(offset + 8)
+            byte = segment_file.read(1)
+            segment_file.seek(offset + 8)
+            segment_file.write(bytes([byte[0] ^ 0xFF]))
+
+    def test_skips_corrupted_records(self):
+        # Every record takes 16 bytes, so every segment holds 2 records.
+        spool = DiskSpool(self.directory, segment_bytes=32)
+        for index in range(6):
+            spool.append(f"payload{index}".encode())
+        segments = sorted(
+            name
+            for name in os.listdir(self.directory)
+            if name.endswith(".seg")
+        )
+        # The records following them in the same segment are still replayed,
+        # and the newest segment is not stuck on its corrupted record.
+        self._corrupt_record(segments[0], 0)
+        self._corrupt_record(segments[-1], 0)
+        spool = DiskSpool(self.directory, segment_bytes=32)
+        with self.assertLogs(level="WARNING"):
+            self.assertEqual(
+                self._drain(spool),
+                [b"payload1", b"payload2", b"payload3", b"payload5"],
+            )
+        spool.append(b"next")
+        self.assertEqual(self._drain(spool), [b"next"])
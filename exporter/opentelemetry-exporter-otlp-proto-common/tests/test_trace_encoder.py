@@ -13,7 +13,10 @@ from opentelemetry.exporter.otlp.proto.common._internal.trace_encoder import (
     _SPAN_KIND_MAP,
     _encode_status,
 )
-from opentelemetry.exporter.otlp.proto.common.trace_encoder import encode_spans
+from opentelemetry.exporter.otlp.proto.common.trace_encoder import (
+    encode_spans,
+    encode_spans_to_bytes,
+)
 from opentelemetry.proto.collector.trace.v1.trace_service_pb2 import (
     ExportTraceServiceRequest as PB2ExportTraceServiceRequest,
 )
@@ -50,6 +53,49 @@ class TestOTLPTraceEncoder(unittest.TestCase):
         otel_spans, expected_encoding = self.get_exhaustive_test_spans()
         self.assertEqual(encode_spans(otel_spans), expected_encoding)
 
+    def test_encode_spans_to_bytes(self):
+        otel_spans = self.get_exhaustive_otel_span_list()
+        self.assertEqual(
+            encode_spans_to_bytes(otel_spans),
+            encode_spans(otel_spans).SerializePartialToString(),
+        )
+        self.assertEqual(encode_spans_to_bytes([]), b"")
+
+    def test_encode_spans_to_bytes_attribute_values(self):
+        span = SDKSpan(
+            "attributes",
+            SDKSpanContext(1, 2, is_remote=False),
+            resource=SDKResource({"service.name": "svc"}, "resource_schema"),
+            instrumentation_scope=SDKInstrumentationScope(
+                "scope", None, "scope_schema", {"scope_key": 1}
+            ),
+        )
+        span.start(start_time=1)
+        span.end(end_time=2)
+        # The attributes are set after ending the span to include values
+        # that the SDK does not accept but that the encoders handle.
+        span._attributes = {
+            "false": False,
+            "zero": 0,
+            "negative": -5,
+            "int64_max": 2**63 - 1,
+            "too_large": 2**64,
+            "double": -1.5,
+            "empty": "",
+            "unicode": "h\u00e9llo",
+            "long": "x" * 300,
+            "bytes": b"\x00\x01",
+            "sequence": (1, 2, 3),
+            "empty_sequence": [],
+            "mapping": {"key": {"nested": [True]}},
+            "invalid": object(),
+            "": "empty key",
+        }
+        with self.assertLogs(level="ERROR"):
+            expected = encode_spans([span]).SerializePartialToString()
+        with self.assertLogs(level="ERROR"):
+            self.assertEqual(encode_spans_to_bytes([span]), expected)
+
     @staticmethod
     def get_exhaustive_otel_span_list() -> list[SDKSpan]:
         trace_id = 0x3E0C63257DE34C926F9EFCD03927272E
@@ -8,6 +8,7 @@ from typing import Literal
 
 from grpc import ChannelCredentials, Compression, StatusCode
 from opentelemetry.exporter.otlp.proto.common._log_encoder import encode_logs
+from opentelemetry.exporter.otlp.proto.common._spool import DiskSpool
 from opentelemetry.exporter.otlp.proto.grpc.exporter import (
     OTLPExporterMixin,
     _get_credentials,
@@ -65,6 +66,7 @@ class OTLPLogExporter(
         retryable_error_codes: Iterable[StatusCode] | None = None,
         *,
         meter_provider: MeterProvider | None = None,
+        spool: DiskSpool | None = None,
     ):
         insecure_logs = environ.get(OTEL_EXPORTER_OTLP_LOGS_INSECURE)
         if insecure is None and insecure_logs is not None:
@@ -108,6 +110,7 @@ class OTLPLogExporter(
             component_type=OtelComponentTypeValues.OTLP_GRPC_LOG_EXPORTER,
             signal="logs",
             meter_provider=meter_provider,
+            spool=spool,
         )
 
     def _translate_data(
@@ -121,8 +124,9 @@ class OTLPLogExporter(
     def export(  # type: ignore [reportIncompatibleMethodOverride]
         self,
         batch: Sequence[ReadableLogRecord],
+        timeout_millis: float | None = None,
     ) -> Literal[LogRecordExportResult.SUCCESS, LogRecordExportResult.FAILURE]:
-        return OTLPExporterMixin._export(self, batch)
+        return OTLPExporterMixin._export(self, batch, timeout_millis)
 
     def shutdown(self, timeout_millis: float = 30_000, **kwargs) -> None:
         OTLPExporterMixin.shutdown(self, timeout_millis=timeout_millis)
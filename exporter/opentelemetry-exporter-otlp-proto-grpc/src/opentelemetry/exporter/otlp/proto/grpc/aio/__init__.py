@@ -0,0 +1,312 @@
+# Copyright The OpenTelemetry Authors
+# SPDX-License-Identifier: Apache-2.0
+
+"""OTLP gRPC exporters for asyncio applications.
+
+The exporters of this module are configured like their counterparts of the
+``trace_exporter``, ``metric_exporter`` and ``_log_exporter`` modules, but
+``export`` and ``shutdown`` are coroutines sending the requests through a
+``grpc.aio`` channel, so exporting never blocks the event loop. Telemetry is
+encoded, and requests are spooled, in threads of the loop's default
+executor.
+
+They are meant to be used with the asyncio processors and readers of the
+SDK, which retry failed exports the same way as the blocking exporters.
+
+.. code:: python
+
+    from opentelemetry.exporter.otlp.proto.grpc.aio import OTLPSpanExporter
+    from opentelemetry.sdk.trace.export import AsyncBatchSpanProcessor
+
+    async def main():
+        tracer_provider.add_span_processor(
+            AsyncBatchSpanProcessor(OTLPSpanExporter(insecure=True))
+        )
+"""
+
+from __future__ import annotations
+
+import asyncio
+import concurrent.futures
+from collections.abc import Sequence
+from logging import getLogger
+from time import time
+from typing import Literal
+
+from google.protobuf.message import DecodeError
+
+from grpc import RpcError, StatusCode
+from grpc.aio import insecure_channel, secure_channel
+from opentelemetry.exporter.otlp.proto.grpc import _log_exporter
+from opentelemetry.exporter.otlp.proto.grpc import (
+    metric_exporter as _metric_exporter,
+)
+from opentelemetry.exporter.otlp.proto.grpc import (
+    trace_exporter as _trace_exporter,
+)
+from opentelemetry.exporter.otlp.proto.grpc.exporter import _MAX_RETRYS
+from opentelemetry.sdk._logs import ReadableLogRecord
+from opentelemetry.sdk._logs.export import LogRecordExportResult
+from opentelemetry.sdk._shared_internal import DuplicateFilter
+from opentelemetry.sdk.metrics.export import MetricExportResult, MetricsData
+from opentelemetry.sdk.trace import ReadableSpan
+from opentelemetry.sdk.trace.export import SpanExportResult
+
+logger = getLogger(__name__)
+logger.addFilter(DuplicateFilter())
+
+
+class _AsyncOTLPExporterMixin:
+    """Sends the requests built by ``OTLPExporterMixin`` through a
+    ``grpc.aio`` channel, with the same retries, backoff and ``RetryInfo``
+    handling as ``OTLPExporterMixin._export``."""
+
+    def _initialize_channel_and_stub(self):
+        # Channels belong to the event loop they are created from, they are
+        # created by the first export made from each loop.
+        self._channel = None
+        self._client = None
+        self._channel_loop: asyncio.AbstractEventLoop | None = None
+        # Interrupts the backoff between retries on shutdown.
+        self._shutdown_event: asyncio.Event | None = None
+
+    def _connect(self) -> None:
+        loop = asyncio.get_running_loop()
+        if self._channel_loop is loop and self._channel is not None:
+            return
+        if self._channel_loop is not loop:
+            self._close_channel()
+        self._channel_loop = loop
+        self._shutdown_event = asyncio.Event()
+        if self._insecure:
+            self._channel = insecure_channel(
+                self._endpoint,
+                compression=self._compression,
+                options=self._channel_options,
+            )
+        else:
+            assert self._credentials is not None
+            self._channel = secure_channel(
+                self._endpoint,
+                self._credentials,
+                compression=self._compression,
+                options=self._channel_options,
+            )
+        self._client = self._stub(self._channel)
+
+    def _close_channel(self) -> concurrent.futures.Future[None] | None:
+        """Schedules closing the channel on the event loop it belongs to,
+        when exporting from or shutting down in another loop.
+
+        Returns the future of the close, or None if there is no channel to
+        close. The channel of a closed loop cannot be closed anymore."""
+        channel, loop = self._channel, self._channel_loop
+        if channel is None or loop.is_closed():  # type: ignore[union-attr]
+            return None
+        return asyncio.run_coroutine_threadsafe(channel.close(), loop)  # type: ignore[arg-type]
+
+    async def _reinitialize_channel_async(self) -> None:
+        logger.debug(
+            "Reinitializing gRPC channel for %s exporter due to UNAVAILABLE error",
+            self._exporting,
+        )
+        try:
+            await self._channel.close()
+        except Exception as e:  # pylint: disable=broad-exception-caught
+            logger.debug(
+                "Error closing channel for %s exporter to %s: %s",
+                self._exporting,
+                self._endpoint,
+                str(e),
+            )
+        self._channel = None
+        self._connect()
+
+    async def _export_async(self, data, timeout_millis: float | None = None):
+        if self._shutdown:
+            logger.warning("Exporter already shutdown, ignoring batch")
+            return self._result.FAILURE
+        # Encoding holds the GIL for a while, from a thread the event loop
+        # keeps running in between.
+        request = await asyncio.to_thread(self._prepare_export, data)
+        return await self._export_prepared_async(
+            request, self._count_data(data), timeout_millis
+        )
+
+    async def _export_prepared_async(
+        self, request, count: int, timeout_millis: float | None = None
+    ):
+        if self._shutdown:
+            logger.warning("Exporter already shutdown, ignoring batch")
+            return self._result.FAILURE
+
+        with self._metrics.export_operation(count) as result:
+            timeout_sec = self._timeout
+            if timeout_millis is not None:
+                timeout_sec = min(timeout_sec, timeout_millis / 1e3)
+            deadline_sec = time() + timeout_sec
+            self._connect()
+            for retry_num in range(_MAX_RETRYS):
+                try:
+                    await self._client.Export(
+                        request=request,
+                        metadata=self._headers,
+                        timeout=deadline_sec - time(),
+                    )
+                    if self._spool is not None:
+                        await self._replay_spool_async(
+                            type(request), deadline_sec
+                        )
+                    return self._result.SUCCESS
+                except RpcError as error:
+                    # For UNAVAILABLE errors, reinitialize the channel to force reconnection
+                    if (
+                        error.code() == StatusCode.UNAVAILABLE
+                        and retry_num == 0
+                    ):
+                        await self._reinitialize_channel_async()
+                    backoff_seconds = self._retry_backoff(
+                        error, retry_num, deadline_sec, result
+                    )
+                    if backoff_seconds is None:
+                        if error.code() in self._retryable_error_codes:
+                            await asyncio.to_thread(
+                                self._spool_request, request
+                            )
+                        return self._result.FAILURE
+                try:
+                    await asyncio.wait_for(
+                        self._shutdown_event.wait(), backoff_seconds
+                    )
+                except asyncio.TimeoutError:
+                    continue
+                logger.warning("Shutdown in progress, aborting retry.")
+                break
+            await asyncio.to_thread(self._spool_request, request)
+            return self._result.FAILURE
+
+    async def _replay_spool_async(self, request_type, deadline_sec: float):
+        # Sends the requests spooled during an outage, oldest first, until one
+        # of them fails with a retryable error or the deadline passes. Only
+        # one concurrent export replays the spool.
+        if not self._spool.acquire_replay():
+            return
+        try:
+            while deadline_sec > time():
+                # Reading the spool and decoding the request block, so they
+                # happen in the default executor.
+                payload = await asyncio.to_thread(self._spool.peek)
+                if payload is None:
+                    return
+                try:
+                    request = (
+                        payload
+                        if request_type is bytes
+                        else await asyncio.to_thread(
+                            request_type.FromString, payload
+                        )
+                    )
+                    if (timeout_sec := deadline_sec - time()) <= 0:
+                        return
+                    await self._client.Export(
+                        request=request,
+                        metadata=self._headers,
+                        timeout=timeout_sec,
+                    )
+                except DecodeError:
+                    logger.warning("Dropping unreadable spooled request.")
+                except RpcError as error:
+                    if error.code() in self._retryable_error_codes:
+                        return
+                    # Requests rejected for good are dropped, they would never
+                    # succeed.
+                await asyncio.to_thread(self._spool.commit)
+        finally:
+            self._spool.release_replay()
+
+    async def shutdown(self, timeout_millis: float = 30_000, **kwargs) -> None:
+        """
+        Shut down the exporter.
+
+        Args:
+            timeout_millis: Timeout in milliseconds for shutting down the exporter.
+        """
+        if self._shutdown:
+            logger.warning("Exporter already shutdown, ignoring call")
+            return
+        self._shutdown = True
+        self._shutdown_in_progress.set()
+        loop = self._channel_loop
+        if loop is None:
+            return
+        if loop is asyncio.get_running_loop():
+            self._shutdown_event.set()
+            await self._channel.close()
+            return
+        # The channel and the backoffs belong to another event loop.
+        if not loop.is_closed():
+            loop.call_soon_threadsafe(self._shutdown_event.set)
+        close = self._close_channel()
+        if close is not None and loop.is_running():
+            try:
+                await asyncio.wait_for(
+                    asyncio.wrap_future(close), timeout_millis / 1e3
+                )
+            except asyncio.TimeoutError:
+                logger.warning("Timed out while closing the channel")
+
+
+class OTLPSpanExporter(
+    _AsyncOTLPExporterMixin, _trace_exporter.OTLPSpanExporter
+):
+    """Asyncio OTLP span exporter, see
+    :class:`~opentelemetry.exporter.otlp.proto.grpc.trace_exporter.OTLPSpanExporter`
+    for its arguments."""
+
+    async def export(
+        self,
+        spans: Sequence[ReadableSpan],
+        timeout_millis: float | None = None,
+    ) -> SpanExportResult:
+        return await self._export_async(spans, timeout_millis)
+
+
+class OTLPMetricExporter(
+    _AsyncOTLPExporterMixin, _metric_exporter.OTLPMetricExporter
+):
+    """Asyncio OTLP metric exporter, see
+    :class:`~opentelemetry.exporter.otlp.proto.grpc.metric_exporter.OTLPMetricExporter`
+    for its arguments."""
+
+    async def export(
+        self,
+        metrics_data: MetricsData,
+        timeout_millis: float = 10_000,
+        **kwargs,
+    ) -> MetricExportResult:
+        if self._max_export_batch_size is None:
+            return await self._export_async(metrics_data, timeout_millis)
+
+        export_result = MetricExportResult.SUCCESS
+        deadline_sec = time() + timeout_millis / 1e3
+        for split_metrics_data in self._split_metrics_data(metrics_data):
+            split_export_result = await self._export_async(
+                split_metrics_data, max(0, (deadline_sec - time()) * 1e3)
+            )
+
+            if split_export_result is MetricExportResult.FAILURE:
+                export_result = MetricExportResult.FAILURE
+        return export_result
+
+
+class OTLPLogExporter(_AsyncOTLPExporterMixin, _log_exporter.OTLPLogExporter):
+    """Asyncio OTLP log exporter, see
+    :class:`~opentelemetry.exporter.otlp.proto.grpc._log_exporter.OTLPLogExporter`
+    for its arguments."""
+
+    async def export(  # type: ignore [reportIncompatibleMethodOverride]
+        self,
+        batch: Sequence[ReadableLogRecord],
+        timeout_millis: float | None = None,
+    ) -> Literal[LogRecordExportResult.SUCCESS, LogRecordExportResult.FAILURE]:
+        return await self._export_async(batch, timeout_millis)
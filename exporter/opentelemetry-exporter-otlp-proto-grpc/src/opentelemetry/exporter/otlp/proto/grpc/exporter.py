@@ -33,6 +33,7 @@ from typing import (  # noqa: F401
 )
 from urllib.parse import urlparse
 
+from google.protobuf.message import DecodeError
 from google.rpc.error_details_pb2 import RetryInfo
 from typing_extensions import deprecated
 
@@ -51,6 +52,7 @@ from opentelemetry.exporter.otlp.proto.common._exporter_metrics import (
 from opentelemetry.exporter.otlp.proto.common._internal import (
     _get_resource_data,
 )
+from opentelemetry.exporter.otlp.proto.common._spool import DiskSpool
 from opentelemetry.exporter.otlp.proto.grpc import (
     _OTLP_GRPC_CHANNEL_OPTIONS,
 )
@@ -283,6 +285,8 @@ class OTLPExporterMixin(
         timeout: Backend request timeout in seconds
         compression: gRPC compression method to use
         channel_options: gRPC channel options
+        spool: Spool keeping the requests that could not be delivered, they
+            are sent again after the next successful export
     """
 
     def __init__(
@@ -304,9 +308,11 @@ class OTLPExporterMixin(
         component_type: OtelComponentTypeValues | None = None,
         signal: Literal["traces", "metrics", "logs"] = "traces",
         meter_provider: MeterProvider | None = None,
+        spool: DiskSpool | None = None,
     ):
         super().__init__()
         self._result = result
+        self._spool = spool
         self._stub = stub
         self._endpoint = endpoint or environ.get(
             OTEL_EXPORTER_OTLP_ENDPOINT, "http://localhost:4317"
@@ -446,99 +452,190 @@ class OTLPExporterMixin(
     ) -> int:
         pass
 
+    def _prepare_export(self, data: SDKDataT) -> ExportServiceRequestT:
+        return self._translate_data(data)
+
     def _export(
         self,
         data: SDKDataT,
+        timeout_millis: float | None = None,
     ) -> ExportResultT:
         if self._shutdown:
             logger.warning("Exporter already shutdown, ignoring batch")
             return self._result.FAILURE  # type: ignore [reportReturnType]
+        return self._export_prepared(
+            self._prepare_export(data), self._count_data(data), timeout_millis
+        )
 
-        with self._metrics.export_operation(self._count_data(data)) as result:
+    def _export_prepared(
+        self,
+        request: ExportServiceRequestT,
+        count: int,
+        timeout_millis: float | None = None,
+    ) -> ExportResultT:
+        if self._shutdown:
+            logger.warning("Exporter already shutdown, ignoring batch")
+            return self._result.FAILURE  # type: ignore [reportReturnType]
+
+        with self._metrics.export_operation(count) as result:
             # FIXME remove this check if the export type for traces
             # gets updated to a class that represents the proto
             # TracesData and use the code below instead.
-            deadline_sec = time() + self._timeout
+            timeout_sec = self._timeout
+            if timeout_millis is not None:
+                timeout_sec = min(timeout_sec, timeout_millis / 1e3)
+            deadline_sec = time() + timeout_sec
             for retry_num in range(_MAX_RETRYS):
                 try:
                     if self._client is None:
                         return self._result.FAILURE
                     self._client.Export(
-                        request=self._translate_data(data),
+                        request=request,
                         metadata=self._headers,
                         timeout=deadline_sec - time(),
                     )
+                    if self._spool is not None:
+                        self._replay_spool(type(request), deadline_sec)
                     return self._result.SUCCESS  # type: ignore [reportReturnType]
                 except RpcError as error:
-                    retry_info_bin = dict(error.trailing_metadata()).get(  # type: ignore [reportAttributeAccessIssue]
-                        "google.rpc.retryinfo-bin"  # type: ignore [reportArgumentType]
-                    )
-                    # multiplying by a random number between .8 and 1.2 introduces a +/20% jitter to each backoff.
-                    backoff_seconds = 2**retry_num * random.uniform(0.8, 1.2)
-                    if retry_info_bin is not None:
-                        retry_info = RetryInfo()
-                        retry_info.ParseFromString(retry_info_bin)
-                        backoff_seconds = (
-                            retry_info.retry_delay.seconds
-                            + retry_info.retry_delay.nanos / 1.0e9
-                        )
-
                     # For UNAVAILABLE errors, reinitialize the channel to force reconnection
                     if (
                         error.code() == StatusCode.UNAVAILABLE
                         and retry_num == 0
                     ):  # type: ignore
-                        logger.debug(
-                            "Reinitializing gRPC channel for %s exporter due to UNAVAILABLE error",
-                            self._exporting,
-                        )
-                        try:
-                            if self._channel:
-                                self._channel.close()
-                        except Exception as e:
-                            logger.debug(
-                                "Error closing channel for %s exporter to %s: %s",
-                                self._exporting,
-                                self._endpoint,
-                                str(e),
-                            )
-                        # Enable channel reconnection for subsequent calls
-                        self._initialize_channel_and_stub()
-
-                    if (
-                        error.code() not in self._retryable_error_codes  # type: ignore [reportAttributeAccessIssue]
-                        or retry_num + 1 == _MAX_RETRYS
-                        or backoff_seconds > (deadline_sec - time())
-                        or self._shutdown
-                    ):
-                        logger.error(
-                            "Failed to export %s to %s, error code: %s, error details: %s",
-                            self._exporting,
-                            self._endpoint,
-                            error.code(),  # type: ignore [reportAttributeAccessIssue]
-                            error.details(),
-                            exc_info=error.code() == StatusCode.UNKNOWN,  # type: ignore [reportAttributeAccessIssue]
-                        )
-                        result.error = error
-                        result.error_attrs = {
-                            RPC_RESPONSE_STATUS_CODE: error.code().name
-                        }
-                        return self._result.FAILURE  # type: ignore [reportReturnType]
-                    logger.warning(
-                        "Transient error %s encountered while exporting %s to %s, retrying in %.2fs. Error details: %s",
-                        error.code(),  # type: ignore [reportAttributeAccessIssue]
-                        self._exporting,
-                        self._endpoint,
-                        backoff_seconds,
-                        error.details(),
+                        self._reinitialize_channel()
+                    backoff_seconds = self._retry_backoff(
+                        error, retry_num, deadline_sec, result
                     )
+                    if backoff_seconds is None:
+                        if error.code() in self._retryable_error_codes:  # type: ignore [reportAttributeAccessIssue]
+                            self._spool_request(request)
+                        return self._result.FAILURE  # type: ignore [reportReturnType]
                 shutdown = self._shutdown_in_progress.wait(backoff_seconds)
                 if shutdown:
                     logger.warning("Shutdown in progress, aborting retry.")
                     break
-            # Not possible to reach here but the linter is complaining.
+            self._spool_request(request)
             return self._result.FAILURE  # type: ignore [reportReturnType]
 
+    def _reinitialize_channel(self) -> None:
+        logger.debug(
+            "Reinitializing gRPC channel for %s exporter due to UNAVAILABLE error",
+            self._exporting,
+        )
+        try:
+            if self._channel:
+                self._channel.close()
+        except Exception as e:
+            logger.debug(
+                "Error closing channel for %s exporter to %s: %s",
+                self._exporting,
+                self._endpoint,
+                str(e),
+            )
+        # Enable channel reconnection for subsequent calls
+        self._initialize_channel_and_stub()
+
+    def _retry_backoff(
+        self,
+        error: RpcError,
+        retry_num: int,
+        deadline_sec: float,
+        result,
+    ) -> float | None:
+        """Returns the number of seconds to wait before retrying an export
+        which failed with ``error``, or None, once the failure is recorded in
+        ``result``, if the export must not be retried. Requests failing with
+        a retryable error are then spooled by the caller."""
+        retry_info_bin = dict(error.trailing_metadata()).get(  # type: ignore [reportAttributeAccessIssue]
+            "google.rpc.retryinfo-bin"  # type: ignore [reportArgumentType]
+        )
+        # multiplying by a random number between .8 and 1.2 introduces a +/20% jitter to each backoff.
+        backoff_seconds = 2**retry_num * random.uniform(0.8, 1.2)
+        if retry_info_bin is not None:
+            retry_info = RetryInfo()
+            retry_info.ParseFromString(retry_info_bin)
+            backoff_seconds = (
+                retry_info.retry_delay.seconds
+                + retry_info.retry_delay.nanos / 1.0e9
+            )
+
+        if (
+            error.code() not in self._retryable_error_codes  # type: ignore [reportAttributeAccessIssue]
+            or retry_num + 1 == _MAX_RETRYS
+            or backoff_seconds > (deadline_sec - time())
+            or self._shutdown
+        ):
+            logger.error(
+                "Failed to export %s to %s, error code: %s, error details: %s",
+                self._exporting,
+                self._endpoint,
+                error.code(),  # type: ignore [reportAttributeAccessIssue]
+                error.details(),
+                exc_info=error.code() == StatusCode.UNKNOWN,  # type: ignore [reportAttributeAccessIssue]
+            )
+            result.error = error
+            result.error_attrs = {RPC_RESPONSE_STATUS_CODE: error.code().name}
+            return None
+        logger.warning(
+            "Transient error %s encountered while exporting %s to %s, retrying in %.2fs. Error details: %s",
+            error.code(),  # type: ignore [reportAttributeAccessIssue]
+            self._exporting,
+            self._endpoint,
+            backoff_seconds,
+            error.details(),
+        )
+        return backoff_seconds
+
+    def _spool_request(self, request: ExportServiceRequestT) -> None:
+        if self._spool is None:
+            return
+        # Requests encoded directly in the wire format are already bytes.
+        payload = (
+            request
+            if isinstance(request, bytes)
+            else request.SerializeToString()
+        )
+        if self._spool.append(payload):
+            logger.warning(
+                "Spooled %d bytes of %s to send once %s recovers.",
+                len(payload),
+                self._exporting,
+                self._endpoint,
+            )
+
+    def _replay_spool(
+        self, request_type: type[ExportServiceRequestT], deadline_sec: float
+    ) -> None:
+        # Sends the requests spooled during an outage, oldest first, until one
+        # of them fails with a retryable error or the deadline passes. Only
+        # one concurrent export replays the spool.
+        if not self._spool.acquire_replay():
+            return
+        try:
+            while (timeout_sec := deadline_sec - time()) > 0:
+                payload = self._spool.peek()
+                if payload is None:
+                    return
+                try:
+                    self._client.Export(
+                        request=payload
+                        if request_type is bytes
+                        else request_type.FromString(payload),
+                        metadata=self._headers,
+                        timeout=timeout_sec,
+                    )
+                except DecodeError:
+                    logger.warning("Dropping unreadable spooled request.")
+                except RpcError as error:
+                    if error.code() in self._retryable_error_codes:  # type: ignore [reportAttributeAccessIssue]
+                        return
+                    # Requests rejected for good are dropped, they would never
+                    # succeed.
+                self._spool.commit()
+        finally:
+            self._spool.release_replay()
+
     def shutdown(self, timeout_millis: float = 30_000, **kwargs) -> None:
         """
         Shut down the exporter.
@@ -9,8 +9,10 @@ from collections.abc import Sequence as TypingSequence
 from os import environ
 
 from grpc import ChannelCredentials, Compression, StatusCode
+from opentelemetry.exporter.otlp.proto.common._spool import DiskSpool
 from opentelemetry.exporter.otlp.proto.common.trace_encoder import (
     encode_spans,
+    encode_spans_to_bytes,
 )
 from opentelemetry.exporter.otlp.proto.grpc.exporter import (  # noqa: F401
     OTLPExporterMixin,
@@ -21,6 +23,7 @@ from opentelemetry.exporter.otlp.proto.grpc.exporter import (  # noqa: F401
 from opentelemetry.metrics import MeterProvider
 from opentelemetry.proto.collector.trace.v1.trace_service_pb2 import (
     ExportTraceServiceRequest,
+    ExportTraceServiceResponse,
 )
 from opentelemetry.proto.collector.trace.v1.trace_service_pb2_grpc import (
     TraceServiceStub,
@@ -56,6 +59,17 @@ from opentelemetry.semconv._incubating.attributes.otel_attributes import (
 logger = logging.getLogger(__name__)
 
 
+class _SerializedTraceServiceStub:
+    """TraceServiceStub sending requests that are already serialized."""
+
+    def __init__(self, channel):
+        # Without a request serializer the request bytes are sent as they are.
+        self.Export = channel.unary_unary(
+            "/opentelemetry.proto.collector.trace.v1.TraceService/Export",
+            response_deserializer=ExportTraceServiceResponse.FromString,
+        )
+
+
 # pylint: disable=no-member
 class OTLPSpanExporter(
     SpanExporter,
@@ -76,6 +90,10 @@ class OTLPSpanExporter(
         headers: Headers to send when exporting
         timeout: Backend request timeout in seconds
         compression: gRPC compression method to use
+        spool: Spool keeping the spans that could not be delivered, they are
+            sent again after the next successful export
+        direct_encoding: Write the spans directly in the protobuf wire
+            format instead of building the protobuf messages first
     """
 
     def __init__(
@@ -93,7 +111,10 @@ class OTLPSpanExporter(
         retryable_error_codes: Iterable[StatusCode] | None = None,
         *,
         meter_provider: MeterProvider | None = None,
+        spool: DiskSpool | None = None,
+        direct_encoding: bool = False,
     ):
+        self._direct_encoding = direct_encoding
         insecure_spans = environ.get(OTEL_EXPORTER_OTLP_TRACES_INSECURE)
         if insecure is None and insecure_spans is not None:
             insecure = insecure_spans.lower() == "true"
@@ -123,7 +144,9 @@ class OTLPSpanExporter(
 
         OTLPExporterMixin.__init__(
             self,
-            stub=TraceServiceStub,
+            stub=_SerializedTraceServiceStub
+            if direct_encoding
+            else TraceServiceStub,
             result=SpanExportResult,
             endpoint=endpoint
             or environ.get(OTEL_EXPORTER_OTLP_TRACES_ENDPOINT),
@@ -137,18 +160,25 @@ class OTLPSpanExporter(
             component_type=OtelComponentTypeValues.OTLP_GRPC_SPAN_EXPORTER,
             signal="traces",
             meter_provider=meter_provider,
+            spool=spool,
         )
 
     def _translate_data(
         self, data: Sequence[ReadableSpan]
-    ) -> ExportTraceServiceRequest:
+    ) -> ExportTraceServiceRequest | bytes:
+        if self._direct_encoding:
+            return encode_spans_to_bytes(data)
         return encode_spans(data)
 
     def _count_data(self, data: Sequence[ReadableSpan]):
         return len(data)
 
-    def export(self, spans: Sequence[ReadableSpan]) -> SpanExportResult:
-        return self._export(spans)
+    def export(
+        self,
+        spans: Sequence[ReadableSpan],
+        timeout_millis: float | None = None,
+    ) -> SpanExportResult:
+        return self._export(spans, timeout_millis)
 
     def shutdown(self, timeout_millis: float = 30_000, **kwargs) -> None:
         OTLPExporterMixin.shutdown(self, timeout_millis=timeout_millis)
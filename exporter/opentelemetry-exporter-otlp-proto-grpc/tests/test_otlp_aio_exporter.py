@@ -0,0 +1,319 @@
+# Copyright The OpenTelemetry Authors
+# SPDX-License-Identifier: Apache-2.0
+
+# pylint: disable=protected-access,invalid-name
+import asyncio
+import tempfile
+import threading
+import time
+from unittest import IsolatedAsyncioTestCase
+from unittest.mock import patch
+
+from google.protobuf.duration_pb2 import (  # pylint: disable=no-name-in-module
+    Duration,
+)
+from google.rpc.error_details_pb2 import (  # pylint: disable=no-name-in-module
+    RetryInfo,
+)
+from grpc import StatusCode, aio
+
+from opentelemetry._logs import LogRecord
+from opentelemetry.exporter.otlp.proto.common._spool import DiskSpool
+from opentelemetry.exporter.otlp.proto.grpc.aio import (
+    OTLPLogExporter,
+    OTLPMetricExporter,
+    OTLPSpanExporter,
+)
+from opentelemetry.proto.collector.logs.v1.logs_service_pb2 import (
+    ExportLogsServiceResponse,
+)
+from opentelemetry.proto.collector.logs.v1.logs_service_pb2_grpc import (
+    LogsServiceServicer,
+    add_LogsServiceServicer_to_server,
+)
+from opentelemetry.proto.collector.metrics.v1.metrics_service_pb2 import (
+    ExportMetricsServiceResponse,
+)
+from opentelemetry.proto.collector.metrics.v1.metrics_service_pb2_grpc import (
+    MetricsServiceServicer,
+    add_MetricsServiceServicer_to_server,
+)
+from opentelemetry.proto.collector.trace.v1.trace_service_pb2 import (
+    ExportTraceServiceResponse,
+)
+from opentelemetry.proto.collector.trace.v1.trace_service_pb2_grpc import (
+    TraceServiceServicer,
+    add_TraceServiceServicer_to_server,
+)
+from opentelemetry.sdk._logs import ReadableLogRecord
+from opentelemetry.sdk._logs.export import LogRecordExportResult
+from opentelemetry.sdk.metrics.export import (
+    MetricExportResult,
+    MetricsData,
+    ResourceMetrics,
+)
+from opentelemetry.sdk.resources import Resource
+from opentelemetry.sdk.trace import SpanContext, _Span
+from opentelemetry.sdk.trace.export import (
+    AsyncBatchSpanProcessor,
+    SpanExportResult,
+)
+from opentelemetry.sdk.util.instrumentation import InstrumentationScope
+from opentelemetry.trace import TraceFlags
+
+
+class ServicerForTesting(
+    TraceServiceServicer, MetricsServiceServicer, LogsServiceServicer
+):
+    def __init__(self, response):
+        self.response = response
+        self.requests = []
+        # Status codes returned to the next requests, with the retry delay
+        # sent in their RetryInfo.
+        self.failures: list[tuple[StatusCode, int | None]] = []
+
+    async def Export(self, request, context):
+        self.requests.append(request)
+        if self.failures:
+            code, retry_nanos = self.failures.pop(0)
+            if retry_nanos is not None:
+                context.set_trailing_metadata(
+                    (
+                        (
+                            "google.rpc.retryinfo-bin",
+                            RetryInfo(
+                                retry_delay=Duration(nanos=retry_nanos)
+                            ).SerializeToString(),
+                        ),
+                    )
+                )
+            await context.abort(code, "failure for testing")
+        return self.response
+
+
+def _span():
+    span = _Span(
+        "span",
+        SpanContext(
+            1, 2, is_remote=False, trace_flags=TraceFlags(TraceFlags.SAMPLED)
+        ),
+        resource=Resource({"service.name": "test"}),
+        instrumentation_scope=InstrumentationScope("test"),
+    )
+    span.start(start_time=1)
+    span.end(end_time=2)
+    return span
+
+
+class TestAsyncOTLPExporters(IsolatedAsyncioTestCase):
+    async def asyncSetUp(self):
+        self.server = aio.server()
+        self.trace_servicer = ServicerForTesting(ExportTraceServiceResponse())
+        self.metrics_servicer = ServicerForTesting(
+            ExportMetricsServiceResponse()
+        )
+        self.logs_servicer = ServicerForTesting(ExportLogsServiceResponse())
+        add_TraceServiceServicer_to_server(self.trace_servicer, self.server)
+        add_MetricsServiceServicer_to_server(
+            self.metrics_servicer, self.server
+        )
+        add_LogsServiceServicer_to_server(self.logs_servicer, self.server)
+        port = self.server.add_insecure_port("127.0.0.1:0")
+        self.endpoint = f"127.0.0.1:{port}"
+        await self.server.start()
+
+    async def asyncTearDown(self):
+        await self.server.stop(None)
+
+    async def test_export_spans(self):
+        exporter = OTLPSpanExporter(endpoint=self.endpoint, insecure=True)
+        self.assertEqual(
+            await exporter.export([_span()]), SpanExportResult.SUCCESS
+        )
+        (request,) = self.trace_servicer.requests
+        self.assertEqual(
+            request.resource_spans[0].scope_spans[0].spans[0].name, "span"
+        )
+        await exporter.shutdown()
+        self.assertEqual(
+            await exporter.export([_span()]), SpanExportResult.FAILURE
+        )
+
+    async def test_export_direct_encoding(self):
+        exporter = OTLPSpanExporter(
+            endpoint=self.endpoint, insecure=True, direct_encoding=True
+        )
+        self.assertEqual(
+            await exporter.export([_span()]), SpanExportResult.SUCCESS
+        )
+        self.assertEqual(len(self.trace_servicer.requests), 1)
+        await exporter.shutdown()
+
+    async def test_export_metrics(self):
+        exporter = OTLPMetricExporter(endpoint=self.endpoint, insecure=True)
+        metrics_data = MetricsData(
+            resource_metrics=[
+                ResourceMetrics(
+                    resource=Resource({}), scope_metrics=[], schema_url=""
+                )
+            ]
+        )
+        self.assertEqual(
+            await exporter.export(metrics_data), MetricExportResult.SUCCESS
+        )
+        self.assertEqual(len(self.metrics_servicer.requests), 1)
+        await exporter.shutdown()
+
+    async def test_export_logs(self):
+        exporter = OTLPLogExporter(endpoint=self.endpoint, insecure=True)
+        log_record = ReadableLogRecord(
+            LogRecord(body="message"),
+            resource=Resource({}),
+            instrumentation_scope=InstrumentationScope("test"),
+        )
+        self.assertEqual(
+            await exporter.export([log_record]),
+            LogRecordExportResult.SUCCESS,
+        )
+        (request,) = self.logs_servicer.requests
+        self.assertEqual(
+            request.resource_logs[0]
+            .scope_logs[0]
+            .log_records[0]
+            .body.string_value,
+            "message",
+        )
+        await exporter.shutdown()
+
+    async def test_retry_info_is_honored(self):
+        exporter = OTLPSpanExporter(endpoint=self.endpoint, insecure=True)
+        self.trace_servicer.failures = [
+            (StatusCode.UNAVAILABLE, 100_000_000),
+            (StatusCode.RESOURCE_EXHAUSTED, 100_000_000),
+        ]
+        before = time.time()
+        self.assertEqual(
+            await exporter.export([_span()]), SpanExportResult.SUCCESS
+        )
+        self.assertGreaterEqual(time.time() - before, 0.2)
+        self.assertEqual(len(self.trace_servicer.requests), 3)
+        await exporter.shutdown()
+
+    async def test_backoff_without_retry_info(self):
+        exporter = OTLPSpanExporter(endpoint=self.endpoint, insecure=True)
+        self.trace_servicer.failures = [(StatusCode.ABORTED, None)]
+        before = time.time()
+        with patch("random.uniform", return_value=0.1):
+            self.assertEqual(
+                await exporter.export([_span()]), SpanExportResult.SUCCESS
+            )
+        self.assertLess(time.time() - before, 0.5)
+        self.assertEqual(len(self.trace_servicer.requests), 2)
+        await exporter.shutdown()
+
+    async def test_non_retryable_error(self):
+        exporter = OTLPSpanExporter(endpoint=self.endpoint, insecure=True)
+        self.trace_servicer.failures = [(StatusCode.INVALID_ARGUMENT, None)]
+        self.assertEqual(
+            await exporter.export([_span()]), SpanExportResult.FAILURE
+        )
+        self.assertEqual(len(self.trace_servicer.requests), 1)
+        await exporter.shutdown()
+
+    async def test_backoff_exceeding_timeout_is_not_waited(self):
+        exporter = OTLPSpanExporter(
+            endpoint=self.endpoint, insecure=True, timeout=0.5
+        )
+        self.trace_servicer.failures = [(StatusCode.UNAVAILABLE, None)] * 6
+        before = time.time()
+        self.assertEqual(
+            await exporter.export([_span()]), SpanExportResult.FAILURE
+        )
+        self.assertLess(time.time() - before, 0.5)
+        await exporter.shutdown()
+
+    async def test_shutdown_interrupts_backoff(self):
+        exporter = OTLPSpanExporter(endpoint=self.endpoint, insecure=True)
+        self.trace_servicer.failures = [(StatusCode.UNAVAILABLE, None)] * 6
+        export = asyncio.ensure_future(exporter.export([_span()]))
+        await asyncio.sleep(0.2)
+        before = time.time()
+        await exporter.shutdown()
+        self.assertEqual(await export, SpanExportResult.FAILURE)
+        self.assertLess(time.time() - before, 0.5)
+
+    async def test_spool_is_not_read_by_event_loop(self):
+        threads = []
+
+        def record_thread(method):
+            def wrapper(*args):
+                threads.append(threading.current_thread())
+                return method(*args)
+
+            return wrapper
+
+        with tempfile.TemporaryDirectory() as directory:
+            spool = DiskSpool(directory)
+            for name in ("append", "peek", "commit"):
+                setattr(spool, name, record_thread(getattr(spool, name)))
+            # The backoff is longer than the timeout, so there is no retry.
+            exporter = OTLPSpanExporter(
+                endpoint=self.endpoint, insecure=True, timeout=0.5, spool=spool
+            )
+            self.trace_servicer.failures = [(StatusCode.UNAVAILABLE, None)]
+            self.assertEqual(
+                await exporter.export([_span()]), SpanExportResult.FAILURE
+            )
+            self.assertEqual(
+                await exporter.export([_span()]), SpanExportResult.SUCCESS
+            )
+            self.assertEqual(len(self.trace_servicer.requests), 3)
+            await exporter.shutdown()
+        # Appended, peeked and committed, then peeked again.
+        self.assertEqual(len(threads), 4)
+        self.assertNotIn(threading.current_thread(), threads)
+
+    def _start_other_loop(self):
+        other_loop = asyncio.new_event_loop()
+        thread = threading.Thread(target=other_loop.run_forever)
+        thread.start()
+
+        def stop():
+            other_loop.call_soon_threadsafe(other_loop.stop)
+            thread.join()
+            other_loop.close()
+
+        self.addCleanup(stop)
+        return other_loop
+
+    async def test_shutdown_from_another_loop(self):
+        exporter = OTLPSpanExporter(endpoint=self.endpoint, insecure=True)
+        self.trace_servicer.failures = [(StatusCode.UNAVAILABLE, None)] * 6
+        other_loop = self._start_other_loop()
+        export = asyncio.run_coroutine_threadsafe(
+            exporter.export([_span()]), other_loop
+        )
+        await asyncio.sleep(0.2)
+        channel = exporter._channel
+        before = time.time()
+        await exporter.shutdown()
+        # The backoff in the other loop is interrupted and the channel is
+        # closed there.
+        self.assertEqual(
+            await asyncio.wrap_future(export), SpanExportResult.FAILURE
+        )
+        self.assertLess(time.time() - before, 0.5)
+        self.assertTrue(channel._channel.closed())
+
+    async def test_batch_processor(self):
+        exporter = OTLPSpanExporter(endpoint=self.endpoint, insecure=True)
+        processor = AsyncBatchSpanProcessor(exporter)
+        for _ in range(3):
+            processor.on_end(_span())
+        self.assertTrue(await processor.force_flush_async())
+        (request,) = self.trace_servicer.requests
+        self.assertEqual(
+            len(request.resource_spans[0].scope_spans[0].spans), 3
+        )
+        await processor.shutdown_async()
+        self.assertTrue(exporter._shutdown)
@@ -1,6 +1,7 @@
 # Copyright The OpenTelemetry Authors
 # SPDX-License-Identifier: Apache-2.0
 
+import tempfile
 import threading
 import time
 import unittest
@@ -23,6 +24,7 @@ from google.rpc.error_details_pb2 import (  # pylint: disable=no-name-in-module
 )
 from grpc import ChannelCredentials, Compression, StatusCode, server
 
+from opentelemetry.exporter.otlp.proto.common._spool import DiskSpool
 from opentelemetry.exporter.otlp.proto.common.trace_encoder import (
     encode_spans,
 )
@@ -609,6 +611,54 @@ class TestOTLPExporterMixin(TestCase):
             self.assertEqual(mock_trace_service.num_requests, 2)
             self.assertAlmostEqual(after - before, 1.4, 1)
 
+    def test_export_timeout_millis_shortens_timeout(self):
+        exporter = OTLPSpanExporterForTesting(insecure=True, timeout=10)
+        with patch.object(exporter._client, "Export") as mock_export:
+            self.assertEqual(
+                exporter._export([self.span], timeout_millis=200),
+                SpanExportResult.SUCCESS,
+            )
+        self.assertAlmostEqual(mock_export.call_args.kwargs["timeout"], 0.2, 2)
+
+    def test_failed_export_is_spooled_and_replayed(self):
+        class ResourceExhaustedError(grpc.RpcError):
+            def code(self):
+                return StatusCode.RESOURCE_EXHAUSTED
+
+            def details(self):
+                return "Resource exhausted."
+
+            def trailing_metadata(self):
+                return ()
+
+        with tempfile.TemporaryDirectory() as directory:
+            spool = DiskSpool(directory)
+            exporter = OTLPSpanExporterForTesting(
+                insecure=True, timeout=0.1, spool=spool
+            )
+            with patch.object(exporter._client, "Export") as mock_export:
+                mock_export.side_effect = ResourceExhaustedError()
+                with self.assertLogs(level=WARNING):
+                    self.assertEqual(
+                        exporter.export([self.span]),
+                        SpanExportResult.FAILURE,
+                    )
+                self.assertEqual(
+                    spool.peek(), encode_spans([self.span]).SerializeToString()
+                )
+
+                mock_export.side_effect = None
+                exporter._timeout = 10
+                self.assertEqual(
+                    exporter.export([self.span]), SpanExportResult.SUCCESS
+                )
+            self.assertEqual(mock_export.call_count, 3)
+            self.assertEqual(
+                mock_export.call_args.kwargs["request"],
+                encode_spans([self.span]),
+            )
+            self.assertIsNone(spool.peek())
+
     def test_channel_options_set_correctly(self):
         """Test that gRPC channel options are set correctly for keepalive and reconnection"""
         # This test verifies that the channel is created with the right options
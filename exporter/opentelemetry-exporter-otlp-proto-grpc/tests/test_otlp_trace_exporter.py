@@ -4,10 +4,11 @@
 # pylint: disable=too-many-lines
 
 import os
+from concurrent.futures import ThreadPoolExecutor
 from unittest import TestCase
 from unittest.mock import Mock, PropertyMock, patch
 
-from grpc import ChannelCredentials, Compression
+from grpc import ChannelCredentials, Compression, server
 
 from opentelemetry.attributes import BoundedAttributes
 from opentelemetry.exporter.otlp.proto.common._internal import (
@@ -19,6 +20,11 @@ from opentelemetry.exporter.otlp.proto.grpc.trace_exporter import (
 from opentelemetry.exporter.otlp.proto.grpc.version import __version__
 from opentelemetry.proto.collector.trace.v1.trace_service_pb2 import (
     ExportTraceServiceRequest,
+    ExportTraceServiceResponse,
+)
+from opentelemetry.proto.collector.trace.v1.trace_service_pb2_grpc import (
+    TraceServiceServicer,
+    add_TraceServiceServicer_to_server,
 )
 from opentelemetry.proto.common.v1.common_pb2 import (
     AnyValue,
@@ -54,6 +60,7 @@ from opentelemetry.sdk.trace import StatusCode as SDKStatusCode
 from opentelemetry.sdk.trace import TracerProvider, _Span
 from opentelemetry.sdk.trace.export import (
     SimpleSpanProcessor,
+    SpanExportResult,
 )
 from opentelemetry.sdk.util.instrumentation import InstrumentationScope
 from opentelemetry.test.spantestutil import (
@@ -779,6 +786,37 @@ class TestOTLPSpanExporter(TestCase):
             .dropped_attributes_count,
         )
 
+    def test_direct_encoding(self):
+        requests = []
+
+        class RecordingTraceServiceServicer(TraceServiceServicer):
+            # pylint: disable=invalid-name,unused-argument
+            def Export(self, request, context):
+                requests.append(request)
+                return ExportTraceServiceResponse()
+
+        grpc_server = server(ThreadPoolExecutor(max_workers=1))
+        add_TraceServiceServicer_to_server(
+            RecordingTraceServiceServicer(), grpc_server
+        )
+        port = grpc_server.add_insecure_port("127.0.0.1:0")
+        grpc_server.start()
+        try:
+            exporter = OTLPSpanExporter(
+                endpoint=f"127.0.0.1:{port}",
+                insecure=True,
+                direct_encoding=True,
+            )
+            spans = [self.span, self.span2, self.span3]
+            # pylint: disable-next=protected-access
+            self.assertIsInstance(exporter._translate_data(spans), bytes)
+            self.assertEqual(exporter.export(spans), SpanExportResult.SUCCESS)
+        finally:
+            grpc_server.stop(None)
+
+        # pylint: disable-next=protected-access
+        self.assertEqual(requests, [self.exporter._translate_data(spans)])
+
 
 def _create_span_with_status(status: SDKStatus):
     span = _Span(
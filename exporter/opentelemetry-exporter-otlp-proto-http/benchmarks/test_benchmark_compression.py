@@ -0,0 +1,87 @@
+# Copyright The OpenTelemetry Authors
+# SPDX-License-Identifier: Apache-2.0
+
+# Compresses the body of a request carrying a default sized batch of spans
+# with each codec at a few levels. The mean time is the CPU cost of the
+# codec, the ratio and throughput are reported in the extra info of each
+# benchmark.
+
+# pylint: disable=invalid-name
+import pytest
+
+from opentelemetry.exporter.otlp.proto.common.trace_encoder import (
+    encode_spans_to_bytes,
+)
+from opentelemetry.exporter.otlp.proto.http import Compression
+from opentelemetry.exporter.otlp.proto.http._common._compression import (
+    _create_compressor,
+)
+from opentelemetry.sdk.resources import Resource
+from opentelemetry.sdk.trace import SpanContext, _Span
+from opentelemetry.sdk.util.instrumentation import InstrumentationScope
+
+try:
+    import zstandard
+except ImportError:
+    zstandard = None
+
+TRACE_ID = 0x3E0C63257DE34C926F9EFCD03927272E
+BATCH_SIZE = 512
+
+resource = Resource({"service.name": "benchmark", "host.name": "benchmark"})
+scope = InstrumentationScope("benchmark_scope", "1.0.0")
+
+
+def _make_span(index):
+    span = _Span(
+        f"span-{index}",
+        SpanContext(TRACE_ID, 0x1000 + index, is_remote=False),
+        parent=SpanContext(TRACE_ID, 0x1000, is_remote=False),
+        resource=resource,
+        attributes={
+            "http.request.method": "GET",
+            "http.response.status_code": 200,
+            "url.full": f"https://example.com/items/{index}",
+            "user_agent.original": "Mozilla/5.0 (X11; Linux x86_64)",
+        },
+        instrumentation_scope=scope,
+    )
+    span.start(start_time=index)
+    span.end(end_time=index + 1000)
+    return span
+
+
+data = encode_spans_to_bytes(
+    [_make_span(index) for index in range(BATCH_SIZE)]
+)
+
+requires_zstandard = pytest.mark.skipif(
+    zstandard is None, reason="zstandard is not installed"
+)
+
+
+@pytest.mark.parametrize(
+    "compression,level",
+    [
+        (Compression.Gzip, 1),
+        (Compression.Gzip, 6),
+        (Compression.Gzip, 9),
+        (Compression.Deflate, 6),
+        pytest.param(Compression.Zstd, 1, marks=requires_zstandard),
+        pytest.param(Compression.Zstd, 3, marks=requires_zstandard),
+    ],
+    ids=["gzip-1", "gzip-6", "gzip-9", "deflate-6", "zstd-1", "zstd-3"],
+)
+@pytest.mark.parametrize("chunked", [False, True], ids=["whole", "chunked"])
+def test_compress(benchmark, compression, level, chunked):
+    compressor = _create_compressor(compression, level)
+    if chunked:
+        compressed = benchmark(
+            lambda: b"".join(compressor.iter_compress(data))
+        )
+    else:
+        compressed = benchmark(compressor.compress, data)
+    benchmark.extra_info["ratio"] = len(data) / len(compressed)
+    benchmark.extra_info["throughput_mb_s"] = (
+        len(data) / benchmark.stats.stats.mean / 1e6
+    )
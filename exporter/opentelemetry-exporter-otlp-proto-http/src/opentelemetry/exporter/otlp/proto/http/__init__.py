@@ -73,3 +73,5 @@ class Compression(enum.Enum):
     NoCompression = "none"
     Deflate = "deflate"
     Gzip = "gzip"
+    # Requires the zstandard package.
+    Zstd = "zstd"
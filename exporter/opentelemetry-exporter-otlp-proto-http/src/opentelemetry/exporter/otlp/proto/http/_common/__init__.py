@@ -1,11 +1,14 @@
 # Copyright The OpenTelemetry Authors
 # SPDX-License-Identifier: Apache-2.0
 
+from collections.abc import Callable
 from os import environ
+from time import time
 from typing import Literal
 
 import requests
 
+from opentelemetry.exporter.otlp.proto.common._spool import DiskSpool
 from opentelemetry.sdk.environment_variables import (
     _OTEL_PYTHON_EXPORTER_OTLP_HTTP_CREDENTIAL_PROVIDER,
 )
@@ -13,13 +16,45 @@ from opentelemetry.util._importlib_metadata import entry_points
 
 
 def _is_retryable(resp: requests.Response) -> bool:
-    if resp.status_code == 408:
+    return _is_retryable_status(resp.status_code)
+
+
+def _is_retryable_status(status_code: int) -> bool:
+    if status_code == 408:
         return True
-    if resp.status_code >= 500 and resp.status_code <= 599:
+    if status_code >= 500 and status_code <= 599:
         return True
     return False
 
 
+def _replay_spool(
+    spool: DiskSpool,
+    export: Callable[[bytes, float], requests.Response],
+    deadline_sec: float,
+) -> None:
+    """Sends the requests spooled during an outage, oldest first, until one
+    of them fails with a retryable error or the deadline passes. Only one
+    concurrent export replays the spool."""
+    if not spool.acquire_replay():
+        return
+    try:
+        while (timeout_sec := deadline_sec - time()) > 0:
+            payload = spool.peek()
+            if payload is None:
+                return
+            try:
+                resp = export(payload, timeout_sec)
+            except requests.exceptions.RequestException:
+                return
+            # Requests rejected for good are dropped, they would never
+            # succeed.
+            if not resp.ok and _is_retryable(resp):
+                return
+            spool.commit()
+    finally:
+        spool.release_replay()
+
+
 def _load_session_from_envvar(
     cred_envvar: Literal[
         "OTEL_PYTHON_EXPORTER_OTLP_HTTP_LOGS_CREDENTIAL_PROVIDER",
@@ -0,0 +1,115 @@
+# Copyright The OpenTelemetry Authors
+# SPDX-License-Identifier: Apache-2.0
+
+"""Compression of the bodies of the requests sent by the OTLP/HTTP
+exporters."""
+
+from __future__ import annotations
+
+import logging
+import threading
+import zlib
+from collections.abc import Callable, Iterator
+from typing import NamedTuple
+
+from opentelemetry.exporter.otlp.proto.http import Compression
+
+try:
+    import zstandard
+except ImportError:
+    zstandard = None
+
+_logger = logging.getLogger(__name__)
+
+# Size of the slices of the request body handed to the compressor when the
+# body is uploaded in chunks.
+_CHUNK_SIZE = 64 * 1024
+
+_ZLIB_WBITS = {Compression.Gzip: 31, Compression.Deflate: 15}
+_DEFAULT_LEVELS = {
+    # The level used by gzip.GzipFile.
+    Compression.Gzip: 9,
+    Compression.Deflate: zlib.Z_DEFAULT_COMPRESSION,
+    Compression.Zstd: 3,
+}
+
+
+class _Compressor:
+    """Compresses request bodies with one of the supported codecs, either at
+    once or in chunks while the request is uploaded."""
+
+    def __init__(self, compression: Compression, level: int | None = None):
+        self.compression = compression
+        self._level = _DEFAULT_LEVELS[compression] if level is None else level
+        self._local = threading.local()
+
+    def _compressobj(self, size: int, reuse_context: bool = True):
+        if self.compression is Compression.Zstd:
+            if not reuse_context:
+                return zstandard.ZstdCompressor(level=self._level).compressobj(
+                    size=size
+                )
+            # Setting up a zstd context is expensive, each thread reuses its
+            # own for all the requests it compresses.
+            context = getattr(self._local, "context", None)
+            if context is None:
+                context = self._local.context = zstandard.ZstdCompressor(
+                    level=self._level
+                )
+            return context.compressobj(size=size)
+        return zlib.compressobj(
+            self._level, zlib.DEFLATED, _ZLIB_WBITS[self.compression]
+        )
+
+    def compress(self, data: bytes) -> bytes:
+        compressobj = self._compressobj(len(data))
+        return compressobj.compress(data) + compressobj.flush()
+
+    def iter_compress(self, data: bytes) -> Iterator[bytes]:
+        # The chunks may be compressed by different threads, interleaved with
+        # other requests, so the zstd context of a thread is not reused.
+        compressobj = self._compressobj(len(data), reuse_context=False)
+        view = memoryview(data)
+        for start in range(0, len(view), _CHUNK_SIZE):
+            chunk = compressobj.compress(view[start : start + _CHUNK_SIZE])
+            if chunk:
+                yield chunk
+        yield compressobj.flush()
+
+
+def _create_compressor(
+    compression: Compression, level: int | None = None
+) -> _Compressor | None:
+    if compression is Compression.NoCompression:
+        return None
+    if compression is Compression.Zstd and zstandard is None:
+        _logger.warning(
+            "zstd compression requires the zstandard package, "
+            "requests are sent uncompressed."
+        )
+        return None
+    return _Compressor(compression, level)
+
+
+def _request_body(
+    compressor: _Compressor | None, serialized_data: bytes, chunked: bool
+) -> Callable[[], bytes | Iterator[bytes]]:
+    """Returns a function creating the body of a request, called again for
+    each attempt to send it.
+
+    Chunked bodies are compressed while they are uploaded, so the whole
+    compressed body is never held in memory."""
+    if compressor is None:
+        return lambda: serialized_data
+    if chunked:
+        return lambda: compressor.iter_compress(serialized_data)
+    data = compressor.compress(serialized_data)
+    return lambda: data
+
+
+class _PreparedRequest(NamedTuple):
+    """A request encoded ahead of being sent. The serialized data is what
+    gets spooled, the body is what gets posted."""
+
+    serialized_data: bytes
+    body: Callable[[], bytes | Iterator[bytes]]
@@ -0,0 +1,443 @@
+# Copyright The OpenTelemetry Authors
+# SPDX-License-Identifier: Apache-2.0
+
+"""OTLP HTTP exporters for asyncio applications.
+
+The exporters of this module are configured like their counterparts of the
+``trace_exporter``, ``metric_exporter`` and ``_log_exporter`` modules, but
+``export`` and ``shutdown`` are coroutines posting the requests with
+`aiohttp`_, so exporting never blocks the event loop. Telemetry is encoded
+and compressed, and requests are spooled, in threads of the loop's default
+executor. Only the headers of a ``session`` passed to them are used.
+
+They require the ``asyncio`` extra of this package and are meant to be used
+with the asyncio processors and readers of the SDK.
+
+.. _aiohttp: https://docs.aiohttp.org/
+
+.. code:: python
+
+    from opentelemetry.exporter.otlp.proto.http.aio import OTLPSpanExporter
+    from opentelemetry.sdk.trace.export import AsyncBatchSpanProcessor
+
+    async def main():
+        tracer_provider.add_span_processor(
+            AsyncBatchSpanProcessor(OTLPSpanExporter())
+        )
+"""
+
+from __future__ import annotations
+
+import asyncio
+import concurrent.futures
+import logging
+import random
+import ssl
+from collections.abc import AsyncIterator, Callable, Iterator, Sequence
+from time import time
+from typing import Literal
+
+import aiohttp
+
+from opentelemetry.exporter.otlp.proto.common.metrics_encoder import (
+    encode_metrics,
+)
+from opentelemetry.exporter.otlp.proto.http import _log_exporter
+from opentelemetry.exporter.otlp.proto.http import (
+    metric_exporter as _metric_exporter,
+)
+from opentelemetry.exporter.otlp.proto.http import (
+    trace_exporter as _trace_exporter,
+)
+from opentelemetry.exporter.otlp.proto.http._common import (
+    _is_retryable_status,
+)
+from opentelemetry.exporter.otlp.proto.http._common._compression import (
+    _PreparedRequest,
+    _request_body,
+)
+from opentelemetry.sdk._logs import ReadableLogRecord
+from opentelemetry.sdk._logs.export import LogRecordExportResult
+from opentelemetry.sdk.metrics.export import MetricExportResult, MetricsData
+from opentelemetry.sdk.trace import ReadableSpan
+from opentelemetry.sdk.trace.export import SpanExportResult
+from opentelemetry.semconv.attributes.http_attributes import (
+    HTTP_RESPONSE_STATUS_CODE,
+)
+
+_logger = logging.getLogger(__name__)
+
+_MAX_RETRYS = 6
+
+
+def _ssl_context(
+    certificate_file: str | bool, client_cert: str | tuple[str, str] | None
+) -> ssl.SSLContext | Literal[False]:
+    # Mirrors the verify and cert arguments of requests.
+    if certificate_file is False:
+        return False
+    context = ssl.create_default_context(
+        cafile=certificate_file if isinstance(certificate_file, str) else None
+    )
+    if isinstance(client_cert, tuple):
+        context.load_cert_chain(*client_cert)
+    elif client_cert:
+        context.load_cert_chain(client_cert)
+    return context
+
+
+async def _iter_async(chunks: Iterator[bytes]) -> AsyncIterator[bytes]:
+    # The chunks are compressed by the iterator, so it is driven from the
+    # default executor instead of the event loop.
+    loop = asyncio.get_running_loop()
+    while (
+        chunk := await loop.run_in_executor(None, next, chunks, None)
+    ) is not None:
+        yield chunk
+
+
+class _AsyncOTLPExporterMixin:
+    """Posts the requests built by the OTLP HTTP exporters with aiohttp,
+    with the same retries and backoff as the blocking exporters."""
+
+    _result: type
+    # Describes a batch in the log messages.
+    _exported_batch: str
+
+    def __init__(self, *args, **kwargs):
+        super().__init__(*args, **kwargs)
+        self._ssl = (
+            _ssl_context(self._certificate_file, self._client_cert)
+            if self._endpoint.startswith("https")
+            else None
+        )
+        # Client sessions belong to the event loop they are created from,
+        # they are created by the first export made from each loop.
+        self._client_session: aiohttp.ClientSession | None = None
+        self._client_session_loop: asyncio.AbstractEventLoop | None = None
+        # Interrupts the backoff between retries on shutdown.
+        self._shutdown_event: asyncio.Event | None = None
+
+    def _get_client_session(self) -> aiohttp.ClientSession:
+        loop = asyncio.get_running_loop()
+        if self._client_session_loop is not loop:
+            self._close_client_session()
+            self._client_session_loop = loop
+            self._shutdown_event = asyncio.Event()
+            self._client_session = aiohttp.ClientSession(
+                headers=dict(self._session.headers)
+            )
+        return self._client_session  # type: ignore[return-value]
+
+    def _close_client_session(
+        self,
+    ) -> concurrent.futures.Future[None] | None:
+        """Schedules closing the client session on the event loop it belongs
+        to, when exporting from or shutting down in another loop.
+
+        Returns the future of the close, or None if there is no session to
+        close. The session of a closed loop cannot be closed anymore."""
+        session, loop = self._client_session, self._client_session_loop
+        if session is None or session.closed or loop.is_closed():  # type: ignore[union-attr]
+            return None
+        return asyncio.run_coroutine_threadsafe(session.close(), loop)  # type: ignore[arg-type]
+
+    async def _post(
+        self,
+        body: Callable[[], bytes | Iterator[bytes]],
+        timeout_sec: float,
+    ) -> aiohttp.ClientResponse:
+        data = body()
+        async with self._get_client_session().post(
+            self._endpoint,
+            data=data if isinstance(data, bytes) else _iter_async(data),
+            ssl=self._ssl,
+            timeout=aiohttp.ClientTimeout(total=timeout_sec),
+        ) as resp:
+            await resp.read()
+            return resp
+
+    async def _post_with_reconnect(
+        self,
+        body: Callable[[], bytes | Iterator[bytes]],
+        timeout_sec: float,
+    ) -> aiohttp.ClientResponse:
+        # Backends may close a kept alive connection while a post happens,
+        # such posts are sent again right away.
+        try:
+            return await self._post(body, timeout_sec)
+        except aiohttp.ClientConnectionError:
+            return await self._post(body, timeout_sec)
+
+    async def _export_prepared_async(
+        self,
+        prepared: _PreparedRequest,
+        count: int,
+        timeout_millis: float | None = None,
+    ):
+        if self._shutdown:
+            _logger.warning("Exporter already shutdown, ignoring batch")
+            return self._result.FAILURE
+
+        serialized_data = prepared.serialized_data
+        with self._metrics.export_operation(count) as result:
+            timeout_sec = self._timeout
+            if timeout_millis is not None:
+                timeout_sec = min(timeout_sec, timeout_millis / 1e3)
+            deadline_sec = time() + timeout_sec
+            for retry_num in range(_MAX_RETRYS):
+                # multiplying by a random number between .8 and 1.2 introduces a +/20% jitter to each backoff.
+                backoff_seconds = 2**retry_num * random.uniform(0.8, 1.2)
+                export_error: Exception | None = None
+                try:
+                    resp = await self._post_with_reconnect(
+                        prepared.body, deadline_sec - time()
+                    )
+                    if resp.ok:
+                        if self._spool is not None:
+                            await self._replay_spool_async(deadline_sec)
+                        return self._result.SUCCESS
+                except (aiohttp.ClientError, asyncio.TimeoutError) as error:
+                    reason = error
+                    export_error = error
+                    retryable = isinstance(
+                        error, aiohttp.ClientConnectionError
+                    )
+                    status_code = None
+                else:
+                    reason = resp.reason
+                    retryable = _is_retryable_status(resp.status)
+                    status_code = resp.status
+
+                error_attrs = (
+                    {HTTP_RESPONSE_STATUS_CODE: status_code}
+                    if status_code is not None
+                    else None
+                )
+                if not retryable:
+                    _logger.error(
+                        "Failed to export %s batch code: %s, reason: %s",
+                        self._exported_batch,
+                        status_code,
+                        reason,
+                    )
+                    result.error = export_error
+                    result.error_attrs = error_attrs
+                    return self._result.FAILURE
+
+                if (
+                    retry_num + 1 == _MAX_RETRYS
+                    or backoff_seconds > (deadline_sec - time())
+                    or self._shutdown
+                ):
+                    _logger.error(
+                        "Failed to export %s batch due to timeout, "
+                        "max retries or shutdown.",
+                        self._exported_batch,
+                    )
+                    result.error = export_error
+                    result.error_attrs = error_attrs
+                    await asyncio.to_thread(
+                        self._spool_request, serialized_data
+                    )
+                    return self._result.FAILURE
+                _logger.warning(
+                    "Transient error %s encountered while exporting %s batch, retrying in %.2fs.",
+                    reason,
+                    self._exported_batch,
+                    backoff_seconds,
+                )
+                try:
+                    await asyncio.wait_for(
+                        self._shutdown_event.wait(),  # type: ignore[union-attr]
+                        backoff_seconds,
+                    )
+                except asyncio.TimeoutError:
+                    continue
+                _logger.warning("Shutdown in progress, aborting retry.")
+                break
+            await asyncio.to_thread(self._spool_request, serialized_data)
+            return self._result.FAILURE
+
+    async def _replay_spool_async(self, deadline_sec: float) -> None:
+        # Sends the requests spooled during an outage, oldest first, until one
+        # of them fails with a retryable error or the deadline passes. Only
+        # one concurrent export replays the spool.
+        if not self._spool.acquire_replay():
+            return
+        try:
+            while deadline_sec > time():
+                # Reading the spool and compressing the request block, so
+                # they happen in the default executor.
+                payload = await asyncio.to_thread(self._spool.peek)
+                if payload is None:
+                    return
+                body = await asyncio.to_thread(
+                    _request_body,
+                    self._compressor,
+                    payload,
+                    self._chunked_upload,
+                )
+                if (timeout_sec := deadline_sec - time()) <= 0:
+                    return
+                try:
+                    resp = await self._post_with_reconnect(body, timeout_sec)
+                except (aiohttp.ClientError, asyncio.TimeoutError):
+                    return
+                # Requests rejected for good are dropped, they would never
+                # succeed.
+                if not resp.ok and _is_retryable_status(resp.status):
+                    return
+                await asyncio.to_thread(self._spool.commit)
+        finally:
+            self._spool.release_replay()
+
+    def _spool_request(self, serialized_data: bytes) -> None:
+        if self._spool is not None and self._spool.append(serialized_data):
+            _logger.warning(
+                "Spooled %d bytes to send once the endpoint recovers.",
+                len(serialized_data),
+            )
+
+    async def shutdown(self, timeout_millis: float = 30_000, **kwargs) -> None:
+        if self._shutdown:
+            _logger.warning("Exporter already shutdown, ignoring call")
+            return
+        self._shutdown = True
+        self._session.close()
+        loop = self._client_session_loop
+        if loop is None:
+            return
+        if loop is asyncio.get_running_loop():
+            self._shutdown_event.set()  # type: ignore[union-attr]
+            await self._client_session.close()  # type: ignore[union-attr]
+            return
+        # The client session and the backoffs belong to another event loop.
+        if not loop.is_closed():
+            loop.call_soon_threadsafe(self._shutdown_event.set)  # type: ignore[union-attr]
+        close = self._close_client_session()
+        if close is not None and loop.is_running():
+            try:
+                await asyncio.wait_for(
+                    asyncio.wrap_future(close), timeout_millis / 1e3
+                )
+            except asyncio.TimeoutError:
+                _logger.warning("Timed out while closing the client session")
+
+
+class OTLPSpanExporter(
+    _AsyncOTLPExporterMixin, _trace_exporter.OTLPSpanExporter
+):
+    """Asyncio OTLP span exporter, see
+    :class:`~opentelemetry.exporter.otlp.proto.http.trace_exporter.OTLPSpanExporter`
+    for its arguments."""
+
+    _result = SpanExportResult
+    _exported_batch = "span"
+
+    async def export(
+        self,
+        spans: Sequence[ReadableSpan],
+        timeout_millis: float | None = None,
+    ) -> SpanExportResult:
+        if self._shutdown:
+            _logger.warning("Exporter already shutdown, ignoring batch")
+            return SpanExportResult.FAILURE
+        prepared = await asyncio.to_thread(self._prepare_export, spans)
+        return await self._export_prepared_async(
+            prepared, len(spans), timeout_millis
+        )
+
+
+class OTLPLogExporter(_AsyncOTLPExporterMixin, _log_exporter.OTLPLogExporter):
+    """Asyncio OTLP log exporter, see
+    :class:`~opentelemetry.exporter.otlp.proto.http._log_exporter.OTLPLogExporter`
+    for its arguments."""
+
+    _result = LogRecordExportResult
+    _exported_batch = "logs"
+
+    async def export(
+        self,
+        batch: Sequence[ReadableLogRecord],
+        timeout_millis: float | None = None,
+    ) -> LogRecordExportResult:
+        if self._shutdown:
+            _logger.warning("Exporter already shutdown, ignoring batch")
+            return LogRecordExportResult.FAILURE
+        prepared = await asyncio.to_thread(self._prepare_export, batch)
+        return await self._export_prepared_async(
+            prepared, len(batch), timeout_millis
+        )
+
+
+class OTLPMetricExporter(
+    _AsyncOTLPExporterMixin, _metric_exporter.OTLPMetricExporter
+):
+    """Asyncio OTLP metric exporter, see
+    :class:`~opentelemetry.exporter.otlp.proto.http.metric_exporter.OTLPMetricExporter`
+    for its arguments."""
+
+    _result = MetricExportResult
+    _exported_batch = "metrics"
+
+    def __init__(self, *args, **kwargs):
+        super().__init__(*args, **kwargs)
+        # Metrics are not spooled.
+        self._spool = None
+
+    def _prepare_export(
+        self, metrics_data: MetricsData
+    ) -> list[_PreparedRequest]:
+        export_request = encode_metrics(metrics_data)
+        export_requests = (
+            [export_request]
+            if self._max_export_batch_size is None
+            else _metric_exporter._split_metrics_data(  # pylint: disable=protected-access
+                export_request, self._max_export_batch_size
+            )
+        )
+        prepared = []
+        for request in export_requests:
+            serialized_data = request.SerializeToString()
+            prepared.append(
+                _PreparedRequest(
+                    serialized_data,
+                    _request_body(
+                        self._compressor, serialized_data, self._chunked_upload
+                    ),
+                )
+            )
+        return prepared
+
+    async def export(
+        self,
+        metrics_data: MetricsData,
+        timeout_millis: float | None = 10000,
+        **kwargs,
+    ) -> MetricExportResult:
+        if self._shutdown:
+            _logger.warning("Exporter already shutdown, ignoring batch")
+            return MetricExportResult.FAILURE
+
+        num_items = 0
+        for resource_metrics in metrics_data.resource_metrics:
+            for scope_metrics in resource_metrics.scope_metrics:
+                for metric in scope_metrics.metrics:
+                    num_items += len(metric.data.data_points)
+
+        timeout_sec = self._timeout
+        if timeout_millis is not None:
+            timeout_sec = min(timeout_sec, timeout_millis / 1e3)
+        deadline_sec = time() + timeout_sec
+        for prepared in await asyncio.to_thread(
+            self._prepare_export, metrics_data
+        ):
+            export_result = await self._export_prepared_async(
+                prepared, num_items, max(0, (deadline_sec - time()) * 1e3)
+            )
+            if export_result != MetricExportResult.SUCCESS:
+                return MetricExportResult.FAILURE
+
+        # Only returns SUCCESS if all batches succeeded
+        return MetricExportResult.SUCCESS
@@ -2,14 +2,11 @@
 # SPDX-License-Identifier: Apache-2.0
 from __future__ import annotations
 
-import gzip
 import logging
 import os
 import random
 import threading
-import zlib
 from collections.abc import Callable, Iterable
-from io import BytesIO
 from os import environ
 from time import time
 from typing import (  # noqa: F401
@@ -42,6 +39,10 @@ from opentelemetry.exporter.otlp.proto.http._common import (
     _is_retryable,
     _load_session_from_envvar,
 )
+from opentelemetry.exporter.otlp.proto.http._common._compression import (
+    _create_compressor,
+    _request_body,
+)
 from opentelemetry.metrics import MeterProvider
 from opentelemetry.proto.collector.metrics.v1.metrics_service_pb2 import (  # noqa: F401
     ExportMetricsServiceRequest,
@@ -124,6 +125,8 @@ class OTLPMetricExporter(MetricExporter, OTLPMetricExporterMixin):
         max_export_batch_size: int | None = None,
         *,
         meter_provider: MeterProvider | None = None,
+        compression_level: int | None = None,
+        chunked_upload: bool = False,
     ):
         """OTLP HTTP metrics exporter
 
@@ -134,7 +137,7 @@ class OTLPMetricExporter(MetricExporter, OTLPMetricExporterMixin):
             client_certificate_file: Path to the client certificate file to use for any TLS
             headers: Headers to be sent with HTTP requests at export
             timeout: Timeout in seconds for export
-            compression: Compression to use; one of none, gzip, deflate
+            compression: Compression to use; one of none, gzip, deflate, zstd
             session: Requests session to use at export
             preferred_temporality: Map of preferred temporality for each metric type.
                 See `opentelemetry.sdk.metrics.export.MetricReader` for more details on what
@@ -145,6 +148,8 @@ class OTLPMetricExporter(MetricExporter, OTLPMetricExporterMixin):
             max_export_batch_size: Maximum number of data points to export in a single request.
                 If not set there is no limit to the number of data points in a request.
                 If it is set and the number of data points exceeds the max, the request will be split.
+            compression_level: Compression level to use; the default of the codec if not set
+            chunked_upload: Upload compressed requests in chunks as they are compressed
         """
         self._shutdown_in_progress = threading.Event()
         self._endpoint = endpoint or environ.get(
@@ -184,6 +189,14 @@ class OTLPMetricExporter(MetricExporter, OTLPMetricExporterMixin):
             )
         )
         self._compression = compression or _compression_from_env()
+        self._compressor = _create_compressor(
+            self._compression, compression_level
+        )
+        if self._compressor is None:
+            self._compression = Compression.NoCompression
+        # Compressed bodies are uploaded in chunks as they are compressed
+        # instead of compressing the whole body first.
+        self._chunked_upload = chunked_upload
         self._session = (
             session
             or _load_session_from_envvar(
@@ -220,15 +233,9 @@ class OTLPMetricExporter(MetricExporter, OTLPMetricExporterMixin):
     def _export(
         self, serialized_data: bytes, timeout_sec: float | None = None
     ):
-        data = serialized_data
-        if self._compression == Compression.Gzip:
-            gzip_data = BytesIO()
-            with gzip.GzipFile(fileobj=gzip_data, mode="w") as gzip_stream:
-                gzip_stream.write(serialized_data)
-            data = gzip_data.getvalue()
-        elif self._compression == Compression.Deflate:
-            data = zlib.compress(serialized_data)
-
+        body = _request_body(
+            self._compressor, serialized_data, self._chunked_upload
+        )
         if timeout_sec is None:
             timeout_sec = self._timeout
 
@@ -239,7 +246,7 @@ class OTLPMetricExporter(MetricExporter, OTLPMetricExporterMixin):
         try:
             resp = self._session.post(
                 url=self._endpoint,
-                data=data,
+                data=body(),
                 verify=self._certificate_file,
                 timeout=timeout_sec,
                 cert=self._client_cert,
@@ -247,7 +254,7 @@ class OTLPMetricExporter(MetricExporter, OTLPMetricExporterMixin):
         except ConnectionError:
             resp = self._session.post(
                 url=self._endpoint,
-                data=data,
+                data=body(),
                 verify=self._certificate_file,
                 timeout=timeout_sec,
                 cert=self._client_cert,
@@ -1,14 +1,11 @@
 # Copyright The OpenTelemetry Authors
 # SPDX-License-Identifier: Apache-2.0
 
-import gzip
 import logging
 import os
 import random
 import threading
-import zlib
-from collections.abc import Sequence
-from io import BytesIO
+from collections.abc import Callable, Iterator, Sequence
 from os import environ
 from time import time
 from urllib.parse import urlparse
@@ -19,8 +16,10 @@ from requests.exceptions import ConnectionError
 from opentelemetry.exporter.otlp.proto.common._exporter_metrics import (
     create_exporter_metrics,
 )
+from opentelemetry.exporter.otlp.proto.common._spool import DiskSpool
 from opentelemetry.exporter.otlp.proto.common.trace_encoder import (
     encode_spans,
+    encode_spans_to_bytes,
 )
 from opentelemetry.exporter.otlp.proto.http import (
     _OTLP_HTTP_HEADERS,
@@ -29,6 +28,12 @@ from opentelemetry.exporter.otlp.proto.http import (
 from opentelemetry.exporter.otlp.proto.http._common import (
     _is_retryable,
     _load_session_from_envvar,
+    _replay_spool,
+)
+from opentelemetry.exporter.otlp.proto.http._common._compression import (
+    _create_compressor,
+    _PreparedRequest,
+    _request_body,
 )
 from opentelemetry.metrics import MeterProvider
 from opentelemetry.sdk.environment_variables import (
@@ -82,7 +87,17 @@ class OTLPSpanExporter(SpanExporter):
         session: requests.Session | None = None,
         *,
         meter_provider: MeterProvider | None = None,
+        spool: DiskSpool | None = None,
+        direct_encoding: bool = False,
+        compression_level: int | None = None,
+        chunked_upload: bool = False,
     ):
+        # Requests that could not be delivered are written to the spool and
+        # sent again after the next successful export.
+        self._spool = spool
+        # Spans are written directly in the protobuf wire format instead of
+        # building the protobuf messages first.
+        self._direct_encoding = direct_encoding
         self._shutdown_in_progress = threading.Event()
         self._endpoint = endpoint or environ.get(
             OTEL_EXPORTER_OTLP_TRACES_ENDPOINT,
@@ -121,6 +136,14 @@ class OTLPSpanExporter(SpanExporter):
             )
         )
         self._compression = compression or _compression_from_env()
+        self._compressor = _create_compressor(
+            self._compression, compression_level
+        )
+        if self._compressor is None:
+            self._compression = Compression.NoCompression
+        # Compressed bodies are uploaded in chunks as they are compressed
+        # instead of compressing the whole body first.
+        self._chunked_upload = chunked_upload
         self._session = (
             session
             or _load_session_from_envvar(
@@ -150,17 +173,15 @@ class OTLPSpanExporter(SpanExporter):
         )
 
     def _export(
-        self, serialized_data: bytes, timeout_sec: float | None = None
+        self,
+        serialized_data: bytes,
+        timeout_sec: float | None = None,
+        body: Callable[[], bytes | Iterator[bytes]] | None = None,
     ):
-        data = serialized_data
-        if self._compression == Compression.Gzip:
-            gzip_data = BytesIO()
-            with gzip.GzipFile(fileobj=gzip_data, mode="w") as gzip_stream:
-                gzip_stream.write(serialized_data)
-            data = gzip_data.getvalue()
-        elif self._compression == Compression.Deflate:
-            data = zlib.compress(serialized_data)
-
+        if body is None:
+            body = _request_body(
+                self._compressor, serialized_data, self._chunked_upload
+            )
         if timeout_sec is None:
             timeout_sec = self._timeout
 
@@ -171,7 +192,7 @@ class OTLPSpanExporter(SpanExporter):
         try:
             resp = self._session.post(
                 url=self._endpoint,
-                data=data,
+                data=body(),
                 verify=self._certificate_file,
                 timeout=timeout_sec,
                 cert=self._client_cert,
@@ -179,28 +200,68 @@ class OTLPSpanExporter(SpanExporter):
         except ConnectionError:
             resp = self._session.post(
                 url=self._endpoint,
-                data=data,
+                data=body(),
                 verify=self._certificate_file,
                 timeout=timeout_sec,
                 cert=self._client_cert,
             )
         return resp
 
-    def export(self, spans: Sequence[ReadableSpan]) -> SpanExportResult:
+    def _prepare_export(
+        self, spans: Sequence[ReadableSpan]
+    ) -> _PreparedRequest:
+        if self._direct_encoding:
+            serialized_data = encode_spans_to_bytes(spans)
+        else:
+            serialized_data = encode_spans(spans).SerializePartialToString()
+        return _PreparedRequest(
+            serialized_data,
+            _request_body(
+                self._compressor, serialized_data, self._chunked_upload
+            ),
+        )
+
+    def export(
+        self,
+        spans: Sequence[ReadableSpan],
+        timeout_millis: float | None = None,
+    ) -> SpanExportResult:
         if self._shutdown:
             _logger.warning("Exporter already shutdown, ignoring batch")
             return SpanExportResult.FAILURE
+        return self._export_prepared(
+            self._prepare_export(spans), len(spans), timeout_millis
+        )
 
-        with self._metrics.export_operation(len(spans)) as result:
-            serialized_data = encode_spans(spans).SerializePartialToString()
-            deadline_sec = time() + self._timeout
+    def _export_prepared(
+        self,
+        prepared: _PreparedRequest,
+        count: int,
+        timeout_millis: float | None = None,
+    ) -> SpanExportResult:
+        if self._shutdown:
+            _logger.warning("Exporter already shutdown, ignoring batch")
+            return SpanExportResult.FAILURE
+
+        serialized_data = prepared.serialized_data
+        with self._metrics.export_operation(count) as result:
+            timeout_sec = self._timeout
+            if timeout_millis is not None:
+                timeout_sec = min(timeout_sec, timeout_millis / 1e3)
+            deadline_sec = time() + timeout_sec
             for retry_num in range(_MAX_RETRYS):
                 # multiplying by a random number between .8 and 1.2 introduces a +/20% jitter to each backoff.
                 backoff_seconds = 2**retry_num * random.uniform(0.8, 1.2)
                 export_error: Exception | None = None
                 try:
-                    resp = self._export(serialized_data, deadline_sec - time())
+                    resp = self._export(
+                        serialized_data, deadline_sec - time(), prepared.body
+                    )
                     if resp.ok:
+                        if self._spool is not None:
+                            _replay_spool(
+                                self._spool, self._export, deadline_sec
+                            )
                         return SpanExportResult.SUCCESS
                 except requests.exceptions.RequestException as error:
                     reason = error
@@ -243,6 +304,7 @@ class OTLPSpanExporter(SpanExporter):
                     )
                     result.error = export_error
                     result.error_attrs = error_attrs
+                    self._spool_request(serialized_data)
                     return SpanExportResult.FAILURE
                 _logger.warning(
                     "Transient error %s encountered while exporting span batch, retrying in %.2fs.",
@@ -253,8 +315,16 @@ class OTLPSpanExporter(SpanExporter):
                 if shutdown:
                     _logger.warning("Shutdown in progress, aborting retry.")
                     break
+            self._spool_request(serialized_data)
             return SpanExportResult.FAILURE
 
+    def _spool_request(self, serialized_data: bytes) -> None:
+        if self._spool is not None and self._spool.append(serialized_data):
+            _logger.warning(
+                "Spooled %d bytes to send once the endpoint recovers.",
+                len(serialized_data),
+            )
+
     def shutdown(self):
         if self._shutdown:
             _logger.warning("Exporter already shutdown, ignoring call")
@@ -0,0 +1,370 @@
+# Copyright The OpenTelemetry Authors
+# SPDX-License-Identifier: Apache-2.0
+
+# pylint: disable=protected-access
+import asyncio
+import tempfile
+import threading
+import time
+import unittest
+from unittest import IsolatedAsyncioTestCase
+from unittest.mock import patch
+
+try:
+    from aiohttp import web
+except ImportError:
+    web = None
+
+from opentelemetry._logs import LogRecord
+from opentelemetry.exporter.otlp.proto.common._spool import DiskSpool
+from opentelemetry.exporter.otlp.proto.http import Compression
+from opentelemetry.proto.collector.logs.v1.logs_service_pb2 import (
+    ExportLogsServiceRequest,
+)
+from opentelemetry.proto.collector.metrics.v1.metrics_service_pb2 import (
+    ExportMetricsServiceRequest,
+)
+from opentelemetry.proto.collector.trace.v1.trace_service_pb2 import (
+    ExportTraceServiceRequest,
+)
+from opentelemetry.sdk._logs import ReadableLogRecord
+from opentelemetry.sdk._logs.export import LogRecordExportResult
+from opentelemetry.sdk.metrics.export import (
+    Metric,
+    MetricExportResult,
+    MetricsData,
+    NumberDataPoint,
+    ResourceMetrics,
+    ScopeMetrics,
+    Sum,
+)
+from opentelemetry.sdk.resources import Resource
+from opentelemetry.sdk.trace import SpanContext, _Span
+from opentelemetry.sdk.trace.export import (
+    AsyncBatchSpanProcessor,
+    SpanExportResult,
+)
+from opentelemetry.sdk.util.instrumentation import InstrumentationScope
+from opentelemetry.trace import TraceFlags
+
+if web is not None:
+    from opentelemetry.exporter.otlp.proto.http.aio import (
+        OTLPLogExporter,
+        OTLPMetricExporter,
+        OTLPSpanExporter,
+    )
+
+
+def _span():
+    span = _Span(
+        "span",
+        SpanContext(
+            1, 2, is_remote=False, trace_flags=TraceFlags(TraceFlags.SAMPLED)
+        ),
+        resource=Resource({"service.name": "test"}),
+        instrumentation_scope=InstrumentationScope("test"),
+    )
+    span.start(start_time=1)
+    span.end(end_time=2)
+    return span
+
+
+def _metrics_data(points):
+    return MetricsData(
+        resource_metrics=[
+            ResourceMetrics(
+                resource=Resource({}),
+                scope_metrics=[
+                    ScopeMetrics(
+                        scope=InstrumentationScope("test"),
+                        metrics=[
+                            Metric(
+                                name="counter",
+                                description="",
+                                unit="",
+                                data=Sum(
+                                    data_points=[
+                                        NumberDataPoint(
+                                            attributes={"point": point},
+                                            start_time_unix_nano=1,
+                                            time_unix_nano=2,
+                                            value=point,
+                                        )
+                                        for point in range(points)
+                                    ],
+                                    aggregation_temporality=1,
+                                    is_monotonic=True,
+                                ),
+                            )
+                        ],
+                        schema_url="",
+                    )
+                ],
+                schema_url="",
+            )
+        ]
+    )
+
+
+@unittest.skipIf(web is None, "aiohttp is not installed")
+class TestAsyncOTLPExporters(IsolatedAsyncioTestCase):
+    async def asyncSetUp(self):
+        self.bodies = []
+        self.headers = []
+        # Status codes returned to the next requests.
+        self.statuses = []
+        app = web.Application()
+        app.router.add_post("/v1/{signal}", self._handle)
+        self.runner = web.AppRunner(app)
+        await self.runner.setup()
+        site = web.TCPSite(self.runner, "127.0.0.1", 0)
+        await site.start()
+        port = site._server.sockets[0].getsockname()[1]
+        self.endpoint = f"http://127.0.0.1:{port}/v1/"
+
+    async def asyncTearDown(self):
+        await self.runner.cleanup()
+
+    async def _handle(self, request):
+        # The server decompresses the bodies.
+        self.bodies.append(await request.read())
+        self.headers.append(request.headers)
+        if self.statuses:
+            return web.Response(status=self.statuses.pop(0))
+        return web.Response()
+
+    async def test_export_spans(self):
+        exporter = OTLPSpanExporter(
+            endpoint=self.endpoint + "traces", headers={"key": "value"}
+        )
+        self.assertEqual(
+            await exporter.export([_span()]), SpanExportResult.SUCCESS
+        )
+        (body,) = self.bodies
+        request = ExportTraceServiceRequest.FromString(body)
+        self.assertEqual(
+            request.resource_spans[0].scope_spans[0].spans[0].name, "span"
+        )
+        self.assertEqual(self.headers[0]["key"], "value")
+        self.assertEqual(
+            self.headers[0]["Content-Type"], "application/x-protobuf"
+        )
+        await exporter.shutdown()
+        self.assertEqual(
+            await exporter.export([_span()]), SpanExportResult.FAILURE
+        )
+
+    async def test_export_compressed_chunks(self):
+        exporter = OTLPSpanExporter(
+            endpoint=self.endpoint + "traces",
+            compression=Compression.Deflate,
+            chunked_upload=True,
+        )
+        iter_compress = exporter._compressor.iter_compress
+        threads = set()
+
+        def record_threads(data):
+            for chunk in iter_compress(data):
+                threads.add(threading.current_thread())
+                yield chunk
+
+        exporter._compressor.iter_compress = record_threads
+        self.assertEqual(
+            await exporter.export([_span()] * 10), SpanExportResult.SUCCESS
+        )
+        self.assertEqual(self.headers[0]["Transfer-Encoding"], "chunked")
+        # The chunks are not compressed by the event loop.
+        self.assertTrue(threads)
+        self.assertNotIn(threading.current_thread(), threads)
+        request = ExportTraceServiceRequest.FromString(self.bodies[0])
+        self.assertEqual(
+            len(request.resource_spans[0].scope_spans[0].spans), 10
+        )
+        await exporter.shutdown()
+
+    async def test_export_logs(self):
+        exporter = OTLPLogExporter(endpoint=self.endpoint + "logs")
+        log_record = ReadableLogRecord(
+            LogRecord(body="message"),
+            resource=Resource({}),
+            instrumentation_scope=InstrumentationScope("test"),
+        )
+        self.assertEqual(
+            await exporter.export([log_record]),
+            LogRecordExportResult.SUCCESS,
+        )
+        request = ExportLogsServiceRequest.FromString(self.bodies[0])
+        self.assertEqual(
+            request.resource_logs[0]
+            .scope_logs[0]
+            .log_records[0]
+            .body.string_value,
+            "message",
+        )
+        await exporter.shutdown()
+
+    async def test_export_metrics_in_batches(self):
+        exporter = OTLPMetricExporter(
+            endpoint=self.endpoint + "metrics", max_export_batch_size=2
+        )
+        self.assertEqual(
+            await exporter.export(_metrics_data(3)),
+            MetricExportResult.SUCCESS,
+        )
+        self.assertEqual(
+            [
+                len(
+                    ExportMetricsServiceRequest.FromString(body)
+                    .resource_metrics[0]
+                    .scope_metrics[0]
+                    .metrics[0]
+                    .sum.data_points
+                )
+                for body in self.bodies
+            ],
+            [2, 1],
+        )
+        await exporter.shutdown()
+
+    async def test_retryable_status_is_retried(self):
+        exporter = OTLPSpanExporter(endpoint=self.endpoint + "traces")
+        self.statuses = [503, 408]
+        with patch("random.uniform", return_value=0.05):
+            self.assertEqual(
+                await exporter.export([_span()]), SpanExportResult.SUCCESS
+            )
+        self.assertEqual(len(self.bodies), 3)
+        await exporter.shutdown()
+
+    async def test_non_retryable_status(self):
+        exporter = OTLPSpanExporter(endpoint=self.endpoint + "traces")
+        self.statuses = [400]
+        self.assertEqual(
+            await exporter.export([_span()]), SpanExportResult.FAILURE
+        )
+        self.assertEqual(len(self.bodies), 1)
+        await exporter.shutdown()
+
+    async def test_failed_export_is_spooled_and_replayed(self):
+        self.statuses = [503]
+        with tempfile.TemporaryDirectory() as directory:
+            spool = DiskSpool(directory)
+            # The backoff is longer than the timeout, so there is no retry.
+            exporter = OTLPSpanExporter(
+                endpoint=self.endpoint + "traces", timeout=0.1, spool=spool
+            )
+            self.assertEqual(
+                await exporter.export([_span()]), SpanExportResult.FAILURE
+            )
+            self.assertEqual(spool.peek(), self.bodies[0])
+
+            self.assertEqual(
+                await exporter.export([_span()]), SpanExportResult.SUCCESS
+            )
+            self.assertEqual(len(self.bodies), 3)
+            self.assertEqual(self.bodies[2], self.bodies[0])
+            self.assertIsNone(spool.peek())
+            await exporter.shutdown()
+
+    async def test_spool_is_not_read_by_event_loop(self):
+        self.statuses = [503]
+        threads = []
+
+        def record_thread(method):
+            def wrapper(*args):
+                threads.append(threading.current_thread())
+                return method(*args)
+
+            return wrapper
+
+        with tempfile.TemporaryDirectory() as directory:
+            spool = DiskSpool(directory)
+            for name in ("append", "peek", "commit"):
+                setattr(spool, name, record_thread(getattr(spool, name)))
+            exporter = OTLPSpanExporter(
+                endpoint=self.endpoint + "traces",
+                timeout=0.1,
+                compression=Compression.Gzip,
+                spool=spool,
+            )
+            await exporter.export([_span()])
+            self.assertEqual(
+                await exporter.export([_span()]), SpanExportResult.SUCCESS
+            )
+            self.assertEqual(len(self.bodies), 3)
+            await exporter.shutdown()
+        # Appended, peeked and committed, then peeked again.
+        self.assertEqual(len(threads), 4)
+        self.assertNotIn(threading.current_thread(), threads)
+
+    def _start_other_loop(self):
+        other_loop = asyncio.new_event_loop()
+        thread = threading.Thread(target=other_loop.run_forever)
+        thread.start()
+
+        def stop():
+            other_loop.call_soon_threadsafe(other_loop.stop)
+            thread.join()
+            other_loop.close()
+
+        self.addCleanup(stop)
+        return other_loop
+
+    async def test_switching_loops_closes_previous_session(self):
+        exporter = OTLPSpanExporter(endpoint=self.endpoint + "traces")
+        other_loop = self._start_other_loop()
+        self.assertEqual(
+            await asyncio.wrap_future(
+                asyncio.run_coroutine_threadsafe(
+                    exporter.export([_span()]), other_loop
+                )
+            ),
+            SpanExportResult.SUCCESS,
+        )
+        other_session = exporter._client_session
+
+        self.assertEqual(
+            await exporter.export([_span()]), SpanExportResult.SUCCESS
+        )
+        self.assertIsNot(exporter._client_session, other_session)
+        for _ in range(50):
+            if other_session.closed:
+                break
+            await asyncio.sleep(0.01)
+        self.assertTrue(other_session.closed)
+        await exporter.shutdown()
+
+    async def test_shutdown_from_another_loop(self):
+        exporter = OTLPSpanExporter(endpoint=self.endpoint + "traces")
+        self.assertEqual(
+            await exporter.export([_span()]), SpanExportResult.SUCCESS
+        )
+        other_loop = self._start_other_loop()
+        # The session is closed by this loop, which keeps running meanwhile.
+        await asyncio.wrap_future(
+            asyncio.run_coroutine_threadsafe(exporter.shutdown(), other_loop)
+        )
+        self.assertTrue(exporter._client_session.closed)
+
+    async def test_shutdown_interrupts_backoff(self):
+        exporter = OTLPSpanExporter(endpoint=self.endpoint + "traces")
+        self.statuses = [503] * 6
+        export = asyncio.ensure_future(exporter.export([_span()]))
+        await asyncio.sleep(0.2)
+        before = time.time()
+        await exporter.shutdown()
+        self.assertEqual(await export, SpanExportResult.FAILURE)
+        self.assertLess(time.time() - before, 0.5)
+
+    async def test_batch_processor(self):
+        exporter = OTLPSpanExporter(endpoint=self.endpoint + "traces")
+        processor = AsyncBatchSpanProcessor(exporter)
+        for _ in range(3):
+            processor.on_end(_span())
+        self.assertTrue(await processor.force_flush_async())
+        request = ExportTraceServiceRequest.FromString(self.bodies[0])
+        self.assertEqual(
+            len(request.resource_spans[0].scope_spans[0].spans), 3
+        )
+        await processor.shutdown_async()
+        self.assertTrue(exporter._shutdown)
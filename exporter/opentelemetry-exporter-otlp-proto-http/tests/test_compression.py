@@ -0,0 +1,91 @@
+# Copyright The OpenTelemetry Authors
+# SPDX-License-Identifier: Apache-2.0
+
+# pylint: disable=protected-access
+
+import gzip
+import unittest
+import zlib
+from logging import WARNING
+from unittest.mock import patch
+
+from opentelemetry.exporter.otlp.proto.http import Compression
+from opentelemetry.exporter.otlp.proto.http._common import _compression
+from opentelemetry.exporter.otlp.proto.http._common._compression import (
+    _CHUNK_SIZE,
+    _create_compressor,
+    _request_body,
+)
+
+try:
+    import zstandard
+except ImportError:
+    zstandard = None
+
+# Large enough to be compressed in several chunks.
+DATA = b"".join(
+    f"span-{index}:http.request.method=GET;".encode() for index in range(20000)
+)
+
+DECOMPRESS = {
+    Compression.Gzip: gzip.decompress,
+    Compression.Deflate: zlib.decompress,
+}
+if zstandard is not None:
+    DECOMPRESS[Compression.Zstd] = zstandard.ZstdDecompressor().decompress
+
+
+class TestCompressor(unittest.TestCase):
+    def test_compress(self):
+        for compression, decompress in DECOMPRESS.items():
+            with self.subTest(compression=compression):
+                compressor = _create_compressor(compression)
+                self.assertIs(compressor.compression, compression)
+                self.assertEqual(decompress(compressor.compress(DATA)), DATA)
+                # Compressors are reused for the following requests.
+                self.assertEqual(decompress(compressor.compress(DATA)), DATA)
+                self.assertEqual(decompress(compressor.compress(b"")), b"")
+
+    def test_iter_compress(self):
+        self.assertGreater(len(DATA), 2 * _CHUNK_SIZE)
+        for compression, decompress in DECOMPRESS.items():
+            with self.subTest(compression=compression):
+                compressor = _create_compressor(compression)
+                chunks = list(compressor.iter_compress(DATA))
+                self.assertGreater(len(chunks), 1)
+                self.assertEqual(decompress(b"".join(chunks)), DATA)
+
+    def test_compression_level(self):
+        for compression, decompress in DECOMPRESS.items():
+            with self.subTest(compression=compression):
+                fast = _create_compressor(compression, 1).compress(DATA)
+                small = _create_compressor(compression, 9).compress(DATA)
+                self.assertEqual(decompress(fast), DATA)
+                self.assertEqual(decompress(small), DATA)
+                self.assertNotEqual(small, fast)
+
+    def test_no_compression(self):
+        self.assertIsNone(_create_compressor(Compression.NoCompression))
+
+    def test_zstd_unavailable(self):
+        with patch.object(_compression, "zstandard", None):
+            with self.assertLogs(level=WARNING) as logs:
+                self.assertIsNone(_create_compressor(Compression.Zstd))
+        self.assertIn("zstandard", logs.output[0])
+
+    def test_request_body(self):
+        compressor = _create_compressor(Compression.Gzip)
+
+        body = _request_body(None, DATA, chunked=True)
+        self.assertIs(body(), DATA)
+
+        body = _request_body(compressor, DATA, chunked=False)
+        self.assertIs(body(), body())
+        self.assertEqual(gzip.decompress(body()), DATA)
+
+        # Each attempt to send a chunked request gets a new body.
+        body = _request_body(compressor, DATA, chunked=True)
+        first, second = body(), body()
+        self.assertIsNot(first, second)
+        self.assertEqual(gzip.decompress(b"".join(first)), DATA)
+        self.assertEqual(gzip.decompress(b"".join(second)), DATA)
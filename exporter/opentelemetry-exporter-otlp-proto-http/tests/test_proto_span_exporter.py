@@ -1,9 +1,12 @@
 # Copyright The OpenTelemetry Authors
 # SPDX-License-Identifier: Apache-2.0
 
+import gzip
+import tempfile
 import threading
 import time
 import unittest
+import zlib
 from logging import WARNING
 from unittest.mock import MagicMock, Mock, patch
 
@@ -12,6 +15,10 @@ from requests import Session
 from requests.exceptions import ConnectionError
 from requests.models import Response
 
+from opentelemetry.exporter.otlp.proto.common._spool import DiskSpool
+from opentelemetry.exporter.otlp.proto.common.trace_encoder import (
+    encode_spans,
+)
 from opentelemetry.exporter.otlp.proto.http import Compression
 from opentelemetry.exporter.otlp.proto.http.trace_exporter import (
     DEFAULT_COMPRESSION,
@@ -41,8 +48,11 @@ from opentelemetry.sdk.environment_variables import (
 )
 from opentelemetry.sdk.metrics import MeterProvider
 from opentelemetry.sdk.metrics.export import InMemoryMetricReader
-from opentelemetry.sdk.trace import _Span
-from opentelemetry.sdk.trace.export import SpanExportResult
+from opentelemetry.sdk.trace import TracerProvider, _Span
+from opentelemetry.sdk.trace.export import (
+    BatchSpanProcessor,
+    SpanExportResult,
+)
 from opentelemetry.test.mock_test_classes import IterEntryPoint
 
 OS_ENV_ENDPOINT = "os.env.base"
@@ -457,6 +467,139 @@ class TestOTLPSpanExporter(unittest.TestCase):
         exporter = OTLPSpanExporter(timeout=0.4)
         exporter.export([BASIC_SPAN])
 
+    @patch.object(Session, "post")
+    def test_export_timeout_millis_shortens_timeout(self, mock_post):
+        resp = Response()
+        resp.status_code = 200
+
+        def export_side_effect(*args, **kwargs):
+            self.assertAlmostEqual(0.2, kwargs["timeout"], 2)
+            return resp
+
+        mock_post.side_effect = export_side_effect
+        exporter = OTLPSpanExporter(timeout=0.4)
+        exporter.export([BASIC_SPAN], timeout_millis=200)
+        # The exporter's own timeout still applies when it is shorter.
+        exporter = OTLPSpanExporter(timeout=0.2)
+        exporter.export([BASIC_SPAN], timeout_millis=400)
+
+    @patch.object(Session, "post")
+    def test_failed_export_is_spooled_and_replayed(self, mock_post):
+        unavailable = Response()
+        unavailable.status_code = 503
+        ok = Response()
+        ok.status_code = 200
+        with tempfile.TemporaryDirectory() as directory:
+            spool = DiskSpool(directory)
+            # The backoff is longer than the timeout, so there is no retry.
+            exporter = OTLPSpanExporter(timeout=0.1, spool=spool)
+            mock_post.return_value = unavailable
+            with self.assertLogs(level=WARNING):
+                self.assertEqual(
+                    exporter.export([BASIC_SPAN]), SpanExportResult.FAILURE
+                )
+            spooled = spool.peek()
+            self.assertEqual(spooled, mock_post.call_args.kwargs["data"])
+
+            mock_post.return_value = ok
+            self.assertEqual(
+                exporter.export([BASIC_SPAN]), SpanExportResult.SUCCESS
+            )
+            self.assertEqual(mock_post.call_count, 3)
+            self.assertEqual(mock_post.call_args.kwargs["data"], spooled)
+            self.assertIsNone(spool.peek())
+
+    @patch.object(Session, "post")
+    def test_spool_replayed_by_one_export_at_a_time(self, mock_post):
+        ok = Response()
+        ok.status_code = 200
+        mock_post.return_value = ok
+        with tempfile.TemporaryDirectory() as directory:
+            spool = DiskSpool(directory)
+            spool.append(b"spooled")
+            exporter = OTLPSpanExporter(spool=spool)
+            # Another export is replaying the spool.
+            self.assertTrue(spool.acquire_replay())
+            self.assertEqual(
+                exporter.export([BASIC_SPAN]), SpanExportResult.SUCCESS
+            )
+            self.assertEqual(mock_post.call_count, 1)
+            self.assertEqual(spool.peek(), b"spooled")
+            spool.release_replay()
+            self.assertEqual(
+                exporter.export([BASIC_SPAN]), SpanExportResult.SUCCESS
+            )
+            self.assertEqual(mock_post.call_count, 3)
+            self.assertEqual(mock_post.call_args.kwargs["data"], b"spooled")
+            self.assertIsNone(spool.peek())
+
+    @patch.object(Session, "post")
+    def test_direct_encoding(self, mock_post):
+        resp = Response()
+        resp.status_code = 200
+        mock_post.return_value = resp
+
+        OTLPSpanExporter().export([BASIC_SPAN])
+        OTLPSpanExporter(direct_encoding=True).export([BASIC_SPAN])
+
+        self.assertEqual(
+            mock_post.call_args_list[0].kwargs["data"],
+            mock_post.call_args_list[1].kwargs["data"],
+        )
+
+    @patch.object(Session, "post")
+    def test_chunked_upload(self, mock_post):
+        resp = Response()
+        resp.status_code = 200
+        bodies = []
+
+        def post(**kwargs):
+            bodies.append(b"".join(kwargs["data"]))
+            if len(bodies) == 1:
+                raise ConnectionError()
+            return resp
+
+        mock_post.side_effect = post
+        exporter = OTLPSpanExporter(
+            compression=Compression.Gzip,
+            compression_level=1,
+            chunked_upload=True,
+        )
+        self.assertEqual(
+            exporter.export([BASIC_SPAN]), SpanExportResult.SUCCESS
+        )
+        self.assertEqual(exporter._session.headers["Content-Encoding"], "gzip")
+        # The request sent again after the connection error is complete.
+        self.assertEqual(len(bodies), 2)
+        self.assertEqual(bodies[0], bodies[1])
+        self.assertEqual(
+            gzip.decompress(bodies[1]),
+            encode_spans([BASIC_SPAN]).SerializePartialToString(),
+        )
+
+    @patch.object(Session, "post")
+    def test_pipelined_exports(self, mock_post):
+        resp = Response()
+        resp.status_code = 200
+        mock_post.return_value = resp
+        exporter = OTLPSpanExporter(compression=Compression.Deflate)
+        span_processor = BatchSpanProcessor(
+            exporter, schedule_delay_millis=30000, pipelined_exports=True
+        )
+        tracer = TracerProvider().get_tracer(__name__)
+        for _ in range(3):
+            with tracer.start_as_current_span("span") as span:
+                pass
+            span_processor.on_end(span)
+            self.assertTrue(span_processor.force_flush())
+
+        self.assertEqual(mock_post.call_count, 3)
+        self.assertEqual(
+            zlib.decompress(mock_post.call_args.kwargs["data"]),
+            encode_spans([span]).SerializePartialToString(),
+        )
+        span_processor.shutdown()
+
     @patch.object(Session, "post")
     def test_shutdown_interrupts_retry_backoff(self, mock_post):
         exporter = OTLPSpanExporter(timeout=1.5)
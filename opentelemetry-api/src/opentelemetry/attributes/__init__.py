@@ -6,8 +6,10 @@ import logging
 import threading
 from collections import OrderedDict
 from collections.abc import Mapping, MutableMapping, Sequence
+from contextlib import AbstractContextManager, nullcontext
 
 from opentelemetry.util import types
+from opentelemetry.util._striped_lock import StripedLock
 
 # bytes are accepted as a user supplied value for attributes but
 # decoded to strings internally.
@@ -33,6 +35,53 @@ def _type_name(t):
 
 
 _logger = logging.getLogger(__name__)
+# Attribute maps are created for every span, event, link and log record, so
+# they share a pool of locks instead of allocating one each.
+_LOCKS = StripedLock(threading.RLock)
+_NO_LOCK = nullcontext()
+
+
+# Attribute values that are sequences are cleaned element by element. The same
+# values tend to be set over and over, so the cleaned tuples are kept, keyed by
+# the elements and their types since for instance (1, 0) == (True, False).
+# Only valid sequences are kept, so the warnings for invalid ones are still
+# logged every time. Only short sequences of strings, booleans and integers
+# are kept: floats compare equal across values (-0.0 == 0.0, 1.0 == 1) and
+# nested sequences would need their element types in the key as well.
+_CLEANED_SEQUENCES_MAX_SIZE = 1024
+_CACHED_SEQUENCE_MAX_LEN = 16
+_CACHED_ELEMENT_TYPES = frozenset((str, bool, int))
+_CLEANED_SEQUENCES: dict[tuple, tuple] = {}
+_CLEANED_EXTENDED_SEQUENCES: dict[tuple, tuple] = {}
+
+
+def _sequence_cache_key(value: Sequence, max_len: int | None) -> tuple | None:
+    if (
+        type(value) not in (tuple, list)
+        or len(value) > _CACHED_SEQUENCE_MAX_LEN
+    ):
+        return None
+    value_types = tuple(map(type, value))
+    if not _CACHED_ELEMENT_TYPES.issuperset(value_types):
+        return None
+    return (tuple(value), value_types, max_len)
+
+
+def _remember_cleaned_sequence(
+    cache: dict[tuple, tuple],
+    cache_key: tuple | None,
+    cleaned: tuple,
+    max_len: int | None,
+) -> tuple:
+    if cache_key is not None:
+        if len(cache) >= _CLEANED_SEQUENCES_MAX_SIZE:
+            cache.clear()
+        cache[cache_key] = cleaned
+        # Cleaning an already cleaned tuple gives the same tuple.
+        cleaned_key = _sequence_cache_key(cleaned, max_len)
+        if cleaned_key is not None:
+            cache[cleaned_key] = cleaned
+    return cleaned
 
 
 def _clean_attribute(
@@ -57,15 +106,28 @@ def _clean_attribute(
         _logger.warning("invalid key `%s`. must be non-empty string.", key)
         return None
 
+    clean_value = _CLEAN_ATTRIBUTE_VALUE_BY_TYPE.get(type(value))
+    if clean_value is not None:
+        return clean_value(value, max_len)
+
     if isinstance(value, _VALID_ATTR_VALUE_TYPES):
         return _clean_attribute_value(value, max_len)
 
     if isinstance(value, Sequence):
+        cache_key = _sequence_cache_key(value, max_len)
+        if cache_key is not None:
+            cleaned = _CLEANED_SEQUENCES.get(cache_key)
+            if cleaned is not None:
+                return cleaned
+
         sequence_first_valid_type = None
         cleaned_seq = []
 
         for element in value:
-            element = _clean_attribute_value(element, max_len)  # type: ignore
+            clean_value = _CLEAN_ATTRIBUTE_VALUE_BY_TYPE.get(
+                type(element), _clean_attribute_value
+            )
+            element = clean_value(element, max_len)  # type: ignore
             if element is None:
                 cleaned_seq.append(element)
                 continue
@@ -102,7 +164,9 @@ def _clean_attribute(
             cleaned_seq.append(element)
 
         # Freeze mutable sequences defensively
-        return tuple(cleaned_seq)
+        return _remember_cleaned_sequence(
+            _CLEANED_SEQUENCES, cache_key, tuple(cleaned_seq), max_len
+        )
 
     _logger.warning(
         "Invalid type %s for attribute '%s' value. Expected one of %s or a "
@@ -140,6 +204,12 @@ def _clean_extended_attribute_value(  # pylint: disable=too-many-branches
         return cleaned_dict
 
     if isinstance(value, Sequence):
+        cache_key = _sequence_cache_key(value, max_len)
+        if cache_key is not None:
+            cleaned = _CLEANED_EXTENDED_SEQUENCES.get(cache_key)
+            if cleaned is not None:
+                return cleaned
+
         sequence_first_valid_type = None
         cleaned_seq: list[types.AnyValue] = []
 
@@ -174,7 +244,9 @@ def _clean_extended_attribute_value(  # pylint: disable=too-many-branches
             cleaned_seq.append(element)
 
         # Freeze mutable sequences defensively
-        return tuple(cleaned_seq)
+        return _remember_cleaned_sequence(
+            _CLEANED_EXTENDED_SEQUENCES, cache_key, tuple(cleaned_seq), max_len
+        )
 
     # Some applications such as Django add values to log records whose types fall outside the
     # primitive types and `_VALID_ANY_VALUE_TYPES`, i.e., they are not of type `AnyValue`.
@@ -232,11 +304,39 @@ def _clean_attribute_value(
     return value
 
 
+def _keep_attribute_value(
+    value: types.AttributeValue, limit: int | None
+) -> types.AttributeValue:
+    return value
+
+
+def _truncate_attribute_value(value: str, limit: int | None) -> str:
+    if limit is not None:
+        return value[:limit]
+    return value
+
+
+# Cleans the values of the most common exact types without going through the
+# isinstance checks of `_clean_attribute`.
+_CLEAN_ATTRIBUTE_VALUE_BY_TYPE = {
+    bool: _keep_attribute_value,
+    int: _keep_attribute_value,
+    float: _keep_attribute_value,
+    str: _truncate_attribute_value,
+    bytes: _clean_attribute_value,
+}
+
+
 class BoundedAttributes(MutableMapping):  # type: ignore
     """An ordered dict with a fixed max capacity.
 
     Oldest elements are dropped when the dict is full and a new element is
     added.
+
+    Pass ``thread_safe=False`` when the owner of the mapping already
+    serializes all the changes to it, for instance under its own lock, to skip
+    the internal locking. Once the mapping is immutable it is iterated without
+    being copied.
     """
 
     def __init__(
@@ -246,6 +346,8 @@ class BoundedAttributes(MutableMapping):  # type: ignore
         immutable: bool = True,
         max_value_len: int | None = None,
         extended_attributes: bool = False,
+        *,
+        thread_safe: bool = True,
     ):
         if maxlen is not None:
             if not isinstance(maxlen, int) or maxlen < 0:
@@ -262,12 +364,19 @@ class BoundedAttributes(MutableMapping):  # type: ignore
             MutableMapping[str, types.AnyValue]
             | OrderedDict[str, types.AnyValue]
         ) = {}
-        self._lock = threading.RLock()
+        self._lock_stripe = _LOCKS.assign() if thread_safe else None
+        self._immutable = False
         if attributes:
             for key, value in attributes.items():
                 self[key] = value
         self._immutable = immutable
 
+    @property
+    def _lock(self) -> AbstractContextManager[bool]:
+        if self._lock_stripe is None:
+            return _NO_LOCK
+        return _LOCKS.lock(self._lock_stripe)
+
     def __repr__(self) -> str:
         return f"{dict(self._dict)}"
 
@@ -275,39 +384,46 @@ class BoundedAttributes(MutableMapping):  # type: ignore
         return self._dict[key]
 
     def __setitem__(self, key: str, value: types.AnyValue) -> None:
-        if getattr(self, "_immutable", False):  # type: ignore
+        if self._immutable:
             raise TypeError
-        with self._lock:
-            if self.maxlen is not None and self.maxlen == 0:
-                self.dropped += 1
+        if self._lock_stripe is None:
+            self._set(key, value)
+        else:
+            with _LOCKS.lock(self._lock_stripe):
+                self._set(key, value)
+
+    def _set(self, key: str, value: types.AnyValue) -> None:
+        if self.maxlen is not None and self.maxlen == 0:
+            self.dropped += 1
+            return
+
+        if self._extended_attributes:
+            value = _clean_extended_attribute(key, value, self.max_value_len)
+        else:
+            value = _clean_attribute(key, value, self.max_value_len)  # type: ignore
+            if value is None:
                 return
 
-            if self._extended_attributes:
-                value = _clean_extended_attribute(
-                    key, value, self.max_value_len
-                )
-            else:
-                value = _clean_attribute(key, value, self.max_value_len)  # type: ignore
-                if value is None:
-                    return
-
-            if key in self._dict:
-                del self._dict[key]
-            elif self.maxlen is not None and len(self._dict) == self.maxlen:
-                if not isinstance(self._dict, OrderedDict):
-                    self._dict = OrderedDict(self._dict)
-                self._dict.popitem(last=False)  # type: ignore
-                self.dropped += 1
+        if key in self._dict:
+            del self._dict[key]
+        elif self.maxlen is not None and len(self._dict) == self.maxlen:
+            if not isinstance(self._dict, OrderedDict):
+                self._dict = OrderedDict(self._dict)
+            self._dict.popitem(last=False)  # type: ignore
+            self.dropped += 1
 
-            self._dict[key] = value  # type: ignore
+        self._dict[key] = value  # type: ignore
 
     def __delitem__(self, key: str) -> None:
-        if getattr(self, "_immutable", False):  # type: ignore
+        if self._immutable:
             raise TypeError
         with self._lock:
             del self._dict[key]
 
     def __iter__(self):  # type: ignore
+        if self._immutable:
+            # Nothing can change the mapping anymore.
+            return iter(self._dict)
         with self._lock:
             return iter(self._dict.copy())  # type: ignore
 
@@ -320,6 +436,7 @@ class BoundedAttributes(MutableMapping):  # type: ignore
             immutable=self._immutable,
             max_value_len=self.max_value_len,
             extended_attributes=self._extended_attributes,
+            thread_safe=self._lock_stripe is not None,
         )
         memo[id(self)] = copy_
         with self._lock:
@@ -445,6 +445,9 @@ class SpanContext(tuple[int, int, bool, "TraceFlags", "TraceState", bool]):
         trace_state: Tracing-system-specific info to propagate.
     """
 
+    # Span contexts are immutable, so they do not need a __dict__.
+    __slots__ = ()
+
     def __new__(
         cls,
         trace_id: int,
@@ -0,0 +1,46 @@
+# Copyright The OpenTelemetry Authors
+# SPDX-License-Identifier: Apache-2.0
+
+import os
+from collections.abc import Callable
+from contextlib import AbstractContextManager
+from itertools import count
+
+_DEFAULT_STRIPES = 64
+
+
+class StripedLock:
+    """A fixed pool of locks shared by many short lived objects.
+
+    Objects that would otherwise allocate a lock each get a stripe from
+    `assign` and use the lock returned by `lock` for that stripe. Stripes are
+    handed out round robin, so unrelated objects rarely contend.
+
+    Unrelated objects share the lock of a stripe, so code running under the
+    lock of one object may acquire it again through another one, e.g. from a
+    logging handler. Pools of objects that run arbitrary code under their lock
+    must therefore use reentrant locks.
+    """
+
+    def __init__(
+        self,
+        lock_factory: Callable[[], AbstractContextManager[bool]],
+        stripes: int = _DEFAULT_STRIPES,
+    ) -> None:
+        self._lock_factory = lock_factory
+        self._stripes = stripes
+        self._locks = [lock_factory() for _ in range(stripes)]
+        self._next_stripe = count()
+        if hasattr(os, "register_at_fork"):
+            # A lock held by another thread at fork time would otherwise never
+            # be released in the child.
+            os.register_at_fork(after_in_child=self._at_fork_reinit)
+
+    def assign(self) -> int:
+        return next(self._next_stripe) % self._stripes
+
+    def lock(self, stripe: int) -> AbstractContextManager[bool]:
+        return self._locks[stripe]
+
+    def _at_fork_reinit(self) -> None:
+        self._locks = [self._lock_factory() for _ in range(self._stripes)]
@@ -4,11 +4,13 @@
 # type: ignore
 
 import copy
+import math
 import unittest
 import unittest.mock
 from collections.abc import MutableSequence
 
 from opentelemetry.attributes import (
+    _CLEANED_SEQUENCES,
     BoundedAttributes,
     _clean_attribute,
     _clean_extended_attribute,
@@ -65,6 +67,54 @@ class TestAttributes(unittest.TestCase):
         self.assertInvalid("value", "")
         self.assertInvalid("value", None)
 
+    def test_clean_attribute_subclasses(self):
+        class Flag(int):
+            pass
+
+        class Name(str):
+            pass
+
+        self.assertEqual(_clean_attribute("k", Flag(3), None), 3)
+        self.assertEqual(_clean_attribute("k", Name("long"), 2), "lo")
+        self.assertEqual(_clean_attribute("k", "long", 2), "lo")
+        self.assertEqual(_clean_attribute("k", b"bytes", None), "bytes")
+        self.assertEqual(
+            _clean_attribute("k", [Name("long"), "long"], 2), ("lo", "lo")
+        )
+
+    def test_clean_attribute_caches_sequences(self):
+        cleaned = _clean_attribute("k", ["a", "b"], None)
+        self.assertIs(_clean_attribute("k", ["a", "b"], None), cleaned)
+        self.assertIs(_clean_attribute("k", cleaned, None), cleaned)
+        self.assertEqual(_clean_attribute("k", ["abc"], 1), ("a",))
+        self.assertEqual(_clean_attribute("k", ["abc"], None), ("abc",))
+        # Equal sequences of different types are cleaned separately.
+        self.assertEqual(_clean_attribute("k", [1, 0], None), (1, 0))
+        self.assertIs(
+            type(_clean_attribute("k", [True, False], None)[0]), bool
+        )
+        for _ in range(2):
+            with self.assertLogs(level="WARNING"):
+                self.assertInvalid(("a", 1))
+
+    def test_sequence_cache_is_bounded(self):
+        with unittest.mock.patch(
+            "opentelemetry.attributes._CLEANED_SEQUENCES_MAX_SIZE", 4
+        ):
+            for num in range(10):
+                _clean_attribute("k", [num], None)
+            self.assertLessEqual(len(_CLEANED_SEQUENCES), 4)
+
+    def test_float_and_long_sequences_are_not_cached(self):
+        _clean_attribute("k", [0.0], None)
+        cleaned = _clean_attribute("k", [-0.0], None)
+        self.assertEqual(math.copysign(1, cleaned[0]), -1)
+        long_sequence = ["a"] * 100
+        self.assertEqual(
+            _clean_attribute("k", long_sequence, None), tuple(long_sequence)
+        )
+        self.assertNotIn(tuple(long_sequence), _CLEANED_SEQUENCES.values())
+
     def test_sequence_attr_decode(self):
         seq = [
             None,
@@ -151,6 +201,24 @@ class TestExtendedAttributes(unittest.TestCase):
             _clean_extended_attribute("headers", seq, None), tuple(seq)
         )
 
+    def test_nested_sequences_are_not_mixed_up(self):
+        # Equal nested sequences of different element types are cleaned
+        # separately.
+        self.assertEqual(
+            _clean_extended_attribute("k", [(1, 0)], None), ((1, 0),)
+        )
+        cleaned = _clean_extended_attribute("k", [(True, False)], None)
+        self.assertEqual(cleaned, ((True, False),))
+        self.assertIs(type(cleaned[0][0]), bool)
+
+        self.assertEqual(_clean_extended_attribute("k", [(1,)], None), ((1,),))
+        cleaned = _clean_extended_attribute("k", [(1.0,)], None)
+        self.assertIs(type(cleaned[0][0]), float)
+
+        _clean_extended_attribute("k", [(0.0,)], None)
+        cleaned = _clean_extended_attribute("k", [(-0.0,)], None)
+        self.assertEqual(math.copysign(1, cleaned[0][0]), -1)
+
     def test_mapping(self):
         mapping = {
             "": "invalid",
@@ -321,6 +389,29 @@ class TestBoundedAttributes(unittest.TestCase):
         with self.assertRaises(TypeError):
             _clean_extended_attribute_value(BadStr(), None)
 
+    # pylint: disable=protected-access
+    def test_not_thread_safe(self):
+        bdict = BoundedAttributes(2, immutable=False, thread_safe=False)
+        for num in range(3):
+            bdict[str(num)] = num
+        self.assertEqual(dict(bdict), {"1": 1, "2": 2})
+        self.assertEqual(bdict.dropped, 1)
+        self.assertIsNone(bdict._lock_stripe)
+        self.assertIsNone(copy.deepcopy(bdict)._lock_stripe)
+
+    # pylint: disable=protected-access
+    def test_immutable_iteration_does_not_copy(self):
+        mutable = BoundedAttributes(attributes=self.base, immutable=False)
+        keys = iter(mutable)
+        mutable._dict["new"] = "value"
+        self.assertEqual(list(keys), list(self.base))
+
+        immutable = BoundedAttributes(attributes=self.base)
+        keys = iter(immutable)
+        immutable._dict["new"] = "value"
+        with self.assertRaises(RuntimeError):
+            list(keys)
+
     def test_deepcopy(self):
         bdict = BoundedAttributes(4, self.base, immutable=False)
         bdict.dropped = 10
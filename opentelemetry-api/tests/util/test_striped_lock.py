@@ -0,0 +1,24 @@
+# Copyright The OpenTelemetry Authors
+# SPDX-License-Identifier: Apache-2.0
+
+# pylint: disable=protected-access
+import threading
+import unittest
+
+from opentelemetry.util._striped_lock import StripedLock
+
+
+class TestStripedLock(unittest.TestCase):
+    def test_stripes_are_assigned_round_robin(self):
+        striped_lock = StripedLock(threading.Lock, stripes=4)
+        self.assertEqual(
+            [striped_lock.assign() for _ in range(6)], [0, 1, 2, 3, 0, 1]
+        )
+        self.assertIs(striped_lock.lock(1), striped_lock.lock(1))
+        self.assertIsNot(striped_lock.lock(1), striped_lock.lock(2))
+
+    def test_at_fork_reinit_releases_locks(self):
+        striped_lock = StripedLock(threading.Lock, stripes=2)
+        striped_lock.lock(0).acquire()
+        striped_lock._at_fork_reinit()
+        self.assertTrue(striped_lock.lock(0).acquire(blocking=False))
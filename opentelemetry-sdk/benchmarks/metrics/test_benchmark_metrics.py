@@ -2,7 +2,11 @@
 # SPDX-License-Identifier: Apache-2.0
 import pytest
 
-from opentelemetry.sdk.metrics import Counter, MeterProvider
+from opentelemetry.sdk.metrics import (
+    AlwaysOffExemplarFilter,
+    Counter,
+    MeterProvider,
+)
 from opentelemetry.sdk.metrics._internal import (
     _default_meter_configurator,
     _disable_meter_configurator,
@@ -25,11 +29,18 @@ provider_reader_cumulative = MeterProvider(
     metric_readers=[reader_cumulative],
 )
 provider_reader_delta = MeterProvider(metric_readers=[reader_delta])
+provider_exemplars_off = MeterProvider(
+    metric_readers=[InMemoryMetricReader()],
+    exemplar_filter=AlwaysOffExemplarFilter(),
+)
 meter_cumulative = provider_reader_cumulative.get_meter("sdk_meter_provider")
 meter_delta = provider_reader_delta.get_meter("sdk_meter_provider_delta")
 counter_cumulative = meter_cumulative.create_counter("test_counter")
 counter_delta = meter_delta.create_counter("test_counter2")
 udcounter = meter_cumulative.create_up_down_counter("test_udcounter")
+counter_exemplars_off = provider_exemplars_off.get_meter(
+    "sdk_meter_provider_exemplars_off"
+).create_counter("test_counter3")
 
 
 @pytest.mark.parametrize(
@@ -62,6 +73,27 @@ def test_counter_add(benchmark, num_labels, temporality):
     benchmark(benchmark_counter_add)
 
 
+@pytest.mark.parametrize("num_labels", [0, 1, 3, 5, 10])
+def test_bound_counter_add(benchmark, num_labels):
+    labels = {f"Key{i}": f"Value{i}" for i in range(num_labels)}
+    bound_counter = counter_cumulative.bind(labels)
+
+    def benchmark_bound_counter_add():
+        bound_counter.add(1)
+
+    benchmark(benchmark_bound_counter_add)
+
+
+@pytest.mark.parametrize("num_labels", [0, 1, 3, 5, 10])
+def test_counter_add_exemplars_off(benchmark, num_labels):
+    labels = {f"Key{i}": f"Value{i}" for i in range(num_labels)}
+
+    def benchmark_counter_add_exemplars_off():
+        counter_exemplars_off.add(1, labels)
+
+    benchmark(benchmark_counter_add_exemplars_off)
+
+
 @pytest.mark.parametrize("num_labels", [0, 1, 3, 5, 10])
 def test_up_down_counter_add(benchmark, num_labels):
     labels = {}
@@ -0,0 +1,44 @@
+# Copyright The OpenTelemetry Authors
+# SPDX-License-Identifier: Apache-2.0
+
+# Collects counters and histograms with many cumulative streams of which only
+# one in a hundred receives measurements between collections.
+
+# pylint: disable=invalid-name
+import pytest
+
+from opentelemetry.sdk.metrics import Counter, Histogram, MeterProvider
+from opentelemetry.sdk.metrics.export import InMemoryMetricReader
+
+STREAMS = 10000
+CHANGED_STREAMS_STEP = 100
+
+
+def _create_reader(skip_unchanged_streams):
+    reader = InMemoryMetricReader(
+        cardinality_limits={Counter: STREAMS + 1, Histogram: STREAMS + 1},
+        skip_unchanged_streams=skip_unchanged_streams,
+    )
+    meter = MeterProvider(metric_readers=[reader]).get_meter(
+        "sdk_meter_provider"
+    )
+    counter = meter.create_counter("test_counter")
+    histogram = meter.create_histogram("test_histogram")
+    for stream in range(STREAMS):
+        counter.add(1, {"Key0": stream})
+        histogram.record(stream, {"Key0": stream})
+    reader.get_metrics_data()
+    return reader, counter, histogram
+
+
+@pytest.mark.parametrize("skip_unchanged_streams", [False, True])
+def test_collect_cumulative(benchmark, skip_unchanged_streams):
+    reader, counter, histogram = _create_reader(skip_unchanged_streams)
+
+    def benchmark_collect_cumulative():
+        for stream in range(0, STREAMS, CHANGED_STREAMS_STEP):
+            counter.add(1, {"Key0": stream})
+            histogram.record(stream, {"Key0": stream})
+        reader.get_metrics_data()
+
+    benchmark(benchmark_collect_cumulative)
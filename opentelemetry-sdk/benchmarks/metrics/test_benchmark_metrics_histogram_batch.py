@@ -0,0 +1,78 @@
+# Copyright The OpenTelemetry Authors
+# SPDX-License-Identifier: Apache-2.0
+
+# pylint: disable=invalid-name
+import random
+from array import array
+
+import pytest
+
+from opentelemetry.sdk.metrics import MeterProvider
+from opentelemetry.sdk.metrics.export import InMemoryMetricReader
+from opentelemetry.sdk.metrics.view import (
+    ExplicitBucketHistogramAggregation,
+    View,
+)
+
+MAX_BOUND_VALUE = 10000
+VALUES_PER_ROUND = 1000
+
+
+def _generate_bounds(bound_count):
+    return [i * MAX_BOUND_VALUE / bound_count for i in range(bound_count)]
+
+
+reader = InMemoryMetricReader()
+provider = MeterProvider(
+    metric_readers=[reader],
+    views=[
+        View(
+            instrument_name="test_histogram_1000_bound",
+            aggregation=ExplicitBucketHistogramAggregation(
+                _generate_bounds(1000)
+            ),
+        ),
+    ],
+)
+meter = provider.get_meter("sdk_meter_provider")
+histograms = {
+    "default": meter.create_histogram("test_histogram_default"),
+    "1000_bound": meter.create_histogram("test_histogram_1000_bound"),
+}
+values = array(
+    "d", (random.random() * MAX_BOUND_VALUE for _ in range(VALUES_PER_ROUND))
+)
+labels = {"Key0": "Value0"}
+
+
+@pytest.mark.parametrize("bounds", ["default", "1000_bound"])
+def test_histogram_record_each(benchmark, bounds):
+    hist = histograms[bounds]
+
+    def benchmark_histogram_record_each():
+        for value in values:
+            hist.record(value, labels)
+
+    benchmark(benchmark_histogram_record_each)
+
+
+@pytest.mark.parametrize("bounds", ["default", "1000_bound"])
+def test_histogram_record_many(benchmark, bounds):
+    hist = histograms[bounds]
+
+    def benchmark_histogram_record_many():
+        hist.record_many(values, labels)
+
+    benchmark(benchmark_histogram_record_many)
+
+
+@pytest.mark.parametrize("bounds", ["default", "1000_bound"])
+def test_histogram_record_many_numpy(benchmark, bounds):
+    numpy = pytest.importorskip("numpy")
+    hist = histograms[bounds]
+    numpy_values = numpy.frombuffer(values, dtype=numpy.float64)
+
+    def benchmark_histogram_record_many_numpy():
+        hist.record_many(numpy_values, labels)
+
+    benchmark(benchmark_histogram_record_many_numpy)
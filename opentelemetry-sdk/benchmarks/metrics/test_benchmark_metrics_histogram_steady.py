@@ -8,6 +8,7 @@ from opentelemetry.sdk.metrics import MeterProvider
 from opentelemetry.sdk.metrics.export import InMemoryMetricReader
 from opentelemetry.sdk.metrics.view import (
     ExplicitBucketHistogramAggregation,
+    ExponentialBucketHistogramAggregation,
     View,
 )
 
@@ -37,6 +38,10 @@ hist_view_1000 = View(
     instrument_name="test_histogram_1000_bound",
     aggregation=ExplicitBucketHistogramAggregation(_generate_bounds(1000)),
 )
+hist_view_exponential = View(
+    instrument_name="test_histogram_exponential",
+    aggregation=ExponentialBucketHistogramAggregation(),
+)
 reader = InMemoryMetricReader()
 provider = MeterProvider(
     metric_readers=[reader],
@@ -45,6 +50,7 @@ provider = MeterProvider(
         hist_view_49,
         hist_view_50,
         hist_view_1000,
+        hist_view_exponential,
     ],
 )
 meter = provider.get_meter("sdk_meter_provider")
@@ -53,6 +59,7 @@ hist10 = meter.create_histogram("test_histogram_10_bound")
 hist49 = meter.create_histogram("test_histogram_49_bound")
 hist50 = meter.create_histogram("test_histogram_50_bound")
 hist1000 = meter.create_histogram("test_histogram_1000_bound")
+hist_exponential = meter.create_histogram("test_histogram_exponential")
 
 
 def test_histogram_record(benchmark):
@@ -98,3 +105,23 @@ def test_histogram_record_1000(benchmark):
         hist1000.record(next(values))
 
     benchmark(benchmark_histogram_record_1000)
+
+
+def test_histogram_record_exponential(benchmark):
+    values = itertools.cycle(_generate_bounds(1000))
+
+    def benchmark_histogram_record_exponential():
+        hist_exponential.record(next(values))
+
+    benchmark(benchmark_histogram_record_exponential)
+
+
+def test_histogram_collect_exponential(benchmark):
+    for value in _generate_bounds(1000):
+        hist_exponential.record(value)
+
+    def benchmark_histogram_collect_exponential():
+        hist_exponential.record(MAX_BOUND_VALUE)
+        reader.get_metrics_data()
+
+    benchmark(benchmark_histogram_collect_exponential)
@@ -0,0 +1,54 @@
+# Copyright The OpenTelemetry Authors
+# SPDX-License-Identifier: Apache-2.0
+
+# Every round, each thread adds ADDS_PER_THREAD times to the same counter, so
+# the time of a round stays flat as threads are added when adds scale. With
+# the GIL rounds take longer with every thread whatever the mode, striped sums
+# pay off on free-threaded CPython builds where threads add in parallel.
+
+# pylint: disable=invalid-name
+from concurrent.futures import ThreadPoolExecutor
+
+import pytest
+
+from opentelemetry.sdk.metrics import MeterProvider
+from opentelemetry.sdk.metrics.export import InMemoryMetricReader
+from opentelemetry.sdk.metrics.view import SumAggregation, View
+
+ADDS_PER_THREAD = 1000
+
+reader = InMemoryMetricReader()
+provider = MeterProvider(
+    metric_readers=[reader],
+    views=[
+        View(
+            instrument_name="test_counter_striped",
+            aggregation=SumAggregation(stripes=16),
+        ),
+    ],
+)
+meter = provider.get_meter("sdk_meter_provider")
+counters = {
+    "default": meter.create_counter("test_counter_default"),
+    "striped": meter.create_counter("test_counter_striped"),
+}
+labels = {"Key0": "Value0"}
+
+
+@pytest.mark.parametrize("num_threads", [1, 2, 4, 8])
+@pytest.mark.parametrize("mode", ["default", "striped"])
+def test_counter_add_threads(benchmark, num_threads, mode):
+    counter = counters[mode]
+
+    def add():
+        for _ in range(ADDS_PER_THREAD):
+            counter.add(1, labels)
+
+    with ThreadPoolExecutor(max_workers=num_threads) as executor:
+
+        def benchmark_counter_add_threads():
+            futures = [executor.submit(add) for _ in range(num_threads)]
+            for future in futures:
+                future.result()
+
+        benchmark(benchmark_counter_add_threads)
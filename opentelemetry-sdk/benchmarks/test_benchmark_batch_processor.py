@@ -0,0 +1,51 @@
+# Copyright The OpenTelemetry Authors
+# SPDX-License-Identifier: Apache-2.0
+
+# pylint: disable=protected-access
+from concurrent.futures import ThreadPoolExecutor
+
+import pytest
+
+from opentelemetry.sdk.trace import ReadableSpan
+from opentelemetry.sdk.trace.export import (
+    BatchSpanProcessor,
+    SpanExporter,
+    SpanExportResult,
+)
+from opentelemetry.sdk.util.instrumentation import InstrumentationScope
+
+SPAN = ReadableSpan(
+    "benchmark_span",
+    instrumentation_scope=InstrumentationScope("benchmark", "1.0.0"),
+)
+EMITS_PER_ROUND = 32768
+
+
+class NoOpSpanExporter(SpanExporter):
+    def export(self, spans):
+        return SpanExportResult.SUCCESS
+
+
+@pytest.mark.parametrize("sharded_queue", [False, True])
+@pytest.mark.parametrize("num_threads", [1, 8, 32])
+def test_batch_processor_emit(benchmark, num_threads, sharded_queue):
+    processor = BatchSpanProcessor(
+        NoOpSpanExporter(), sharded_queue=sharded_queue
+    )
+    emit = processor._batch_processor.emit
+    emits_per_thread = EMITS_PER_ROUND // num_threads
+
+    def emit_spans():
+        for _ in range(emits_per_thread):
+            emit(SPAN)
+
+    with ThreadPoolExecutor(max_workers=num_threads) as executor:
+
+        def benchmark_emit():
+            for future in [
+                executor.submit(emit_spans) for _ in range(num_threads)
+            ]:
+                future.result()
+
+        benchmark(benchmark_emit)
+    processor.shutdown()
@@ -0,0 +1,32 @@
+# Copyright The OpenTelemetry Authors
+# SPDX-License-Identifier: Apache-2.0
+
+from concurrent.futures import ThreadPoolExecutor
+
+import pytest
+
+from opentelemetry.sdk.trace.id_generator import RandomIdGenerator
+
+IDS_PER_ROUND = 32768
+
+
+@pytest.mark.parametrize("num_threads", [1, 8, 32])
+def test_generate_ids(benchmark, num_threads):
+    id_generator = RandomIdGenerator()
+    ids_per_thread = IDS_PER_ROUND // num_threads
+
+    def generate_ids():
+        # Root spans need both a trace ID and a span ID.
+        for _ in range(ids_per_thread):
+            id_generator.generate_trace_id()
+            id_generator.generate_span_id()
+
+    with ThreadPoolExecutor(max_workers=num_threads) as executor:
+
+        def benchmark_generate_ids():
+            for future in [
+                executor.submit(generate_ids) for _ in range(num_threads)
+            ]:
+                future.result()
+
+        benchmark(benchmark_generate_ids)
@@ -1,6 +1,7 @@
 # Copyright The OpenTelemetry Authors
 # SPDX-License-Identifier: Apache-2.0
 
+import tracemalloc
 from functools import lru_cache
 
 import pytest
@@ -26,6 +27,7 @@ tracer_provider = TracerProvider(
     ),
 )
 tracer = tracer_provider.get_tracer("sdk_tracer_provider")
+SPANS_PER_ALLOCATION_ROUND = 1000
 
 
 @pytest.fixture(params=[0, 1, 10, 50])
@@ -89,3 +91,61 @@ def test_simple_start_as_current_span(benchmark):
             span.add_event("benchmarkEvent")
 
     benchmark(benchmark_start_as_current_span)
+
+
+def test_span_allocations(benchmark):
+    """Records the peak memory allocated while creating and ending a span in
+    the ``peak_allocated_bytes_per_span`` extra info."""
+
+    def benchmark_start_span():
+        span = tracer.start_span(
+            "benchmarkedSpan",
+            attributes={"long.attribute": -10000000001000000000},
+        )
+        span.add_event("benchmarkEvent")
+        span.end()
+
+    tracemalloc.start()
+    try:
+        allocated_bytes = 0
+        for _ in range(SPANS_PER_ALLOCATION_ROUND):
+            before, _ = tracemalloc.get_traced_memory()
+            tracemalloc.reset_peak()
+            benchmark_start_span()
+            _, peak = tracemalloc.get_traced_memory()
+            allocated_bytes += peak - before
+    finally:
+        tracemalloc.stop()
+    benchmark.extra_info["peak_allocated_bytes_per_span"] = (
+        allocated_bytes // SPANS_PER_ALLOCATION_ROUND
+    )
+    benchmark(benchmark_start_span)
+
+
+def test_span_memory(benchmark):
+    """Records the memory retained by an ended span, for instance while it is
+    queued for export, in the ``retained_bytes_per_span`` extra info."""
+    spans = []
+
+    def benchmark_start_span():
+        span = tracer.start_span(
+            "benchmarkedSpan",
+            attributes={"long.attribute": -10000000001000000000},
+        )
+        span.add_event("benchmarkEvent")
+        span.end()
+        return span
+
+    tracemalloc.start()
+    try:
+        before, _ = tracemalloc.get_traced_memory()
+        for _ in range(SPANS_PER_ALLOCATION_ROUND):
+            spans.append(benchmark_start_span())
+        after, _ = tracemalloc.get_traced_memory()
+    finally:
+        tracemalloc.stop()
+    benchmark.extra_info["retained_bytes_per_span"] = (
+        after - before
+    ) // SPANS_PER_ALLOCATION_ROUND
+    spans.clear()
+    benchmark(benchmark_start_span)
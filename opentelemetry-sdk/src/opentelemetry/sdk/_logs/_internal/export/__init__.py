@@ -27,8 +27,11 @@ from opentelemetry.sdk._logs import (
     ReadWriteLogRecord,
 )
 from opentelemetry.sdk._shared_internal import (
+    AsyncBatchProcessor,
     BatchProcessor,
     DuplicateFilter,
+    _estimate_attributes_size,
+    _estimate_value_size,
 )
 from opentelemetry.sdk._shared_internal._processor_metrics import (
     create_processor_metrics,
@@ -58,6 +61,40 @@ _ENV_VAR_INT_VALUE_ERROR_MESSAGE = (
 _logger = logging.getLogger(__name__)
 _logger.addFilter(DuplicateFilter())
 
+# Rough number of bytes taken by the timestamps, ids, severity and other
+# fixed size fields of a log record once encoded.
+_LOG_RECORD_SIZE_ESTIMATE = 48
+
+
+def _estimate_log_record_size(readable_log_record: ReadableLogRecord) -> int:
+    log_record = readable_log_record.log_record
+    return (
+        _LOG_RECORD_SIZE_ESTIMATE
+        + len(log_record.severity_text or "")
+        + len(log_record.event_name or "")
+        + _estimate_value_size(log_record.body)
+        + _estimate_attributes_size(log_record.attributes)
+    )
+
+
+def _to_readable_log_record(
+    log_record: ReadWriteLogRecord,
+) -> ReadableLogRecord:
+    # Convert ReadWriteLogRecord to ReadableLogRecord before passing to the batch processors
+    # Note: resource should not be None at this point as it's set during Logger.emit()
+    resource = (
+        log_record.resource
+        if log_record.resource is not None
+        else Resource.create({})
+    )
+    return ReadableLogRecord(
+        log_record=log_record.log_record,
+        resource=resource,
+        instrumentation_scope=log_record.instrumentation_scope,
+        limits=log_record.limits,
+    )
+
+
 _propagate_false_logger = logging.getLogger(__name__ + ".propagate.false")
 _propagate_false_logger.propagate = False
 
@@ -257,6 +294,29 @@ class BatchLogRecordProcessor(LogRecordProcessor):
     - :envvar:`OTEL_BLRP_EXPORT_TIMEOUT`
 
     All the logic for emitting logs, shutting down etc. resides in the BatchProcessor class.
+
+    When ``sharded_queue`` is ``True`` every emitting thread buffers logs in
+    its own queue, which the worker thread drains in a single sweep. This
+    avoids contention between threads emitting logs concurrently.
+    ``max_queue_size`` still bounds the logs buffered by all the threads,
+    once it is reached new logs are dropped.
+
+    ``export_timeout_millis`` is passed to exporters whose ``export`` accepts
+    a ``timeout_millis`` argument. ``force_flush`` returns ``False`` once its
+    timeout passes instead of waiting for the exporter.
+
+    ``max_concurrent_exports`` bounds the number of batches handed to the
+    exporter at the same time. With a value above 1 a slow export no longer
+    stops the worker from draining the queue, but batches of logs may reach
+    the exporter out of order.
+
+    ``max_export_batch_bytes`` additionally cuts batches once their estimated
+    encoded size reaches the given number of bytes, to stay below the request
+    size limits of receivers. The estimate is cheap and approximate.
+
+    ``pipelined_exports`` makes the worker thread encode the next batch of
+    logs while the previous one is sent from an export thread, for
+    exporters which support it such as the OTLP exporters.
     """
 
     def __init__(
@@ -268,6 +328,10 @@ class BatchLogRecordProcessor(LogRecordProcessor):
         max_queue_size: int | None = None,
         *,
         meter_provider: MeterProvider | None = None,
+        sharded_queue: bool = False,
+        max_concurrent_exports: int = 1,
+        max_export_batch_bytes: int | None = None,
+        pipelined_exports: bool = False,
     ):
         if max_queue_size is None:
             max_queue_size = BatchLogRecordProcessor._default_max_queue_size()
@@ -281,7 +345,6 @@ class BatchLogRecordProcessor(LogRecordProcessor):
             max_export_batch_size = (
                 BatchLogRecordProcessor._default_max_export_batch_size()
             )
-        # Not used. No way currently to pass timeout to export.
         if export_timeout_millis is None:
             export_timeout_millis = (
                 BatchLogRecordProcessor._default_export_timeout_millis()
@@ -307,23 +370,15 @@ class BatchLogRecordProcessor(LogRecordProcessor):
                     OTEL_PYTHON_SDK_INTERNAL_METRICS_ENABLED
                 ),
             ),
+            sharded_queue=sharded_queue,
+            max_concurrent_exports=max_concurrent_exports,
+            max_export_batch_bytes=max_export_batch_bytes,
+            estimate_size=_estimate_log_record_size,
+            pipelined_exports=pipelined_exports,
         )
 
     def on_emit(self, log_record: ReadWriteLogRecord) -> None:
-        # Convert ReadWriteLogRecord to ReadableLogRecord before passing to BatchProcessor
-        # Note: resource should not be None at this point as it's set during Logger.emit()
-        resource = (
-            log_record.resource
-            if log_record.resource is not None
-            else Resource.create({})
-        )
-        readable_log_record = ReadableLogRecord(
-            log_record=log_record.log_record,
-            resource=resource,
-            instrumentation_scope=log_record.instrumentation_scope,
-            limits=log_record.limits,
-        )
-        return self._batch_processor.emit(readable_log_record)
+        return self._batch_processor.emit(_to_readable_log_record(log_record))
 
     def shutdown(self):
         return self._batch_processor.shutdown()
@@ -413,3 +468,87 @@ class BatchLogRecordProcessor(LogRecordProcessor):
             raise ValueError(
                 "max_export_batch_size must be less than or equal to max_queue_size."
             )
+
+
+class AsyncBatchLogRecordProcessor(LogRecordProcessor):
+    """Batch log record processor exporting from an asyncio event loop.
+
+    `AsyncBatchLogRecordProcessor` batches logs like
+    `BatchLogRecordProcessor`, and is configured by the same environment
+    variables, but sends them through an exporter whose ``export`` is a
+    coroutine, such as the asyncio OTLP exporters, from a task of the event
+    loop instead of a thread.
+
+    The processor binds to the event loop running when it is created, or
+    else to the loop of the first thread emitting logs while running one.
+    Await ``force_flush_async`` and ``shutdown_async`` from that loop,
+    ``force_flush`` and ``shutdown`` cannot block it.
+
+    All the logic for emitting logs, shutting down etc. resides in the
+    AsyncBatchProcessor class.
+    """
+
+    def __init__(
+        self,
+        exporter: LogRecordExporter,
+        schedule_delay_millis: float | None = None,
+        max_export_batch_size: int | None = None,
+        export_timeout_millis: float | None = None,
+        max_queue_size: int | None = None,
+        *,
+        meter_provider: MeterProvider | None = None,
+    ):
+        if max_queue_size is None:
+            max_queue_size = BatchLogRecordProcessor._default_max_queue_size()
+
+        if schedule_delay_millis is None:
+            schedule_delay_millis = (
+                BatchLogRecordProcessor._default_schedule_delay_millis()
+            )
+
+        if max_export_batch_size is None:
+            max_export_batch_size = (
+                BatchLogRecordProcessor._default_max_export_batch_size()
+            )
+        if export_timeout_millis is None:
+            export_timeout_millis = (
+                BatchLogRecordProcessor._default_export_timeout_millis()
+            )
+
+        BatchLogRecordProcessor._validate_arguments(
+            max_queue_size, schedule_delay_millis, max_export_batch_size
+        )
+        self._batch_processor = AsyncBatchProcessor(
+            exporter,
+            schedule_delay_millis,
+            max_export_batch_size,
+            export_timeout_millis,
+            max_queue_size,
+            "Log",
+            create_processor_metrics(
+                "logs",
+                OtelComponentTypeValues.BATCHING_LOG_PROCESSOR,
+                meter_provider or get_meter_provider(),
+                capacity=max_queue_size,
+                enabled=parse_boolean_environment_variable(
+                    OTEL_PYTHON_SDK_INTERNAL_METRICS_ENABLED
+                ),
+            ),
+        )
+
+    def on_emit(self, log_record: ReadWriteLogRecord) -> None:
+        return self._batch_processor.emit(_to_readable_log_record(log_record))
+
+    def shutdown(self):
+        return self._batch_processor.shutdown()
+
+    def force_flush(self, timeout_millis: int | None = None) -> bool:
+        return self._batch_processor.force_flush(timeout_millis)
+
+    async def shutdown_async(self, timeout_millis: int = 30000) -> None:
+        await self._batch_processor.shutdown_async(timeout_millis)
+
+    async def force_flush_async(
+        self, timeout_millis: int | None = None
+    ) -> bool:
+        return await self._batch_processor.force_flush_async(timeout_millis)
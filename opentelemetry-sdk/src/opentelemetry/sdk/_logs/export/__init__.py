@@ -2,6 +2,7 @@
 # SPDX-License-Identifier: Apache-2.0
 
 from opentelemetry.sdk._logs._internal.export import (
+    AsyncBatchLogRecordProcessor,
     BatchLogRecordProcessor,
     ConsoleLogExporter,
     ConsoleLogRecordExporter,
@@ -19,6 +20,7 @@ from opentelemetry.sdk._logs._internal.export.in_memory_log_exporter import (
 )
 
 __all__ = [
+    "AsyncBatchLogRecordProcessor",
     "BatchLogRecordProcessor",
     "ConsoleLogExporter",
     "ConsoleLogRecordExporter",
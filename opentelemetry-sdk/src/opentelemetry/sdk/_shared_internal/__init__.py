@@ -3,16 +3,22 @@
 
 from __future__ import annotations
 
+import asyncio
 import collections
+import concurrent.futures
 import enum
 import inspect
+import itertools
 import logging
 import os
+import queue
 import threading
 import time
 import weakref
 from abc import abstractmethod
+from collections.abc import Callable, Mapping
 from typing import (
+    Any,
     Generic,
     Protocol,
     TypeVar,
@@ -72,9 +78,128 @@ class Exporter(Protocol[Telemetry]):
         raise NotImplementedError
 
 
+def _supports_pipelined_exports(exporter: Exporter[Telemetry]) -> bool:
+    """Whether the exporter splits its exports in two stages:
+    ``_prepare_export(batch)`` builds the request for a batch, which is never
+    None, and ``_export_prepared(prepared, count, timeout_millis=...)``
+    sends it. ``export(batch)`` does both."""
+    exporter_type = type(exporter)
+    return callable(
+        getattr(exporter_type, "_prepare_export", None)
+    ) and callable(getattr(exporter_type, "_export_prepared", None))
+
+
 _logger = logging.getLogger(__name__)
 _logger.addFilter(DuplicateFilter())
 
+# Rough number of bytes a scalar value or a key value pair adds to an encoded
+# OTLP request besides the bytes of the strings it contains.
+_SCALAR_SIZE_ESTIMATE = 8
+_KEY_VALUE_OVERHEAD_ESTIMATE = 4
+
+
+def _estimate_value_size(value: Any) -> int:
+    """Cheaply estimates the encoded size in bytes of an attribute value or a
+    log body. This is not exact, it is only used to cut batches by size."""
+    if value is None:
+        return 0
+    if isinstance(value, (str, bytes)):
+        return len(value)
+    if isinstance(value, Mapping):
+        return _estimate_attributes_size(value)
+    if isinstance(value, (list, tuple)):
+        return sum(_estimate_value_size(item) + 2 for item in value)
+    return _SCALAR_SIZE_ESTIMATE
+
+
+def _estimate_attributes_size(attributes: Mapping[str, Any] | None) -> int:
+    if not attributes:
+        return 0
+    return sum(
+        len(key) + _estimate_value_size(value) + _KEY_VALUE_OVERHEAD_ESTIMATE
+        for key, value in attributes.items()
+    )
+
+
+class _DaemonThreadPool:
+    """Runs functions on up to ``max_workers`` daemon threads.
+
+    Unlike the threads of a ``concurrent.futures.ThreadPoolExecutor``, which
+    are joined at interpreter exit, a hung function cannot keep the process
+    from exiting once the SDK is shut down."""
+
+    def __init__(self, max_workers: int, thread_name_prefix: str):
+        self._max_workers = max_workers
+        self._thread_name_prefix = thread_name_prefix
+        self._tasks: queue.SimpleQueue = queue.SimpleQueue()
+        self._threads: list[threading.Thread] = []
+        self._idle = threading.Semaphore(0)
+        self._lock = threading.Lock()
+        self._shutdown = False
+
+    def submit(
+        self, fn: Callable[..., Any], /, *args: Any
+    ) -> concurrent.futures.Future:
+        future: concurrent.futures.Future = concurrent.futures.Future()
+        with self._lock:
+            if self._shutdown:
+                raise RuntimeError("cannot schedule new tasks after shutdown")
+            self._tasks.put((future, fn, args))
+            # Like ThreadPoolExecutor, threads are started as needed.
+            if (
+                not self._idle.acquire(blocking=False)
+                and len(self._threads) < self._max_workers
+            ):
+                thread = threading.Thread(
+                    name=f"{self._thread_name_prefix}_{len(self._threads)}",
+                    target=self._work,
+                    daemon=True,
+                )
+                thread.start()
+                self._threads.append(thread)
+        return future
+
+    def _work(self) -> None:
+        while True:
+            task = self._tasks.get()
+            if task is None:
+                return
+            future, fn, args = task
+            if future.set_running_or_notify_cancel():
+                try:
+                    result = fn(*args)
+                except BaseException as err:  # pylint: disable=broad-exception-caught
+                    future.set_exception(err)
+                else:
+                    future.set_result(result)
+            del task, future
+            self._idle.release()
+
+    def shutdown(self) -> None:
+        """Rejects new tasks. The threads exit once they ran the tasks already
+        submitted, without being waited for."""
+        with self._lock:
+            if self._shutdown:
+                return
+            self._shutdown = True
+            for _ in self._threads:
+                self._tasks.put(None)
+
+
+class _Shard:
+    """The telemetry emitted by a thread of a sharded BatchProcessor."""
+
+    __slots__ = ("thread", "items", "dropped", "released_drops")
+
+    def __init__(self, max_queue_size: int):
+        self.thread = threading.current_thread()
+        self.items: collections.deque = collections.deque([], max_queue_size)
+        # Only the owning thread increments it.
+        self.dropped = 0
+        # Drops already released from the reservations, only the worker
+        # updates it.
+        self.released_drops = 0
+
 
 class BatchProcessor(Generic[Telemetry]):
     """This class can be used with exporter's that implement the above
@@ -90,18 +215,62 @@ class BatchProcessor(Generic[Telemetry]):
         max_queue_size: int,
         exporting: str,
         metrics: ProcessorMetricsT,
+        *,
+        sharded_queue: bool = False,
+        max_concurrent_exports: int = 1,
+        max_export_batch_bytes: int | None = None,
+        estimate_size: Callable[[Telemetry], int] | None = None,
+        pipelined_exports: bool = False,
     ):
+        if max_concurrent_exports <= 0:
+            raise ValueError(
+                "max_concurrent_exports must be a positive integer."
+            )
+        if pipelined_exports and not _supports_pipelined_exports(exporter):
+            raise ValueError(
+                "pipelined_exports requires an exporter supporting them."
+            )
+        if max_export_batch_bytes is not None:
+            if max_export_batch_bytes <= 0:
+                raise ValueError(
+                    "max_export_batch_bytes must be a positive integer."
+                )
+            if estimate_size is None:
+                raise ValueError(
+                    "estimate_size is required with max_export_batch_bytes."
+                )
         self._bsp_reset_once = Once()
         self._exporter = exporter
         self._max_queue_size = max_queue_size
         self._schedule_delay_millis = schedule_delay_millis
         self._schedule_delay = schedule_delay_millis / 1e3
         self._max_export_batch_size = max_export_batch_size
-        # Not used. No way currently to pass timeout to export.
-        # TODO(https://github.com/open-telemetry/opentelemetry-python/issues/4555): figure out what this should do.
+        # Batches are also cut once their estimated size reaches this many
+        # bytes, a batch always contains at least one item.
+        self._max_export_batch_bytes = max_export_batch_bytes
+        self._estimate_size = estimate_size
+        # Passed to exporters whose export supports a timeout_millis param.
         self._export_timeout_millis = export_timeout_millis
+        export_argspec = inspect.getfullargspec(exporter.export)
+        self._export_accepts_timeout = (
+            "timeout_millis" in export_argspec.args
+            or "timeout_millis" in export_argspec.kwonlyargs
+        )
         # Deque is thread safe.
         self._queue = collections.deque([], max_queue_size)
+        # In sharded mode every emitting thread appends to its own deque, the
+        # worker moves the shards into `_queue` before exporting. This keeps
+        # emitting threads from contending on a single deque.
+        self._sharded_queue = sharded_queue
+        self._shards: list[_Shard] = []
+        self._shards_lock = threading.Lock()
+        self._local_shard = threading.local()
+        # `max_queue_size` bounds the items in all the shards and `_queue`.
+        # Emitting threads reserve a place for every item, whether it is
+        # appended or dropped, and the worker releases the places of the items
+        # it moved out of the shards or that were dropped.
+        self._shard_reservations = itertools.count()
+        self._shard_released = 0
         self._worker_thread = threading.Thread(
             name=f"OtelBatch{exporting}RecordProcessor",
             target=self.worker,
@@ -110,16 +279,36 @@ class BatchProcessor(Generic[Telemetry]):
         self._exporting = exporting
 
         self._shutdown = False
+        self._shutdown_deadline: float | None = None
         self._shutdown_timeout_exceeded = False
         self._export_lock = threading.Lock()
         self._worker_awaken = threading.Event()
+        # Pending force_flush calls, as (flushed event, deadline) tuples, which
+        # the worker thread serves so a hung export cannot block the caller.
+        self._flush_requests: list[tuple[threading.Event, float]] = []
+        self._flush_requests_lock = threading.Lock()
+        # With more than one concurrent export the worker hands batches to a
+        # pool of export threads. Once all of them are busy the worker blocks,
+        # so telemetry accumulates in (and eventually overflows) the queue.
+        self._max_concurrent_exports = max_concurrent_exports
+        # With pipelined exports the worker prepares the request for the next
+        # batch while the export threads send the previous ones.
+        self._pipelined_exports = pipelined_exports
+        self._export_executor: _DaemonThreadPool | None = None
+        self._export_slots = threading.BoundedSemaphore(max_concurrent_exports)
+        self._in_flight_exports: set[concurrent.futures.Future] = set()
+        self._in_flight_lock = threading.Lock()
+        self._init_export_executor()
         self._worker_thread.start()
-        if hasattr(os, "register_at_fork"):
+        # When fork hooks are available the child reinitializes itself, so emit
+        # does not need to compare pids on every call.
+        self._check_pid = not hasattr(os, "register_at_fork")
+        if not self._check_pid:
             weak_reinit = weakref.WeakMethod(self._at_fork_reinit)
             os.register_at_fork(after_in_child=lambda: weak_reinit()())  # pyright: ignore[reportOptionalCall] pylint: disable=unnecessary-lambda
         self._pid = os.getpid()
 
-        metrics.register_queue_size(lambda: len(self._queue))
+        metrics.register_queue_size(self._queue_size)
         self._metrics = metrics
 
     def _should_export_batch(
@@ -136,10 +325,31 @@ class BatchProcessor(Generic[Telemetry]):
             return num_iterations == 0
         return False
 
+    def _init_export_executor(self):
+        if self._max_concurrent_exports == 1 and not self._pipelined_exports:
+            return
+        self._export_executor = _DaemonThreadPool(
+            max_workers=self._max_concurrent_exports,
+            thread_name_prefix=f"OtelBatch{self._exporting}Export",
+        )
+        self._export_slots = threading.BoundedSemaphore(
+            self._max_concurrent_exports
+        )
+        self._in_flight_exports = set()
+        self._in_flight_lock = threading.Lock()
+
     def _at_fork_reinit(self):
         self._export_lock = threading.Lock()
+        self._init_export_executor()
         self._worker_awaken = threading.Event()
+        self._flush_requests = []
+        self._flush_requests_lock = threading.Lock()
         self._queue.clear()
+        self._shards = []
+        self._shards_lock = threading.Lock()
+        self._local_shard = threading.local()
+        self._shard_reservations = itertools.count()
+        self._shard_released = 0
         self._worker_thread = threading.Thread(
             name=f"OtelBatch{self._exporting}RecordProcessor",
             target=self.worker,
@@ -148,59 +358,245 @@ class BatchProcessor(Generic[Telemetry]):
         self._worker_thread.start()
         self._pid = os.getpid()
 
+    def _queue_size(self) -> int:
+        return len(self._queue) + sum(
+            len(shard.items) for shard in self._shards
+        )
+
+    def _register_shard(self) -> _Shard:
+        shard = _Shard(self._max_queue_size)
+        with self._shards_lock:
+            self._shards.append(shard)
+        self._local_shard.shard = shard
+        return shard
+
+    def _drain_shards(self) -> None:
+        dropped = 0
+        with self._shards_lock:
+            shards = self._shards
+            # Forget shards of threads that have exited once they are empty.
+            self._shards = [
+                shard
+                for shard in shards
+                if shard.items or shard.thread.is_alive()
+            ]
+        for shard in shards:
+            # Only the worker pops from shards, so this many items are
+            # guaranteed to be available even while the owner keeps appending.
+            for _ in range(len(shard.items)):
+                if len(self._queue) == self._max_queue_size:
+                    dropped += 1
+                # Shards are oldest first, `_queue` is oldest last.
+                self._queue.appendleft(shard.items.popleft())
+                # Released once the item is in `_queue`, so emitting threads
+                # never see fewer items than there are.
+                self._shard_released += 1
+            # Read once, the owner may be dropping items concurrently.
+            shard_dropped = shard.dropped
+            self._shard_released += shard_dropped - shard.released_drops
+            shard.released_drops = shard_dropped
+        if dropped:
+            _logger.warning("Queue full, dropping %s.", self._exporting)
+            self._metrics.drop_items(dropped)
+
     def worker(self):
         while not self._shutdown:
             # Lots of strategies in the spec for setting next timeout.
             # https://github.com/open-telemetry/opentelemetry-specification/blob/main/specification/trace/sdk.md#batching-processor.
             # Shutdown will interrupt this sleep. Emit will interrupt this sleep only if the queue is bigger then threshold.
+            # Force flush will interrupt this sleep too.
             sleep_interrupted = self._worker_awaken.wait(self._schedule_delay)
+            # Cleared before exporting so wake ups that happen during the
+            # export are not lost.
+            self._worker_awaken.clear()
             if self._shutdown:
                 break
+            with self._flush_requests_lock:
+                flush_requests = self._flush_requests
+                self._flush_requests = []
+            if flush_requests:
+                self._serve_flush_requests(flush_requests)
+                continue
             self._export(
                 BatchExportStrategy.EXPORT_WHILE_BATCH_EXCEEDS_THRESHOLD
                 if sleep_interrupted
                 else BatchExportStrategy.EXPORT_AT_LEAST_ONE_BATCH
             )
-            self._worker_awaken.clear()
-        self._export(BatchExportStrategy.EXPORT_ALL)
+        self._flush(self._shutdown_deadline)
 
-    def _export(self, batch_strategy: BatchExportStrategy) -> None:
+    def _serve_flush_requests(
+        self, flush_requests: list[tuple[threading.Event, float]]
+    ) -> None:
+        # Each flush picks up where the previous one stopped, so the requests
+        # are tried in order of their deadlines. Callers whose deadline passed
+        # before the queue was flushed time out waiting on their event and
+        # report failure, without failing the requests with later deadlines.
+        flush_requests.sort(key=lambda request: request[1])
+        for index, (_, deadline) in enumerate(flush_requests):
+            if self._shutdown:
+                return
+            if self._flush(deadline):
+                for flushed, _ in flush_requests[index:]:
+                    flushed.set()
+                return
+
+    def _flush(self, deadline: float | None) -> bool:
+        if not self._export(BatchExportStrategy.EXPORT_ALL, deadline):
+            return False
+        if deadline is None:
+            return self._wait_for_in_flight_exports()
+        return self._wait_for_in_flight_exports(
+            max(0.0, deadline - time.time())
+        )
+
+    def _export(
+        self,
+        batch_strategy: BatchExportStrategy,
+        deadline: float | None = None,
+    ) -> bool:
+        """Returns False if the deadline passed before all the batches
+        selected by `batch_strategy` were exported."""
         with self._export_lock:
+            if self._sharded_queue:
+                self._drain_shards()
             iteration = 0
             # We could see concurrent export calls from worker and force_flush. We call _should_export_batch
             # once the lock is obtained to see if we still need to make the requested export.
             while self._should_export_batch(batch_strategy, iteration):
+                if deadline is not None and time.time() >= deadline:
+                    return False
                 iteration += 1
-                token = attach(set_value(_SUPPRESS_INSTRUMENTATION_KEY, True))
-                error: Exception | None = None
-                count = 0
+                batch = self._next_batch()
+                if self._export_executor is None:
+                    self._export_batch(batch, deadline)
+                    continue
+                prepared = None
+                if self._pipelined_exports:
+                    prepared = self._prepare_batch(batch)
+                    if prepared is None:
+                        continue
+                # Blocks until one of the in-flight exports completes.
+                if not self._export_slots.acquire(  # pylint: disable=consider-using-with
+                    timeout=None
+                    if deadline is None
+                    else max(0.0, deadline - time.time())
+                ):
+                    self._requeue_batch(batch)
+                    return False
                 try:
-                    count = min(
-                        self._max_export_batch_size,
-                        len(self._queue),
-                    )
-                    self._exporter.export(
-                        [
-                            # Oldest records are at the back, so pop from there.
-                            self._queue.pop()
-                            for _ in range(count)
-                        ]
+                    future = self._export_executor.submit(
+                        self._export_batch, batch, deadline, prepared
                     )
-                except Exception as err:  # pylint: disable=broad-exception-caught
-                    error = err
-                    _logger.exception(
-                        "Exception while exporting %s.", self._exporting
-                    )
-                finally:
-                    self._metrics.finish_items(count, error)
-                detach(token)
+                except RuntimeError:
+                    # Shutdown timed out and stopped the export threads.
+                    self._export_slots.release()
+                    self._metrics.drop_items(len(batch))
+                    return False
+                with self._in_flight_lock:
+                    self._in_flight_exports.add(future)
+                future.add_done_callback(self._export_done)
+                if self._pipelined_exports:
+                    # Lets the export thread start sending before this thread
+                    # holds the GIL to prepare the next batch.
+                    time.sleep(0)
+        return True
+
+    def _next_batch(self) -> list[Telemetry]:
+        count = min(self._max_export_batch_size, len(self._queue))
+        if self._max_export_batch_bytes is None:
+            # Oldest records are at the back, so pop from there.
+            return [self._queue.pop() for _ in range(count)]
+        batch = [self._queue.pop()]
+        batch_bytes = self._estimate_size(batch[0])  # type: ignore[misc]
+        while len(batch) < count:
+            item_bytes = self._estimate_size(self._queue[-1])  # type: ignore[misc]
+            if batch_bytes + item_bytes > self._max_export_batch_bytes:
+                break
+            batch_bytes += item_bytes
+            batch.append(self._queue.pop())
+        return batch
+
+    def _requeue_batch(self, batch: list[Telemetry]) -> None:
+        """Puts back a batch that could not be exported before a deadline, so
+        that it is exported later."""
+        dropped = 0
+        # The batch is oldest first, `_queue` is oldest last.
+        for item in reversed(batch):
+            if len(self._queue) == self._max_queue_size:
+                dropped += 1
+            # This drops the newest item if the queue filled up meanwhile.
+            self._queue.append(item)
+        if dropped:
+            _logger.warning("Queue full, dropping %s.", self._exporting)
+            self._metrics.drop_items(dropped)
+
+    def _prepare_batch(self, batch: list[Telemetry]) -> Any:
+        """Runs the first stage of a pipelined export. Returns None, after
+        accounting for the batch, if it failed."""
+        token = attach(set_value(_SUPPRESS_INSTRUMENTATION_KEY, True))
+        try:
+            return self._exporter._prepare_export(batch)  # type: ignore  # pylint: disable=protected-access
+        except Exception as err:  # pylint: disable=broad-exception-caught
+            _logger.exception("Exception while exporting %s.", self._exporting)
+            self._metrics.finish_items(len(batch), err)
+            return None
+        finally:
+            detach(token)
+
+    def _export_batch(
+        self,
+        batch: list[Telemetry],
+        deadline: float | None,
+        prepared: Any = None,
+    ) -> None:
+        token = attach(set_value(_SUPPRESS_INSTRUMENTATION_KEY, True))
+        error: Exception | None = None
+        try:
+            timeout_millis = self._export_timeout_millis
+            if deadline is not None:
+                timeout_millis = min(
+                    timeout_millis,
+                    max(0.0, (deadline - time.time()) * 1000),
+                )
+            if prepared is not None:
+                self._exporter._export_prepared(  # type: ignore  # pylint: disable=protected-access
+                    prepared, len(batch), timeout_millis=timeout_millis
+                )
+            elif self._export_accepts_timeout:
+                self._exporter.export(batch, timeout_millis=timeout_millis)  # type: ignore
+            else:
+                self._exporter.export(batch)
+        except Exception as err:  # pylint: disable=broad-exception-caught
+            error = err
+            _logger.exception("Exception while exporting %s.", self._exporting)
+        finally:
+            self._metrics.finish_items(len(batch), error)
+        detach(token)
+
+    def _export_done(self, future: concurrent.futures.Future) -> None:
+        with self._in_flight_lock:
+            self._in_flight_exports.discard(future)
+        self._export_slots.release()
+
+    def _wait_for_in_flight_exports(
+        self, timeout: float | None = None
+    ) -> bool:
+        with self._in_flight_lock:
+            in_flight = list(self._in_flight_exports)
+        if not in_flight:
+            return True
+        _, not_done = concurrent.futures.wait(in_flight, timeout)
+        return not not_done
 
     def emit(self, data: Telemetry) -> None:
         if self._shutdown:
             _logger.info("Shutdown called, ignoring %s.", self._exporting)
             return
-        if self._pid != os.getpid():
+        if self._check_pid and self._pid != os.getpid():
             self._bsp_reset_once.do_once(self._at_fork_reinit)
+        if self._sharded_queue:
+            self._emit_sharded(data)
+            return
         if len(self._queue) == self._max_queue_size:
             _logger.warning("Queue full, dropping %s.", self._exporting)
             self._metrics.drop_items(1)
@@ -209,10 +605,35 @@ class BatchProcessor(Generic[Telemetry]):
         if len(self._queue) >= self._max_export_batch_size:
             self._worker_awaken.set()
 
+    def _emit_sharded(self, data: Telemetry) -> None:
+        try:
+            shard = self._local_shard.shard
+        except AttributeError:
+            shard = self._register_shard()
+        # Items in all the shards and `_queue`, counting the ones the worker
+        # has moved or that were dropped but whose places it has not released
+        # yet.
+        queued = (
+            next(self._shard_reservations)
+            - self._shard_released
+            + len(self._queue)
+        )
+        if queued >= self._max_queue_size:
+            _logger.warning("Queue full, dropping %s.", self._exporting)
+            self._metrics.drop_items(1)
+            shard.dropped += 1
+        else:
+            shard.items.append(data)
+            queued += 1
+        if queued >= self._max_export_batch_size:
+            self._worker_awaken.set()
+
     def shutdown(self, timeout_millis: int = 30000):
         if self._shutdown:
             return
         shutdown_should_end = time.time() + (timeout_millis / 1000)
+        # Bounds the exports the worker makes while flushing the queue.
+        self._shutdown_deadline = shutdown_should_end
         # Causes emit to reject telemetry and makes force_flush a no-op.
         self._shutdown = True
         # Interrupts sleep in the worker if it's sleeping.
@@ -220,6 +641,8 @@ class BatchProcessor(Generic[Telemetry]):
         self._worker_thread.join(timeout_millis / 1000)
         # Stops worker thread from calling export again if queue is still not empty.
         self._shutdown_timeout_exceeded = True
+        if self._export_executor is not None:
+            self._export_executor.shutdown()
         # We want to shutdown immediately only if we already waited `timeout_secs`.
         # Otherwise we pass the remaining timeout to the exporter.
         # Some exporter's shutdown support a timeout param.
@@ -236,10 +659,306 @@ class BatchProcessor(Generic[Telemetry]):
         # call is ongoing and the thread isn't finished. In this case we will return instead of waiting on
         # the thread to finish.
 
-    # TODO: Fix force flush so the timeout is used https://github.com/open-telemetry/opentelemetry-python/issues/4568.
     def force_flush(self, timeout_millis: int | None = None) -> bool:
         if self._shutdown:
             return False
-        # Blocking call to export.
-        self._export(BatchExportStrategy.EXPORT_ALL)
+        if timeout_millis is None:
+            # Blocking call to export.
+            return self._flush(None)
+        flushed = threading.Event()
+        with self._flush_requests_lock:
+            self._flush_requests.append(
+                (flushed, time.time() + timeout_millis / 1e3)
+            )
+        self._worker_awaken.set()
+        if not flushed.wait(timeout_millis / 1e3):
+            _logger.warning(
+                "Timeout was exceeded in force_flush of %s.", self._exporting
+            )
+            return False
+        return True
+
+
+def _running_loop() -> asyncio.AbstractEventLoop | None:
+    try:
+        return asyncio.get_running_loop()
+    except RuntimeError:
+        return None
+
+
+# Strong references to the tasks scheduled from synchronous code, which the
+# event loop only keeps weak references to.
+_background_tasks: set[asyncio.Task] = set()
+
+
+def _run_from_sync(
+    loop: asyncio.AbstractEventLoop | None,
+    make_coroutine: Callable[[], Any],
+    timeout_millis: float | None,
+    name: str,
+) -> Any:
+    """Runs the coroutine returned by ``make_coroutine`` from synchronous code
+    and returns its result.
+
+    The coroutine runs on ``loop`` when it is running, blocking the calling
+    thread until it completes or ``timeout_millis`` pass, and in a new event
+    loop once ``loop`` is gone, e.g. when the SDK is shut down at exit. The
+    thread running ``loop`` cannot block waiting for it: there the coroutine
+    is scheduled and None is returned."""
+    current_loop = _running_loop()
+    if loop is None or loop.is_closed() or not loop.is_running():
+        if current_loop is None:
+            return asyncio.run(make_coroutine())
+        loop = current_loop
+    if loop is current_loop:
+        task = loop.create_task(make_coroutine())
+        _background_tasks.add(task)
+        task.add_done_callback(_background_tasks.discard)
+        _logger.warning(
+            "%s cannot block the event loop it runs on, await %s_async "
+            "instead.",
+            name,
+            name,
+        )
+        return None
+    future = asyncio.run_coroutine_threadsafe(make_coroutine(), loop)
+    try:
+        return future.result(
+            None if timeout_millis is None else timeout_millis / 1e3
+        )
+    except concurrent.futures.TimeoutError:
+        return None
+
+
+class AsyncBatchProcessor(Generic[Telemetry]):
+    """Buffers telemetry and sends it in batches from an asyncio event loop,
+    through an exporter whose ``export(batch, timeout_millis=...)`` is a
+    coroutine, such as the asyncio OTLP exporters.
+
+    Telemetry can be emitted from any thread. The processor binds to the
+    event loop of the first thread emitting telemetry while running one, and
+    exports from a task of that loop, so exports never block it. Until then,
+    telemetry is only exported by ``force_flush`` and ``shutdown``.
+
+    ``force_flush_async`` and ``shutdown_async`` are meant to be awaited
+    from the event loop. ``force_flush`` and ``shutdown`` block other threads
+    until the loop completed them. Called from the loop itself they only
+    schedule the work, and ``force_flush`` returns ``False``."""
+
+    def __init__(
+        self,
+        exporter: Exporter[Telemetry],
+        schedule_delay_millis: float,
+        max_export_batch_size: int,
+        export_timeout_millis: float,
+        max_queue_size: int,
+        exporting: str,
+        metrics: ProcessorMetricsT,
+    ):
+        if not inspect.iscoroutinefunction(exporter.export):
+            raise ValueError(
+                "An asynchronous batch processor requires an exporter with "
+                "an asynchronous export."
+            )
+        self._exporter = exporter
+        self._max_queue_size = max_queue_size
+        self._schedule_delay = schedule_delay_millis / 1e3
+        self._max_export_batch_size = max_export_batch_size
+        self._export_timeout_millis = export_timeout_millis
+        self._exporting = exporting
+        # Deque is thread safe.
+        self._queue = collections.deque([], max_queue_size)
+        self._loop: asyncio.AbstractEventLoop | None = None
+        self._worker_task: asyncio.Task | None = None
+        self._worker_awaken: asyncio.Event | None = None
+        # Set while a wake up of the worker is pending, so threads emitting
+        # many items schedule a single callback on the event loop.
+        self._wake_pending = False
+        self._export_lock = asyncio.Lock()
+        self._shutdown = False
+        metrics.register_queue_size(lambda: len(self._queue))
+        self._metrics = metrics
+        self._bind(_running_loop())
+
+    def _bind(self, loop: asyncio.AbstractEventLoop | None) -> None:
+        if loop is None:
+            return
+        self._loop = loop
+        self._worker_awaken = asyncio.Event()
+        self._worker_task = loop.create_task(self._worker())
+
+    def _wake_worker(self) -> None:
+        if self._loop is None or self._wake_pending:
+            return
+        self._wake_pending = True
+        if _running_loop() is self._loop:
+            self._worker_awaken.set()  # type: ignore[union-attr]
+            return
+        try:
+            self._loop.call_soon_threadsafe(self._worker_awaken.set)  # type: ignore[union-attr]
+        except RuntimeError:
+            # The event loop is closed, shutdown flushes the queue.
+            pass
+
+    async def _worker(self) -> None:
+        while not self._shutdown:
+            try:
+                await asyncio.wait_for(
+                    self._worker_awaken.wait(),  # type: ignore[union-attr]
+                    self._schedule_delay,
+                )
+                sleep_interrupted = True
+            except asyncio.TimeoutError:
+                sleep_interrupted = False
+            self._worker_awaken.clear()  # type: ignore[union-attr]
+            self._wake_pending = False
+            if self._shutdown:
+                break
+            await self._export(
+                BatchExportStrategy.EXPORT_WHILE_BATCH_EXCEEDS_THRESHOLD
+                if sleep_interrupted
+                else BatchExportStrategy.EXPORT_AT_LEAST_ONE_BATCH
+            )
+
+    def _should_export_batch(
+        self, batch_strategy: BatchExportStrategy, num_iterations: int
+    ) -> bool:
+        if not self._queue:
+            return False
+        # Always continue to export while queue length exceeds max batch size.
+        if len(self._queue) >= self._max_export_batch_size:
+            return True
+        if batch_strategy is BatchExportStrategy.EXPORT_ALL:
+            return True
+        if batch_strategy is BatchExportStrategy.EXPORT_AT_LEAST_ONE_BATCH:
+            return num_iterations == 0
+        return False
+
+    async def _export(
+        self,
+        batch_strategy: BatchExportStrategy,
+        deadline: float | None = None,
+    ) -> bool:
+        """Returns False if the deadline passed before all the batches
+        selected by `batch_strategy` were exported."""
+        async with self._export_lock:
+            iteration = 0
+            while self._should_export_batch(batch_strategy, iteration):
+                if deadline is not None and time.time() >= deadline:
+                    return False
+                iteration += 1
+                # Oldest records are at the back, so pop from there.
+                batch = [
+                    self._queue.pop()
+                    for _ in range(
+                        min(self._max_export_batch_size, len(self._queue))
+                    )
+                ]
+                await self._export_batch(batch, deadline)
+        return True
+
+    async def _export_batch(
+        self, batch: list[Telemetry], deadline: float | None
+    ) -> None:
+        token = attach(set_value(_SUPPRESS_INSTRUMENTATION_KEY, True))
+        error: Exception | None = None
+        try:
+            timeout_millis = self._export_timeout_millis
+            if deadline is not None:
+                timeout_millis = min(
+                    timeout_millis,
+                    max(0.0, (deadline - time.time()) * 1000),
+                )
+            await self._exporter.export(batch, timeout_millis=timeout_millis)  # type: ignore
+        except Exception as err:  # pylint: disable=broad-exception-caught
+            error = err
+            _logger.exception("Exception while exporting %s.", self._exporting)
+        finally:
+            self._metrics.finish_items(len(batch), error)
+            detach(token)
+
+    async def _flush(self, deadline: float | None) -> bool:
+        # The export runs in its own task so that a deadline passing does
+        # not cancel a request the exporter is sending.
+        export = asyncio.ensure_future(
+            self._export(BatchExportStrategy.EXPORT_ALL, deadline)
+        )
+        done, _ = await asyncio.wait(
+            {export},
+            timeout=None if deadline is None else deadline - time.time(),
+        )
+        return bool(done) and export.result()
+
+    def emit(self, data: Telemetry) -> None:
+        if self._shutdown:
+            _logger.info("Shutdown called, ignoring %s.", self._exporting)
+            return
+        if self._loop is None:
+            self._bind(_running_loop())
+        if len(self._queue) == self._max_queue_size:
+            _logger.warning("Queue full, dropping %s.", self._exporting)
+            self._metrics.drop_items(1)
+        # This will drop a log from the right side if the queue is at _max_queue_size.
+        self._queue.appendleft(data)
+        if len(self._queue) >= self._max_export_batch_size:
+            self._wake_worker()
+
+    async def force_flush_async(
+        self, timeout_millis: int | None = None
+    ) -> bool:
+        if self._shutdown:
+            return False
+        if not await self._flush(
+            None
+            if timeout_millis is None
+            else time.time() + timeout_millis / 1e3
+        ):
+            _logger.warning(
+                "Timeout was exceeded in force_flush of %s.", self._exporting
+            )
+            return False
         return True
+
+    async def shutdown_async(self, timeout_millis: int = 30000) -> None:
+        if self._shutdown:
+            return
+        shutdown_should_end = time.time() + (timeout_millis / 1000)
+        # Causes emit to reject telemetry and makes force_flush a no-op.
+        self._shutdown = True
+        if self._loop is asyncio.get_running_loop():
+            # Interrupts sleep in the worker if it's sleeping.
+            self._worker_awaken.set()  # type: ignore[union-attr]
+        else:
+            # The lock may belong to the event loop the processor was bound
+            # to, which is gone.
+            self._export_lock = asyncio.Lock()
+        await self._flush(shutdown_should_end)
+        remaining_millis = max(0, (shutdown_should_end - time.time()) * 1000)
+        if (
+            "timeout_millis"
+            in inspect.getfullargspec(self._exporter.shutdown).args
+        ):
+            result = self._exporter.shutdown(timeout_millis=remaining_millis)  # type: ignore
+        else:
+            result = self._exporter.shutdown()
+        # The asyncio exporters close their connections asynchronously.
+        if inspect.isawaitable(result):
+            await result
+
+    def force_flush(self, timeout_millis: int | None = None) -> bool:
+        return bool(
+            _run_from_sync(
+                self._loop,
+                lambda: self.force_flush_async(timeout_millis),
+                timeout_millis,
+                "force_flush",
+            )
+        )
+
+    def shutdown(self, timeout_millis: int = 30000) -> None:
+        _run_from_sync(
+            self._loop,
+            lambda: self.shutdown_async(timeout_millis),
+            timeout_millis,
+            "shutdown",
+        )
@@ -858,3 +858,19 @@ The :envvar:`OTEL_PYTHON_SDK_INTERNAL_METRICS_ENABLED` environment variable enab
 metrics emitted by the SDK about its own internal state.
 Default: "false"
 """
+
+OTEL_PYTHON_METRIC_CALLBACK_MAX_WORKERS = (
+    "OTEL_PYTHON_METRIC_CALLBACK_MAX_WORKERS"
+)
+"""
+.. envvar:: OTEL_PYTHON_METRIC_CALLBACK_MAX_WORKERS
+
+The :envvar:`OTEL_PYTHON_METRIC_CALLBACK_MAX_WORKERS` environment variable configures
+the number of threads running the callbacks of asynchronous instruments concurrently
+when metrics are collected. With ``0`` the callbacks run one after the other in the
+collecting thread.
+Default: 0
+
+This is an experimental environment variable and the name of this variable and its behavior can
+change in a non-backwards compatible way.
+"""
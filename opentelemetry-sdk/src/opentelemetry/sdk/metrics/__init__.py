@@ -16,6 +16,9 @@ from opentelemetry.sdk.metrics._internal.exemplar import (
     TraceBasedExemplarFilter,
 )
 from opentelemetry.sdk.metrics._internal.instrument import (
+    BoundCounter,
+    BoundHistogram,
+    BoundUpDownCounter,
     Counter,
     Histogram,
     ObservableCounter,
@@ -23,6 +26,9 @@ from opentelemetry.sdk.metrics._internal.instrument import (
     ObservableUpDownCounter,
     UpDownCounter,
 )
+from opentelemetry.sdk.metrics._internal.instrument import (
+    BoundGauge as _BoundGauge,
+)
 from opentelemetry.sdk.metrics._internal.instrument import Gauge as _Gauge
 
 __all__ = [
@@ -32,6 +38,10 @@ __all__ = [
     "Exemplar",
     "ExemplarFilter",
     "ExemplarReservoir",
+    "BoundCounter",
+    "BoundHistogram",
+    "BoundUpDownCounter",
+    "_BoundGauge",
     "Meter",
     "MeterProvider",
     "MetricsTimeoutError",
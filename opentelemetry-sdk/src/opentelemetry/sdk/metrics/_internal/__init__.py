@@ -26,6 +26,7 @@ from opentelemetry.metrics import UpDownCounter as APIUpDownCounter
 from opentelemetry.metrics import _Gauge as APIGauge
 from opentelemetry.sdk.environment_variables import (
     OTEL_METRICS_EXEMPLAR_FILTER,
+    OTEL_PYTHON_METRIC_CALLBACK_MAX_WORKERS,
     OTEL_SDK_DISABLED,
 )
 from opentelemetry.sdk.metrics._internal.exceptions import MetricsTimeoutError
@@ -402,6 +403,24 @@ def _get_exemplar_filter(exemplar_filter: str) -> ExemplarFilter:
     raise ValueError(msg)
 
 
+def _get_callback_max_workers() -> int:
+    try:
+        callback_max_workers = int(
+            environ.get(OTEL_PYTHON_METRIC_CALLBACK_MAX_WORKERS, 0)
+        )
+    except ValueError:
+        _logger.warning(
+            "Found invalid value for callback max workers, using default"
+        )
+        return 0
+    if callback_max_workers < 0:
+        _logger.warning(
+            "Found negative value for callback max workers, using default"
+        )
+        return 0
+    return callback_max_workers
+
+
 _MeterConfiguratorT = Callable[[InstrumentationScope], _MeterConfig]
 _RuleBasedMeterConfigurator = RuleBasedConfigurator[_MeterConfig]
 
@@ -431,6 +450,14 @@ class MeterProvider(APIMeterProvider):
         shutdown_on_exit: If true, registers an `atexit` handler to call
             `MeterProvider.shutdown`
         views: The views to configure the metric output the SDK
+        callback_max_workers: The number of threads running the callbacks of
+            asynchronous instruments concurrently on collection. Every
+            callback then gets its own timeout, and the measurements of the
+            callbacks that time out are dropped without delaying the others.
+            A callback that has not returned is not called again until it
+            does. With ``0`` the callbacks run one after the other in the
+            collecting thread. Defaults to the value of
+            :envvar:`OTEL_PYTHON_METRIC_CALLBACK_MAX_WORKERS`, or ``0``.
 
     .. code-block:: python
         :caption: Push-based export with PeriodicExportingMetricReader
@@ -475,6 +502,7 @@ class MeterProvider(APIMeterProvider):
         shutdown_on_exit: bool = True,
         views: Sequence["opentelemetry.sdk.metrics.view.View"] = (),
         *,
+        callback_max_workers: int | None = None,
         _meter_configurator: _MeterConfiguratorT | None = None,
     ):
         self._lock = Lock()
@@ -482,6 +510,10 @@ class MeterProvider(APIMeterProvider):
         self._atexit_handler = None
         if resource is None:
             resource = Resource.create({})
+        if callback_max_workers is None:
+            callback_max_workers = _get_callback_max_workers()
+        elif callback_max_workers < 0:
+            raise ValueError("callback_max_workers must not be negative.")
         self._sdk_config = SdkConfiguration(
             exemplar_filter=(
                 exemplar_filter
@@ -491,6 +523,7 @@ class MeterProvider(APIMeterProvider):
             ),
             resource=resource,
             views=views,
+            callback_max_workers=callback_max_workers,
         )
         self._metric_readers = metric_readers
         self._measurement_consumer = SynchronousMeasurementConsumer(
@@ -622,6 +655,8 @@ class MeterProvider(APIMeterProvider):
             except Exception as error:
                 metric_reader_error[metric_reader] = error
 
+        self._measurement_consumer.shutdown()
+
         if self._atexit_handler is not None:
             unregister(self._atexit_handler)
             self._atexit_handler = None
@@ -2,12 +2,13 @@
 # SPDX-License-Identifier: Apache-2.0
 
 
-from collections.abc import Sequence
+from collections.abc import Callable, Sequence
 from logging import getLogger
 from threading import Lock
 from time import time_ns
 from typing import cast
 
+from opentelemetry.metrics import Synchronous
 from opentelemetry.sdk.metrics._internal.aggregation import (
     Aggregation,
     AggregationTemporality,
@@ -19,9 +20,18 @@ from opentelemetry.sdk.metrics._internal.instrument import _Instrument
 from opentelemetry.sdk.metrics._internal.measurement import Measurement
 from opentelemetry.sdk.metrics._internal.point import DataPointT
 from opentelemetry.sdk.metrics._internal.view import View
+from opentelemetry.util.types import Attributes
 
 _logger = getLogger(__name__)
 
+_DEFAULT_CARDINALITY_LIMIT = 2000
+_OVERFLOW_ATTRIBUTES = {"otel.metric.overflow": True}
+_OVERFLOW_KEY = frozenset(_OVERFLOW_ATTRIBUTES.items())
+# Attribute sets folded into the overflow stream are counted up to this
+# number per collection interval, so that a flood of attribute sets does not
+# grow the set counting them without bound.
+_MAX_FOLDED_ATTRIBUTE_SETS = 2000
+
 
 class _ViewInstrumentMatch:
     def __init__(
@@ -29,11 +39,24 @@ class _ViewInstrumentMatch:
         view: View,
         instrument: _Instrument,
         instrument_class_aggregation: dict[type, Aggregation],
+        cardinality_limit: int = _DEFAULT_CARDINALITY_LIMIT,
+        max_idle_collections: int | None = None,
+        skip_unchanged_streams: bool = False,
     ):
         self._view = view
         self._instrument = instrument
         self._attributes_aggregation: dict[frozenset, _Aggregation] = {}
         self._lock = Lock()
+        # The overflow stream counts towards the limit, so at most
+        # cardinality_limit - 1 streams are kept for other attribute sets.
+        self._cardinality_limit = cardinality_limit
+        # Hashes of the attribute sets folded into the overflow stream since
+        # the last collection, kept instead of the attribute sets themselves.
+        self._folded_attribute_sets: set[int] = set()
+        self._overflowed = False
+        self._max_idle_collections = max_idle_collections
+        self._evicted_streams = 0
+        self._skip_unchanged_streams = skip_unchanged_streams
         self._instrument_class_aggregation = instrument_class_aggregation
         self._name = self._view._name or self._instrument.name
         self._description = (
@@ -87,63 +110,232 @@ class _ViewInstrumentMatch:
     def consume_measurement(
         self, measurement: Measurement, should_sample_exemplar: bool = True
     ) -> None:
+        if not self.get_aggregation(measurement.attributes).aggregate(
+            measurement, should_sample_exemplar
+        ):
+            self.aggregate_evicted(
+                measurement.attributes,
+                lambda aggregation: aggregation.aggregate(
+                    measurement, should_sample_exemplar
+                ),
+            )
+
+    def consume_value(
+        self, value: int | float, attributes: Attributes
+    ) -> None:
+        if not self.get_aggregation(attributes).aggregate_value(value):
+            self.aggregate_evicted(
+                attributes,
+                lambda aggregation: aggregation.aggregate_value(value),
+            )
+
+    def consume_batch(
+        self,
+        values: Sequence[int | float],
+        measurement: Measurement,
+        should_sample_exemplar: bool = True,
+    ) -> None:
+        if not self.get_aggregation(measurement.attributes).aggregate_batch(
+            values, measurement, should_sample_exemplar
+        ):
+            self.aggregate_evicted(
+                measurement.attributes,
+                lambda aggregation: aggregation.aggregate_batch(
+                    values, measurement, should_sample_exemplar
+                ),
+            )
+
+    def aggregate_evicted(
+        self,
+        attributes: Attributes,
+        aggregate: Callable[[_Aggregation], bool],
+    ) -> None:
+        """Aggregates into the stream replacing an evicted aggregation.
+
+        Args:
+            attributes: Attributes of the measurement
+            aggregate: Aggregates the measurement into the given aggregation,
+                returning False if the aggregation was evicted as well
+        """
+        while not aggregate(self._get_aggregation(attributes, lookup=False)):
+            pass
+
+    def get_aggregation(self, attributes: Attributes) -> _Aggregation:
+        """Returns the aggregation of the stream the given attributes belong
+        to, creating it if needed."""
+        return self._get_aggregation(attributes, lookup=True)
+
+    # pylint: disable=protected-access
+    def _get_aggregation(
+        self, attributes: Attributes, lookup: bool
+    ) -> _Aggregation:
         if self._view._attribute_keys is not None:
-            attributes = {}
+            filtered_attributes = {}
 
-            for key, value in (measurement.attributes or {}).items():
+            for key, value in (attributes or {}).items():
                 if key in self._view._attribute_keys:
-                    attributes[key] = value
-        elif measurement.attributes is not None:
-            attributes = dict(measurement.attributes)
+                    filtered_attributes[key] = value
+        elif attributes is not None:
+            filtered_attributes = dict(attributes)
         else:
-            attributes = {}
+            filtered_attributes = {}
 
-        aggr_key = frozenset(attributes.items())
+        aggr_key = frozenset(filtered_attributes.items())
 
-        if aggr_key not in self._attributes_aggregation:
-            with self._lock:
-                if aggr_key not in self._attributes_aggregation:
-                    if not isinstance(
-                        self._view._aggregation, DefaultAggregation
-                    ):
-                        aggregation = (
-                            self._view._aggregation._create_aggregation(
-                                self._instrument,
-                                attributes,
-                                self._view._exemplar_reservoir_factory,
-                                time_ns(),
-                            )
-                        )
-                    else:
-                        aggregation = self._instrument_class_aggregation[
-                            self._instrument.__class__
-                        ]._create_aggregation(
-                            self._instrument,
-                            attributes,
-                            self._view._exemplar_reservoir_factory,
-                            time_ns(),
+        if lookup:
+            # Streams can be evicted concurrently, so the aggregation is
+            # looked up once instead of checking for the key first.
+            aggregation = self._attributes_aggregation.get(aggr_key)
+            if aggregation is not None:
+                return aggregation
+
+        # Taking the lock waits for a collection evicting the stream to
+        # remove it, instead of finding the evicted aggregation again.
+
+        with self._lock:
+            aggregation = self._attributes_aggregation.get(aggr_key)
+            if aggregation is None:
+                if self._is_full():
+                    if not self._overflowed:
+                        self._overflowed = True
+                        _logger.warning(
+                            "Cardinality limit of %s reached for metric "
+                            "%s, measurements with new attributes are "
+                            "aggregated into the overflow stream.",
+                            self._cardinality_limit,
+                            self._name,
                         )
+                    if (
+                        len(self._folded_attribute_sets)
+                        < _MAX_FOLDED_ATTRIBUTE_SETS
+                    ):
+                        self._folded_attribute_sets.add(hash(aggr_key))
+                    aggr_key = _OVERFLOW_KEY
+                    filtered_attributes = _OVERFLOW_ATTRIBUTES
+                    aggregation = self._attributes_aggregation.get(aggr_key)
+                if aggregation is None:
+                    aggregation = self._create_aggregation(filtered_attributes)
                     self._attributes_aggregation[aggr_key] = aggregation
 
-        self._attributes_aggregation[aggr_key].aggregate(
-            measurement, should_sample_exemplar
+        return aggregation
+
+    def _is_full(self) -> bool:
+        streams = len(self._attributes_aggregation)
+        if _OVERFLOW_KEY in self._attributes_aggregation:
+            streams -= 1
+        return streams >= self._cardinality_limit - 1
+
+    # pylint: disable=protected-access
+    def _create_aggregation(self, attributes: Attributes) -> _Aggregation:
+        if not isinstance(self._view._aggregation, DefaultAggregation):
+            return self._view._aggregation._create_aggregation(
+                self._instrument,
+                attributes,
+                self._view._exemplar_reservoir_factory,
+                time_ns(),
+            )
+        return self._instrument_class_aggregation[
+            self._instrument.__class__
+        ]._create_aggregation(
+            self._instrument,
+            attributes,
+            self._view._exemplar_reservoir_factory,
+            time_ns(),
         )
 
+    def pop_folded_streams(self) -> int:
+        """Returns the number of attribute sets folded into the overflow
+        stream since the last call, counted up to a fixed bound."""
+        with self._lock:
+            folded_streams = len(self._folded_attribute_sets)
+            self._folded_attribute_sets = set()
+        return folded_streams
+
+    def pop_evicted_streams(self) -> int:
+        """Returns the number of streams evicted since the last call."""
+        with self._lock:
+            evicted_streams = self._evicted_streams
+            self._evicted_streams = 0
+        return evicted_streams
+
     def collect(
         self,
         collection_aggregation_temporality: AggregationTemporality,
         collection_start_nanos: int,
     ) -> Sequence[DataPointT] | None:
         data_points: list[DataPointT] = []
+        delta = collection_aggregation_temporality is (
+            AggregationTemporality.DELTA
+        ) and isinstance(self._instrument, Synchronous)
         with self._lock:
-            for aggregation in self._attributes_aggregation.values():
-                data_point = aggregation.collect(
-                    collection_aggregation_temporality, collection_start_nanos
-                )
-                if data_point is not None:
-                    data_points.append(data_point)
+            # At the cardinality limit, delta streams that reported an empty
+            # interval are released, so that new attribute sets get their
+            # own stream again instead of the overflow one.
+            release_empty = delta and self._is_full()
+            for aggr_key, aggregation in list(
+                self._attributes_aggregation.items()
+            ):
+                # A stream whose value did not change is left out without
+                # building a data point for it.
+                if not self._is_unchanged(
+                    aggregation, collection_aggregation_temporality
+                ):
+                    data_point = aggregation.collect(
+                        collection_aggregation_temporality,
+                        collection_start_nanos,
+                    )
+                    if data_point is not None:
+                        data_points.append(data_point)
+                if (
+                    self._is_stale(
+                        aggregation, collection_aggregation_temporality
+                    )
+                    or (release_empty and aggregation._idle_collections > 0)
+                ) and aggregation._evict():
+                    del self._attributes_aggregation[aggr_key]
+                    self._evicted_streams += 1
+            if delta and not self._is_full():
+                # The overflow is logged again if the limit is reached again.
+                self._overflowed = False
 
         # Returning here None instead of an empty list because the caller
         # does not consume a sequence and to be consistent with the rest of
         # collect methods that also return None.
         return data_points or None
+
+    # pylint: disable=protected-access
+    def _is_unchanged(
+        self,
+        aggregation: _Aggregation,
+        collection_aggregation_temporality: AggregationTemporality,
+    ) -> bool:
+        if (
+            not self._skip_unchanged_streams
+            or collection_aggregation_temporality
+            is not AggregationTemporality.CUMULATIVE
+        ):
+            return False
+        with aggregation._lock:
+            if aggregation._has_measurements():
+                return False
+            aggregation._update_idle_collections(False)
+        return True
+
+    # pylint: disable=protected-access
+    def _is_stale(
+        self,
+        aggregation: _Aggregation,
+        collection_aggregation_temporality: AggregationTemporality,
+    ) -> bool:
+        if (
+            self._max_idle_collections is None
+            or aggregation._idle_collections == 0
+        ):
+            return False
+        if collection_aggregation_temporality is (
+            AggregationTemporality.DELTA
+        ) and isinstance(self._instrument, Synchronous):
+            # Nothing carries over from one delta interval to the next, so
+            # the stream is evicted as soon as it reports an empty interval.
+            return True
+        return aggregation._idle_collections >= self._max_idle_collections
@@ -3,14 +3,18 @@
 
 # pylint: disable=too-many-lines
 
+import sys
 from abc import ABC, abstractmethod
 from bisect import bisect_left
 from collections.abc import Callable, Sequence
+from contextlib import ExitStack
 from enum import IntEnum
 from functools import partial
+from itertools import count
 from logging import getLogger
 from math import inf
-from threading import Lock
+from operator import add
+from threading import Lock, local
 from typing import (
     Generic,
     TypeVar,
@@ -45,7 +49,11 @@ from opentelemetry.sdk.metrics._internal.exponential_histogram.mapping.logarithm
     LogarithmMapping,
 )
 from opentelemetry.sdk.metrics._internal.instrument import _Instrument
-from opentelemetry.sdk.metrics._internal.measurement import Measurement
+from opentelemetry.sdk.metrics._internal.measurement import (
+    Measurement,
+    _as_list,
+    _is_ndarray,
+)
 from opentelemetry.sdk.metrics._internal.point import Buckets as BucketsPoint
 from opentelemetry.sdk.metrics._internal.point import (
     ExponentialHistogramDataPoint,
@@ -63,6 +71,19 @@ _DataPointVarT = TypeVar("_DataPointVarT", NumberDataPoint, HistogramDataPoint)
 
 _logger = getLogger(__name__)
 
+_thread_stripe = local()
+_next_thread_stripe = count()
+
+
+def _get_thread_stripe() -> int:
+    """Returns a number identifying the current thread, handed out to
+    threads round robin so that they spread evenly over stripes."""
+    try:
+        return _thread_stripe.index
+    except AttributeError:
+        _thread_stripe.index = next(_next_thread_stripe)
+        return _thread_stripe.index
+
 
 class AggregationTemporality(IntEnum):
     """
@@ -86,16 +107,66 @@ class _Aggregation(ABC, Generic[_DataPointVarT]):
         self._attributes = attributes
         self._reservoir = reservoir_builder()
         self._previous_point = None
+        # The number of consecutive collections without measurements.
+        self._idle_collections = 0
+        # Set under the lock when the stream of the aggregation is evicted,
+        # after which the aggregation rejects measurements.
+        self._evicted = False
 
-    @abstractmethod
     def aggregate(
         self, measurement: Measurement, should_sample_exemplar: bool = True
-    ) -> None:
+    ) -> bool:
         """Aggregate a measurement.
 
         Args:
             measurement: Measurement to aggregate
             should_sample_exemplar: Whether the measurement should be sampled by the exemplars reservoir or not.
+
+        Returns:
+            False if the aggregation was evicted and the measurement was not
+            aggregated.
+        """
+        if not self.aggregate_value(measurement.value):
+            return False
+        self._sample_exemplar(measurement, should_sample_exemplar)
+        return True
+
+    @abstractmethod
+    def aggregate_value(self, value: int | float) -> bool:
+        """Aggregate a value without offering it to the exemplar reservoir.
+
+        Used when no exemplar can be sampled, so that the time and context of
+        a `Measurement` are not needed.
+
+        Args:
+            value: Value to aggregate
+
+        Returns:
+            False if the aggregation was evicted and the value was not
+            aggregated.
+        """
+
+    @abstractmethod
+    def aggregate_batch(
+        self,
+        values: Sequence[int | float],
+        measurement: Measurement,
+        should_sample_exemplar: bool = True,
+    ) -> bool:
+        """Aggregate a batch of values.
+
+        Either all the values are aggregated or, if the aggregation was
+        evicted, none of them.
+
+        Args:
+            values: Values to aggregate, a sequence or a NumPy array
+            measurement: Measurement holding the time, context and
+                attributes shared by all the values, its value is ignored
+            should_sample_exemplar: Whether the values should be sampled by the exemplars reservoir or not.
+
+        Returns:
+            False if the aggregation was evicted and the values were not
+            aggregated.
         """
 
     @abstractmethod
@@ -106,6 +177,60 @@ class _Aggregation(ABC, Generic[_DataPointVarT]):
     ) -> _DataPointVarT | None:
         pass
 
+    @abstractmethod
+    def _has_measurements(self) -> bool:
+        """Returns whether measurements were aggregated since the previous
+        collection."""
+
+    def _evict(self) -> bool:
+        """Marks the aggregation as evicted, unless measurements were
+        aggregated since the previous collection.
+
+        Measurements racing with the eviction are then either aggregated
+        before it, keeping the stream, or rejected, to be aggregated into the
+        stream replacing it.
+
+        Returns:
+            Whether the aggregation was evicted.
+        """
+        with self._lock:
+            if self._has_measurements():
+                return False
+            self._evicted = True
+            return True
+
+    def _update_idle_collections(self, has_measurements: bool) -> None:
+        """Counts the collection, to be called by `collect` with the
+        aggregation lock held.
+
+        Args:
+            has_measurements: Whether measurements were aggregated since the
+                previous collection.
+        """
+        if has_measurements:
+            self._idle_collections = 0
+        else:
+            self._idle_collections += 1
+
+    def _sample_exemplars(
+        self,
+        values: Sequence[int | float],
+        measurement: Measurement,
+        should_sample_exemplar: bool,
+    ) -> None:
+        """Offer a batch of values to the exemplar reservoir for sampling.
+
+        It should be called within each `aggregate_batch` override.
+        """
+        if should_sample_exemplar:
+            for value in _as_list(values):
+                self._reservoir.offer(
+                    value,
+                    measurement.time_unix_nano,
+                    measurement.attributes,
+                    measurement.context,
+                )
+
     def _collect_exemplars(self) -> Sequence[Exemplar]:
         """Returns the collected exemplars.
 
@@ -137,8 +262,22 @@ class _Aggregation(ABC, Generic[_DataPointVarT]):
 class _DropAggregation(_Aggregation):
     def aggregate(
         self, measurement: Measurement, should_sample_exemplar: bool = True
-    ) -> None:
-        pass
+    ) -> bool:
+        return True
+
+    def aggregate_value(self, value: int | float) -> bool:
+        return True
+
+    def _has_measurements(self) -> bool:
+        return False
+
+    def aggregate_batch(
+        self,
+        values: Sequence[int | float],
+        measurement: Measurement,
+        should_sample_exemplar: bool = True,
+    ) -> bool:
+        return True
 
     def collect(
         self,
@@ -156,6 +295,7 @@ class _SumAggregation(_Aggregation[Sum]):
         instrument_aggregation_temporality: AggregationTemporality,
         start_time_unix_nano: int,
         reservoir_builder: ExemplarReservoirBuilder,
+        stripes: int | None = None,
     ):
         super().__init__(attributes, reservoir_builder)
 
@@ -167,19 +307,55 @@ class _SumAggregation(_Aggregation[Sum]):
 
         self._value = None
 
+        # With stripes, every thread adds to the partial sum of its stripe
+        # under the lock of the stripe, so that threads adding to the same
+        # sum rarely contend. The partial sums are merged by collect.
+        self._stripe_locks: list[Lock] | None = None
+        self._stripe_values: list[int | float | None] | None = None
+        if stripes is not None:
+            self._stripe_locks = [Lock() for _ in range(stripes)]
+            self._stripe_values = [None] * stripes
+
         self._previous_collection_start_nano = self._start_time_unix_nano
         self._previous_value = 0
 
-    def aggregate(
-        self, measurement: Measurement, should_sample_exemplar: bool = True
-    ) -> None:
+    def aggregate_value(self, value: int | float) -> bool:
+        if self._stripe_values is not None:
+            stripe = _get_thread_stripe() % len(self._stripe_values)
+            with self._stripe_locks[stripe]:
+                if self._evicted:
+                    return False
+                stripe_value = self._stripe_values[stripe]
+                self._stripe_values[stripe] = (
+                    value if stripe_value is None else stripe_value + value
+                )
+            return True
+
         with self._lock:
+            if self._evicted:
+                return False
             if self._value is None:
                 self._value = 0
 
-            self._value = self._value + measurement.value
+            self._value = self._value + value
+        return True
 
-        self._sample_exemplar(measurement, should_sample_exemplar)
+    def aggregate_batch(
+        self,
+        values: Sequence[int | float],
+        measurement: Measurement,
+        should_sample_exemplar: bool = True,
+    ) -> bool:
+        if _is_ndarray(values):
+            total = values.sum().item()  # type: ignore[attr-defined]
+        else:
+            total = sum(values)
+
+        if not self.aggregate_value(total):
+            return False
+
+        self._sample_exemplars(values, measurement, should_sample_exemplar)
+        return True
 
     def collect(
         self,
@@ -307,8 +483,12 @@ class _SumAggregation(_Aggregation[Sum]):
         """
 
         with self._lock:
-            value = self._value
-            self._value = None
+            if self._stripe_values is None:
+                value = self._value
+                self._value = None
+            else:
+                value = self._merge_stripes()
+            self._update_idle_collections(value is not None)
 
             if (
                 self._instrument_aggregation_temporality
@@ -388,6 +568,36 @@ class _SumAggregation(_Aggregation[Sum]):
                 value=value,
             )
 
+    def _has_measurements(self) -> bool:
+        if self._stripe_values is None:
+            return self._value is not None
+        return any(value is not None for value in self._stripe_values)
+
+    def _evict(self) -> bool:
+        if self._stripe_locks is None:
+            return super()._evict()
+        # Striped measurements only take the lock of their stripe, so all of
+        # them are held to mark the aggregation as evicted.
+        with self._lock, ExitStack() as stack:
+            for stripe_lock in self._stripe_locks:
+                stack.enter_context(stripe_lock)
+            if self._has_measurements():
+                return False
+            self._evicted = True
+            return True
+
+    def _merge_stripes(self) -> int | float | None:
+        """Returns the sum of the partial sums of all the stripes and resets
+        them, or None if there was no measurement."""
+        value = None
+        for stripe, stripe_lock in enumerate(self._stripe_locks):
+            with stripe_lock:
+                stripe_value = self._stripe_values[stripe]
+                self._stripe_values[stripe] = None
+            if stripe_value is not None:
+                value = stripe_value if value is None else value + stripe_value
+        return value
+
 
 class _LastValueAggregation(_Aggregation[GaugePoint]):
     def __init__(
@@ -398,13 +608,28 @@ class _LastValueAggregation(_Aggregation[GaugePoint]):
         super().__init__(attributes, reservoir_builder)
         self._value = None
 
-    def aggregate(
-        self, measurement: Measurement, should_sample_exemplar: bool = True
-    ):
+    def aggregate_value(self, value: int | float) -> bool:
         with self._lock:
-            self._value = measurement.value
+            if self._evicted:
+                return False
+            self._value = value
+        return True
 
-        self._sample_exemplar(measurement, should_sample_exemplar)
+    def aggregate_batch(
+        self,
+        values: Sequence[int | float],
+        measurement: Measurement,
+        should_sample_exemplar: bool = True,
+    ) -> bool:
+        # Only the last value of the batch is kept.
+        if len(values) and not self.aggregate_value(_as_list(values)[-1]):
+            return False
+
+        self._sample_exemplars(values, measurement, should_sample_exemplar)
+        return True
+
+    def _has_measurements(self) -> bool:
+        return self._value is not None
 
     def collect(
         self,
@@ -415,6 +640,7 @@ class _LastValueAggregation(_Aggregation[GaugePoint]):
         Atomically return a point for the current value of the metric.
         """
         with self._lock:
+            self._update_idle_collections(self._value is not None)
             if self._value is None:
                 return None
             value = self._value
@@ -483,7 +709,8 @@ class _ExplicitBucketHistogramAggregation(_Aggregation[HistogramPoint]):
         self._max = -inf
         self._sum = 0
 
-        self._previous_value = None
+        self._previous_value: tuple[int, ...] | None = None
+        self._previous_count = 0
         self._previous_min = inf
         self._previous_max = -inf
         self._previous_sum = 0
@@ -493,24 +720,73 @@ class _ExplicitBucketHistogramAggregation(_Aggregation[HistogramPoint]):
     def _get_empty_bucket_counts(self) -> list[int]:
         return [0] * (len(self._boundaries) + 1)
 
-    def aggregate(
-        self, measurement: Measurement, should_sample_exemplar: bool = True
-    ) -> None:
+    def _has_measurements(self) -> bool:
+        return self._value is not None
+
+    def aggregate_value(self, value: int | float) -> bool:
         with self._lock:
+            if self._evicted:
+                return False
             if self._value is None:
                 self._value = self._get_empty_bucket_counts()
 
-            measurement_value = measurement.value
-
-            self._sum += measurement_value
+            self._sum += value
 
             if self._record_min_max:
-                self._min = min(self._min, measurement_value)
-                self._max = max(self._max, measurement_value)
+                self._min = min(self._min, value)
+                self._max = max(self._max, value)
 
-            self._value[bisect_left(self._boundaries, measurement_value)] += 1
+            self._value[bisect_left(self._boundaries, value)] += 1
+        return True
 
-        self._sample_exemplar(measurement, should_sample_exemplar)
+    def aggregate_batch(
+        self,
+        values: Sequence[int | float],
+        measurement: Measurement,
+        should_sample_exemplar: bool = True,
+    ) -> bool:
+        if len(values) == 0:
+            return True
+
+        # The values are bucketed before taking the lock, which is then only
+        # held to merge the results.
+        if _is_ndarray(values):
+            numpy = sys.modules["numpy"]
+            bucket_counts = numpy.bincount(
+                numpy.searchsorted(self._boundaries, values, side="left"),
+                minlength=len(self._boundaries) + 1,
+            ).tolist()
+            sum_ = values.sum().item()  # type: ignore[attr-defined]
+            min_ = values.min().item()  # type: ignore[attr-defined]
+            max_ = values.max().item()  # type: ignore[attr-defined]
+        else:
+            bucket_counts = self._get_empty_bucket_counts()
+            boundaries = self._boundaries
+            for value in values:
+                bucket_counts[bisect_left(boundaries, value)] += 1
+            sum_ = sum(values)
+            min_ = min(values)
+            max_ = max(values)
+
+        with self._lock:
+            if self._evicted:
+                return False
+            if self._value is None:
+                self._value = bucket_counts
+            else:
+                self._value = [
+                    current + count
+                    for current, count in zip(self._value, bucket_counts)
+                ]
+
+            self._sum += sum_
+
+            if self._record_min_max:
+                self._min = min(self._min, min_)
+                self._max = max(self._max, max_)
+
+        self._sample_exemplars(values, measurement, should_sample_exemplar)
+        return True
 
     def collect(
         self,
@@ -526,6 +802,7 @@ class _ExplicitBucketHistogramAggregation(_Aggregation[HistogramPoint]):
             sum_ = self._sum
             min_ = self._min
             max_ = self._max
+            self._update_idle_collections(value is not None)
 
             self._value = None
             self._sum = 0
@@ -565,19 +842,19 @@ class _ExplicitBucketHistogramAggregation(_Aggregation[HistogramPoint]):
                         max=max_,
                     )
 
-                if value is None:
-                    value = self._get_empty_bucket_counts()
-
                 if self._previous_value is None:
-                    self._previous_value = self._get_empty_bucket_counts()
-
-                self._previous_value = [
-                    value_element + previous_value_element
-                    for (
-                        value_element,
-                        previous_value_element,
-                    ) in zip(value, self._previous_value)
-                ]
+                    self._previous_value = tuple(
+                        self._get_empty_bucket_counts()
+                    )
+
+                # The cumulative bucket counts are kept as a tuple, so that
+                # the tuple of a stream without new measurements is reused by
+                # its next data point instead of being built again.
+                if value is not None:
+                    self._previous_value = tuple(
+                        map(add, value, self._previous_value)
+                    )
+                    self._previous_count += sum(value)
                 self._previous_min = min(min_, self._previous_min)
                 self._previous_max = max(max_, self._previous_max)
                 self._previous_sum = sum_ + self._previous_sum
@@ -587,9 +864,9 @@ class _ExplicitBucketHistogramAggregation(_Aggregation[HistogramPoint]):
                     exemplars=self._collect_exemplars(),
                     start_time_unix_nano=self._start_time_unix_nano,
                     time_unix_nano=collection_start_nano,
-                    count=sum(self._previous_value),
+                    count=self._previous_count,
                     sum=self._previous_sum,
-                    bucket_counts=tuple(self._previous_value),
+                    bucket_counts=self._previous_value,
                     explicit_bounds=self._boundaries,
                     min=self._previous_min,
                     max=self._previous_max,
@@ -694,118 +971,151 @@ class _ExponentialBucketHistogramAggregation(_Aggregation[HistogramPoint]):
 
         self._mapping = self._new_mapping(self._max_scale)
 
-    def aggregate(
-        self, measurement: Measurement, should_sample_exemplar: bool = True
-    ) -> None:
-        # pylint: disable=too-many-branches,too-many-statements, too-many-locals
+    def _has_measurements(self) -> bool:
+        return self._value_positive is not None
 
+    def aggregate_value(self, value: int | float) -> bool:
         with self._lock:
-            if self._value_positive is None:
-                self._value_positive = Buckets()
-            if self._value_negative is None:
-                self._value_negative = Buckets()
+            if self._evicted:
+                return False
+            self._aggregate_value(value)
+        return True
 
-            measurement_value = measurement.value
+    def aggregate_batch(
+        self,
+        values: Sequence[int | float],
+        measurement: Measurement,
+        should_sample_exemplar: bool = True,
+    ) -> bool:
+        # The lock is held for the whole batch, so that it is not evicted
+        # after only some of the values were aggregated.
+        with self._lock:
+            if self._evicted:
+                return False
+            for value in _as_list(values):
+                self._aggregate_value(value)
 
-            self._sum += measurement_value
+        self._sample_exemplars(values, measurement, should_sample_exemplar)
+        return True
 
-            self._min = min(self._min, measurement_value)
-            self._max = max(self._max, measurement_value)
+    def _aggregate_value(self, value: int | float) -> None:
+        """Aggregates a value, with the aggregation lock held."""
+        # pylint: disable=too-many-branches,too-many-statements, too-many-locals
 
-            self._count += 1
+        measurement_value = value
+        if self._value_positive is None:
+            self._value_positive = Buckets()
+        if self._value_negative is None:
+            self._value_negative = Buckets()
 
-            if measurement_value == 0:
-                self._zero_count += 1
+        self._sum += measurement_value
 
-                if self._count == self._zero_count:
-                    self._scale = 0
+        self._min = min(self._min, measurement_value)
+        self._max = max(self._max, measurement_value)
 
-                return
+        self._count += 1
 
-            if measurement_value > 0:
-                value = self._value_positive
+        if measurement_value == 0:
+            self._zero_count += 1
 
-            else:
-                measurement_value = -measurement_value
-                value = self._value_negative
-
-            # The following code finds out if it is necessary to change the
-            # buckets to hold the incoming measurement_value, changes them if
-            # necessary. This process does not exist in
-            # _ExplicitBucketHistogram aggregation because the buckets there
-            # are constant in size and amount.
-            index = self._mapping.map_to_index(measurement_value)
+            if self._count == self._zero_count:
+                self._scale = 0
 
-            is_rescaling_needed = False
-            low, high = 0, 0
+            return
 
-            if len(value) == 0:
-                value.index_start = index
-                value.index_end = index
-                value.index_base = index
+        if measurement_value > 0:
+            value = self._value_positive
 
-            elif (
-                index < value.index_start
-                and (value.index_end - index) >= self._max_size
-            ):
-                is_rescaling_needed = True
-                low = index
-                high = value.index_end
+        else:
+            measurement_value = -measurement_value
+            value = self._value_negative
+
+        # The following code finds out if it is necessary to change the
+        # buckets to hold the incoming measurement_value, changes them if
+        # necessary. This process does not exist in
+        # _ExplicitBucketHistogram aggregation because the buckets there
+        # are constant in size and amount.
+        index = self._mapping.map_to_index(measurement_value)
+
+        # In the steady state most measurements fall in the range of
+        # indexes the buckets already hold, so neither growing nor
+        # rescaling them is needed.
+        if value.index_start <= index <= value.index_end:
+            self._scale = self._mapping.scale
+            bucket_index = index - value.index_base
+            if bucket_index < 0:
+                bucket_index += len(value.counts)
+            value.increment_bucket(bucket_index)
+            return
 
-            elif (
-                index > value.index_end
-                and (index - value.index_start) >= self._max_size
-            ):
-                is_rescaling_needed = True
-                low = value.index_start
-                high = index
+        is_rescaling_needed = False
+        low, high = 0, 0
 
-            if is_rescaling_needed:
-                scale_change = self._get_scale_change(low, high)
-                self._downscale(
-                    scale_change,
-                    self._value_positive,
-                    self._value_negative,
-                )
-                self._mapping = self._new_mapping(
-                    self._mapping.scale - scale_change
-                )
+        if len(value) == 0:
+            value.index_start = index
+            value.index_end = index
+            value.index_base = index
 
-                index = self._mapping.map_to_index(measurement_value)
+        elif (
+            index < value.index_start
+            and (value.index_end - index) >= self._max_size
+        ):
+            is_rescaling_needed = True
+            low = index
+            high = value.index_end
 
-            self._scale = self._mapping.scale
+        elif (
+            index > value.index_end
+            and (index - value.index_start) >= self._max_size
+        ):
+            is_rescaling_needed = True
+            low = value.index_start
+            high = index
+
+        if is_rescaling_needed:
+            scale_change = self._get_scale_change(low, high)
+            self._downscale(
+                scale_change,
+                self._value_positive,
+                self._value_negative,
+            )
+            self._mapping = self._new_mapping(
+                self._mapping.scale - scale_change
+            )
 
-            if index < value.index_start:
-                span = value.index_end - index
+            index = self._mapping.map_to_index(measurement_value)
 
-                if span >= len(value.counts):
-                    value.grow(span + 1, self._max_size)
+        self._scale = self._mapping.scale
 
-                value.index_start = index
+        if index < value.index_start:
+            span = value.index_end - index
 
-            elif index > value.index_end:
-                span = index - value.index_start
+            if span >= len(value.counts):
+                value.grow(span + 1, self._max_size)
 
-                if span >= len(value.counts):
-                    value.grow(span + 1, self._max_size)
+            value.index_start = index
 
-                value.index_end = index
+        elif index > value.index_end:
+            span = index - value.index_start
 
-            bucket_index = index - value.index_base
+            if span >= len(value.counts):
+                value.grow(span + 1, self._max_size)
 
-            if bucket_index < 0:
-                bucket_index += len(value.counts)
+            value.index_end = index
 
-            # Now the buckets have been changed if needed and bucket_index will
-            # be used to increment the counter of the bucket that needs to be
-            # incremented.
+        bucket_index = index - value.index_base
 
-            # This is analogous to
-            # self._value[bisect_left(self._boundaries, measurement_value)] += 1
-            # in _ExplicitBucketHistogramAggregation.aggregate
-            value.increment_bucket(bucket_index)
+        if bucket_index < 0:
+            bucket_index += len(value.counts)
 
-        self._sample_exemplar(measurement, should_sample_exemplar)
+        # Now the buckets have been changed if needed and bucket_index will
+        # be used to increment the counter of the bucket that needs to be
+        # incremented.
+
+        # This is analogous to
+        # self._value[bisect_left(self._boundaries, measurement_value)] += 1
+        # in _ExplicitBucketHistogramAggregation.aggregate_value
+        value.increment_bucket(bucket_index)
 
     def collect(
         self,
@@ -826,6 +1136,7 @@ class _ExponentialBucketHistogramAggregation(_Aggregation[HistogramPoint]):
             count = self._count
             zero_count = self._zero_count
             scale = self._scale
+            self._update_idle_collections(value_positive is not None)
 
             self._value_positive = None
             self._value_negative = None
@@ -1087,7 +1398,8 @@ class _ExponentialBucketHistogramAggregation(_Aggregation[HistogramPoint]):
 
     @staticmethod
     def _get_low_high(buckets, scale, min_scale):
-        if buckets.counts == [0]:
+        counts = buckets.counts
+        if len(counts) == 1 and counts[0] == 0:
             return 0, -1
 
         shift = scale - min_scale
@@ -1132,10 +1444,11 @@ class _ExponentialBucketHistogramAggregation(_Aggregation[HistogramPoint]):
         aggregation_temporality,
     ):
         current_change = current_scale - min_scale
+        current_counts = current_buckets.counts
+        current_index_base = current_buckets.index_base
+        current_index_end = current_buckets.index_end
 
-        for current_bucket_index, current_bucket in enumerate(
-            current_buckets.counts
-        ):
+        for current_bucket_index, current_bucket in enumerate(current_counts):
             if current_bucket == 0:
                 continue
 
@@ -1143,9 +1456,9 @@ class _ExponentialBucketHistogramAggregation(_Aggregation[HistogramPoint]):
             # would not happen because self._previous_point is only assigned to
             # an ExponentialHistogramDataPoint object if self._count != 0.
 
-            current_index = current_buckets.index_base + current_bucket_index
-            if current_index > current_buckets.index_end:
-                current_index -= len(current_buckets.counts)
+            current_index = current_index_base + current_bucket_index
+            if current_index > current_index_end:
+                current_index -= len(current_counts)
 
             index = current_index >> current_change
 
@@ -1406,8 +1719,20 @@ class SumAggregation(Aggregation):
     """This aggregation informs the SDK to collect:
 
     - The arithmetic sum of Measurement values.
+
+    Args:
+        stripes: Number of partial sums kept for every synchronous instrument
+            stream. Threads are spread over them, so that many threads adding
+            to the same stream do not all contend for a single lock. The
+            partial sums are merged when the metrics are collected. By default
+            a single sum is kept.
     """
 
+    def __init__(self, stripes: int | None = None) -> None:
+        if stripes is not None and stripes < 1:
+            raise ValueError("stripes must be a positive integer.")
+        self._stripes = stripes
+
     def _create_aggregation(
         self,
         instrument: _Instrument,
@@ -1431,6 +1756,8 @@ class SumAggregation(Aggregation):
             instrument_aggregation_temporality,
             start_time_unix_nano,
             reservoir_factory(_SumAggregation),
+            # Asynchronous instruments report totals from a single thread.
+            self._stripes if isinstance(instrument, Synchronous) else None,
         )
 
 
@@ -164,6 +164,10 @@ class FixedSizeExemplarReservoirABC(ExemplarReservoir):
             exemplars contain the attributes that were filtered out by the aggregator,
             but recorded alongside the original measurement.
         """
+        if not self._reservoir_storage:
+            # Nothing was offered since the last collection.
+            self._reset()
+            return []
         exemplars = [
             e
             for e in (
@@ -172,6 +176,9 @@ class FixedSizeExemplarReservoirABC(ExemplarReservoir):
             )
             if e is not None
         ]
+        # The buckets are dropped rather than kept empty, so that collecting
+        # a reservoir that is not offered measurements anymore stays cheap.
+        self._reservoir_storage.clear()
         self._reset()
         return exemplars
 
@@ -1,15 +1,25 @@
 # Copyright The OpenTelemetry Authors
 # SPDX-License-Identifier: Apache-2.0
 
+from array import array
 from math import ceil, log2
 
+# Bucket counts are never negative, they are stored in arrays of unsigned 64
+# bit integers that take 8 bytes per bucket instead of the 8 bytes per pointer
+# plus the integer objects of a list.
+_TYPECODE = "Q"
+
+
+def _zeros(size: int) -> array:
+    return array(_TYPECODE, bytes(8 * size))
+
 
 class Buckets:
     # No method of this class is protected by locks because instances of this
     # class are only used in methods that are protected by locks themselves.
 
     def __init__(self):
-        self._counts = [0]
+        self._counts = _zeros(1)
 
         # The term index refers to the number of the exponential histogram bucket
         # used to determine its boundaries. The lower boundary of a bucket is
@@ -61,9 +71,11 @@ class Buckets:
     def counts(self):
         return self._counts
 
-    def get_offset_counts(self):
+    def get_offset_counts(self) -> list[int]:
         bias = self.__index_base - self.__index_start
-        return self._counts[-bias:] + self._counts[:-bias]
+        if bias == 0:
+            return self._counts.tolist()
+        return (self._counts[-bias:] + self._counts[:-bias]).tolist()
 
     def grow(self, needed: int, max_size: int) -> None:
         size = len(self._counts)
@@ -84,7 +96,7 @@ class Buckets:
 
         new_positive_limit = new_size - bias
 
-        tmp = [0] * new_size
+        tmp = _zeros(new_size)
         tmp[new_positive_limit:] = self._counts[old_positive_limit:]
         tmp[0:old_positive_limit] = self._counts[0:old_positive_limit]
         self._counts = tmp
@@ -122,40 +134,24 @@ class Buckets:
         if bias != 0:
             self.__index_base = self.__index_start
 
-            # [0, 1, 2, 3, 4] Original backing array
-
-            self._counts = self._counts[::-1]
-            # [4, 3, 2, 1, 0]
-
-            self._counts = (
-                self._counts[:bias][::-1] + self._counts[bias:][::-1]
-            )
-            # [3, 4, 0, 1, 2] This is a rotation of the backing array.
-
-        size = 1 + self.__index_end - self.__index_start
-        each = 1 << amount
-        inpos = 0
-        outpos = 0
-
-        pos = self.__index_start
-
-        while pos <= self.__index_end:
-            mod = pos % each
-            if mod < 0:
-                mod += each
-
-            index = mod
+            # [0, 1, 2, 3, 4] Original backing array, with bias 2
+            # [3, 4, 0, 1, 2] Rotated backing array
+            self._counts = self._counts[-bias:] + self._counts[:-bias]
 
-            while index < each and inpos < size:
-                if outpos != inpos:
-                    self._counts[outpos] += self._counts[inpos]
-                    self._counts[inpos] = 0
+        # The bucket in position inpos of the rotated backing array has the
+        # index self.__index_start + inpos, after downscaling it goes in the
+        # position that corresponds with that index shifted by amount. As
+        # outpos <= inpos the collapse can be done in place.
+        counts = self._counts
+        index_start = self.__index_start
+        shifted_index_start = index_start >> amount
 
-                inpos += 1
-                pos += 1
-                index += 1
+        for inpos in range(1 + self.__index_end - index_start):
+            outpos = ((index_start + inpos) >> amount) - shifted_index_start
 
-            outpos += 1
+            if outpos != inpos:
+                counts[outpos] += counts[inpos]
+                counts[inpos] = 0
 
         self.__index_start >>= amount
         self.__index_end >>= amount
@@ -174,6 +170,6 @@ class Buckets:
         copy._Buckets__index_base = self._Buckets__index_base  # type: ignore[reportArgumentType]
         copy._Buckets__index_start = self._Buckets__index_start  # type: ignore[reportArgumentType]
         copy._Buckets__index_end = self._Buckets__index_end  # type: ignore[reportArgumentType]
-        copy._counts = [0 for _ in self._counts]
+        copy._counts = _zeros(len(self._counts))
 
         return copy
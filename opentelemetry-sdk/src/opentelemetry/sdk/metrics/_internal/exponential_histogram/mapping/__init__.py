@@ -18,6 +18,12 @@ class Mapping(ABC):
 
     # pylint: disable=no-member
     def __new__(cls, scale: int):
+        # Mappings are immutable once initialized, so the lock is only needed
+        # to create the mapping of a scale that has not been used yet.
+        mapping = cls._mappings.get(scale)
+        if mapping is not None:
+            return mapping
+
         with cls._mappings_lock:
             # cls._mappings and cls._mappings_lock are implemented in each of
             # the child classes as a dictionary and a lock, respectively. They
@@ -25,8 +31,11 @@ class Mapping(ABC):
             # classes having the same instance of cls._mappings and
             # cls._mappings_lock.
             if scale not in cls._mappings:
-                cls._mappings[scale] = super().__new__(cls)
-                cls._mappings[scale]._init(scale)
+                # The mapping is published only after it has been initialized
+                # so that it is never seen half built without the lock.
+                mapping = super().__new__(cls)
+                mapping._init(scale)
+                cls._mappings[scale] = mapping
 
         return cls._mappings[scale]
 
@@ -2,6 +2,8 @@
 # SPDX-License-Identifier: Apache-2.0
 from __future__ import annotations
 
+import asyncio
+import inspect
 import math
 import os
 import weakref
@@ -26,6 +28,7 @@ from opentelemetry.context import (
     set_value,
 )
 from opentelemetry.metrics import MeterProvider, NoOpMeterProvider
+from opentelemetry.sdk._shared_internal import _run_from_sync, _running_loop
 from opentelemetry.sdk.environment_variables import (
     OTEL_METRIC_EXPORT_INTERVAL,
     OTEL_METRIC_EXPORT_TIMEOUT,
@@ -34,6 +37,9 @@ from opentelemetry.sdk.environment_variables import (
 from opentelemetry.sdk.environment_variables._internal import (
     parse_boolean_environment_variable,
 )
+from opentelemetry.sdk.metrics._internal._view_instrument_match import (
+    _DEFAULT_CARDINALITY_LIMIT,
+)
 from opentelemetry.sdk.metrics._internal.aggregation import (
     AggregationTemporality,
     DefaultAggregation,
@@ -207,6 +213,26 @@ class MetricReader(ABC):
             default aggregations. The aggregation defined here will be
             overridden by an aggregation defined by a view that is not
             `DefaultAggregation`.
+        cardinality_limits: A mapping between instrument classes and the
+            maximum number of metric streams, including the overflow stream,
+            produced for each instrument of the class. By default the limit is
+            2000 for all instrument classes. Measurements with attribute sets
+            beyond the limit are aggregated into a single stream with the
+            ``otel.metric.overflow`` attribute set to `True`. The limit defined
+            here will be overridden by a limit defined by a view.
+        max_idle_collections: The number of consecutive collections without
+            measurements after which a metric stream is evicted to reclaim its
+            memory. Streams of synchronous instruments collected with DELTA
+            temporality are evicted after the first collection without
+            measurements. If `None`, the default, streams are never evicted. A
+            stream receiving measurements again after its eviction starts over
+            with a new start time.
+        skip_unchanged_streams: Whether to leave out of the collected metrics
+            the streams collected with CUMULATIVE temporality that received
+            no measurements since the previous collection. Their values did
+            not change, which saves building and exporting them for backends
+            that keep the last value reported for every stream. `False` by
+            default.
 
     .. document protected _receive_metrics which is a intended to be overridden by subclass
     .. automethod:: _receive_metrics
@@ -221,6 +247,9 @@ class MetricReader(ABC):
         ]
         | None = None,
         *,
+        cardinality_limits: dict[type, int] | None = None,
+        max_idle_collections: int | None = None,
+        skip_unchanged_streams: bool = False,
         otel_component_type: OtelComponentTypeValues | None = None,
     ) -> None:
         self._collect: (
@@ -323,6 +352,38 @@ class MetricReader(ABC):
                 else:
                     raise Exception(f"Invalid instrument class found {typ}")
 
+        self._instrument_class_cardinality_limit = dict.fromkeys(
+            self._instrument_class_temporality, _DEFAULT_CARDINALITY_LIMIT
+        )
+
+        if cardinality_limits is not None:
+            sdk_instrument_classes = {
+                Counter: _Counter,
+                UpDownCounter: _UpDownCounter,
+                Histogram: _Histogram,
+                Gauge: _Gauge,
+                ObservableCounter: _ObservableCounter,
+                ObservableUpDownCounter: _ObservableUpDownCounter,
+                ObservableGauge: _ObservableGauge,
+            }
+            for typ, limit in cardinality_limits.items():
+                if typ not in sdk_instrument_classes:
+                    raise Exception(f"Invalid instrument class found {typ}")
+                if limit <= 0:
+                    raise ValueError(
+                        f"Invalid cardinality limit found {limit}"
+                    )
+                self._instrument_class_cardinality_limit[
+                    sdk_instrument_classes[typ]
+                ] = limit
+
+        if max_idle_collections is not None and max_idle_collections <= 0:
+            raise ValueError(
+                "max_idle_collections must be a positive integer."
+            )
+        self._max_idle_collections = max_idle_collections
+        self._skip_unchanged_streams = skip_unchanged_streams
+
         self._otel_component_type = (
             otel_component_type.value
             if otel_component_type
@@ -432,10 +493,17 @@ class InMemoryMetricReader(MetricReader):
             type, opentelemetry.sdk.metrics.view.Aggregation
         ]
         | None = None,
+        *,
+        cardinality_limits: dict[type, int] | None = None,
+        max_idle_collections: int | None = None,
+        skip_unchanged_streams: bool = False,
     ) -> None:
         super().__init__(
             preferred_temporality=preferred_temporality,
             preferred_aggregation=preferred_aggregation,
+            cardinality_limits=cardinality_limits,
+            max_idle_collections=max_idle_collections,
+            skip_unchanged_streams=skip_unchanged_streams,
         )
         self._lock = RLock()
         self._metrics_data: MetricsData | None = None
@@ -463,6 +531,26 @@ class InMemoryMetricReader(MetricReader):
         pass
 
 
+def _default_export_interval_millis() -> float:
+    try:
+        return float(environ.get(OTEL_METRIC_EXPORT_INTERVAL, 60000))
+    except ValueError:
+        _logger.warning(
+            "Found invalid value for export interval, using default"
+        )
+        return 60000
+
+
+def _default_export_timeout_millis() -> float:
+    try:
+        return float(environ.get(OTEL_METRIC_EXPORT_TIMEOUT, 30000))
+    except ValueError:
+        _logger.warning(
+            "Found invalid value for export timeout, using default"
+        )
+        return 30000
+
+
 class PeriodicExportingMetricReader(MetricReader):
     """`PeriodicExportingMetricReader` is an implementation of `MetricReader`
     that collects metrics based on a user-configurable time interval, and passes the
@@ -478,11 +566,18 @@ class PeriodicExportingMetricReader(MetricReader):
         exporter: MetricExporter,
         export_interval_millis: float | None = None,
         export_timeout_millis: float | None = None,
+        *,
+        cardinality_limits: dict[type, int] | None = None,
+        max_idle_collections: int | None = None,
+        skip_unchanged_streams: bool = False,
     ) -> None:
         # PeriodicExportingMetricReader defers to exporter for configuration
         super().__init__(
             preferred_temporality=exporter._preferred_temporality,
             preferred_aggregation=exporter._preferred_aggregation,
+            cardinality_limits=cardinality_limits,
+            max_idle_collections=max_idle_collections,
+            skip_unchanged_streams=skip_unchanged_streams,
             otel_component_type=OtelComponentTypeValues.PERIODIC_METRIC_READER,
         )
 
@@ -493,25 +588,9 @@ class PeriodicExportingMetricReader(MetricReader):
 
         self._exporter = exporter
         if export_interval_millis is None:
-            try:
-                export_interval_millis = float(
-                    environ.get(OTEL_METRIC_EXPORT_INTERVAL, 60000)
-                )
-            except ValueError:
-                _logger.warning(
-                    "Found invalid value for export interval, using default"
-                )
-                export_interval_millis = 60000
+            export_interval_millis = _default_export_interval_millis()
         if export_timeout_millis is None:
-            try:
-                export_timeout_millis = float(
-                    environ.get(OTEL_METRIC_EXPORT_TIMEOUT, 30000)
-                )
-            except ValueError:
-                _logger.warning(
-                    "Found invalid value for export timeout, using default"
-                )
-                export_timeout_millis = 30000
+            export_timeout_millis = _default_export_timeout_millis()
         self._export_interval_millis = export_interval_millis
         self._export_timeout_millis = export_timeout_millis
         self._shutdown = False
@@ -605,3 +684,183 @@ class PeriodicExportingMetricReader(MetricReader):
         super().force_flush(timeout_millis=timeout_millis)
         self._exporter.force_flush(timeout_millis=timeout_millis)
         return True
+
+
+class AsyncPeriodicExportingMetricReader(MetricReader):
+    """`AsyncPeriodicExportingMetricReader` is the asyncio counterpart of
+    `PeriodicExportingMetricReader`, for exporters whose ``export`` is a
+    coroutine such as the asyncio OTLP exporters.
+
+    The reader must be created from a running event loop, from which it
+    periodically collects metrics and passes them to the exporter. Metrics
+    are collected in a thread of the loop's default executor, since the
+    callbacks of observable instruments may block, and exported from the
+    loop. Await ``collect_async``, ``force_flush_async`` and
+    ``shutdown_async`` from that loop, ``collect``, ``force_flush`` and
+    ``shutdown`` cannot block it.
+
+    The configured exporter's ``export`` method will not be called
+    concurrently.
+    """
+
+    def __init__(
+        self,
+        exporter: MetricExporter,
+        export_interval_millis: float | None = None,
+        export_timeout_millis: float | None = None,
+        *,
+        cardinality_limits: dict[type, int] | None = None,
+        max_idle_collections: int | None = None,
+        skip_unchanged_streams: bool = False,
+    ) -> None:
+        if not inspect.iscoroutinefunction(exporter.export):
+            raise ValueError(
+                "An asynchronous metric reader requires an exporter with an "
+                "asynchronous export."
+            )
+        super().__init__(
+            preferred_temporality=exporter._preferred_temporality,
+            preferred_aggregation=exporter._preferred_aggregation,
+            cardinality_limits=cardinality_limits,
+            max_idle_collections=max_idle_collections,
+            skip_unchanged_streams=skip_unchanged_streams,
+            otel_component_type=OtelComponentTypeValues.PERIODIC_METRIC_READER,
+        )
+        self._exporter = exporter
+        # Held while awaiting self._exporter.export() to prevent concurrent
+        # execution of MetricExporter.export()
+        self._export_lock = asyncio.Lock()
+        if export_interval_millis is None:
+            export_interval_millis = _default_export_interval_millis()
+        if export_timeout_millis is None:
+            export_timeout_millis = _default_export_timeout_millis()
+        if export_interval_millis <= 0:
+            raise ValueError(
+                f"interval value {export_interval_millis} is invalid \
+                and needs to be larger than zero."
+            )
+        self._export_interval_millis = export_interval_millis
+        self._export_timeout_millis = export_timeout_millis
+        self._shutdown = False
+        self._shutdown_once = Once()
+        self._shutdown_event = asyncio.Event()
+        self._ticker_task: asyncio.Task | None = None
+        self._loop = _running_loop()
+        if self._export_interval_millis < math.inf:
+            if self._loop is None:
+                _logger.warning(
+                    "AsyncPeriodicExportingMetricReader was not created from "
+                    "a running event loop, metrics are only exported by "
+                    "force_flush and shutdown."
+                )
+            else:
+                self._ticker_task = self._loop.create_task(self._ticker())
+
+    async def _ticker(self) -> None:
+        interval_secs = self._export_interval_millis / 1e3
+        while not self._shutdown:
+            try:
+                await asyncio.wait_for(
+                    self._shutdown_event.wait(), interval_secs
+                )
+            except asyncio.TimeoutError:
+                await self._collect_in_thread(self._export_timeout_millis)
+
+    async def _collect_in_thread(self, timeout_millis: float) -> None:
+        await asyncio.to_thread(self._collect_and_export, timeout_millis)
+
+    def _collect_and_export(self, timeout_millis: float) -> None:
+        try:
+            self.collect(timeout_millis=timeout_millis)
+        except MetricsTimeoutError:
+            _logger.warning("Metric collection timed out.", exc_info=True)
+
+    def _receive_metrics(
+        self,
+        metrics_data: MetricsData,
+        timeout_millis: float = 10_000,
+        **kwargs,
+    ) -> None:
+        # Called from the thread collecting the metrics, which waits for
+        # the event loop to export them.
+        _run_from_sync(
+            self._loop,
+            lambda: self._export(metrics_data, timeout_millis),
+            timeout_millis,
+            "collect",
+        )
+
+    async def _export(
+        self, metrics_data: MetricsData, timeout_millis: float
+    ) -> None:
+        token = attach(set_value(_SUPPRESS_INSTRUMENTATION_KEY, True))
+        # pylint: disable=broad-exception-caught,invalid-name
+        try:
+            async with self._export_lock:
+                await self._exporter.export(
+                    metrics_data, timeout_millis=timeout_millis
+                )
+        except Exception:
+            _logger.exception("Exception while exporting metrics")
+        finally:
+            detach(token)
+
+    async def collect_async(self, timeout_millis: float = 10_000) -> None:
+        """Collects the metrics and exports them, without blocking the
+        event loop."""
+        await self._collect_in_thread(timeout_millis)
+
+    async def force_flush_async(self, timeout_millis: float = 10_000) -> bool:
+        await self._collect_in_thread(timeout_millis)
+        result = self._exporter.force_flush(timeout_millis=timeout_millis)
+        if inspect.isawaitable(result):
+            await result
+        return True
+
+    async def shutdown_async(
+        self, timeout_millis: float = 30_000, **kwargs
+    ) -> None:
+        deadline_ns = time_ns() + timeout_millis * 10**6
+
+        def _shutdown():
+            self._shutdown = True
+
+        did_set = self._shutdown_once.do_once(_shutdown)
+        if not did_set:
+            _logger.warning("Can't shutdown multiple times")
+            return
+
+        loop = asyncio.get_running_loop()
+        if self._loop is loop:
+            self._shutdown_event.set()
+            if self._ticker_task is not None:
+                await asyncio.wait(
+                    {self._ticker_task},
+                    timeout=max(0, (deadline_ns - time_ns()) / 10**9),
+                )
+        else:
+            # The event loop the reader was created from is gone, the last
+            # metrics are exported from this one.
+            self._loop = loop
+            self._export_lock = asyncio.Lock()
+        # one last collection before shutting down completely
+        await self._collect_in_thread(
+            max(0, (deadline_ns - time_ns()) / 10**6)
+        )
+        result = self._exporter.shutdown(
+            timeout_millis=max(0, (deadline_ns - time_ns()) / 10**6)
+        )
+        if inspect.isawaitable(result):
+            await result
+
+    def force_flush(self, timeout_millis: float = 10_000) -> bool:
+        super().force_flush(timeout_millis=timeout_millis)
+        return True
+
+    def shutdown(self, timeout_millis: float = 30_000, **kwargs) -> None:
+        _run_from_sync(
+            self._loop,
+            lambda: self.shutdown_async(timeout_millis),
+            timeout_millis,
+            "shutdown",
+        )
@@ -16,14 +16,22 @@ from opentelemetry.semconv._incubating.metrics.otel_metrics import (
 _component_counter = Counter()
 
 
+_FOLDED_STREAMS = "otel.sdk.metric_reader.folded_streams"
+
+
 class MetricReaderMetricsT(Protocol):
     def record_collection(self, duration: float) -> None: ...
 
+    def record_folded_streams(self, folded_streams: int) -> None: ...
+
 
 class NoOpMetricReaderMetrics:
     def record_collection(self, duration: float) -> None:
         pass
 
+    def record_folded_streams(self, folded_streams: int) -> None:
+        pass
+
 
 class MetricReaderMetrics:
     def __init__(
@@ -42,10 +50,18 @@ class MetricReaderMetrics:
         self._collection_duration = (
             create_otel_sdk_metric_reader_collection_duration(meter)
         )
+        self._folded_streams = meter.create_gauge(
+            name=_FOLDED_STREAMS,
+            description="The number of attribute sets aggregated into overflow streams because of cardinality limits during the last collection interval, counted up to 2000 per metric.",
+            unit="{stream}",
+        )
 
     def record_collection(self, duration: float) -> None:
         self._collection_duration.record(duration, self._standard_attrs)
 
+    def record_folded_streams(self, folded_streams: int) -> None:
+        self._folded_streams.set(folded_streams, self._standard_attrs)
+
 
 def create_metric_reader_metrics(
     component_type: str,
@@ -4,7 +4,7 @@
 # pylint: disable=too-many-ancestors, unused-import
 from __future__ import annotations
 
-from collections.abc import Generator, Iterable, Sequence
+from collections.abc import Callable, Generator, Iterable, Sequence
 from logging import getLogger
 from time import time_ns
 from typing import (
@@ -16,7 +16,12 @@ from typing import (
 
 # This kind of import is needed to avoid Sphinx errors.
 from opentelemetry.context import Context, get_current
-from opentelemetry.metrics import Asynchronous, CallbackT, Synchronous
+from opentelemetry.metrics import (
+    Asynchronous,
+    CallbackT,
+    Observation,
+    Synchronous,
+)
 from opentelemetry.metrics import Counter as APICounter
 from opentelemetry.metrics import Histogram as APIHistogram
 from opentelemetry.metrics import ObservableCounter as APIObservableCounter
@@ -30,7 +35,10 @@ from opentelemetry.metrics._internal.instrument import (
     CallbackOptions,
     _MetricsHistogramAdvisory,
 )
-from opentelemetry.sdk.metrics._internal.measurement import Measurement
+from opentelemetry.sdk.metrics._internal.measurement import (
+    Measurement,
+    _is_ndarray,
+)
 
 if TYPE_CHECKING:
     from opentelemetry.sdk.metrics._internal import (
@@ -38,6 +46,7 @@ if TYPE_CHECKING:
     )
     from opentelemetry.sdk.metrics._internal.measurement_consumer import (
         MeasurementConsumer,
+        _Binding,
     )
     from opentelemetry.sdk.util.instrumentation import InstrumentationScope
 
@@ -95,6 +104,82 @@ class _Synchronous(_Instrument, Synchronous):
     def _is_enabled(self) -> bool:
         return self._meter_config is None or self._meter_config.is_enabled
 
+    def _consume_batch(
+        self,
+        amounts: Sequence[int | float],
+        attributes: dict[str, str] | None,
+        context: Context | None,
+    ) -> None:
+        self._measurement_consumer.consume_batch(
+            amounts,
+            Measurement(
+                amounts[0],
+                time_ns(),
+                self,
+                context or get_current(),
+                attributes,
+            ),
+        )
+
+
+def _drop_negative_amounts(
+    amounts: Sequence[int | float], message: str, name: str
+) -> Sequence[int | float]:
+    if len(amounts) == 0:
+        return amounts
+    if _is_ndarray(amounts):
+        minimum = amounts.min()  # type: ignore[attr-defined]
+    else:
+        minimum = min(amounts)
+    if minimum >= 0:
+        return amounts
+    _logger.warning(message, name)
+    return [amount for amount in amounts if amount >= 0]
+
+
+class _BoundInstrument:
+    """A synchronous instrument bound to a fixed set of attributes.
+
+    The view filtering and the lookup of the aggregations for the attributes
+    are done once instead of on every measurement.
+    """
+
+    __slots__ = ("_instrument", "_attributes", "_binding")
+
+    def __init__(
+        self, instrument: _Synchronous, attributes: dict[str, str] | None
+    ) -> None:
+        self._instrument = instrument
+        self._attributes = dict(attributes) if attributes else None
+        # pylint: disable=protected-access
+        self._binding: _Binding = instrument._measurement_consumer.bind(
+            instrument, self._attributes
+        )
+
+    def _consume(self, amount: int | float, context: Context | None) -> None:
+        instrument = self._instrument
+        # pylint: disable=protected-access
+        instrument._measurement_consumer.consume_bound_value(
+            self._binding, instrument, amount, context
+        )
+
+    def _consume_batch(
+        self, amounts: Sequence[int | float], context: Context | None
+    ) -> None:
+        instrument = self._instrument
+        # pylint: disable=protected-access
+        instrument._measurement_consumer.consume_bound_batch(
+            self._binding,
+            amounts,
+            Measurement(
+                amounts[0],
+                time_ns(),
+                instrument,
+                context or get_current(),
+                self._attributes,
+            ),
+        )
+
 
 class _Asynchronous(_Instrument, Asynchronous):
     def __init__(
@@ -161,19 +246,30 @@ class _Asynchronous(_Instrument, Asynchronous):
         if not self._is_enabled():
             return
         for callback in self._callbacks:
-            try:
-                for api_measurement in callback(callback_options):
-                    yield Measurement(
+            yield from self._observe(callback, callback_options)
+
+    def _observe(
+        self,
+        callback: Callable[[CallbackOptions], Iterable[Observation]],
+        callback_options: CallbackOptions,
+    ) -> list[Measurement]:
+        """Calls one of the callbacks of the instrument and returns its
+        measurements, the ones observed before it failed if it does."""
+        measurements = []
+        try:
+            for api_measurement in callback(callback_options):
+                measurements.append(
+                    Measurement(
                         api_measurement.value,
                         time_unix_nano=time_ns(),
                         instrument=self,
                         context=api_measurement.context or get_current(),
                         attributes=api_measurement.attributes,
                     )
-            except Exception:  # pylint: disable=broad-exception-caught
-                _logger.exception(
-                    "Callback failed for instrument %s.", self.name
                 )
+        except Exception:  # pylint: disable=broad-exception-caught
+            _logger.exception("Callback failed for instrument %s.", self.name)
+        return measurements
 
 
 class Counter(_Synchronous, APICounter):
@@ -182,6 +278,13 @@ class Counter(_Synchronous, APICounter):
             raise TypeError("Counter must be instantiated via a meter.")
         return super().__new__(cls)
 
+    def bind(self, attributes: dict[str, str] | None = None) -> BoundCounter:
+        """Returns a handle recording measurements with ``attributes``.
+
+        Prefer it over passing the same attributes on every call in hot paths.
+        """
+        return BoundCounter(self, attributes)
+
     def add(
         self,
         amount: int | float,
@@ -197,16 +300,32 @@ class Counter(_Synchronous, APICounter):
                 "Add amount must be non-negative on Counter %s.", self.name
             )
             return
-        time_unix_nano = time_ns()
-        self._measurement_consumer.consume_measurement(
-            Measurement(
-                amount,
-                time_unix_nano,
-                self,
-                context or get_current(),
-                attributes,
-            )
+        self._measurement_consumer.consume_value(
+            self, amount, attributes, context
+        )
+
+    def add_many(
+        self,
+        amounts: Sequence[int | float],
+        attributes: dict[str, str] | None = None,
+        context: Context | None = None,
+    ):
+        """Adds every amount of ``amounts`` with the same attributes.
+
+        The amounts can be any sequence, including `array.array`,
+        `memoryview` and NumPy arrays, and are aggregated together under a
+        single timestamp.
+        """
+        if not self._is_enabled():
+            return
+
+        amounts = _drop_negative_amounts(
+            amounts,
+            "Add amount must be non-negative on Counter %s.",
+            self.name,
         )
+        if len(amounts) > 0:
+            self._consume_batch(amounts, attributes, context)
 
 
 class UpDownCounter(_Synchronous, APIUpDownCounter):
@@ -215,6 +334,15 @@ class UpDownCounter(_Synchronous, APIUpDownCounter):
             raise TypeError("UpDownCounter must be instantiated via a meter.")
         return super().__new__(cls)
 
+    def bind(
+        self, attributes: dict[str, str] | None = None
+    ) -> BoundUpDownCounter:
+        """Returns a handle recording measurements with ``attributes``.
+
+        Prefer it over passing the same attributes on every call in hot paths.
+        """
+        return BoundUpDownCounter(self, attributes)
+
     def add(
         self,
         amount: int | float,
@@ -225,17 +353,28 @@ class UpDownCounter(_Synchronous, APIUpDownCounter):
             super().add(amount, attributes=attributes, context=context)
             return
 
-        time_unix_nano = time_ns()
-        self._measurement_consumer.consume_measurement(
-            Measurement(
-                amount,
-                time_unix_nano,
-                self,
-                context or get_current(),
-                attributes,
-            )
+        self._measurement_consumer.consume_value(
+            self, amount, attributes, context
         )
 
+    def add_many(
+        self,
+        amounts: Sequence[int | float],
+        attributes: dict[str, str] | None = None,
+        context: Context | None = None,
+    ):
+        """Adds every amount of ``amounts`` with the same attributes.
+
+        The amounts can be any sequence, including `array.array`,
+        `memoryview` and NumPy arrays, and are aggregated together under a
+        single timestamp.
+        """
+        if not self._is_enabled():
+            return
+
+        if len(amounts) > 0:
+            self._consume_batch(amounts, attributes, context)
+
 
 class ObservableCounter(_Asynchronous, APIObservableCounter):
     def __new__(cls, *args, **kwargs):
@@ -284,6 +423,13 @@ class Histogram(_Synchronous, APIHistogram):
             raise TypeError("Histogram must be instantiated via a meter.")
         return super().__new__(cls)
 
+    def bind(self, attributes: dict[str, str] | None = None) -> BoundHistogram:
+        """Returns a handle recording measurements with ``attributes``.
+
+        Prefer it over passing the same attributes on every call in hot paths.
+        """
+        return BoundHistogram(self, attributes)
+
     def record(
         self,
         amount: int | float,
@@ -300,16 +446,32 @@ class Histogram(_Synchronous, APIHistogram):
                 self.name,
             )
             return
-        time_unix_nano = time_ns()
-        self._measurement_consumer.consume_measurement(
-            Measurement(
-                amount,
-                time_unix_nano,
-                self,
-                context or get_current(),
-                attributes,
-            )
+        self._measurement_consumer.consume_value(
+            self, amount, attributes, context
+        )
+
+    def record_many(
+        self,
+        amounts: Sequence[int | float],
+        attributes: dict[str, str] | None = None,
+        context: Context | None = None,
+    ):
+        """Records every amount of ``amounts`` with the same attributes.
+
+        The amounts can be any sequence, including `array.array`,
+        `memoryview` and NumPy arrays, and are aggregated together under a
+        single timestamp.
+        """
+        if not self._is_enabled():
+            return
+
+        amounts = _drop_negative_amounts(
+            amounts,
+            "Record amount must be non-negative on Histogram %s.",
+            self.name,
         )
+        if len(amounts) > 0:
+            self._consume_batch(amounts, attributes, context)
 
 
 class Gauge(_Synchronous, APIGauge):
@@ -318,6 +480,13 @@ class Gauge(_Synchronous, APIGauge):
             raise TypeError("Gauge must be instantiated via a meter.")
         return super().__new__(cls)
 
+    def bind(self, attributes: dict[str, str] | None = None) -> BoundGauge:
+        """Returns a handle recording measurements with ``attributes``.
+
+        Prefer it over passing the same attributes on every call in hot paths.
+        """
+        return BoundGauge(self, attributes)
+
     def set(
         self,
         amount: int | float,
@@ -328,15 +497,8 @@ class Gauge(_Synchronous, APIGauge):
             super().set(amount, attributes=attributes, context=context)
             return
 
-        time_unix_nano = time_ns()
-        self._measurement_consumer.consume_measurement(
-            Measurement(
-                amount,
-                time_unix_nano,
-                self,
-                context or get_current(),
-                attributes,
-            )
+        self._measurement_consumer.consume_value(
+            self, amount, attributes, context
         )
 
 
@@ -349,6 +511,102 @@ class ObservableGauge(_Asynchronous, APIObservableGauge):
         return super().__new__(cls)
 
 
+class BoundCounter(_BoundInstrument):
+    __slots__ = ()
+
+    def add(self, amount: int | float, context: Context | None = None):
+        # pylint: disable=protected-access
+        if not self._instrument._is_enabled():
+            return
+
+        if amount < 0:
+            _logger.warning(
+                "Add amount must be non-negative on Counter %s.",
+                self._instrument.name,
+            )
+            return
+        self._consume(amount, context)
+
+    def add_many(
+        self, amounts: Sequence[int | float], context: Context | None = None
+    ):
+        # pylint: disable=protected-access
+        if not self._instrument._is_enabled():
+            return
+
+        amounts = _drop_negative_amounts(
+            amounts,
+            "Add amount must be non-negative on Counter %s.",
+            self._instrument.name,
+        )
+        if len(amounts) > 0:
+            self._consume_batch(amounts, context)
+
+
+class BoundUpDownCounter(_BoundInstrument):
+    __slots__ = ()
+
+    def add(self, amount: int | float, context: Context | None = None):
+        # pylint: disable=protected-access
+        if not self._instrument._is_enabled():
+            return
+
+        self._consume(amount, context)
+
+    def add_many(
+        self, amounts: Sequence[int | float], context: Context | None = None
+    ):
+        # pylint: disable=protected-access
+        if not self._instrument._is_enabled():
+            return
+
+        if len(amounts) > 0:
+            self._consume_batch(amounts, context)
+
+
+class BoundHistogram(_BoundInstrument):
+    __slots__ = ()
+
+    def record(self, amount: int | float, context: Context | None = None):
+        # pylint: disable=protected-access
+        if not self._instrument._is_enabled():
+            return
+
+        if amount < 0:
+            _logger.warning(
+                "Record amount must be non-negative on Histogram %s.",
+                self._instrument.name,
+            )
+            return
+        self._consume(amount, context)
+
+    def record_many(
+        self, amounts: Sequence[int | float], context: Context | None = None
+    ):
+        # pylint: disable=protected-access
+        if not self._instrument._is_enabled():
+            return
+
+        amounts = _drop_negative_amounts(
+            amounts,
+            "Record amount must be non-negative on Histogram %s.",
+            self._instrument.name,
+        )
+        if len(amounts) > 0:
+            self._consume_batch(amounts, context)
+
+
+class BoundGauge(_BoundInstrument):
+    __slots__ = ()
+
+    def set(self, amount: int | float, context: Context | None = None):
+        # pylint: disable=protected-access
+        if not self._instrument._is_enabled():
+            return
+
+        self._consume(amount, context)
+
+
 # Below classes exist to prevent the direct instantiation
 class _Counter(Counter):
     pass
@@ -3,8 +3,10 @@
 
 from __future__ import annotations
 
+import sys
+from collections.abc import Sequence
 from dataclasses import dataclass
-from typing import TYPE_CHECKING
+from typing import TYPE_CHECKING, Any
 
 from opentelemetry.context import Context
 from opentelemetry.util.types import Attributes
@@ -31,3 +33,18 @@ class Measurement:
     instrument: _Instrument
     context: Context
     attributes: Attributes = None
+
+
+def _is_ndarray(values: Any) -> bool:
+    # NumPy is not a dependency, an array can only be passed if the
+    # application already imported it.
+    numpy = sys.modules.get("numpy")
+    return numpy is not None and isinstance(values, numpy.ndarray)
+
+
+def _as_list(values: Sequence[int | float]) -> Sequence[int | float]:
+    """Returns the values of a NumPy array as Python numbers, other sequences
+    are returned unchanged."""
+    if _is_ndarray(values):
+        return values.tolist()  # type: ignore[attr-defined]
+    return values
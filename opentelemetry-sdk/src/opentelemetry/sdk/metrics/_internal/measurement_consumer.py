@@ -3,22 +3,59 @@
 
 # pylint: disable=unused-import
 
+import os
 import weakref
 from abc import ABC, abstractmethod
-from collections.abc import Iterable, Mapping
+from collections.abc import Iterable, Mapping, Sequence
+from concurrent.futures import Future
+from concurrent.futures import TimeoutError as FutureTimeoutError
+from logging import getLogger
 from threading import Lock
 from time import time_ns
 
 # This kind of import is needed to avoid Sphinx errors.
 import opentelemetry.sdk.metrics
 import opentelemetry.sdk.metrics._internal.instrument
+from opentelemetry.context import Context, get_current
 from opentelemetry.metrics._internal.instrument import CallbackOptions
+from opentelemetry.sdk._shared_internal import _DaemonThreadPool
+from opentelemetry.sdk.metrics._internal._view_instrument_match import (
+    _ViewInstrumentMatch,
+)
+from opentelemetry.sdk.metrics._internal.aggregation import _Aggregation
 from opentelemetry.sdk.metrics._internal.exceptions import MetricsTimeoutError
+from opentelemetry.sdk.metrics._internal.exemplar import (
+    AlwaysOffExemplarFilter,
+)
 from opentelemetry.sdk.metrics._internal.measurement import Measurement
 from opentelemetry.sdk.metrics._internal.metric_reader_storage import (
     MetricReaderStorage,
 )
 from opentelemetry.sdk.metrics._internal.point import MetricsData
+from opentelemetry.util.types import Attributes
+
+_logger = getLogger(__name__)
+
+_DEFAULT_CALLBACK_TIMEOUT_NS = 10000 * 1e6
+
+
+class _Binding:
+    """The aggregations a bound instrument records to, along with the view
+    instrument matches holding them.
+
+    They are resolved lazily and resolved again whenever the metric readers
+    of the consumer change or streams are evicted, as tracked by
+    ``generation``.
+    """
+
+    __slots__ = ("attributes", "streams", "generation")
+
+    def __init__(self, attributes: Attributes) -> None:
+        self.attributes = attributes
+        self.streams: tuple[
+            tuple[_ViewInstrumentMatch, _Aggregation], ...
+        ] = ()
+        self.generation = -1
 
 
 class MeasurementConsumer(ABC):
@@ -26,6 +63,55 @@ class MeasurementConsumer(ABC):
     def consume_measurement(self, measurement: Measurement) -> None:
         pass
 
+    @abstractmethod
+    def consume_value(
+        self,
+        instrument: "opentelemetry.sdk.metrics._internal.instrument._Synchronous",
+        value: int | float,
+        attributes: Attributes,
+        context: Context | None,
+    ) -> None:
+        pass
+
+    @abstractmethod
+    def consume_batch(
+        self, values: Sequence[int | float], measurement: Measurement
+    ) -> None:
+        pass
+
+    @abstractmethod
+    def bind(
+        self,
+        instrument: "opentelemetry.sdk.metrics._internal.instrument._Synchronous",
+        attributes: Attributes,
+    ) -> _Binding:
+        pass
+
+    @abstractmethod
+    def consume_bound_measurement(
+        self, binding: _Binding, measurement: Measurement
+    ) -> None:
+        pass
+
+    @abstractmethod
+    def consume_bound_value(
+        self,
+        binding: _Binding,
+        instrument: "opentelemetry.sdk.metrics._internal.instrument._Synchronous",
+        value: int | float,
+        context: Context | None,
+    ) -> None:
+        pass
+
+    @abstractmethod
+    def consume_bound_batch(
+        self,
+        binding: _Binding,
+        values: Sequence[int | float],
+        measurement: Measurement,
+    ) -> None:
+        pass
+
     @abstractmethod
     def register_asynchronous_instrument(
         self,
@@ -43,6 +129,10 @@ class MeasurementConsumer(ABC):
     ) -> MetricsData | None:
         pass
 
+    @abstractmethod
+    def shutdown(self) -> None:
+        pass
+
 
 class SynchronousMeasurementConsumer(MeasurementConsumer):
     def __init__(
@@ -59,12 +149,39 @@ class SynchronousMeasurementConsumer(MeasurementConsumer):
                 sdk_config,
                 reader._instrument_class_temporality,
                 reader._instrument_class_aggregation,
+                reader._instrument_class_cardinality_limit,
+                reader._max_idle_collections,
+                reader._skip_unchanged_streams,
             )
             for reader in metric_readers
         }
+        # Incremented whenever a metric reader is added or removed or streams
+        # are evicted, so that bindings know when to resolve their
+        # aggregations again.
+        self._generation = 0
+        # Maps every synchronous instrument to the view instrument matches of
+        # all the metric readers its measurements go to. The mapping is never
+        # modified but replaced, so that measurements can be routed without
+        # taking the lock. It is emptied when metric readers change.
+        self._routes: dict[
+            opentelemetry.sdk.metrics._internal.instrument._Instrument,
+            tuple[_ViewInstrumentMatch, ...],
+        ] = {}
         self._async_instruments: list[
             opentelemetry.sdk.metrics._internal.instrument._Asynchronous
         ] = []
+        # Without exemplars the time and context of measurements are never
+        # read, so they are neither looked up nor wrapped in a Measurement.
+        self._skip_measurements = isinstance(
+            sdk_config.exemplar_filter, AlwaysOffExemplarFilter
+        )
+        # Created on the first collection when callbacks run concurrently.
+        self._callback_executor: _DaemonThreadPool | None = None
+        self._shutdown = False
+        # The calls of callbacks that timed out and may still be running, by
+        # instrument and callback since a callback can be shared by several
+        # instruments.
+        self._late_callbacks: dict[tuple[object, object], Future] = {}
 
     def consume_measurement(self, measurement: Measurement) -> None:
         should_sample_exemplar = (
@@ -75,13 +192,180 @@ class SynchronousMeasurementConsumer(MeasurementConsumer):
                 measurement.context,
             )
         )
-        with self._lock:
-            reader_storages = weakref.WeakSet(self._reader_storages.values())
-        for reader_storage in reader_storages:
-            reader_storage.consume_measurement(
+        for view_instrument_match in self._route(measurement.instrument):
+            view_instrument_match.consume_measurement(
                 measurement, should_sample_exemplar
             )
 
+    def consume_value(
+        self,
+        instrument: "opentelemetry.sdk.metrics._internal.instrument._Synchronous",
+        value: int | float,
+        attributes: Attributes,
+        context: Context | None,
+    ) -> None:
+        if self._skip_measurements:
+            for view_instrument_match in self._route(instrument):
+                view_instrument_match.consume_value(value, attributes)
+            return
+        self.consume_measurement(
+            Measurement(
+                value,
+                time_ns(),
+                instrument,
+                context or get_current(),
+                attributes,
+            )
+        )
+
+    def consume_batch(
+        self, values: Sequence[int | float], measurement: Measurement
+    ) -> None:
+        # The exemplar filter is consulted once for the whole batch, with the
+        # value of the measurement standing for all the values.
+        should_sample_exemplar = (
+            self._sdk_config.exemplar_filter.should_sample(
+                measurement.value,
+                measurement.time_unix_nano,
+                measurement.attributes,
+                measurement.context,
+            )
+        )
+        for view_instrument_match in self._route(measurement.instrument):
+            view_instrument_match.consume_batch(
+                values, measurement, should_sample_exemplar
+            )
+
+    def _route(
+        self,
+        instrument: "opentelemetry.sdk.metrics._internal.instrument._Instrument",
+    ) -> tuple[_ViewInstrumentMatch, ...]:
+        view_instrument_matches = self._routes.get(instrument)
+        if view_instrument_matches is not None:
+            return view_instrument_matches
+
+        with self._lock:
+            view_instrument_matches = self._routes.get(instrument)
+            if view_instrument_matches is None:
+                view_instrument_matches = tuple(
+                    view_instrument_match
+                    for reader_storage in self._reader_storages.values()
+                    for view_instrument_match in (
+                        reader_storage.get_view_instrument_matches(instrument)
+                    )
+                )
+                self._routes = {
+                    **self._routes,
+                    instrument: view_instrument_matches,
+                }
+        return view_instrument_matches
+
+    def bind(
+        self,
+        instrument: "opentelemetry.sdk.metrics._internal.instrument._Synchronous",
+        attributes: Attributes,
+    ) -> _Binding:
+        return _Binding(attributes)
+
+    def consume_bound_measurement(
+        self, binding: _Binding, measurement: Measurement
+    ) -> None:
+        if binding.generation != self._generation:
+            self._resolve(binding, measurement.instrument)
+        should_sample_exemplar = (
+            self._sdk_config.exemplar_filter.should_sample(
+                measurement.value,
+                measurement.time_unix_nano,
+                measurement.attributes,
+                measurement.context,
+            )
+        )
+        for view_instrument_match, aggregation in binding.streams:
+            if not aggregation.aggregate(measurement, should_sample_exemplar):
+                binding.generation = -1
+                view_instrument_match.aggregate_evicted(
+                    binding.attributes,
+                    lambda replacement: replacement.aggregate(
+                        measurement, should_sample_exemplar
+                    ),
+                )
+
+    def consume_bound_value(
+        self,
+        binding: _Binding,
+        instrument: "opentelemetry.sdk.metrics._internal.instrument._Synchronous",
+        value: int | float,
+        context: Context | None,
+    ) -> None:
+        if self._skip_measurements:
+            if binding.generation != self._generation:
+                self._resolve(binding, instrument)
+            for view_instrument_match, aggregation in binding.streams:
+                if not aggregation.aggregate_value(value):
+                    binding.generation = -1
+                    view_instrument_match.aggregate_evicted(
+                        binding.attributes,
+                        lambda replacement: replacement.aggregate_value(value),
+                    )
+            return
+        self.consume_bound_measurement(
+            binding,
+            Measurement(
+                value,
+                time_ns(),
+                instrument,
+                context or get_current(),
+                binding.attributes,
+            ),
+        )
+
+    def consume_bound_batch(
+        self,
+        binding: _Binding,
+        values: Sequence[int | float],
+        measurement: Measurement,
+    ) -> None:
+        if binding.generation != self._generation:
+            self._resolve(binding, measurement.instrument)
+        should_sample_exemplar = (
+            self._sdk_config.exemplar_filter.should_sample(
+                measurement.value,
+                measurement.time_unix_nano,
+                measurement.attributes,
+                measurement.context,
+            )
+        )
+        for view_instrument_match, aggregation in binding.streams:
+            if not aggregation.aggregate_batch(
+                values, measurement, should_sample_exemplar
+            ):
+                binding.generation = -1
+                view_instrument_match.aggregate_evicted(
+                    binding.attributes,
+                    lambda replacement: replacement.aggregate_batch(
+                        values, measurement, should_sample_exemplar
+                    ),
+                )
+
+    def _resolve(
+        self,
+        binding: _Binding,
+        instrument: "opentelemetry.sdk.metrics._internal.instrument._Synchronous",
+    ) -> None:
+        with self._lock:
+            generation = self._generation
+        streams = tuple(
+            (
+                view_instrument_match,
+                view_instrument_match.get_aggregation(binding.attributes),
+            )
+            for view_instrument_match in self._route(instrument)
+        )
+        # The streams are set first so that a thread that sees the new
+        # generation also sees the streams resolved for it.
+        binding.streams = streams
+        binding.generation = generation
+
     def register_asynchronous_instrument(
         self,
         instrument: (
@@ -98,42 +382,145 @@ class SynchronousMeasurementConsumer(MeasurementConsumer):
     ) -> MetricsData | None:
         with self._lock:
             metric_reader_storage = self._reader_storages[metric_reader]
-            # for now, just use the defaults
-            callback_options = CallbackOptions()
-            deadline_ns = time_ns() + (timeout_millis * 1e6)
+            # Once shut down, the callbacks run in the collecting thread
+            # instead of starting a new pool.
+            if self._sdk_config.callback_max_workers and not self._shutdown:
+                measurements = self._observe_concurrently(
+                    time_ns() + (timeout_millis * 1e6)
+                )
+            else:
+                measurements = self._observe_serially(
+                    time_ns() + (timeout_millis * 1e6)
+                )
 
-            default_timeout_ns = 10000 * 1e6
+            for measurement in measurements:
+                should_sample_exemplar = (
+                    self._sdk_config.exemplar_filter.should_sample(
+                        measurement.value,
+                        measurement.time_unix_nano,
+                        measurement.attributes,
+                        measurement.context,
+                    )
+                )
+                metric_reader_storage.consume_measurement(
+                    measurement, should_sample_exemplar
+                )
 
-            for async_instrument in self._async_instruments:
-                remaining_time = deadline_ns - time_ns()
+            result = metric_reader_storage.collect()
+            folded_streams = metric_reader_storage.pop_folded_streams()
+            if metric_reader_storage.pop_evicted_streams():
+                # Bindings may hold an evicted aggregation, which they would
+                # otherwise only replace once it rejects a measurement.
+                self._generation += 1
 
-                if remaining_time < default_timeout_ns:
-                    callback_options = CallbackOptions(
-                        timeout_millis=remaining_time / 1e6
-                    )
+        # Recorded without holding the lock, since the metric may be recorded
+        # through this same consumer.
+        # pylint: disable-next=protected-access
+        metric_reader._metrics.record_folded_streams(folded_streams)
+        return result
 
-                measurements = async_instrument.callback(callback_options)
-                if time_ns() >= deadline_ns:
-                    raise MetricsTimeoutError(
-                        "Timed out while executing callback"
-                    )
+    def _observe_serially(self, deadline_ns: float) -> Iterable[Measurement]:
+        """Calls the callbacks of the asynchronous instruments one after the
+        other, raising MetricsTimeoutError once the deadline is passed."""
+        # for now, just use the defaults
+        callback_options = CallbackOptions()
+        for async_instrument in self._async_instruments:
+            remaining_time = deadline_ns - time_ns()
+
+            if remaining_time < _DEFAULT_CALLBACK_TIMEOUT_NS:
+                callback_options = CallbackOptions(
+                    timeout_millis=remaining_time / 1e6
+                )
 
-                for measurement in measurements:
-                    should_sample_exemplar = (
-                        self._sdk_config.exemplar_filter.should_sample(
-                            measurement.value,
-                            measurement.time_unix_nano,
-                            measurement.attributes,
-                            measurement.context,
+            measurements = async_instrument.callback(callback_options)
+            if time_ns() >= deadline_ns:
+                raise MetricsTimeoutError("Timed out while executing callback")
+
+            yield from measurements
+
+    def _observe_concurrently(self, deadline_ns: float) -> list[Measurement]:
+        """Calls the callbacks of the asynchronous instruments on a thread
+        pool. Each callback gets its own timeout, the measurements of the
+        callbacks that do not return in time are dropped."""
+        if self._callback_executor is None:
+            self._init_callback_executor()
+
+        calls = []
+        for async_instrument in self._async_instruments:
+            # pylint: disable=protected-access
+            if not async_instrument._is_enabled():
+                continue
+            for callback in async_instrument._callbacks:
+                late_call = self._late_callbacks.get(
+                    (async_instrument, callback)
+                )
+                if late_call is not None:
+                    if not late_call.done():
+                        _logger.warning(
+                            "Skipping callback of instrument %s, its "
+                            "previous call has not returned yet.",
+                            async_instrument.name,
                         )
+                        continue
+                    del self._late_callbacks[async_instrument, callback]
+                timeout_ns = min(
+                    _DEFAULT_CALLBACK_TIMEOUT_NS, deadline_ns - time_ns()
+                )
+                call = self._callback_executor.submit(
+                    async_instrument._observe,
+                    callback,
+                    CallbackOptions(timeout_millis=timeout_ns / 1e6),
+                )
+                calls.append(
+                    (async_instrument, callback, call, time_ns() + timeout_ns)
+                )
+
+        measurements = []
+        for async_instrument, callback, call, call_deadline_ns in calls:
+            try:
+                measurements.extend(
+                    call.result(
+                        timeout=max(call_deadline_ns - time_ns(), 0) / 1e9
                     )
-                    metric_reader_storage.consume_measurement(
-                        measurement, should_sample_exemplar
-                    )
+                )
+            except FutureTimeoutError:
+                self._late_callbacks[async_instrument, callback] = call
+                _logger.warning(
+                    "Timed out while executing a callback of instrument %s, "
+                    "its measurements are dropped.",
+                    async_instrument.name,
+                )
+        return measurements
+
+    def _init_callback_executor(self) -> None:
+        # The threads are daemon threads, so that a hung callback does not
+        # keep the process from exiting.
+        self._callback_executor = _DaemonThreadPool(
+            max_workers=self._sdk_config.callback_max_workers,
+            thread_name_prefix="OtelMetricCallback",
+        )
+        if hasattr(os, "register_at_fork"):
+            # The threads of the pool are not kept in forked processes, a new
+            # pool is created on the next collection instead.
+            weak_self = weakref.ref(self)
 
-            result = self._reader_storages[metric_reader].collect()
+            def _after_in_child() -> None:
+                consumer = weak_self()
+                if consumer is not None:
+                    consumer._callback_executor = None
+                    consumer._late_callbacks = {}
 
-        return result
+            os.register_at_fork(after_in_child=_after_in_child)
+
+    def shutdown(self) -> None:
+        """Stops the threads running the callbacks of asynchronous
+        instruments, without waiting for the callbacks still running."""
+        with self._lock:
+            self._shutdown = True
+            if self._callback_executor is not None:
+                self._callback_executor.shutdown()
+                self._callback_executor = None
+            self._late_callbacks = {}
 
     def add_metric_reader(
         self, metric_reader: "opentelemetry.sdk.metrics.MetricReader"
@@ -146,7 +533,15 @@ class SynchronousMeasurementConsumer(MeasurementConsumer):
                 metric_reader._instrument_class_temporality,
                 # pylint: disable-next=protected-access
                 metric_reader._instrument_class_aggregation,
+                # pylint: disable-next=protected-access
+                metric_reader._instrument_class_cardinality_limit,
+                # pylint: disable-next=protected-access
+                metric_reader._max_idle_collections,
+                # pylint: disable-next=protected-access
+                metric_reader._skip_unchanged_streams,
             )
+            self._routes = {}
+            self._generation += 1
 
     def remove_metric_reader(
         self, metric_reader: "opentelemetry.sdk.metrics.MetricReader"
@@ -154,3 +549,5 @@ class SynchronousMeasurementConsumer(MeasurementConsumer):
         """Unregisters the given metric reader."""
         with self._lock:
             self._reader_storages.pop(metric_reader)
+            self._routes = {}
+            self._generation += 1
@@ -11,6 +11,7 @@ from opentelemetry.metrics import (
     ObservableCounter,
 )
 from opentelemetry.sdk.metrics._internal._view_instrument_match import (
+    _DEFAULT_CARDINALITY_LIMIT,
     _ViewInstrumentMatch,
 )
 from opentelemetry.sdk.metrics._internal.aggregation import (
@@ -54,6 +55,9 @@ class MetricReaderStorage:
         sdk_config: SdkConfiguration,
         instrument_class_temporality: dict[type, AggregationTemporality],
         instrument_class_aggregation: dict[type, Aggregation],
+        instrument_class_cardinality_limit: dict[type, int] | None = None,
+        max_idle_collections: int | None = None,
+        skip_unchanged_streams: bool = False,
     ) -> None:
         self._lock = RLock()
         self._sdk_config = sdk_config
@@ -62,6 +66,11 @@ class MetricReaderStorage:
         ] = {}
         self._instrument_class_temporality = instrument_class_temporality
         self._instrument_class_aggregation = instrument_class_aggregation
+        self._instrument_class_cardinality_limit = (
+            instrument_class_cardinality_limit or {}
+        )
+        self._max_idle_collections = max_idle_collections
+        self._skip_unchanged_streams = skip_unchanged_streams
 
     def _get_or_init_view_instrument_match(
         self, instrument: _Instrument
@@ -93,6 +102,11 @@ class MetricReaderStorage:
                         instrument_class_aggregation=(
                             self._instrument_class_aggregation
                         ),
+                        cardinality_limit=self._cardinality_limit(
+                            _DEFAULT_VIEW, instrument
+                        ),
+                        max_idle_collections=self._max_idle_collections,
+                        skip_unchanged_streams=self._skip_unchanged_streams,
                     )
                 )
             self._instrument_view_instrument_matches[instrument] = (
@@ -111,6 +125,36 @@ class MetricReaderStorage:
                 measurement, should_sample_exemplar
             )
 
+    def get_view_instrument_matches(
+        self, instrument: _Instrument
+    ) -> list[_ViewInstrumentMatch]:
+        """Returns the view instrument matches the measurements of
+        ``instrument`` go to, one per matching view."""
+        return self._get_or_init_view_instrument_match(instrument)
+
+    def pop_folded_streams(self) -> int:
+        """Returns the number of attribute sets folded into overflow streams
+        because of cardinality limits since the last call."""
+        with self._lock:
+            return sum(
+                view_instrument_match.pop_folded_streams()
+                for view_instrument_matches in (
+                    self._instrument_view_instrument_matches.values()
+                )
+                for view_instrument_match in view_instrument_matches
+            )
+
+    def pop_evicted_streams(self) -> int:
+        """Returns the number of idle streams evicted since the last call."""
+        with self._lock:
+            return sum(
+                view_instrument_match.pop_evicted_streams()
+                for view_instrument_matches in (
+                    self._instrument_view_instrument_matches.values()
+                )
+                for view_instrument_match in view_instrument_matches
+            )
+
     def collect(self) -> MetricsData | None:
         # Use a list instead of yielding to prevent a slow reader from holding
         # SDK locks
@@ -239,6 +283,14 @@ class MetricReaderStorage:
 
             return None
 
+    def _cardinality_limit(self, view: View, instrument: _Instrument) -> int:
+        # pylint: disable=protected-access
+        if view._aggregation_cardinality_limit is not None:
+            return view._aggregation_cardinality_limit
+        return self._instrument_class_cardinality_limit.get(
+            instrument.__class__, _DEFAULT_CARDINALITY_LIMIT
+        )
+
     def _handle_view_instrument_match(
         self,
         instrument: _Instrument,
@@ -258,6 +310,9 @@ class MetricReaderStorage:
                 instrument_class_aggregation=(
                     self._instrument_class_aggregation
                 ),
+                cardinality_limit=self._cardinality_limit(view, instrument),
+                max_idle_collections=self._max_idle_collections,
+                skip_unchanged_streams=self._skip_unchanged_streams,
             )
 
             for (
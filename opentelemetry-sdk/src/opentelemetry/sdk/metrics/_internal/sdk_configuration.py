@@ -16,3 +16,4 @@ class SdkConfiguration:
     exemplar_filter: "opentelemetry.sdk.metrics.ExemplarFilter"
     resource: "opentelemetry.sdk.resources.Resource"
     views: Sequence["opentelemetry.sdk.metrics.view.View"]
+    callback_max_workers: int = 0
@@ -88,6 +88,13 @@ class View:
         instrument_unit: This is an instrument matching attribute: the unit the
             instrument must have to match the view.
 
+        aggregation_cardinality_limit: This is a metric stream customizing
+            attribute: the maximum number of metric streams, including the
+            overflow stream, the view produces for an instrument. Measurements
+            with attribute sets beyond the limit are aggregated into a single
+            stream with the ``otel.metric.overflow`` attribute set to `True`.
+            If `None`, the cardinality limit of the metric reader is used.
+
     This class is not intended to be subclassed by the user.
     """
 
@@ -109,6 +116,7 @@ class View:
         ]
         | None = None,
         instrument_unit: str | None = None,
+        aggregation_cardinality_limit: int | None = None,
     ):
         if (
             instrument_type
@@ -136,6 +144,14 @@ class View:
                 "characters in instrument_name"
             )
 
+        if (
+            aggregation_cardinality_limit is not None
+            and aggregation_cardinality_limit <= 0
+        ):
+            raise ValueError(
+                "aggregation_cardinality_limit must be a positive integer."
+            )
+
         # _name, _description, _aggregation, _exemplar_reservoir_factory and
         # _attribute_keys will be accessed when instantiating a _ViewInstrumentMatch.
         self._name = name
@@ -152,6 +168,7 @@ class View:
         self._exemplar_reservoir_factory = (
             exemplar_reservoir_factory or _default_reservoir_factory
         )
+        self._aggregation_cardinality_limit = aggregation_cardinality_limit
 
     # pylint: disable=too-many-return-statements
     # pylint: disable=too-many-branches
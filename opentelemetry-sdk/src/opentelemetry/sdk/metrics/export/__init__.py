@@ -6,6 +6,7 @@ from opentelemetry.sdk.metrics._internal.aggregation import (
     AggregationTemporality,
 )
 from opentelemetry.sdk.metrics._internal.export import (
+    AsyncPeriodicExportingMetricReader,
     ConsoleMetricExporter,
     InMemoryMetricReader,
     MetricExporter,
@@ -34,6 +35,7 @@ from opentelemetry.sdk.metrics._internal.point import (  # noqa: F401
 
 __all__ = [
     "AggregationTemporality",
+    "AsyncPeriodicExportingMetricReader",
     "Buckets",
     "ConsoleMetricExporter",
     "InMemoryMetricReader",
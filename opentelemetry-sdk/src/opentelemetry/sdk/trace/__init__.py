@@ -19,6 +19,7 @@ from collections.abc import (
     MutableMapping,
     Sequence,
 )
+from contextlib import AbstractContextManager
 from dataclasses import dataclass
 from os import environ
 from time import time_ns
@@ -70,6 +71,7 @@ from opentelemetry.trace import NoOpTracer, SpanContext
 from opentelemetry.trace.status import Status, StatusCode
 from opentelemetry.util import types
 from opentelemetry.util._decorator import _agnosticcontextmanager
+from opentelemetry.util._striped_lock import StripedLock
 
 logger = logging.getLogger(__name__)
 
@@ -83,6 +85,11 @@ _DEFAULT_OTEL_SPAN_LINK_COUNT_LIMIT = 128
 
 _ENV_VALUE_UNSET = ""
 
+# Spans share a pool of locks instead of allocating one each. The locks are
+# reentrant since code running under the lock of a span, such as a logging
+# handler, may touch another span of the same stripe.
+_SPAN_LOCKS = StripedLock(threading.RLock)
+
 
 class SpanProcessor:
     """Interface which allows hooks for SDK's `Span` start and end method
@@ -497,11 +504,11 @@ class ReadableSpan:
 
     @property
     def events(self) -> Sequence[Event]:
-        return tuple(event for event in self._events)
+        return tuple(self._events)
 
     @property
     def links(self) -> Sequence[trace_api.Link]:
-        return tuple(link for link in self._links)
+        return tuple(self._links)
 
     @property
     def resource(self) -> Resource:
@@ -836,12 +843,15 @@ class Span(trace_api.Span, ReadableSpan):
         self._set_status_on_exception = set_status_on_exception
         self._span_processor = span_processor
         self._limits = limits
-        self._lock = threading.Lock()
+        self._lock_stripe = _SPAN_LOCKS.assign()
+        # The attributes are only changed under the lock of the span, and the
+        # attributes of events and links never change once created.
         self._attributes = BoundedAttributes(
             self._limits.max_span_attributes,
             attributes,
             immutable=False,
             max_value_len=self._limits.max_span_attribute_length,
+            thread_safe=False,
         )
         self._events = self._new_events()
         if events:
@@ -850,6 +860,7 @@ class Span(trace_api.Span, ReadableSpan):
                     self._limits.max_event_attributes,
                     event.attributes,
                     max_value_len=self._limits.max_attribute_length,
+                    thread_safe=False,
                 )
                 self._events.append(event)
 
@@ -857,6 +868,10 @@ class Span(trace_api.Span, ReadableSpan):
 
         self._record_end_metrics = record_end_metrics
 
+    @property
+    def _lock(self) -> AbstractContextManager[bool]:
+        return _SPAN_LOCKS.lock(self._lock_stripe)
+
     def __repr__(self):
         return f'{type(self).__name__}(name="{self._name}", context={self._context})'
 
@@ -875,6 +890,7 @@ class Span(trace_api.Span, ReadableSpan):
                     self._limits.max_link_attributes,
                     link.attributes,
                     max_value_len=self._limits.max_attribute_length,
+                    thread_safe=False,
                 )
                 valid_links.append(link)
 
@@ -911,6 +927,7 @@ class Span(trace_api.Span, ReadableSpan):
             self._limits.max_event_attributes,
             attributes,
             max_value_len=self._limits.max_attribute_length,
+            thread_safe=False,
         )
         self._add_event(
             Event(
@@ -936,6 +953,7 @@ class Span(trace_api.Span, ReadableSpan):
             self._limits.max_link_attributes,
             attributes,
             max_value_len=self._limits.max_attribute_length,
+            thread_safe=False,
         )
         self._add_link(
             trace_api.Link(
@@ -944,23 +962,6 @@ class Span(trace_api.Span, ReadableSpan):
             )
         )
 
-    def _readable_span(self) -> ReadableSpan:
-        return ReadableSpan(
-            name=self._name,
-            context=self._context,
-            parent=self._parent,
-            resource=self._resource,
-            attributes=self._attributes,
-            events=self._events,
-            links=self._links,
-            kind=self.kind,
-            status=self._status,
-            start_time=self._start_time,
-            end_time=self._end_time,
-            instrumentation_info=self._instrumentation_info,
-            instrumentation_scope=self._instrumentation_scope,
-        )
-
     def start(
         self,
         start_time: int | None = None,
@@ -990,7 +991,11 @@ class Span(trace_api.Span, ReadableSpan):
             self._record_end_metrics()
         # pylint: disable=protected-access
         self._span_processor._on_ending(self)
-        self._span_processor.on_end(self._readable_span())
+        # Once _on_ending returns every mutator of the span is a no-op, so the
+        # span itself is handed to on_end as the read-only view instead of a
+        # copy.
+        self._attributes._immutable = True
+        self._span_processor.on_end(self)
 
     @_check_span_ended
     def update_name(self, name: str) -> None:
@@ -17,7 +17,9 @@ from opentelemetry.context import (
 )
 from opentelemetry.metrics import MeterProvider, get_meter_provider
 from opentelemetry.sdk._shared_internal import (
+    AsyncBatchProcessor,
     BatchProcessor,
+    _estimate_attributes_size,
 )
 from opentelemetry.sdk._shared_internal._processor_metrics import (
     create_processor_metrics,
@@ -47,6 +49,31 @@ _ENV_VAR_INT_VALUE_ERROR_MESSAGE = (
 
 logger = logging.getLogger(__name__)
 
+# Rough number of bytes taken by the ids, timestamps and other fixed size
+# fields of a span, event and link once encoded.
+_SPAN_SIZE_ESTIMATE = 64
+_EVENT_SIZE_ESTIMATE = 16
+_LINK_SIZE_ESTIMATE = 32
+
+
+def _estimate_span_size(span: ReadableSpan) -> int:
+    size = (
+        _SPAN_SIZE_ESTIMATE
+        + len(span.name)
+        + _estimate_attributes_size(span.attributes)
+    )
+    for event in span.events:
+        size += (
+            _EVENT_SIZE_ESTIMATE
+            + len(event.name)
+            + _estimate_attributes_size(event.attributes)
+        )
+    for link in span.links:
+        size += _LINK_SIZE_ESTIMATE + _estimate_attributes_size(
+            link.attributes
+        )
+    return size
+
 
 class SpanExportResult(Enum):
     SUCCESS = 0
@@ -155,6 +182,29 @@ class BatchSpanProcessor(SpanProcessor):
     - :envvar:`OTEL_BSP_EXPORT_TIMEOUT`
 
     All the logic for emitting spans, shutting down etc. resides in the `BatchProcessor` class.
+
+    When ``sharded_queue`` is ``True`` every emitting thread buffers spans in
+    its own queue, which the worker thread drains in a single sweep. This
+    avoids contention between threads ending spans concurrently.
+    ``max_queue_size`` still bounds the spans buffered by all the threads,
+    once it is reached new spans are dropped.
+
+    ``export_timeout_millis`` is passed to exporters whose ``export`` accepts
+    a ``timeout_millis`` argument. ``force_flush`` returns ``False`` once its
+    timeout passes instead of waiting for the exporter.
+
+    ``max_concurrent_exports`` bounds the number of batches handed to the
+    exporter at the same time. With a value above 1 a slow export no longer
+    stops the worker from draining the queue, but batches of spans may reach
+    the exporter out of order.
+
+    ``max_export_batch_bytes`` additionally cuts batches once their estimated
+    encoded size reaches the given number of bytes, to stay below the request
+    size limits of receivers. The estimate is cheap and approximate.
+
+    ``pipelined_exports`` makes the worker thread encode the next batch of
+    spans while the previous one is sent from an export thread, for
+    exporters which support it such as the OTLP exporters.
     """
 
     def __init__(
@@ -166,6 +216,10 @@ class BatchSpanProcessor(SpanProcessor):
         export_timeout_millis: float | None = None,
         *,
         meter_provider: MeterProvider | None = None,
+        sharded_queue: bool = False,
+        max_concurrent_exports: int = 1,
+        max_export_batch_bytes: int | None = None,
+        pipelined_exports: bool = False,
     ):
         if max_queue_size is None:
             max_queue_size = BatchSpanProcessor._default_max_queue_size()
@@ -180,7 +234,6 @@ class BatchSpanProcessor(SpanProcessor):
                 BatchSpanProcessor._default_max_export_batch_size()
             )
 
-        # Not used. No way currently to pass timeout to export.
         if export_timeout_millis is None:
             export_timeout_millis = (
                 BatchSpanProcessor._default_export_timeout_millis()
@@ -206,6 +259,11 @@ class BatchSpanProcessor(SpanProcessor):
                     OTEL_PYTHON_SDK_INTERNAL_METRICS_ENABLED
                 ),
             ),
+            sharded_queue=sharded_queue,
+            max_concurrent_exports=max_concurrent_exports,
+            max_export_batch_bytes=max_export_batch_bytes,
+            estimate_size=_estimate_span_size,
+            pipelined_exports=pipelined_exports,
         )
 
     # Added for backward compatibility. Not recommended to directly access/use underlying exporter.
@@ -316,6 +374,101 @@ class BatchSpanProcessor(SpanProcessor):
             )
 
 
+class AsyncBatchSpanProcessor(SpanProcessor):
+    """Batch span processor exporting from an asyncio event loop.
+
+    `AsyncBatchSpanProcessor` batches ended spans like `BatchSpanProcessor`,
+    and is configured by the same environment variables, but sends them
+    through an exporter whose ``export`` is a coroutine, such as the asyncio
+    OTLP exporters, from a task of the event loop instead of a thread.
+
+    The processor binds to the event loop running when it is created, or
+    else to the loop of the first thread ending spans while running one.
+    Await ``force_flush_async`` and ``shutdown_async`` from that loop,
+    ``force_flush`` and ``shutdown`` cannot block it.
+
+    All the logic for emitting spans, shutting down etc. resides in the
+    `AsyncBatchProcessor` class.
+    """
+
+    def __init__(
+        self,
+        span_exporter: SpanExporter,
+        max_queue_size: int | None = None,
+        schedule_delay_millis: float | None = None,
+        max_export_batch_size: int | None = None,
+        export_timeout_millis: float | None = None,
+        *,
+        meter_provider: MeterProvider | None = None,
+    ):
+        if max_queue_size is None:
+            max_queue_size = BatchSpanProcessor._default_max_queue_size()
+
+        if schedule_delay_millis is None:
+            schedule_delay_millis = (
+                BatchSpanProcessor._default_schedule_delay_millis()
+            )
+
+        if max_export_batch_size is None:
+            max_export_batch_size = (
+                BatchSpanProcessor._default_max_export_batch_size()
+            )
+
+        if export_timeout_millis is None:
+            export_timeout_millis = (
+                BatchSpanProcessor._default_export_timeout_millis()
+            )
+
+        BatchSpanProcessor._validate_arguments(
+            max_queue_size, schedule_delay_millis, max_export_batch_size
+        )
+
+        self._batch_processor = AsyncBatchProcessor(
+            span_exporter,
+            schedule_delay_millis,
+            max_export_batch_size,
+            export_timeout_millis,
+            max_queue_size,
+            "Span",
+            create_processor_metrics(
+                "traces",
+                OtelComponentTypeValues.BATCHING_SPAN_PROCESSOR,
+                meter_provider or get_meter_provider(),
+                capacity=max_queue_size,
+                enabled=parse_boolean_environment_variable(
+                    OTEL_PYTHON_SDK_INTERNAL_METRICS_ENABLED
+                ),
+            ),
+        )
+
+    def on_start(
+        self, span: Span, parent_context: Context | None = None
+    ) -> None:
+        pass
+
+    def _on_ending(self, span: Span) -> None:
+        pass
+
+    def on_end(self, span: ReadableSpan) -> None:
+        if not (span.context and span.context.trace_flags.sampled):
+            return
+        self._batch_processor.emit(span)
+
+    def shutdown(self):
+        return self._batch_processor.shutdown()
+
+    def force_flush(self, timeout_millis: int | None = None) -> bool:
+        return self._batch_processor.force_flush(timeout_millis)
+
+    async def shutdown_async(self, timeout_millis: int = 30000) -> None:
+        await self._batch_processor.shutdown_async(timeout_millis)
+
+    async def force_flush_async(
+        self, timeout_millis: int | None = None
+    ) -> bool:
+        return await self._batch_processor.force_flush_async(timeout_millis)
+
+
 class ConsoleSpanExporter(SpanExporter):
     """Implementation of :class:`SpanExporter` that prints spans to the
     console.
@@ -6,9 +6,16 @@ import datetime
 import threading
 from collections import deque
 from collections.abc import MutableMapping, Sequence
+from contextlib import AbstractContextManager
 
 from typing_extensions import deprecated
 
+from opentelemetry.util._striped_lock import StripedLock
+
+# Span events and links are kept in bounded lists, which share a pool of
+# reentrant locks instead of allocating one each.
+_BOUNDED_LIST_LOCKS = StripedLock(threading.RLock)
+
 
 def ns_to_iso_str(nanoseconds):
     """Get an ISO 8601 string from time_ns value."""
@@ -42,7 +49,11 @@ class BoundedList(Sequence):
     def __init__(self, maxlen: int | None):
         self.dropped = 0
         self._dq = deque(maxlen=maxlen)  # type: deque
-        self._lock = threading.Lock()
+        self._lock_stripe = _BOUNDED_LIST_LOCKS.assign()
+
+    @property
+    def _lock(self) -> AbstractContextManager[bool]:
+        return _BOUNDED_LIST_LOCKS.lock(self._lock_stripe)
 
     def __deepcopy__(self, memo):
         copy_ = BoundedList(0)
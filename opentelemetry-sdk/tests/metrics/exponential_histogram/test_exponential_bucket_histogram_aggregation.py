@@ -1242,7 +1242,7 @@ class TestExponentialBucketHistogramAggregation(TestCase):
             exponential_histogram_aggregation._value_positive.offset, 0
         )
         self.assertEqual(
-            exponential_histogram_aggregation._value_positive.counts,
+            exponential_histogram_aggregation._value_positive.counts.tolist(),
             [1, 1, 1, 1],
         )
 
@@ -1263,7 +1263,7 @@ class TestExponentialBucketHistogramAggregation(TestCase):
             exponential_histogram_aggregation._value_positive.offset, -4
         )
         self.assertEqual(
-            exponential_histogram_aggregation._value_positive.counts,
+            exponential_histogram_aggregation._value_positive.counts.tolist(),
             [1, 1, 1, 1],
         )
 
@@ -1300,7 +1300,7 @@ class TestExponentialBucketHistogramAggregation(TestCase):
             exponential_histogram_aggregation._value_positive.offset, 0
         )
         self.assertEqual(
-            exponential_histogram_aggregation._value_positive.counts,
+            exponential_histogram_aggregation._value_positive.counts.tolist(),
             [1, 1, 1, 1],
         )
 
@@ -1319,7 +1319,7 @@ class TestExponentialBucketHistogramAggregation(TestCase):
             exponential_histogram_aggregation._value_positive.offset, -4
         )
         self.assertEqual(
-            exponential_histogram_aggregation._value_positive.counts,
+            exponential_histogram_aggregation._value_positive.counts.tolist(),
             [1, 1, 1, 1],
         )
 
@@ -1329,3 +1329,26 @@ class TestExponentialBucketHistogramAggregation(TestCase):
         )
 
         self.assertEqual(result.scale, result_1.scale)
+
+    def test_downscale_rotated_buckets(self):
+        buckets = Buckets()
+        buckets.grow(8, 8)
+        buckets.index_base = 4
+        buckets.index_start = 1
+        buckets.index_end = 7
+
+        # Indexes 1, 2 and 3 are held at the end of the backing array.
+        for index, count in zip(range(1, 8), range(1, 8)):
+            bucket_index = index - buckets.index_base
+            if bucket_index < 0:
+                bucket_index += len(buckets.counts)
+            buckets.increment_bucket(bucket_index, count)
+
+        self.assertEqual(buckets.get_offset_counts(), [1, 2, 3, 4, 5, 6, 7, 0])
+
+        buckets.downscale(1)
+
+        self.assertEqual(buckets.offset, 0)
+        self.assertEqual(buckets.index_end, 3)
+        self.assertEqual(get_counts(buckets), [1, 5, 9, 13])
+        self.assertIsInstance(buckets.get_offset_counts(), list)
@@ -0,0 +1,146 @@
+# Copyright The OpenTelemetry Authors
+# SPDX-License-Identifier: Apache-2.0
+
+from array import array
+from logging import WARNING
+from unittest import TestCase, skipIf
+
+from opentelemetry.sdk.metrics import (
+    AlwaysOnExemplarFilter,
+    MeterProvider,
+)
+from opentelemetry.sdk.metrics.export import InMemoryMetricReader
+from opentelemetry.sdk.metrics.view import (
+    ExplicitBucketHistogramAggregation,
+    View,
+)
+
+try:
+    import numpy
+except ImportError:
+    numpy = None
+
+
+class TestBatchRecording(TestCase):
+    def setUp(self):
+        self.reader = InMemoryMetricReader()
+        self.meter = MeterProvider(
+            metric_readers=[self.reader],
+            views=[
+                View(
+                    instrument_name="histogram",
+                    aggregation=ExplicitBucketHistogramAggregation(
+                        boundaries=[0, 10, 100]
+                    ),
+                )
+            ],
+        ).get_meter("testmeter")
+
+    def _data_points(self):
+        return {
+            metric.name: metric.data.data_points[0]
+            for metric in self.reader.get_metrics_data()
+            .resource_metrics[0]
+            .scope_metrics[0]
+            .metrics
+        }
+
+    def test_add_many(self):
+        counter = self.meter.create_counter("counter")
+        up_down_counter = self.meter.create_up_down_counter("up_down_counter")
+        counter.add_many([1, 2, 3], {"a": "b"})
+        counter.add_many(array("d", [0.5]), {"a": "b"})
+        counter.add_many(memoryview(array("q", [4])), {"a": "b"})
+        counter.add_many([])
+        up_down_counter.add_many([5, -7])
+
+        data_points = self._data_points()
+        self.assertEqual(data_points["counter"].value, 10.5)
+        self.assertEqual(dict(data_points["counter"].attributes), {"a": "b"})
+        self.assertEqual(data_points["up_down_counter"].value, -2)
+
+    def test_record_many(self):
+        histogram = self.meter.create_histogram("histogram")
+        histogram.record_many([5, 50, 500, 0], {"a": "b"})
+        histogram.record(10, {"a": "b"})
+
+        point = self._data_points()["histogram"]
+        self.assertEqual(point.bucket_counts, (1, 2, 1, 1))
+        self.assertEqual(point.count, 5)
+        self.assertEqual(point.sum, 565)
+        self.assertEqual(point.min, 0)
+        self.assertEqual(point.max, 500)
+
+    def test_negative_amounts_are_dropped(self):
+        counter = self.meter.create_counter("counter")
+        histogram = self.meter.create_histogram("histogram")
+        with self.assertLogs(level=WARNING):
+            counter.add_many([1, -1, 2])
+        with self.assertLogs(level=WARNING):
+            histogram.record_many([-5])
+
+        data_points = self._data_points()
+        self.assertEqual(data_points["counter"].value, 3)
+        self.assertNotIn("histogram", data_points)
+
+    def test_bound_batches(self):
+        counter = self.meter.create_counter("counter").bind({"a": "b"})
+        up_down_counter = self.meter.create_up_down_counter(
+            "up_down_counter"
+        ).bind({"a": "b"})
+        histogram = self.meter.create_histogram("histogram").bind({"a": "b"})
+        counter.add_many([1, 2])
+        up_down_counter.add_many([1, -2])
+        histogram.record_many(array("d", [1, 20]))
+        with self.assertLogs(level=WARNING):
+            histogram.record_many([-1, 2])
+
+        data_points = self._data_points()
+        self.assertEqual(data_points["counter"].value, 3)
+        self.assertEqual(data_points["up_down_counter"].value, -1)
+        self.assertEqual(data_points["histogram"].bucket_counts, (0, 2, 1, 0))
+
+    def test_every_value_is_offered_to_the_exemplar_reservoir(self):
+        reader = InMemoryMetricReader()
+        histogram = (
+            MeterProvider(
+                metric_readers=[reader],
+                exemplar_filter=AlwaysOnExemplarFilter(),
+                views=[
+                    View(
+                        instrument_name="histogram",
+                        aggregation=ExplicitBucketHistogramAggregation(
+                            boundaries=[1, 2]
+                        ),
+                    )
+                ],
+            )
+            .get_meter("testmeter")
+            .create_histogram("histogram")
+        )
+        # The aligned reservoir keeps an exemplar per bucket.
+        histogram.record_many([1, 2, 3])
+
+        point = (
+            reader.get_metrics_data()
+            .resource_metrics[0]
+            .scope_metrics[0]
+            .metrics[0]
+            .data.data_points[0]
+        )
+        self.assertEqual(
+            sorted(exemplar.value for exemplar in point.exemplars), [1, 2, 3]
+        )
+
+    @skipIf(numpy is None, "NumPy is not installed")
+    def test_numpy_arrays(self):
+        counter = self.meter.create_counter("counter")
+        histogram = self.meter.create_histogram("histogram")
+        counter.add_many(numpy.array([1, 2, 3]))
+        histogram.record_many(numpy.array([5.0, 50.0, 10.0]))
+
+        data_points = self._data_points()
+        self.assertEqual(data_points["counter"].value, 6)
+        self.assertIsInstance(data_points["counter"].value, int)
+        self.assertEqual(data_points["histogram"].bucket_counts, (0, 2, 1, 0))
+        self.assertEqual(data_points["histogram"].sum, 65.0)
@@ -0,0 +1,149 @@
+# Copyright The OpenTelemetry Authors
+# SPDX-License-Identifier: Apache-2.0
+
+from logging import WARNING
+from unittest import TestCase
+
+from opentelemetry.sdk.metrics import MeterProvider
+from opentelemetry.sdk.metrics._internal import _MeterConfig
+from opentelemetry.sdk.metrics.export import InMemoryMetricReader
+from opentelemetry.sdk.metrics.view import View
+
+
+def _data_points(reader):
+    metrics_data = reader.get_metrics_data()
+    if metrics_data is None:
+        return {}
+    return {
+        metric.name: list(metric.data.data_points)
+        for metric in metrics_data.resource_metrics[0].scope_metrics[0].metrics
+    }
+
+
+class TestBoundInstruments(TestCase):
+    def setUp(self):
+        self.reader = InMemoryMetricReader()
+        self.meter_provider = MeterProvider(metric_readers=[self.reader])
+        self.meter = self.meter_provider.get_meter("testmeter")
+
+    def test_bound_counter(self):
+        counter = self.meter.create_counter("counter")
+        bound = counter.bind({"method": "get"})
+        bound.add(1)
+        bound.add(2)
+        counter.add(4, {"method": "get"})
+        counter.add(8, {"method": "post"})
+        with self.assertLogs(level=WARNING):
+            bound.add(-1)
+
+        data_points = {
+            point.attributes["method"]: point.value
+            for point in _data_points(self.reader)["counter"]
+        }
+        self.assertEqual(data_points, {"get": 7, "post": 8})
+
+    def test_bound_instruments(self):
+        up_down_counter = self.meter.create_up_down_counter("up_down_counter")
+        histogram = self.meter.create_histogram("histogram")
+        gauge = self.meter.create_gauge("gauge")
+        up_down_counter.bind({"a": "b"}).add(-3)
+        histogram.bind({"a": "b"}).record(5)
+        gauge.bind({"a": "b"}).set(7)
+
+        data_points = _data_points(self.reader)
+        self.assertEqual(data_points["up_down_counter"][0].value, -3)
+        self.assertEqual(data_points["histogram"][0].sum, 5)
+        self.assertEqual(data_points["gauge"][0].value, 7)
+        for points in data_points.values():
+            self.assertEqual(dict(points[0].attributes), {"a": "b"})
+
+    def test_bound_attributes_are_copied(self):
+        attributes = {"method": "get"}
+        bound = self.meter.create_counter("counter").bind(attributes)
+        attributes["method"] = "post"
+        bound.add(1)
+        self.assertEqual(
+            dict(_data_points(self.reader)["counter"][0].attributes),
+            {"method": "get"},
+        )
+
+    def test_bound_instrument_applies_views(self):
+        reader = InMemoryMetricReader()
+        meter_provider = MeterProvider(
+            metric_readers=[reader],
+            views=[
+                View(instrument_name="counter", attribute_keys={"method"}),
+                View(instrument_name="counter", name="renamed"),
+            ],
+        )
+        counter = meter_provider.get_meter("testmeter").create_counter(
+            "counter"
+        )
+        counter.bind({"method": "get", "path": "/"}).add(1)
+        counter.add(1, {"method": "get", "path": "/other"})
+
+        data_points = _data_points(reader)
+        self.assertEqual(len(data_points["counter"]), 1)
+        self.assertEqual(data_points["counter"][0].value, 2)
+        self.assertEqual(
+            dict(data_points["counter"][0].attributes), {"method": "get"}
+        )
+        self.assertEqual(len(data_points["renamed"]), 2)
+
+    def test_bound_instrument_follows_metric_readers(self):
+        bound = self.meter.create_counter("counter").bind({"a": "b"})
+        bound.add(1)
+        new_reader = InMemoryMetricReader()
+        self.meter_provider.add_metric_reader(new_reader)
+        bound.add(1)
+        self.assertEqual(_data_points(self.reader)["counter"][0].value, 2)
+        self.assertEqual(_data_points(new_reader)["counter"][0].value, 1)
+
+        self.meter_provider.remove_metric_reader(self.reader)
+        bound.add(1)
+        self.assertEqual(_data_points(new_reader)["counter"][0].value, 2)
+
+    def test_bound_instrument_survives_eviction(self):
+        reader = InMemoryMetricReader(max_idle_collections=1)
+        counter = (
+            MeterProvider(metric_readers=[reader])
+            .get_meter("testmeter")
+            .create_counter("counter")
+        )
+        bound = counter.bind({"a": "b"})
+        bound.add(1)
+        self.assertEqual(_data_points(reader)["counter"][0].value, 1)
+        # The stream is evicted by this collection.
+        self.assertEqual(_data_points(reader)["counter"][0].value, 1)
+        self.assertEqual(_data_points(reader), {})
+
+        bound.add(2)
+        self.assertEqual(_data_points(reader)["counter"][0].value, 2)
+
+    def test_bound_instrument_holding_evicted_aggregation(self):
+        reader = InMemoryMetricReader(max_idle_collections=1)
+        counter = (
+            MeterProvider(metric_readers=[reader])
+            .get_meter("testmeter")
+            .create_counter("counter")
+        )
+        bound = counter.bind({"a": "b"})
+        bound.add(1)
+        _data_points(reader)
+        _data_points(reader)
+        # The binding is not resolved again, as if it recorded concurrently
+        # with the collection evicting its aggregation.
+        # pylint: disable=protected-access
+        bound._binding.generation = counter._measurement_consumer._generation
+
+        bound.add(2)
+        bound.add(4)
+        self.assertEqual(_data_points(reader)["counter"][0].value, 6)
+
+    def test_bound_instrument_of_disabled_meter(self):
+        counter = self.meter.create_counter("counter")
+        bound = counter.bind({"a": "b"})
+        # pylint: disable-next=protected-access
+        counter._meter_config.update(_MeterConfig(is_enabled=False))
+        bound.add(1)
+        self.assertEqual(_data_points(self.reader), {})
@@ -0,0 +1,113 @@
+# Copyright The OpenTelemetry Authors
+# SPDX-License-Identifier: Apache-2.0
+
+from logging import WARNING
+from unittest import TestCase
+from unittest.mock import patch
+
+from opentelemetry.sdk.environment_variables import (
+    OTEL_PYTHON_SDK_INTERNAL_METRICS_ENABLED,
+)
+from opentelemetry.sdk.metrics import Counter, Histogram, MeterProvider
+from opentelemetry.sdk.metrics.export import InMemoryMetricReader
+from opentelemetry.sdk.metrics.view import View
+
+
+def _metrics(reader, scope_name="testmeter"):
+    return {
+        metric.name: metric
+        for scope_metrics in reader.get_metrics_data()
+        .resource_metrics[0]
+        .scope_metrics
+        if scope_metrics.scope.name == scope_name
+        for metric in scope_metrics.metrics
+    }
+
+
+class TestCardinalityLimit(TestCase):
+    def test_overflow_stream(self):
+        reader = InMemoryMetricReader(cardinality_limits={Counter: 3})
+        meter = MeterProvider(metric_readers=[reader]).get_meter("testmeter")
+        counter = meter.create_counter("counter")
+        with self.assertLogs(level=WARNING) as logs:
+            for user in range(5):
+                counter.add(1, {"user": str(user)})
+        self.assertEqual(len(logs.records), 1)
+        # Streams created before the limit was reached keep aggregating.
+        counter.add(1, {"user": "0"})
+
+        data_points = {
+            frozenset(point.attributes.items()): point.value
+            for point in _metrics(reader)["counter"].data.data_points
+        }
+        self.assertEqual(
+            data_points,
+            {
+                frozenset({("user", "0")}): 2,
+                frozenset({("user", "1")}): 1,
+                frozenset({("otel.metric.overflow", True)}): 3,
+            },
+        )
+
+    def test_limit_is_per_instrument_class(self):
+        reader = InMemoryMetricReader(cardinality_limits={Histogram: 1})
+        meter = MeterProvider(metric_readers=[reader]).get_meter("testmeter")
+        counter = meter.create_counter("counter")
+        histogram = meter.create_histogram("histogram")
+        with self.assertLogs(level=WARNING):
+            for user in range(3):
+                counter.add(1, {"user": str(user)})
+                histogram.record(1, {"user": str(user)})
+
+        metrics = _metrics(reader)
+        self.assertEqual(len(metrics["counter"].data.data_points), 3)
+        (histogram_point,) = metrics["histogram"].data.data_points
+        self.assertEqual(
+            dict(histogram_point.attributes), {"otel.metric.overflow": True}
+        )
+        self.assertEqual(histogram_point.count, 3)
+
+    def test_view_limit_overrides_reader_limit(self):
+        reader = InMemoryMetricReader(cardinality_limits={Counter: 10})
+        meter = MeterProvider(
+            metric_readers=[reader],
+            views=[
+                View(
+                    instrument_name="counter", aggregation_cardinality_limit=2
+                )
+            ],
+        ).get_meter("testmeter")
+        counter = meter.create_counter("counter")
+        with self.assertLogs(level=WARNING):
+            for user in range(4):
+                counter.add(1, {"user": str(user)})
+
+        self.assertEqual(len(_metrics(reader)["counter"].data.data_points), 2)
+
+    def test_invalid_limits(self):
+        with self.assertRaises(ValueError):
+            InMemoryMetricReader(cardinality_limits={Counter: 0})
+        with self.assertRaises(Exception):
+            InMemoryMetricReader(cardinality_limits={int: 10})
+        with self.assertRaises(ValueError):
+            View(instrument_name="counter", aggregation_cardinality_limit=-1)
+
+    @patch.dict(
+        "os.environ", {OTEL_PYTHON_SDK_INTERNAL_METRICS_ENABLED: "true"}
+    )
+    def test_folded_streams_metric(self):
+        reader = InMemoryMetricReader(cardinality_limits={Counter: 2})
+        meter = MeterProvider(metric_readers=[reader]).get_meter("testmeter")
+        counter = meter.create_counter("counter")
+        with self.assertLogs(level=WARNING):
+            for user in range(5):
+                counter.add(1, {"user": str(user)})
+        counter.add(1, {"user": "4"})
+        reader.get_metrics_data()
+
+        # The metric recorded during the first collection is exported by
+        # the second one.
+        (point,) = _metrics(reader, "opentelemetry-sdk")[
+            "otel.sdk.metric_reader.folded_streams"
+        ].data.data_points
+        self.assertEqual(point.value, 4)
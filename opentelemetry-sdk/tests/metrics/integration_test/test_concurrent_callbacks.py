@@ -0,0 +1,159 @@
+# Copyright The OpenTelemetry Authors
+# SPDX-License-Identifier: Apache-2.0
+
+# pylint: disable=protected-access
+
+from logging import WARNING
+from os import environ
+from threading import Event, Lock, current_thread
+from unittest import TestCase
+from unittest.mock import patch
+
+from opentelemetry.metrics import Observation
+from opentelemetry.sdk.environment_variables import (
+    OTEL_PYTHON_METRIC_CALLBACK_MAX_WORKERS,
+)
+from opentelemetry.sdk.metrics import MeterProvider
+from opentelemetry.sdk.metrics.export import InMemoryMetricReader
+
+
+def _values(reader, timeout_millis):
+    reader.collect(timeout_millis=timeout_millis)
+    metrics_data = reader._metrics_data
+    if metrics_data is None:
+        return {}
+    return {
+        metric.name: metric.data.data_points[0].value
+        for metric in metrics_data.resource_metrics[0].scope_metrics[0].metrics
+    }
+
+
+class TestConcurrentCallbacks(TestCase):
+    def test_slow_callback_isolated(self):
+        reader = InMemoryMetricReader()
+        meter = MeterProvider(
+            metric_readers=[reader], callback_max_workers=2
+        ).get_meter("testmeter")
+        release = Event()
+        threads = []
+
+        def slow_callback(options):
+            threads.append(current_thread())
+            release.wait(5)
+            yield Observation(1)
+
+        def fast_callback(options):
+            threads.append(current_thread())
+            yield Observation(2)
+
+        meter.create_observable_gauge("slow", [slow_callback])
+        meter.create_observable_gauge("fast", [fast_callback])
+
+        with self.assertLogs(level=WARNING) as logs:
+            self.assertEqual(_values(reader, 200), {"fast": 2})
+        self.assertIn("Timed out", logs.output[0])
+        self.assertNotIn(current_thread(), threads)
+
+        # The slow callback is not called again while it has not returned.
+        with self.assertLogs(level=WARNING) as logs:
+            self.assertEqual(_values(reader, 200), {"fast": 2})
+        self.assertIn("Skipping callback", logs.output[0])
+        self.assertEqual(len(threads), 3)
+
+        release.set()
+        for _ in range(10):
+            values = _values(reader, 1000)
+            if "slow" in values:
+                break
+        self.assertEqual(values, {"slow": 1, "fast": 2})
+
+    def test_late_callback_shared_by_instruments(self):
+        reader = InMemoryMetricReader()
+        meter = MeterProvider(
+            metric_readers=[reader], callback_max_workers=2
+        ).get_meter("testmeter")
+        release = Event()
+        lock = Lock()
+        calls = []
+
+        def shared_callback(options):
+            with lock:
+                calls.append(current_thread())
+                first_call = len(calls) == 1
+            # Only the first call hangs, whichever instrument made it.
+            if first_call:
+                release.wait(5)
+            yield Observation(1)
+
+        meter.create_observable_gauge("first", [shared_callback])
+        meter.create_observable_gauge("second", [shared_callback])
+
+        with self.assertLogs(level=WARNING):
+            (prompt,) = _values(reader, 200)
+
+        # Only the instrument whose call has not returned is skipped.
+        with self.assertLogs(level=WARNING) as logs:
+            self.assertEqual(_values(reader, 200), {prompt: 1})
+        self.assertIn("Skipping callback", logs.output[0])
+        self.assertEqual(len(calls), 3)
+
+        release.set()
+        for _ in range(10):
+            values = _values(reader, 1000)
+            if len(values) == 2:
+                break
+        self.assertEqual(values, {"first": 1, "second": 1})
+
+    def test_max_workers_from_environment(self):
+        with patch.dict(
+            environ, {OTEL_PYTHON_METRIC_CALLBACK_MAX_WORKERS: "3"}
+        ):
+            meter_provider = MeterProvider()
+        self.assertEqual(meter_provider._sdk_config.callback_max_workers, 3)
+
+        with patch.dict(
+            environ, {OTEL_PYTHON_METRIC_CALLBACK_MAX_WORKERS: "many"}
+        ):
+            with self.assertLogs(level=WARNING):
+                meter_provider = MeterProvider()
+        self.assertEqual(meter_provider._sdk_config.callback_max_workers, 0)
+
+        with patch.dict(
+            environ, {OTEL_PYTHON_METRIC_CALLBACK_MAX_WORKERS: "-1"}
+        ):
+            with self.assertLogs(level=WARNING):
+                meter_provider = MeterProvider()
+        self.assertEqual(meter_provider._sdk_config.callback_max_workers, 0)
+
+        with self.assertRaises(ValueError):
+            MeterProvider(callback_max_workers=-1)
+
+    def test_shutdown_stops_callback_threads(self):
+        reader = InMemoryMetricReader()
+        meter_provider = MeterProvider(
+            metric_readers=[reader], callback_max_workers=2
+        )
+        release = Event()
+        threads = []
+
+        def hung_callback(options):
+            threads.append(current_thread())
+            release.wait(5)
+            yield Observation(1)
+
+        meter_provider.get_meter("testmeter").create_observable_gauge(
+            "hung", [hung_callback]
+        )
+        with self.assertLogs(level=WARNING):
+            self.assertEqual(_values(reader, 100), {})
+        # A hung callback does not keep the process from exiting.
+        (thread,) = threads
+        self.assertTrue(thread.daemon)
+
+        meter_provider.shutdown()
+        self.assertIsNone(
+            meter_provider._measurement_consumer._callback_executor
+        )
+        release.set()
+        thread.join(5)
+        self.assertFalse(thread.is_alive())
@@ -0,0 +1,81 @@
+# Copyright The OpenTelemetry Authors
+# SPDX-License-Identifier: Apache-2.0
+
+from unittest import TestCase
+
+from opentelemetry.sdk.metrics import Counter, MeterProvider
+from opentelemetry.sdk.metrics.export import (
+    AggregationTemporality,
+    InMemoryMetricReader,
+)
+
+
+def _data_points(reader, name):
+    metrics_data = reader.get_metrics_data()
+    if metrics_data is None:
+        return {}
+    return {
+        point.attributes["user"]: point
+        for scope_metrics in metrics_data.resource_metrics[0].scope_metrics
+        for metric in scope_metrics.metrics
+        if metric.name == name
+        for point in metric.data.data_points
+    }
+
+
+class TestSkipUnchangedStreams(TestCase):
+    def test_unchanged_streams_skipped(self):
+        reader = InMemoryMetricReader(skip_unchanged_streams=True)
+        meter = MeterProvider(metric_readers=[reader]).get_meter("testmeter")
+        counter = meter.create_counter("counter")
+        histogram = meter.create_histogram("histogram")
+        for user in ("a", "b"):
+            counter.add(1, {"user": user})
+            histogram.record(1, {"user": user})
+        self.assertEqual(len(_data_points(reader, "counter")), 2)
+
+        counter.add(2, {"user": "a"})
+        histogram.record(2, {"user": "a"})
+        metrics_data = reader.get_metrics_data()
+        points = {
+            metric.name: {
+                point.attributes["user"]: point
+                for point in metric.data.data_points
+            }
+            for metric in metrics_data.resource_metrics[0]
+            .scope_metrics[0]
+            .metrics
+        }
+        self.assertEqual(list(points["counter"]), ["a"])
+        self.assertEqual(points["counter"]["a"].value, 3)
+        self.assertEqual(list(points["histogram"]), ["a"])
+        self.assertEqual(points["histogram"]["a"].count, 2)
+
+        self.assertEqual(_data_points(reader, "counter"), {})
+
+        counter.add(1, {"user": "b"})
+        self.assertEqual(_data_points(reader, "counter")["b"].value, 2)
+
+    def test_delta_streams_unaffected(self):
+        reader = InMemoryMetricReader(
+            preferred_temporality={Counter: AggregationTemporality.DELTA},
+            skip_unchanged_streams=True,
+        )
+        meter = MeterProvider(metric_readers=[reader]).get_meter("testmeter")
+        counter = meter.create_counter("counter")
+        counter.add(1, {"user": "a"})
+        self.assertEqual(_data_points(reader, "counter")["a"].value, 1)
+        counter.add(2, {"user": "a"})
+        self.assertEqual(_data_points(reader, "counter")["a"].value, 2)
+
+    def test_unchanged_streams_reported_by_default(self):
+        reader = InMemoryMetricReader()
+        meter = MeterProvider(metric_readers=[reader]).get_meter("testmeter")
+        histogram = meter.create_histogram("histogram")
+        histogram.record(1, {"user": "a"})
+        first = _data_points(reader, "histogram")["a"]
+        second = _data_points(reader, "histogram")["a"]
+        self.assertEqual(second.count, 1)
+        self.assertGreaterEqual(second.time_unix_nano, first.time_unix_nano)
+        # The bucket counts of an unchanged stream are not built again.
+        self.assertIs(second.bucket_counts, first.bucket_counts)
@@ -3,7 +3,9 @@
 
 # pylint: disable=protected-access
 
+from array import array
 from math import inf
+from threading import Thread
 from time import sleep, time_ns
 from unittest import TestCase
 from unittest.mock import Mock
@@ -88,6 +90,100 @@ class TestSynchronousSumAggregation(TestCase):
 
         self.assertEqual(synchronous_sum_aggregation._value, 2)
 
+    def test_aggregate_batch(self):
+        synchronous_sum_aggregation = _SumAggregation(
+            Mock(),
+            True,
+            AggregationTemporality.DELTA,
+            0,
+            _default_reservoir_factory(_SumAggregation),
+        )
+
+        synchronous_sum_aggregation.aggregate(measurement(1))
+        synchronous_sum_aggregation.aggregate_batch(
+            array("d", [2, 3.5]), measurement(2)
+        )
+
+        self.assertEqual(synchronous_sum_aggregation._value, 6.5)
+
+    def test_aggregate_striped(self):
+        synchronous_sum_aggregation = _SumAggregation(
+            Mock(),
+            True,
+            AggregationTemporality.DELTA,
+            0,
+            _default_reservoir_factory(_SumAggregation),
+            stripes=4,
+        )
+
+        def add():
+            for _ in range(1000):
+                synchronous_sum_aggregation.aggregate_value(1)
+
+        threads = [Thread(target=add) for _ in range(8)]
+        for thread in threads:
+            thread.start()
+        for thread in threads:
+            thread.join()
+
+        self.assertIsNone(synchronous_sum_aggregation._value)
+        self.assertEqual(
+            synchronous_sum_aggregation.collect(
+                AggregationTemporality.CUMULATIVE, 1
+            ).value,
+            8000,
+        )
+        synchronous_sum_aggregation.aggregate(measurement(2))
+        self.assertEqual(
+            synchronous_sum_aggregation.collect(
+                AggregationTemporality.CUMULATIVE, 2
+            ).value,
+            8002,
+        )
+        self.assertIsNone(
+            synchronous_sum_aggregation.collect(
+                AggregationTemporality.DELTA, 3
+            )
+        )
+
+    def test_evicted_aggregation_rejects_measurements(self):
+        for stripes in (None, 4):
+            with self.subTest(stripes=stripes):
+                synchronous_sum_aggregation = _SumAggregation(
+                    Mock(),
+                    True,
+                    AggregationTemporality.DELTA,
+                    0,
+                    _default_reservoir_factory(_SumAggregation),
+                    stripes=stripes,
+                )
+                self.assertTrue(
+                    synchronous_sum_aggregation.aggregate(measurement(1))
+                )
+                # Measurements aggregated since the collection keep it.
+                self.assertFalse(synchronous_sum_aggregation._evict())
+                synchronous_sum_aggregation.collect(
+                    AggregationTemporality.DELTA, 1
+                )
+                self.assertTrue(synchronous_sum_aggregation._evict())
+
+                self.assertFalse(
+                    synchronous_sum_aggregation.aggregate(measurement(1))
+                )
+                self.assertFalse(
+                    synchronous_sum_aggregation.aggregate_value(1)
+                )
+                self.assertFalse(
+                    synchronous_sum_aggregation.aggregate_batch(
+                        [1, 2], measurement(1)
+                    )
+                )
+                self.assertIsNone(
+                    synchronous_sum_aggregation.collect(
+                        AggregationTemporality.DELTA, 2
+                    )
+                )
+
     def test_aggregate_cumulative(self):
         """
         `SynchronousSumAggregation` aggregates data for sum metric points
@@ -343,6 +439,48 @@ class TestExplicitBucketHistogramAggregation(TestCase):
         )
         self.assertEqual(histo.sum, 14)
 
+    def test_aggregate_batch(self):
+        def create_aggregation():
+            return _ExplicitBucketHistogramAggregation(
+                Mock(),
+                AggregationTemporality.DELTA,
+                0,
+                _default_reservoir_factory(
+                    _ExplicitBucketHistogramAggregation
+                ),
+                boundaries=[0, 2, 4],
+            )
+
+        values = [-1, 0, 1, 2, 3, 4, 5, 2.5]
+        aggregation = create_aggregation()
+        batch_aggregation = create_aggregation()
+        for value in values:
+            aggregation.aggregate(measurement(value))
+        batch_aggregation.aggregate(measurement(4))
+        batch_aggregation.aggregate_batch(values[1:], measurement(0))
+        batch_aggregation.aggregate_batch(
+            memoryview(array("q", [-1])), measurement(-1)
+        )
+        batch_aggregation.aggregate_batch([], measurement(0))
+
+        self.assertEqual(aggregation._value, [2, 2, 3, 1])
+        point = aggregation.collect(AggregationTemporality.DELTA, 1)
+        batch_point = batch_aggregation.collect(
+            AggregationTemporality.DELTA, 1
+        )
+        # 4 was aggregated in both aggregations, once on its own and once in
+        # the batch.
+        self.assertEqual(batch_point.bucket_counts, (2, 2, 4, 1))
+        self.assertEqual(batch_point.sum, point.sum + 4)
+        self.assertEqual(batch_point.min, -1)
+        self.assertEqual(batch_point.max, 5)
+
+        self.assertTrue(batch_aggregation._evict())
+        self.assertFalse(
+            batch_aggregation.aggregate_batch([1], measurement(1))
+        )
+        self.assertIsNone(batch_aggregation._value)
+
     def test_min_max(self):
         """
         `record_min_max` indicates the aggregator to record the minimum and
@@ -520,6 +658,27 @@ class TestAggregationFactory(TestCase):
             AggregationTemporality.CUMULATIVE,
         )
 
+    def test_sum_factory_stripes(self):
+        factory = SumAggregation(stripes=4)
+        aggregation = factory._create_aggregation(
+            _Counter("name", Mock(), Mock()),
+            Mock(),
+            _default_reservoir_factory,
+            0,
+        )
+        self.assertEqual(len(aggregation._stripe_values), 4)
+
+        aggregation = factory._create_aggregation(
+            _ObservableCounter("name", Mock(), Mock(), None),
+            Mock(),
+            _default_reservoir_factory,
+            0,
+        )
+        self.assertIsNone(aggregation._stripe_values)
+
+        with self.assertRaises(ValueError):
+            SumAggregation(stripes=0)
+
     def test_explicit_bucket_histogram_factory(self):
         histo = _Histogram("name", Mock(), Mock())
         factory = ExplicitBucketHistogramAggregation(
@@ -42,14 +42,14 @@ class TestCounter(TestCase):
         mc = Mock()
         counter = _Counter("name", Mock(), mc)
         counter.add(1.0)
-        mc.consume_measurement.assert_called_once()
+        mc.consume_value.assert_called_once()
 
     def test_add_non_monotonic(self):
         mc = Mock()
         counter = _Counter("name", Mock(), mc)
         with self.assertLogs(level=WARNING):
             counter.add(-1.0)
-        mc.consume_measurement.assert_not_called()
+        mc.consume_value.assert_not_called()
 
     def test_disallow_direct_counter_creation(self):
         with self.assertRaises(TypeError):
@@ -62,13 +62,13 @@ class TestUpDownCounter(TestCase):
         mc = Mock()
         counter = _UpDownCounter("name", Mock(), mc)
         counter.add(1.0)
-        mc.consume_measurement.assert_called_once()
+        mc.consume_value.assert_called_once()
 
     def test_add_non_monotonic(self):
         mc = Mock()
         counter = _UpDownCounter("name", Mock(), mc)
         counter.add(-1.0)
-        mc.consume_measurement.assert_called_once()
+        mc.consume_value.assert_called_once()
 
     def test_disallow_direct_up_down_counter_creation(self):
         with self.assertRaises(TypeError):
@@ -390,7 +390,7 @@ class TestGauge(TestCase):
         mc = Mock()
         gauge = _Gauge("name", Mock(), mc)
         gauge.set(1.0)
-        mc.consume_measurement.assert_called_once()
+        mc.consume_value.assert_called_once()
 
     def test_disallow_direct_counter_creation(self):
         with self.assertRaises(TypeError):
@@ -478,14 +478,14 @@ class TestHistogram(TestCase):
         mc = Mock()
         hist = _Histogram("name", Mock(), mc)
         hist.record(1.0)
-        mc.consume_measurement.assert_called_once()
+        mc.consume_value.assert_called_once()
 
     def test_record_non_monotonic(self):
         mc = Mock()
         hist = _Histogram("name", Mock(), mc)
         with self.assertLogs(level=WARNING):
             hist.record(-1.0)
-        mc.consume_measurement.assert_not_called()
+        mc.consume_value.assert_not_called()
 
     def test_disallow_direct_histogram_creation(self):
         with self.assertRaises(TypeError):
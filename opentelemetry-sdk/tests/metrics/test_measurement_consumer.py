@@ -8,6 +8,9 @@ from time import sleep
 from unittest import TestCase
 from unittest.mock import MagicMock, Mock, patch
 
+from opentelemetry.sdk.metrics._internal.exemplar import (
+    AlwaysOffExemplarFilter,
+)
 from opentelemetry.sdk.metrics._internal.measurement_consumer import (
     MeasurementConsumer,
     SynchronousMeasurementConsumer,
@@ -45,7 +48,11 @@ class TestSynchronousMeasurementConsumer(TestCase):
         self, MockMetricReaderStorage
     ):
         reader_mocks = [Mock() for _ in range(5)]
-        reader_storage_mocks = [Mock() for _ in range(5)]
+        view_instrument_match_mocks = [Mock() for _ in range(5)]
+        reader_storage_mocks = [
+            Mock(get_view_instrument_matches=Mock(return_value=[vim_mock]))
+            for vim_mock in view_instrument_match_mocks
+        ]
         MockMetricReaderStorage.side_effect = reader_storage_mocks
 
         consumer = SynchronousMeasurementConsumer(
@@ -58,12 +65,81 @@ class TestSynchronousMeasurementConsumer(TestCase):
         )
         measurement_mock = Mock()
         consumer.consume_measurement(measurement_mock)
+        consumer.consume_measurement(measurement_mock)
 
-        for rs_mock in reader_storage_mocks:
-            rs_mock.consume_measurement.assert_called_once_with(
+        for rs_mock, vim_mock in zip(
+            reader_storage_mocks, view_instrument_match_mocks
+        ):
+            # The view instrument matches are looked up once per instrument.
+            rs_mock.get_view_instrument_matches.assert_called_once_with(
+                measurement_mock.instrument
+            )
+            self.assertEqual(vim_mock.consume_measurement.call_count, 2)
+            vim_mock.consume_measurement.assert_called_with(
                 measurement_mock, False
             )
 
+    @patch(
+        "opentelemetry.sdk.metrics._internal.measurement_consumer.get_current"
+    )
+    @patch("opentelemetry.sdk.metrics._internal.measurement_consumer.time_ns")
+    def test_values_consumed_without_measurement(
+        self, mock_time_ns, mock_get_current, MockMetricReaderStorage
+    ):
+        vim_mock = Mock()
+        MockMetricReaderStorage.return_value = Mock(
+            get_view_instrument_matches=Mock(return_value=[vim_mock])
+        )
+        consumer = SynchronousMeasurementConsumer(
+            SdkConfiguration(
+                exemplar_filter=AlwaysOffExemplarFilter(),
+                resource=Mock(),
+                views=Mock(),
+            ),
+            metric_readers=[Mock()],
+        )
+        instrument_mock = Mock()
+        consumer.consume_value(instrument_mock, 1, {"a": "b"}, None)
+
+        vim_mock.consume_value.assert_called_once_with(1, {"a": "b"})
+        vim_mock.consume_measurement.assert_not_called()
+
+        binding = consumer.bind(instrument_mock, {"a": "b"})
+        consumer.consume_bound_value(binding, instrument_mock, 2, None)
+
+        vim_mock.get_aggregation.return_value.aggregate_value.assert_called_once_with(
+            2
+        )
+        mock_time_ns.assert_not_called()
+        mock_get_current.assert_not_called()
+
+    def test_routes_reset_when_metric_readers_change(
+        self, MockMetricReaderStorage
+    ):
+        vim_mocks = [Mock(), Mock()]
+        MockMetricReaderStorage.side_effect = [
+            Mock(get_view_instrument_matches=Mock(return_value=[vim_mock]))
+            for vim_mock in vim_mocks
+        ]
+        consumer = SynchronousMeasurementConsumer(
+            SdkConfiguration(
+                exemplar_filter=Mock(should_sample=Mock(return_value=False)),
+                resource=Mock(),
+                views=Mock(),
+            ),
+            metric_readers=[Mock()],
+        )
+        measurement_mock = Mock()
+        consumer.consume_measurement(measurement_mock)
+        reader_mock = Mock()
+        consumer.add_metric_reader(reader_mock)
+        consumer.consume_measurement(measurement_mock)
+        consumer.remove_metric_reader(reader_mock)
+        consumer.consume_measurement(measurement_mock)
+
+        self.assertEqual(vim_mocks[0].consume_measurement.call_count, 3)
+        self.assertEqual(vim_mocks[1].consume_measurement.call_count, 1)
+
     def test_collect_passed_to_reader_stage(self, MockMetricReaderStorage):
         """Its collect() method should defer to the underlying MetricReaderStorage"""
         reader_mocks = [Mock() for _ in range(5)]
@@ -207,7 +283,7 @@ class TestSynchronousMeasurementConsumerConcurrency(TestCase):
                 resource=MagicMock(),
                 views=MagicMock(),
             ),
-            metric_readers=[MagicMock()],
+            metric_readers=[MagicMock(_instrument_class_cardinality_limit={})],
         )
 
         def _hooked_iter(iterable):
@@ -265,7 +341,7 @@ class TestSynchronousMeasurementConsumerConcurrency(TestCase):
                 nonlocal failure
                 if not iteration_started.wait(timeout):
                     failure = iteration_timeout_error
-                reader = MagicMock()
+                reader = MagicMock(_instrument_class_cardinality_limit={})
                 consumer.add_metric_reader(reader)
                 consumer.remove_metric_reader(reader)
 
@@ -273,7 +349,9 @@ class TestSynchronousMeasurementConsumerConcurrency(TestCase):
             t = Thread(target=add_and_remove_readers)
             t.start()
             try:
-                consumer.add_metric_reader(MagicMock())
+                consumer.add_metric_reader(
+                    MagicMock(_instrument_class_cardinality_limit={})
+                )
                 consumer.consume_measurement(MagicMock())
             finally:
                 t.join()
@@ -385,7 +385,7 @@ class TestMeterProvider(ConcurrencyTestBase, TestCase):
 
         counter.add(1)
 
-        sync_consumer_instance.consume_measurement.assert_called()
+        sync_consumer_instance.consume_value.assert_called()
 
     @patch(
         "opentelemetry.sdk.metrics._internal.SynchronousMeasurementConsumer"
@@ -401,7 +401,7 @@ class TestMeterProvider(ConcurrencyTestBase, TestCase):
 
         counter.add(1)
 
-        sync_consumer_instance.consume_measurement.assert_called()
+        sync_consumer_instance.consume_value.assert_called()
 
     @patch(
         "opentelemetry.sdk.metrics._internal.SynchronousMeasurementConsumer"
@@ -415,7 +415,7 @@ class TestMeterProvider(ConcurrencyTestBase, TestCase):
 
         counter.record(1)
 
-        sync_consumer_instance.consume_measurement.assert_called()
+        sync_consumer_instance.consume_value.assert_called()
 
     def test_meter_provider_with_disabled_configurator(self):
         mp = MeterProvider(_meter_configurator=_disable_meter_configurator)
@@ -486,7 +486,7 @@ class TestMeterProvider(ConcurrencyTestBase, TestCase):
 
         gauge.set(1)
 
-        sync_consumer_instance.consume_measurement.assert_called()
+        sync_consumer_instance.consume_value.assert_called()
 
     def test_addition_of_metric_reader(self):
         internal_logger = "opentelemetry.sdk.metrics._internal"
@@ -828,7 +828,7 @@ class TestMeter(TestCase):
         mp = MeterProvider(_meter_configurator=_disable_meter_configurator)
         counter = mp.get_meter("test").create_counter("c")
         counter.add(1)
-        sync_consumer_instance.consume_measurement.assert_not_called()
+        sync_consumer_instance.consume_value.assert_not_called()
 
     @patch(
         "opentelemetry.sdk.metrics._internal.SynchronousMeasurementConsumer"
@@ -840,7 +840,7 @@ class TestMeter(TestCase):
         mp = MeterProvider(_meter_configurator=_disable_meter_configurator)
         counter = mp.get_meter("test").create_up_down_counter("udc")
         counter.add(1)
-        sync_consumer_instance.consume_measurement.assert_not_called()
+        sync_consumer_instance.consume_value.assert_not_called()
 
     @patch(
         "opentelemetry.sdk.metrics._internal.SynchronousMeasurementConsumer"
@@ -852,7 +852,7 @@ class TestMeter(TestCase):
         mp = MeterProvider(_meter_configurator=_disable_meter_configurator)
         histogram = mp.get_meter("test").create_histogram("h")
         histogram.record(1)
-        sync_consumer_instance.consume_measurement.assert_not_called()
+        sync_consumer_instance.consume_value.assert_not_called()
 
     @patch(
         "opentelemetry.sdk.metrics._internal.SynchronousMeasurementConsumer"
@@ -864,7 +864,7 @@ class TestMeter(TestCase):
         mp = MeterProvider(_meter_configurator=_disable_meter_configurator)
         gauge = mp.get_meter("test").create_gauge("g")
         gauge.set(1)
-        sync_consumer_instance.consume_measurement.assert_not_called()
+        sync_consumer_instance.consume_value.assert_not_called()
 
     def test_disabled_meter_observable_counter_skips_callback(self):
         cb = Mock()
@@ -904,14 +904,10 @@ class TestMeter(TestCase):
         counter = meter.create_counter("c")
 
         counter.add(1)
-        self.assertEqual(
-            sync_consumer_instance.consume_measurement.call_count, 1
-        )
+        self.assertEqual(sync_consumer_instance.consume_value.call_count, 1)
 
         counter.add(2)
-        self.assertEqual(
-            sync_consumer_instance.consume_measurement.call_count, 2
-        )
+        self.assertEqual(sync_consumer_instance.consume_value.call_count, 2)
 
         mp._set_meter_configurator(
             meter_configurator=_disable_meter_configurator
@@ -920,9 +916,7 @@ class TestMeter(TestCase):
 
         counter.add(3)
         counter.add(4)
-        self.assertEqual(
-            sync_consumer_instance.consume_measurement.call_count, 2
-        )
+        self.assertEqual(sync_consumer_instance.consume_value.call_count, 2)
 
     @patch(
         "opentelemetry.sdk.metrics._internal.SynchronousMeasurementConsumer"
@@ -936,14 +930,14 @@ class TestMeter(TestCase):
         counter = meter.create_counter("c")
 
         counter.add(1)
-        sync_consumer_instance.consume_measurement.assert_not_called()
+        sync_consumer_instance.consume_value.assert_not_called()
 
         mp._set_meter_configurator(
             meter_configurator=_default_meter_configurator
         )
         self.assertTrue(meter._is_enabled())
         counter.add(1)
-        sync_consumer_instance.consume_measurement.assert_called_once()
+        sync_consumer_instance.consume_value.assert_called_once()
 
 
 class InMemoryMetricExporter(MetricExporter):
@@ -3,6 +3,7 @@
 
 # pylint: disable=protected-access,invalid-name,no-self-use
 
+import asyncio
 import gc
 import math
 import weakref
@@ -30,6 +31,7 @@ from opentelemetry.sdk.metrics._internal.point import (
 )
 from opentelemetry.sdk.metrics.export import (
     AggregationTemporality,
+    AsyncPeriodicExportingMetricReader,
     Gauge,
     Metric,
     MetricExporter,
@@ -76,6 +78,21 @@ class FakeMetricsExporter(MetricExporter):
         return True
 
 
+class AsyncFakeMetricsExporter(FakeMetricsExporter):
+    async def export(
+        self,
+        metrics_data: MetricsData,
+        timeout_millis: float = 10_000,
+        **kwargs,
+    ) -> MetricExportResult:
+        await asyncio.sleep(self.wait)
+        self.metrics.append(metrics_data)
+        return MetricExportResult.SUCCESS
+
+    async def shutdown(self, timeout_millis: float = 30_000, **kwargs) -> None:
+        self._shutdown = True
+
+
 class ExceptionAtCollectionPeriodicExportingMetricReader(
     PeriodicExportingMetricReader
 ):
@@ -355,3 +372,86 @@ class TestPeriodicExportingMetricReader(ConcurrencyTestBase):
         self.assertTrue(name.startswith("periodic_metric_reader/"))
 
         mp.shutdown()
+
+
+class TestAsyncPeriodicExportingMetricReader(ConcurrencyTestBase):
+    @staticmethod
+    def _create_reader(metrics_data, exporter, interval=60000):
+        reader = AsyncPeriodicExportingMetricReader(
+            exporter, export_interval_millis=interval
+        )
+        reader._set_collect_callback(
+            lambda reader, timeout_millis: metrics_data
+        )
+        return reader
+
+    def test_requires_async_exporter(self):
+        with self.assertRaises(ValueError):
+            AsyncPeriodicExportingMetricReader(FakeMetricsExporter())
+
+    def test_ticker_collects_metrics(self):
+        exporter = AsyncFakeMetricsExporter()
+
+        async def run():
+            reader = self._create_reader(metrics, exporter, interval=100)
+            await asyncio.sleep(0.15)
+            self.assertEqual(exporter.metrics, [metrics])
+            await reader.shutdown_async()
+
+        asyncio.run(run())
+        self.assertEqual(exporter.metrics, [metrics, metrics])
+        self.assertTrue(exporter._shutdown)
+
+    def test_collection_does_not_block_event_loop(self):
+        exporter = AsyncFakeMetricsExporter()
+
+        def _collect(reader, timeout_millis):
+            sleep(0.2)
+            return metrics
+
+        async def run():
+            reader = AsyncPeriodicExportingMetricReader(
+                exporter, export_interval_millis=math.inf
+            )
+            reader._set_collect_callback(_collect)
+            flush = asyncio.ensure_future(reader.force_flush_async())
+            before = time_ns()
+            await asyncio.sleep(0.05)
+            self.assertLess(time_ns() - before, 0.15 * 1e9)
+            self.assertTrue(await flush)
+            self.assertEqual(exporter.metrics, [metrics])
+            await reader.shutdown_async()
+
+        asyncio.run(run())
+
+    def test_collect_from_event_loop(self):
+        exporter = AsyncFakeMetricsExporter()
+
+        async def run():
+            reader = self._create_reader(metrics, exporter)
+            with self.assertLogs(level=WARNING) as logs:
+                reader.collect()
+            self.assertIn(
+                "collect cannot block the event loop it runs on, await "
+                "collect_async instead.",
+                logs.output[0],
+            )
+            await reader.collect_async()
+            self.assertEqual(exporter.metrics, [metrics, metrics])
+            await reader.shutdown_async()
+
+        asyncio.run(run())
+
+    def test_shutdown_after_event_loop_closed(self):
+        exporter = AsyncFakeMetricsExporter()
+
+        async def run():
+            return self._create_reader(metrics, exporter)
+
+        reader = asyncio.run(run())
+        reader.shutdown()
+        self.assertEqual(exporter.metrics, [metrics])
+        self.assertTrue(exporter._shutdown)
+        with self.assertLogs(level=WARNING) as logs:
+            reader.shutdown()
+        self.assertIn("Can't shutdown multiple times", logs.output[0])
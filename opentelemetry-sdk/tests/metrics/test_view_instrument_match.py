@@ -5,12 +5,15 @@
 from __future__ import annotations
 
 from collections.abc import Callable, Sequence
+from logging import WARNING
 from time import time_ns
 from unittest import TestCase
 from unittest.mock import MagicMock, Mock, patch
 
 from opentelemetry.context import Context
 from opentelemetry.sdk.metrics._internal._view_instrument_match import (
+    _MAX_FOLDED_ATTRIBUTE_SETS,
+    _OVERFLOW_KEY,
     _ViewInstrumentMatch,
 )
 from opentelemetry.sdk.metrics._internal.aggregation import (
@@ -520,6 +523,185 @@ class Test_ViewInstrumentMatch(TestCase):  # pylint: disable=invalid-name
             _LastValueAggregation,
         )
 
+    def _counter_view_instrument_match(
+        self, max_idle_collections, cardinality_limit=2000
+    ):
+        return _ViewInstrumentMatch(
+            view=View(instrument_name="instrument1"),
+            instrument=_Counter(
+                name="instrument1",
+                instrumentation_scope=self.mock_instrumentation_scope,
+                measurement_consumer=Mock(),
+            ),
+            instrument_class_aggregation={_Counter: DefaultAggregation()},
+            cardinality_limit=cardinality_limit,
+            max_idle_collections=max_idle_collections,
+        )
+
+    def _add(self, view_instrument_match, attributes):
+        view_instrument_match.consume_measurement(
+            Measurement(
+                value=1,
+                time_unix_nano=time_ns(),
+                instrument=view_instrument_match._instrument,
+                context=Context(),
+                attributes=attributes,
+            )
+        )
+
+    def test_idle_streams_are_evicted(self):
+        view_instrument_match = self._counter_view_instrument_match(2)
+        self._add(view_instrument_match, {"a": "b"})
+        self._add(view_instrument_match, {"c": "d"})
+
+        for _ in range(3):
+            self._add(view_instrument_match, {"a": "b"})
+            data_points = view_instrument_match.collect(
+                AggregationTemporality.CUMULATIVE, time_ns()
+            )
+            self.assertEqual(len(data_points), 2)
+        self.assertEqual(len(view_instrument_match._attributes_aggregation), 1)
+        self.assertEqual(view_instrument_match.pop_evicted_streams(), 1)
+        self.assertEqual(view_instrument_match.pop_evicted_streams(), 0)
+
+        # A stream coming back starts over.
+        self._add(view_instrument_match, {"c": "d"})
+        values = {
+            frozenset(point.attributes.items()): point.value
+            for point in view_instrument_match.collect(
+                AggregationTemporality.CUMULATIVE, time_ns()
+            )
+        }
+        self.assertEqual(values[frozenset({("c", "d")})], 1)
+        self.assertEqual(values[frozenset({("a", "b")})], 4)
+
+    def test_delta_streams_are_evicted_after_empty_interval(self):
+        view_instrument_match = self._counter_view_instrument_match(10)
+        self._add(view_instrument_match, {"a": "b"})
+        view_instrument_match.collect(AggregationTemporality.DELTA, time_ns())
+        self.assertEqual(len(view_instrument_match._attributes_aggregation), 1)
+        self.assertIsNone(
+            view_instrument_match.collect(
+                AggregationTemporality.DELTA, time_ns()
+            )
+        )
+        self.assertEqual(view_instrument_match._attributes_aggregation, {})
+
+    def test_measurement_racing_with_eviction_is_kept(self):
+        view_instrument_match = self._counter_view_instrument_match(1)
+        self._add(view_instrument_match, {"a": "b"})
+        aggregation = view_instrument_match.get_aggregation({"a": "b"})
+        for _ in range(2):
+            view_instrument_match.collect(
+                AggregationTemporality.CUMULATIVE, time_ns()
+            )
+        self.assertEqual(view_instrument_match._attributes_aggregation, {})
+
+        # The aggregation was looked up before the stream was evicted.
+        with patch.object(
+            view_instrument_match, "get_aggregation", return_value=aggregation
+        ):
+            self._add(view_instrument_match, {"a": "b"})
+            view_instrument_match.consume_value(2, {"a": "b"})
+        (data_point,) = view_instrument_match.collect(
+            AggregationTemporality.CUMULATIVE, time_ns()
+        )
+        self.assertEqual(data_point.value, 3)
+
+    def test_streams_are_not_evicted_by_default(self):
+        view_instrument_match = self._counter_view_instrument_match(None)
+        self._add(view_instrument_match, {"a": "b"})
+        for _ in range(3):
+            view_instrument_match.collect(
+                AggregationTemporality.DELTA, time_ns()
+            )
+        self.assertEqual(len(view_instrument_match._attributes_aggregation), 1)
+
+    def test_delta_overflow_ends_after_burst(self):
+        view_instrument_match = self._counter_view_instrument_match(
+            None, cardinality_limit=3
+        )
+        with self.assertLogs(level=WARNING):
+            for user in range(4):
+                self._add(view_instrument_match, {"user": str(user)})
+        self._add(view_instrument_match, {"user": "0"})
+        self.assertEqual(
+            len(
+                view_instrument_match.collect(
+                    AggregationTemporality.DELTA, time_ns()
+                )
+            ),
+            3,
+        )
+
+        # Only the stream of user 0 reported values in the last interval.
+        self._add(view_instrument_match, {"user": "0"})
+        view_instrument_match.collect(AggregationTemporality.DELTA, time_ns())
+        self.assertEqual(
+            set(view_instrument_match._attributes_aggregation),
+            {frozenset({("user", "0")})},
+        )
+
+        self._add(view_instrument_match, {"user": "4"})
+        with self.assertLogs(level=WARNING):
+            self._add(view_instrument_match, {"user": "5"})
+        values = {
+            frozenset(point.attributes.items()): point.value
+            for point in view_instrument_match.collect(
+                AggregationTemporality.DELTA, time_ns()
+            )
+        }
+        self.assertEqual(
+            values,
+            {
+                frozenset({("user", "4")}): 1,
+                frozenset({("otel.metric.overflow", True)}): 1,
+            },
+        )
+
+    def test_folded_attribute_sets_are_bounded(self):
+        view_instrument_match = self._counter_view_instrument_match(
+            None, cardinality_limit=10
+        )
+        with self.assertLogs(level=WARNING):
+            for user in range(10_000):
+                view_instrument_match.consume_value(1, {"user": str(user)})
+        self.assertEqual(
+            len(view_instrument_match._attributes_aggregation), 10
+        )
+        self.assertEqual(
+            len(view_instrument_match._folded_attribute_sets),
+            _MAX_FOLDED_ATTRIBUTE_SETS,
+        )
+        self.assertEqual(
+            view_instrument_match.pop_folded_streams(),
+            _MAX_FOLDED_ATTRIBUTE_SETS,
+        )
+        values = {
+            frozenset(point.attributes.items()): point.value
+            for point in view_instrument_match.collect(
+                AggregationTemporality.DELTA, time_ns()
+            )
+        }
+        self.assertEqual(values[_OVERFLOW_KEY], 10_000 - 9)
+
+    def test_cumulative_overflow_is_kept(self):
+        view_instrument_match = self._counter_view_instrument_match(
+            None, cardinality_limit=2
+        )
+        with self.assertLogs(level=WARNING):
+            for user in range(2):
+                self._add(view_instrument_match, {"user": str(user)})
+        for _ in range(2):
+            view_instrument_match.collect(
+                AggregationTemporality.CUMULATIVE, time_ns()
+            )
+        self._add(view_instrument_match, {"user": "2"})
+        self.assertEqual(
+            set(view_instrument_match._attributes_aggregation),
+            {frozenset({("user", "0")}), _OVERFLOW_KEY},
+        )
+
 
 class TestSimpleFixedSizeExemplarReservoir(TestCase):
     def test_consume_measurement_with_custom_reservoir_factory(self):
@@ -2,6 +2,7 @@
 # SPDX-License-Identifier: Apache-2.0
 
 # pylint: disable=protected-access
+import asyncio
 import gc
 import logging
 import multiprocessing
@@ -23,13 +24,19 @@ from opentelemetry.sdk._logs import (
     ReadWriteLogRecord,
 )
 from opentelemetry.sdk._logs.export import (
+    AsyncBatchLogRecordProcessor,
     BatchLogRecordProcessor,
 )
 from opentelemetry.sdk._shared_internal import (
     DuplicateFilter,
+    _estimate_attributes_size,
+    _estimate_value_size,
 )
 from opentelemetry.sdk.trace import ReadableSpan
-from opentelemetry.sdk.trace.export import BatchSpanProcessor
+from opentelemetry.sdk.trace.export import (
+    AsyncBatchSpanProcessor,
+    BatchSpanProcessor,
+)
 from opentelemetry.sdk.util.instrumentation import InstrumentationScope
 
 EMPTY_LOG = ReadWriteLogRecord(
@@ -70,6 +77,52 @@ class MockExporterForTesting:
         self.export_sleep_event.set()
 
 
+class PipelinedExporterForTesting:
+    def __init__(self):
+        self.fail_prepare = False
+        self.exported = []
+        self.overlapped = []
+        self.send_threads = set()
+        self._prepared = threading.Semaphore(0)
+
+    def _prepare_export(self, batch: list[Any]):
+        if self.fail_prepare:
+            raise ValueError("Cannot encode")
+        self._prepared.release()
+        return list(batch)
+
+    def _export_prepared(self, prepared, count, timeout_millis=None):
+        self.send_threads.add(threading.current_thread().name)
+        # Consumes the release of this batch, then waits for the next one.
+        self._prepared.acquire()
+        self.overlapped.append(self._prepared.acquire(timeout=0.5))
+        if self.overlapped[-1]:
+            self._prepared.release()
+        self.exported.append(count)
+
+    def export(self, batch: list[Any]):
+        self._export_prepared(self._prepare_export(batch), len(batch))
+
+    def shutdown(self):
+        pass
+
+
+class AsyncExporterForTesting:
+    def __init__(self, export_sleep: float = 0):
+        self.export_sleep = export_sleep
+        self.exported = []
+        self.timeouts = []
+        self.is_shutdown = False
+
+    async def export(self, batch: list[Any], timeout_millis: float):
+        self.timeouts.append(timeout_millis)
+        await asyncio.sleep(self.export_sleep)
+        self.exported.append(batch)
+
+    async def shutdown(self):
+        self.is_shutdown = True
+
+
 # BatchLogRecodProcessor/BatchSpanProcessor initialize and use BatchProcessor.
 # Important: make sure to call .shutdown() before the end of the test,
 # otherwise the worker thread will continue to run after the end of the test.
@@ -215,6 +268,436 @@ class TestBatchProcessor:
         # Then the reference to the processor should no longer exist
         assert weak_ref() is None
 
+    def test_sharded_queue_exports_telemetry_from_all_threads(
+        self, batch_processor_class, telemetry
+    ):
+        exporter = Mock()
+        batch_processor = batch_processor_class(
+            exporter,
+            max_queue_size=100,
+            max_export_batch_size=100,
+            schedule_delay_millis=30000,
+            sharded_queue=True,
+        )
+
+        def emit_telemetry():
+            for _ in range(10):
+                batch_processor._batch_processor.emit(telemetry)
+
+        threads = [threading.Thread(target=emit_telemetry) for _ in range(8)]
+        for thread in threads:
+            thread.start()
+        for thread in threads:
+            thread.join()
+        assert len(batch_processor._batch_processor._shards) == 8
+        assert batch_processor._batch_processor._queue_size() == 80
+        batch_processor.force_flush()
+        exporter.export.assert_called_once_with([telemetry] * 80)
+        # Shards of threads which have exited are removed once drained.
+        batch_processor.force_flush()
+        assert not batch_processor._batch_processor._shards
+        batch_processor.shutdown()
+
+    def test_sharded_queue_drops_telemetry_when_shard_full(
+        self, batch_processor_class, telemetry
+    ):
+        exporter = Mock()
+        batch_processor = batch_processor_class(
+            exporter,
+            max_queue_size=5,
+            max_export_batch_size=5,
+            schedule_delay_millis=30000,
+            sharded_queue=True,
+        )
+        metrics = Mock()
+        batch_processor._batch_processor._metrics = metrics
+        # Stop the worker from draining the shard while the test emits.
+        with batch_processor._batch_processor._export_lock:
+            for _ in range(8):
+                batch_processor._batch_processor.emit(telemetry)
+        assert metrics.drop_items.call_count == 3
+        batch_processor.force_flush()
+        exporter.export.assert_called_once_with([telemetry] * 5)
+        batch_processor.shutdown()
+
+    def test_sharded_queue_bounds_telemetry_across_threads(
+        self, batch_processor_class, telemetry
+    ):
+        exporter = Mock()
+        batch_processor = batch_processor_class(
+            exporter,
+            max_queue_size=20,
+            max_export_batch_size=20,
+            schedule_delay_millis=30000,
+            sharded_queue=True,
+        )
+        metrics = Mock()
+        batch_processor._batch_processor._metrics = metrics
+
+        def emit_telemetry():
+            for _ in range(10):
+                batch_processor._batch_processor.emit(telemetry)
+
+        # Stop the worker from draining the shards while the test emits.
+        with batch_processor._batch_processor._export_lock:
+            threads = [
+                threading.Thread(target=emit_telemetry) for _ in range(4)
+            ]
+            for thread in threads:
+                thread.start()
+            for thread in threads:
+                thread.join()
+            assert batch_processor._batch_processor._queue_size() == 20
+        assert metrics.drop_items.call_count == 20
+        batch_processor.force_flush()
+        exporter.export.assert_called_once_with([telemetry] * 20)
+        # The places of the dropped telemetry are released once drained.
+        with batch_processor._batch_processor._export_lock:
+            threads = [
+                threading.Thread(target=emit_telemetry) for _ in range(2)
+            ]
+            for thread in threads:
+                thread.start()
+            for thread in threads:
+                thread.join()
+        assert metrics.drop_items.call_count == 20
+        batch_processor.shutdown()
+
+    def test_sharded_queue_wakes_worker_on_total_size(
+        self, batch_processor_class, telemetry
+    ):
+        exporter = Mock()
+        batch_processor = batch_processor_class(
+            exporter,
+            max_queue_size=100,
+            max_export_batch_size=8,
+            schedule_delay_millis=30000,
+            sharded_queue=True,
+        )
+
+        def emit_telemetry():
+            for _ in range(2):
+                batch_processor._batch_processor.emit(telemetry)
+
+        # No thread emits a batch on its own.
+        threads = [threading.Thread(target=emit_telemetry) for _ in range(4)]
+        for thread in threads:
+            thread.start()
+        for thread in threads:
+            thread.join()
+        deadline = time.time() + 5
+        while not exporter.export.called and time.time() < deadline:
+            time.sleep(0.01)
+        exporter.export.assert_called_once_with([telemetry] * 8)
+        batch_processor.shutdown()
+
+    def test_concurrent_exports_are_bounded(
+        self, batch_processor_class, telemetry
+    ):
+        lock = threading.Lock()
+        in_flight = 0
+        max_in_flight = 0
+        exported = []
+
+        def export(batch):
+            nonlocal in_flight, max_in_flight
+            with lock:
+                in_flight += 1
+                max_in_flight = max(max_in_flight, in_flight)
+            time.sleep(0.2)
+            with lock:
+                in_flight -= 1
+                exported.extend(batch)
+
+        exporter = Mock()
+        exporter.export.side_effect = export
+        batch_processor = batch_processor_class(
+            exporter,
+            max_queue_size=100,
+            max_export_batch_size=5,
+            schedule_delay_millis=30000,
+            max_concurrent_exports=3,
+        )
+        # Stop the worker from exporting while the test emits.
+        with batch_processor._batch_processor._export_lock:
+            for _ in range(30):
+                batch_processor._batch_processor.emit(telemetry)
+        before = time.time()
+        assert batch_processor.force_flush() is True
+        # 6 batches, 3 at a time, take 2 rounds of 0.2 seconds.
+        assert time.time() - before < 1
+        assert len(exported) == 30
+        assert max_in_flight == 3
+        batch_processor.shutdown()
+
+    def test_concurrent_exports_run_on_daemon_threads(
+        self, batch_processor_class, telemetry
+    ):
+        export_threads = []
+        exporter = Mock()
+        exporter.export.side_effect = lambda batch: export_threads.append(
+            threading.current_thread()
+        )
+        batch_processor = batch_processor_class(
+            exporter,
+            max_queue_size=100,
+            max_export_batch_size=5,
+            schedule_delay_millis=30000,
+            max_concurrent_exports=2,
+        )
+        batch_processor._batch_processor.emit(telemetry)
+        assert batch_processor.force_flush() is True
+        # A hung export must not keep the interpreter from exiting.
+        assert export_threads[0].daemon
+        batch_processor.shutdown()
+
+    def test_force_flush_times_out_waiting_for_export_slot(
+        self, batch_processor_class, telemetry
+    ):
+        exporter = MockExporterForTesting(export_sleep=30)
+        batch_processor = batch_processor_class(
+            exporter,
+            max_queue_size=100,
+            max_export_batch_size=1,
+            schedule_delay_millis=30000,
+            max_concurrent_exports=2,
+        )
+        # Both export slots are taken by hung exports, the third batch waits.
+        with batch_processor._batch_processor._export_lock:
+            for _ in range(3):
+                batch_processor._batch_processor.emit(telemetry)
+        before = time.time()
+        assert batch_processor.force_flush(timeout_millis=200) is False
+        assert time.time() - before < 1
+        assert exporter.num_export_calls == 2
+        # The batch that found no slot is put back once the worker, which is
+        # not stuck waiting for a slot either, gives up.
+        deadline = time.time() + 5
+        while (
+            batch_processor._batch_processor._queue_size() != 1
+            and time.time() < deadline
+        ):
+            time.sleep(0.01)
+        assert batch_processor._batch_processor._queue_size() == 1
+        assert batch_processor.force_flush(timeout_millis=200) is False
+        exporter.export_sleep_event.set()
+        batch_processor.shutdown()
+
+    def test_max_concurrent_exports_must_be_positive(
+        self, batch_processor_class, telemetry
+    ):
+        with pytest.raises(ValueError):
+            batch_processor_class(Mock(), max_concurrent_exports=0)
+
+    def test_pipelined_exports(self, batch_processor_class, telemetry):
+        exporter = PipelinedExporterForTesting()
+        batch_processor = batch_processor_class(
+            exporter,
+            max_queue_size=100,
+            max_export_batch_size=5,
+            schedule_delay_millis=30000,
+            pipelined_exports=True,
+        )
+        with batch_processor._batch_processor._export_lock:
+            for _ in range(15):
+                batch_processor._batch_processor.emit(telemetry)
+        assert batch_processor.force_flush() is True
+        # The next batch was prepared while the previous one was sent.
+        assert exporter.overlapped == [True, True, False]
+        assert exporter.exported == [5, 5, 5]
+        assert threading.current_thread().name not in exporter.send_threads
+        batch_processor.shutdown()
+
+    def test_pipelined_exports_time_out_waiting_for_export_slot(
+        self, batch_processor_class, telemetry
+    ):
+        send_threads = []
+        sent = threading.Event()
+        release = threading.Event()
+
+        class HungExporter:
+            def _prepare_export(self, batch):
+                return batch
+
+            def _export_prepared(self, prepared, count, timeout_millis=None):
+                send_threads.append(threading.current_thread())
+                sent.set()
+                release.wait(30)
+
+            def export(self, batch):
+                pass
+
+            def shutdown(self):
+                pass
+
+        batch_processor = batch_processor_class(
+            HungExporter(),
+            max_queue_size=100,
+            max_export_batch_size=1,
+            schedule_delay_millis=30000,
+            pipelined_exports=True,
+        )
+        with batch_processor._batch_processor._export_lock:
+            for _ in range(2):
+                batch_processor._batch_processor.emit(telemetry)
+        assert batch_processor.force_flush(timeout_millis=200) is False
+        assert sent.wait(5)
+        # A hung send must not keep the interpreter from exiting.
+        assert send_threads[0].daemon
+        # The prepared batch that found no free slot is put back.
+        deadline = time.time() + 5
+        while (
+            batch_processor._batch_processor._queue_size() != 1
+            and time.time() < deadline
+        ):
+            time.sleep(0.01)
+        assert batch_processor._batch_processor._queue_size() == 1
+        release.set()
+        batch_processor.shutdown()
+
+    def test_pipelined_exports_prepare_error(
+        self, batch_processor_class, telemetry
+    ):
+        exporter = PipelinedExporterForTesting()
+        exporter.fail_prepare = True
+        batch_processor = batch_processor_class(
+            exporter,
+            max_queue_size=100,
+            max_export_batch_size=5,
+            schedule_delay_millis=30000,
+            pipelined_exports=True,
+        )
+        batch_processor._batch_processor.emit(telemetry)
+        assert batch_processor.force_flush() is True
+        assert not exporter.exported
+        # The batch that failed to be prepared is dropped.
+        exporter.fail_prepare = False
+        batch_processor._batch_processor.emit(telemetry)
+        assert batch_processor.force_flush() is True
+        assert exporter.exported == [1]
+        batch_processor.shutdown()
+
+    def test_pipelined_exports_require_support(
+        self, batch_processor_class, telemetry
+    ):
+        with pytest.raises(ValueError):
+            batch_processor_class(Mock(), pipelined_exports=True)
+
+    def test_force_flush_returns_false_on_timeout(
+        self, batch_processor_class, telemetry
+    ):
+        # This exporter blocks until shutdown is called.
+        exporter = MockExporterForTesting(export_sleep=30)
+        batch_processor = batch_processor_class(
+            exporter,
+            max_queue_size=15,
+            max_export_batch_size=15,
+            schedule_delay_millis=30000,
+        )
+        batch_processor._batch_processor.emit(telemetry)
+        before = time.time()
+        assert batch_processor.force_flush(timeout_millis=200) is False
+        assert time.time() - before < 1
+        assert exporter.num_export_calls == 1
+        # Unblock the exporter so shutdown does not wait on it.
+        exporter.export_sleep_event.set()
+        batch_processor.shutdown()
+
+    def test_flush_requests_served_against_their_own_deadline(
+        self, batch_processor_class, telemetry
+    ):
+        exporter = Mock()
+        exporter.export.side_effect = lambda batch: time.sleep(0.4)
+        batch_processor = batch_processor_class(
+            exporter,
+            max_queue_size=15,
+            max_export_batch_size=15,
+            schedule_delay_millis=30000,
+            max_concurrent_exports=2,
+        )
+        batch_processor._batch_processor.emit(telemetry)
+        short, long = threading.Event(), threading.Event()
+        now = time.time()
+        batch_processor._batch_processor._serve_flush_requests(
+            [(long, now + 5), (short, now + 0.1)]
+        )
+        # The export outlives the earliest deadline but not the later one.
+        assert not short.is_set()
+        assert long.is_set()
+        exporter.export.assert_called_once_with([telemetry])
+        batch_processor.shutdown()
+
+    def test_force_flush_with_timeout_flushes_telemetry(
+        self, batch_processor_class, telemetry
+    ):
+        exporter = Mock()
+        batch_processor = batch_processor_class(
+            exporter,
+            max_queue_size=15,
+            max_export_batch_size=15,
+            schedule_delay_millis=30000,
+        )
+        for _ in range(10):
+            batch_processor._batch_processor.emit(telemetry)
+        assert batch_processor.force_flush(timeout_millis=5000) is True
+        exporter.export.assert_called_once_with([telemetry for _ in range(10)])
+        batch_processor.shutdown()
+
+    def test_export_timeout_passed_to_exporter(
+        self, batch_processor_class, telemetry
+    ):
+        timeouts = []
+
+        class TimeoutExporter:
+            def export(self, batch, timeout_millis=None):
+                timeouts.append(timeout_millis)
+
+            def shutdown(self):
+                pass
+
+        batch_processor = batch_processor_class(
+            TimeoutExporter(),
+            max_queue_size=15,
+            max_export_batch_size=15,
+            schedule_delay_millis=30000,
+            export_timeout_millis=500,
+        )
+        batch_processor._batch_processor.emit(telemetry)
+        batch_processor.force_flush()
+        batch_processor._batch_processor.emit(telemetry)
+        # The export must also fit in what remains of the flush timeout.
+        batch_processor.force_flush(timeout_millis=200)
+        assert timeouts[0] == 500
+        assert 0 < timeouts[1] <= 200
+        batch_processor.shutdown()
+
+    def test_batches_cut_by_estimated_bytes(
+        self, batch_processor_class, telemetry
+    ):
+        exporter = Mock()
+        batch_processor = batch_processor_class(
+            exporter,
+            max_queue_size=15,
+            max_export_batch_size=15,
+            schedule_delay_millis=30000,
+            max_export_batch_bytes=1,
+        )
+        item_bytes = batch_processor._batch_processor._estimate_size(telemetry)
+        batch_processor._batch_processor._max_export_batch_bytes = (
+            3 * item_bytes
+        )
+        for _ in range(7):
+            batch_processor._batch_processor.emit(telemetry)
+        batch_processor.force_flush()
+        assert [
+            len(call.args[0]) for call in exporter.export.call_args_list
+        ] == [
+            3,
+            3,
+            1,
+        ]
+        batch_processor.shutdown()
+
     def test_shutdown_allows_1_export_to_finish(
         self, batch_processor_class, telemetry
     ):
@@ -245,7 +728,196 @@ class TestBatchProcessor:
         assert 2 == exporter.num_export_calls
 
 
+@pytest.mark.parametrize(
+    "batch_processor_class,telemetry",
+    [
+        (AsyncBatchLogRecordProcessor, EMPTY_LOG),
+        (AsyncBatchSpanProcessor, BASIC_SPAN),
+    ],
+)
+class TestAsyncBatchProcessor:
+    # pylint: disable=no-self-use
+    def test_requires_async_exporter(self, batch_processor_class, telemetry):
+        with pytest.raises(ValueError):
+            batch_processor_class(Mock())
+
+    def test_telemetry_exported_once_batch_size_reached(
+        self, batch_processor_class, telemetry
+    ):
+        exporter = AsyncExporterForTesting()
+
+        async def run():
+            batch_processor = batch_processor_class(
+                exporter,
+                max_queue_size=15,
+                max_export_batch_size=5,
+                schedule_delay_millis=30000,
+                export_timeout_millis=500,
+            )
+            for _ in range(12):
+                batch_processor._batch_processor.emit(telemetry)
+            await asyncio.sleep(0.1)
+            assert exporter.exported == [[telemetry] * 5, [telemetry] * 5]
+            assert exporter.timeouts == [500, 500]
+            await batch_processor.shutdown_async()
+
+        asyncio.run(run())
+        assert exporter.exported[-1] == [telemetry] * 2
+        assert exporter.is_shutdown
+
+    def test_telemetry_exported_once_schedule_delay_reached(
+        self, batch_processor_class, telemetry
+    ):
+        exporter = AsyncExporterForTesting()
+
+        async def run():
+            batch_processor = batch_processor_class(
+                exporter,
+                max_queue_size=15,
+                max_export_batch_size=15,
+                schedule_delay_millis=100,
+            )
+            batch_processor._batch_processor.emit(telemetry)
+            await asyncio.sleep(0.2)
+            assert exporter.exported == [[telemetry]]
+            await batch_processor.shutdown_async()
+
+        asyncio.run(run())
+
+    def test_export_does_not_block_event_loop(
+        self, batch_processor_class, telemetry
+    ):
+        exporter = AsyncExporterForTesting(export_sleep=0.2)
+
+        async def run():
+            batch_processor = batch_processor_class(
+                exporter, max_queue_size=2, max_export_batch_size=1
+            )
+            batch_processor._batch_processor.emit(telemetry)
+            before = time.time()
+            await asyncio.sleep(0.05)
+            assert time.time() - before < 0.15
+            assert not exporter.exported
+            assert await batch_processor.force_flush_async()
+            assert exporter.exported == [[telemetry]]
+            await batch_processor.shutdown_async()
+
+        asyncio.run(run())
+
+    def test_force_flush_async_returns_false_on_timeout(
+        self, batch_processor_class, telemetry
+    ):
+        exporter = AsyncExporterForTesting(export_sleep=0.5)
+
+        async def run():
+            batch_processor = batch_processor_class(
+                exporter, schedule_delay_millis=30000
+            )
+            batch_processor._batch_processor.emit(telemetry)
+            assert not await batch_processor.force_flush_async(100)
+            # The export is not cancelled by the timeout.
+            assert await batch_processor.force_flush_async()
+            assert exporter.exported == [[telemetry]]
+            await batch_processor.shutdown_async()
+
+        asyncio.run(run())
+
+    def test_telemetry_emitted_from_other_threads(
+        self, batch_processor_class, telemetry
+    ):
+        exporter = AsyncExporterForTesting()
+        loop = asyncio.new_event_loop()
+        loop_thread = threading.Thread(target=loop.run_forever)
+        loop_thread.start()
+        try:
+            batch_processor = asyncio.run_coroutine_threadsafe(
+                _create(
+                    batch_processor_class,
+                    exporter,
+                    max_queue_size=15,
+                    max_export_batch_size=5,
+                    schedule_delay_millis=30000,
+                ),
+                loop,
+            ).result()
+            emitters = [
+                threading.Thread(
+                    target=lambda: [
+                        batch_processor._batch_processor.emit(telemetry)
+                        for _ in range(3)
+                    ]
+                )
+                for _ in range(2)
+            ]
+            for emitter in emitters:
+                emitter.start()
+            for emitter in emitters:
+                emitter.join()
+            time.sleep(0.1)
+            assert exporter.exported == [[telemetry] * 5]
+            # Blocks this thread until the event loop flushed the queue.
+            assert batch_processor.force_flush()
+            assert exporter.exported[-1] == [telemetry]
+            batch_processor.shutdown()
+            assert exporter.is_shutdown
+        finally:
+            loop.call_soon_threadsafe(loop.stop)
+            loop_thread.join()
+            loop.close()
+
+    def test_shutdown_after_event_loop_closed(
+        self, batch_processor_class, telemetry
+    ):
+        exporter = AsyncExporterForTesting()
+
+        async def run():
+            batch_processor = batch_processor_class(
+                exporter, schedule_delay_millis=30000
+            )
+            batch_processor._batch_processor.emit(telemetry)
+            return batch_processor
+
+        batch_processor = asyncio.run(run())
+        # Exports from a new event loop, as when the SDK is shut down at exit.
+        batch_processor.shutdown()
+        assert exporter.exported == [[telemetry]]
+        assert exporter.is_shutdown
+
+    def test_force_flush_from_event_loop_does_not_block(
+        self, batch_processor_class, telemetry
+    ):
+        exporter = AsyncExporterForTesting()
+
+        async def run():
+            batch_processor = batch_processor_class(
+                exporter, schedule_delay_millis=30000
+            )
+            batch_processor._batch_processor.emit(telemetry)
+            assert not batch_processor.force_flush()
+            await asyncio.sleep(0.05)
+            assert exporter.exported == [[telemetry]]
+            await batch_processor.shutdown_async()
+
+        asyncio.run(run())
+
+
+async def _create(processor_class, *args, **kwargs):
+    return processor_class(*args, **kwargs)
+
+
 class TestCommonFuncs(unittest.TestCase):
+    def test_estimate_value_size(self):
+        self.assertEqual(_estimate_value_size(None), 0)
+        self.assertEqual(_estimate_value_size("abc"), 3)
+        self.assertEqual(_estimate_value_size(b"abcd"), 4)
+        self.assertEqual(_estimate_value_size(True), 8)
+        self.assertEqual(_estimate_value_size(["ab", 1]), 14)
+        self.assertEqual(
+            _estimate_value_size({"key": "value"}),
+            _estimate_attributes_size({"key": "value"}),
+        )
+        self.assertEqual(_estimate_attributes_size({"key": "value"}), 12)
+
     def test_duplicate_logs_filter_works(self):
         test_logger = logging.getLogger("testLogger")
         test_logger.addFilter(DuplicateFilter())
@@ -578,6 +578,25 @@ class TestBatchSpanProcessor(unittest.TestCase):
 
         provider.shutdown()
 
+    def test_estimate_span_size(self):
+        span = trace.ReadableSpan("span")
+        span_with_data = trace.ReadableSpan(
+            "span",
+            attributes={"key": "value"},
+            events=(trace.Event("event", {"key": "value"}),),
+            links=(
+                trace_api.Link(
+                    trace_api.INVALID_SPAN_CONTEXT, {"key": "value"}
+                ),
+            ),
+        )
+        self.assertEqual(export._estimate_span_size(span), 68)
+        # 12 bytes per attribute, plus 16 + 5 for the event and 32 for the
+        # link.
+        self.assertEqual(
+            export._estimate_span_size(span_with_data), 68 + 12 * 3 + 21 + 32
+        )
+
 
 class TestConsoleSpanExporter(unittest.TestCase):
     def test_export(self):  # pylint: disable=no-self-use
@@ -1252,6 +1252,32 @@ class TestSpan(unittest.TestCase):
         self.assertEqual(span5.status.status_code, StatusCode.ERROR)
         self.assertEqual(span5.status.description, "desc")
 
+    def test_span_accepts_arbitrary_attributes(self):
+        span = self.tracer.start_span("span")
+        span.add_event("event")
+        span.add_link(span.get_span_context())
+        span.end()
+        for obj in (span, span.events[0], span.links[0]):
+            with self.subTest(obj=obj):
+                obj.custom_attribute = "value"
+                self.assertEqual(obj.custom_attribute, "value")
+
+    def test_span_lock_stripes_are_reentrant(self):
+        span = self.tracer.start_span("span")
+        other_span = self.tracer.start_span("other_span")
+        # Unrelated spans sharing a stripe share its lock.
+        other_span._lock_stripe = span._lock_stripe
+        other_span._events._lock_stripe = span._events._lock_stripe
+        with span._lock, span._events._lock:
+            other_span.set_attribute("key", "value")
+            other_span.add_event("event")
+        self.assertEqual(other_span.attributes["key"], "value")
+        self.assertEqual(len(other_span.events), 1)
+
+    def test_span_context_is_slotted(self):
+        span_context = self.tracer.start_span("span").get_span_context()
+        self.assertFalse(hasattr(span_context, "__dict__"))
+
     def test_ended_span(self):
         """Events, attributes are not allowed after span is ended"""
 
@@ -1690,6 +1716,21 @@ class TestSpanProcessor(unittest.TestCase):
 
         self.assertListEqual(spans_calls_list, expected_list)
 
+    def test_ended_span_is_passed_to_on_end(self):
+        tracer_provider = trace.TracerProvider()
+        span_processor = mock.Mock(spec=trace.SpanProcessor)
+        tracer_provider.add_span_processor(span_processor)
+        span = tracer_provider.get_tracer(__name__).start_span(
+            "span", attributes={"key": "value"}
+        )
+        span.end()
+
+        (readable_span,) = span_processor.on_end.call_args.args
+        self.assertIs(readable_span, span)
+        with self.assertRaises(TypeError):
+            span._attributes["key"] = "other value"
+        self.assertEqual(readable_span.attributes, {"key": "value"})
+
     def test_to_json(self):
         context = trace_api.SpanContext(
             trace_id=0x000000000000000000000000DEADBEEF,